@@ -16,3 +16,4 @@ from app.api.v1 import suggestions  # noqa: F401
 from app.api.v1 import citations  # noqa: F401
 from app.api.v1 import report  # noqa: F401
 from app.api.v1 import health  # noqa: F401
+from app.api.v1 import profiles  # noqa: F401
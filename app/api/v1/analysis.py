@@ -14,6 +14,7 @@ from app.api.v1 import bp
 from app.api.middleware.request_validator import sanitize_input, validate_text_length
 from app.config import Config
 from app.models.enums import ContentType
+from app.services.analysis.block_priority import parse_priority_hint
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,8 @@ def analyze() -> Tuple[Response, int]:
 
     Expects a JSON body with ``text`` (required), ``content_type``
     (optional, defaults to ``"concept"``), and ``format_hint`` (optional).
+    ``viewport`` (``{"start", "end"}``) or ``cursor`` (optional) tell
+    the LLM pass which part of the document to analyse first.
 
     Returns:
         Tuple of (JSON response, HTTP status code).
@@ -50,6 +53,11 @@ def analyze() -> Tuple[Response, int]:
         valid_values = [ct.value for ct in ContentType]
         return jsonify({"error": f"Invalid content_type. Must be one of: {valid_values}"}), 400
 
+    try:
+        priority_hint = parse_priority_hint(data)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
     session_id = data.get("session_id") or None
     html_content = data.get("html_content") or None
     user_selected = bool(data.get("user_selected", False))
@@ -64,6 +72,7 @@ def analyze() -> Tuple[Response, int]:
         session_id=session_id,
         html_content=html_content,
         user_selected=user_selected,
+        priority_hint=priority_hint,
     )
 
 
@@ -88,6 +97,7 @@ def _run_analysis(
     session_id: str | None = None,
     html_content: str | None = None,
     user_selected: bool = False,
+    priority_hint: tuple[int, int] | None = None,
 ) -> Tuple[Response, int]:
     """Execute the analysis pipeline and return the result.
 
@@ -102,13 +112,14 @@ def _run_analysis(
         session_id: Optional session ID from the client for session continuity.
         html_content: Optional sanitized HTML from the browser's contenteditable.
         user_selected: Whether the user explicitly selected the content type.
+        priority_hint: Character range the writer is looking at, if sent.
 
     Returns:
         Tuple of (JSON response, HTTP status code).
     """
     from app.services.analysis.orchestrator import analyze as run_analysis
-    from app.services.parsing import detect_and_parse
-    from app.services.parsing.format_detector import detect_format
+    from app.services.parsing import get_parser
+    from app.services.parsing.sniffer import sniff
     from app.models.enums import FileType
 
     try:
@@ -124,9 +135,10 @@ def _run_analysis(
                 len(blocks), len(html_content),
             )
         else:
-            # Standard flow — format detection + auto-parsing
-            file_type = detect_format(text, None)
-            parse_result = detect_and_parse(text, None)
+            # Standard flow — one sniff picks the parser; preprocessing
+            # reuses the same profile for the content type.
+            file_type = sniff(text).file_type
+            parse_result = get_parser(file_type).parse(text, None)
             blocks = parse_result.blocks if parse_result.blocks else []
 
         response = run_analysis(
@@ -135,12 +147,13 @@ def _run_analysis(
             session_id=session_id,
             blocks=blocks,
             user_selected=user_selected,
+            priority_hint=priority_hint,
         )
         logger.debug(
             "/analyze responding with session_id=%s, %d issues, partial=%s",
             response.session_id, len(response.issues), response.partial,
         )
-        return jsonify(response.to_dict()), 200
+        return Response(response.to_json(), mimetype="application/json"), 200
     except (RuntimeError, OSError) as exc:
         logger.error("Analysis failed: %s", exc, exc_info=True)
         return jsonify({"error": "Analysis failed due to an internal error"}), 500
@@ -2,7 +2,10 @@
 
 Handles GET /api/v1/health which returns the overall health of the
 application including SpaCy model status, LLM availability, loaded
-rules count, and uptime.
+rules count, uptime, counters for cancelled analysis work, the
+approximate memory held by this worker's sessions, how many
+analyses are currently shared by identical requests, and the depth of
+this worker's LLM work queues.
 
 LLM availability is cached with a TTL to avoid expensive TLS
 round-trips to LlamaStack on every Kubernetes probe cycle.
@@ -17,6 +20,11 @@ from flask import Response, jsonify
 
 from app.api.v1 import bp
 from app.config import Config
+from app.llm.client import calls_in_flight
+from app.services.analysis.block_priority import pending_blocks
+from app.services.analysis.single_flight import get_single_flight
+from app.services.session.store import get_session_store
+from models.cancellation import get_cancellation_stats
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +42,15 @@ def health_check() -> Tuple[Response, int]:
     """Return the health status of the application.
 
     Checks SpaCy model loading, LLM availability, and rules
-    registry, and returns a summary JSON response.
+    registry, and returns a summary JSON response.  ``cancellation``
+    reports analyses cancelled or superseded, LLM calls skipped or
+    aborted because of it, and the estimated LLM tokens saved.
+    ``memory`` reports this worker's session store: approximate bytes
+    held by sessions and running analyses, the budget and evictions.
+    ``single_flight`` counts running shared analyses, the requests
+    following them, and completed results kept for repeats.
+    ``queues`` gives the granular blocks waiting for a worker and the
+    LLM calls waiting on a completion.
 
     Returns:
         Tuple of (JSON response with health data, HTTP 200).
@@ -50,6 +66,13 @@ def health_check() -> Tuple[Response, int]:
         "llm_available": llm_available,
         "rules_count": rules_count,
         "uptime_seconds": uptime,
+        "cancellation": get_cancellation_stats().snapshot(),
+        "memory": get_session_store().memory_stats(),
+        "single_flight": get_single_flight().stats(),
+        "queues": {
+            "blocks_pending": pending_blocks(),
+            "llm_calls_in_flight": calls_in_flight(),
+        },
     }), 200
 
 
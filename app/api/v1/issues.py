@@ -1,7 +1,8 @@
 """Issue lifecycle routes — accept, dismiss, and provide feedback.
 
-Handles POST endpoints for updating issue status (accept/dismiss)
-and recording user feedback (thumbs up/down with optional comment).
+Handles POST endpoints for updating issue status (accept/dismiss),
+bulk status updates (e.g. accept all issues in a category), and
+recording user feedback (thumbs up/down with optional comment).
 """
 
 import logging
@@ -67,6 +68,68 @@ def manually_fix_issue(issue_id: str) -> Tuple[Response, int]:
     return _update_issue_status(issue_id, IssueStatus.MANUALLY_FIXED)
 
 
+_BULK_STATUSES = {
+    "accepted": IssueStatus.ACCEPTED,
+    "dismissed": IssueStatus.DISMISSED,
+    "manually_fixed": IssueStatus.MANUALLY_FIXED,
+}
+
+
+@bp.route("/issues/bulk-status", methods=["POST"])
+def bulk_update_issues() -> Tuple[Response, int]:
+    """Apply one status to many issues and return the score once.
+
+    Expects JSON body with ``session_id``, ``status`` (``accepted``,
+    ``dismissed`` or ``manually_fixed``), and either ``issue_ids``
+    (list of strings) or a ``category`` and/or ``rule_name`` selector.
+    Selector-based updates only touch issues that are still open.
+
+    Returns:
+        Tuple of (JSON response, HTTP status code).
+    """
+    from app.services.session.store import get_session_store
+
+    data = request.get_json(silent=True)
+    if data is None:
+        return jsonify({"error": "Request body must be JSON"}), 400
+
+    session_id = data.get("session_id")
+    if not session_id:
+        return jsonify({"error": "Field 'session_id' is required"}), 400
+
+    status = _BULK_STATUSES.get(data.get("status", ""))
+    if status is None:
+        return jsonify({
+            "error": f"Field 'status' must be one of: {', '.join(_BULK_STATUSES)}",
+        }), 400
+
+    issue_ids = data.get("issue_ids")
+    if issue_ids is not None and (
+        not isinstance(issue_ids, list)
+        or not all(isinstance(i, str) for i in issue_ids)
+    ):
+        return jsonify({"error": "Field 'issue_ids' must be a list of strings"}), 400
+
+    category = data.get("category")
+    rule_name = data.get("rule_name")
+    if not issue_ids and not category and not rule_name:
+        return jsonify({
+            "error": "Provide 'issue_ids', 'category', or 'rule_name'",
+        }), 400
+
+    result = get_session_store().update_issue_statuses(
+        session_id, status,
+        issue_ids=issue_ids or None,
+        category=category or None,
+        rule_name=rule_name or None,
+    )
+    if result is None:
+        return jsonify({"error": "Session not found"}), 404
+
+    score, updated_ids = result
+    return jsonify({"score": score.to_dict(), "updated_issue_ids": updated_ids}), 200
+
+
 @bp.route("/issues/<issue_id>/feedback", methods=["POST"])
 def submit_feedback(issue_id: str) -> Tuple[Response, int]:
     """Record user feedback (thumbs up/down) for an issue.
@@ -0,0 +1,93 @@
+"""Slow-analysis profile routes — list and download captured profiles.
+
+Handles GET /api/v1/admin/profiles, which lists the stack-sampled
+profiles this worker kept of slow analyses (see
+:mod:`app.services.analysis.slow_profiles`), and
+GET /api/v1/admin/profiles/<profile_id>, which downloads one as
+collapsed stacks (``format=collapsed``, the default) or a speedscope
+file (``format=speedscope``).
+
+Both require ``SLOW_PROFILE_ADMIN_TOKEN`` in the ``X-Admin-Token``
+header and answer 404 while profiling or the token is not configured,
+so the routes do not exist for clients of a default deployment.
+"""
+
+import hmac
+import json
+import logging
+from typing import Optional, Tuple
+
+from flask import Response, jsonify, request
+
+from app.api.v1 import bp
+from app.config import Config
+from app.services.analysis.slow_profiles import get_slow_profiler
+
+logger = logging.getLogger(__name__)
+
+_FORMATS = ("collapsed", "speedscope")
+
+
+@bp.route("/admin/profiles", methods=["GET"])
+def list_profiles() -> Tuple[Response, int]:
+    """List the kept slow-analysis profiles, newest first.
+
+    Returns:
+        Tuple of (JSON response with ``profiles`` and the capture
+        settings, HTTP status code).
+    """
+    denied = _check_admin()
+    if denied is not None:
+        return denied
+    profiler = get_slow_profiler()
+    return jsonify({
+        "threshold_seconds": profiler.threshold,
+        "interval_ms": profiler.interval * 1000,
+        "profiles": [capture.summary() for capture in profiler.captures()],
+    }), 200
+
+
+@bp.route("/admin/profiles/<profile_id>", methods=["GET"])
+def download_profile(profile_id: str) -> Tuple[Response, int]:
+    """Download one profile as collapsed stacks or a speedscope file.
+
+    Args:
+        profile_id: ID from the profile list.
+
+    Returns:
+        Tuple of (file response, HTTP status code).
+    """
+    denied = _check_admin()
+    if denied is not None:
+        return denied
+    fmt = request.args.get("format", "collapsed")
+    if fmt not in _FORMATS:
+        return jsonify({"error": f"Invalid format. Must be one of: {', '.join(_FORMATS)}"}), 400
+    capture = get_slow_profiler().get(profile_id)
+    if capture is None:
+        return jsonify({"error": "Profile not found"}), 404
+
+    if fmt == "speedscope":
+        body, mimetype, suffix = json.dumps(capture.speedscope()), "application/json", "speedscope.json"
+    else:
+        body, mimetype, suffix = capture.collapsed(), "text/plain", "collapsed.txt"
+    response = Response(body, mimetype=mimetype)
+    response.headers["Content-Disposition"] = (
+        f'attachment; filename="analysis-{capture.id}.{suffix}"'
+    )
+    return response, 200
+
+
+def _check_admin() -> Optional[Tuple[Response, int]]:
+    """Refuse the request unless profiling is on and the token matches.
+
+    Returns:
+        None when allowed, otherwise the error response.
+    """
+    if get_slow_profiler() is None or not Config.SLOW_PROFILE_ADMIN_TOKEN:
+        return jsonify({"error": "Not found"}), 404
+    token = request.headers.get("X-Admin-Token", "")
+    if not hmac.compare_digest(token.encode(), Config.SLOW_PROFILE_ADMIN_TOKEN.encode()):
+        logger.warning("Profile endpoint refused: bad admin token")
+        return jsonify({"error": "Forbidden"}), 403
+    return None
@@ -1,7 +1,10 @@
 """Report routes — retrieves reports and generates PDF exports.
 
-Handles GET /api/v1/report/<session_id> for JSON report data and
-POST /api/v1/report/pdf for downloadable PDF generation.
+Handles GET /api/v1/report/<session_id> for JSON report data,
+POST /api/v1/report/pdf for downloadable PDF generation, and the
+job-style PDF endpoints (submit, poll, download) under
+/api/v1/report/pdf/jobs.  PDFs are rendered off the request greenlet
+and cached per session version.
 """
 
 import logging
@@ -39,34 +42,112 @@ def get_report(session_id: str) -> Tuple[Response, int]:
 def generate_pdf() -> Tuple[Response, int]:
     """Generate a PDF report for an analysis session.
 
-    Expects JSON body with ``session_id``.
+    Expects JSON body with ``session_id``.  Returns the cached PDF when
+    the session has not changed since the last render.
 
     Returns:
         Tuple of (PDF bytes response, HTTP status code).
     """
-    from app.services.reporting.pdf_generator import generate_pdf_report
-    from app.services.session.store import get_session_store
+    from app.services.reporting.pdf_jobs import SessionNotFoundError, get_pdf_job_manager
 
     data = request.get_json(silent=True) or {}
     session_id = data.get("session_id")
     if not session_id:
         return jsonify({"error": "session_id is required"}), 400
 
-    store = get_session_store()
-    session = store.get_session(session_id)
-    if session is None:
+    try:
+        pdf_bytes = get_pdf_job_manager().render(session_id)
+    except SessionNotFoundError:
         return jsonify({"error": "Session not found"}), 404
+    except RuntimeError as exc:
+        logger.error("PDF generation failed: %s", exc)
+        return jsonify({"error": "PDF generation failed"}), 500
 
-    pdf_bytes = generate_pdf_report(
-        report_data=session.report.to_dict(),
-        score_data=session.score.to_dict(),
-        issues_data=[issue.to_dict() for issue in session.issues],
-    )
+    return _pdf_response(pdf_bytes), 200
+
+
+@bp.route("/report/pdf/jobs", methods=["POST"])
+def submit_pdf_job() -> Tuple[Response, int]:
+    """Submit a background PDF render for an analysis session.
+
+    Expects JSON body with ``session_id``.  Poll the returned job via
+    ``GET /report/pdf/jobs/<job_id>`` and download it once ``status``
+    is ``done``.
+
+    Returns:
+        Tuple of (JSON job status, HTTP status code).
+    """
+    from app.services.reporting.pdf_jobs import SessionNotFoundError, get_pdf_job_manager
 
+    data = request.get_json(silent=True) or {}
+    session_id = data.get("session_id")
+    if not session_id:
+        return jsonify({"error": "session_id is required"}), 400
+
+    try:
+        job = get_pdf_job_manager().submit(session_id)
+    except SessionNotFoundError:
+        return jsonify({"error": "Session not found"}), 404
+
+    return jsonify(job), 202
+
+
+@bp.route("/report/pdf/jobs/<job_id>", methods=["GET"])
+def get_pdf_job(job_id: str) -> Tuple[Response, int]:
+    """Return the status of a PDF render job.
+
+    Args:
+        job_id: Identifier returned by the submit endpoint.
+
+    Returns:
+        Tuple of (JSON job status, HTTP status code).
+    """
+    from app.services.reporting.pdf_jobs import get_pdf_job_manager
+
+    job = get_pdf_job_manager().get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job), 200
+
+
+@bp.route("/report/pdf/jobs/<job_id>/download", methods=["GET"])
+def download_pdf_job(job_id: str) -> Tuple[Response, int]:
+    """Download the PDF produced by a finished render job.
+
+    Args:
+        job_id: Identifier returned by the submit endpoint.
+
+    Returns:
+        Tuple of (PDF bytes response or JSON error, HTTP status code).
+    """
+    from app.services.reporting.pdf_jobs import JOB_DONE, get_pdf_job_manager
+
+    manager = get_pdf_job_manager()
+    job = manager.get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    if job["status"] != JOB_DONE:
+        return jsonify(job), 409
+
+    pdf_bytes = manager.get_result(job_id)
+    if pdf_bytes is None:
+        return jsonify({"error": "Report expired, submit a new job"}), 410
+    return _pdf_response(pdf_bytes), 200
+
+
+def _pdf_response(pdf_bytes: bytes) -> Response:
+    """Wrap PDF bytes in a downloadable response.
+
+    Args:
+        pdf_bytes: Rendered PDF content.
+
+    Returns:
+        Flask response with attachment headers.
+    """
     return Response(
         pdf_bytes,
         mimetype="application/pdf",
         headers={
             "Content-Disposition": "attachment; filename=cea_report.pdf",
         },
-    ), 200
+    )
@@ -29,6 +29,9 @@ class Config:
         MAX_CONTENT_LENGTH: Maximum upload file size in bytes.
         MAX_TEXT_LENGTH: Maximum character count for direct text input.
         SPACY_MODEL: SpaCy language model to load.
+        SPACY_PIPELINE_PROFILE: ``slim`` loads and runs only the SpaCy
+            components the registered rules declare they read; ``full``
+            loads and runs the whole pipeline.
         LLM_ENABLED: Whether LLM-based analysis is active.
         MODEL_PROVIDER: Model inference provider (llamastack, api, ollama).
         MODEL_TEMPERATURE: Default sampling temperature.
@@ -43,10 +46,22 @@ class Config:
         LLM_CHUNK_OVERLAP: Number of trailing blocks repeated across chunks.
         LLM_GLOBAL_MIN_WORDS: Minimum word count to trigger global LLM pass.
         LLM_JUDGE_BATCH_SIZE: Issues per judge batch for LLM self-correction.
+        DET_BLOCK_CACHE_MAX_ENTRIES: Max cached per-block deterministic results.
         CONFIDENCE_THRESHOLD: Minimum score to surface an issue.
         FEEDBACK_DB_PATH: Path to the SQLite feedback database.
         FEEDBACK_PERSISTENT: Use persistent (file) or in-memory SQLite.
+        FEEDBACK_FLUSH_INTERVAL_MS: Longest a feedback entry waits in the
+            write-behind queue before it is written.
+        FEEDBACK_FLUSH_BATCH_SIZE: Queued feedback entries that are
+            written at once without waiting for the interval.
         SESSION_TTL_SECONDS: Session time-to-live in seconds.
+        SESSION_MEMORY_BUDGET_MB: Approximate memory one worker may spend
+            on stored sessions and running analyses before the least
+            recently used idle sessions are evicted (0 disables).
+        ANALYSIS_RESULT_CACHE_SECONDS: How long a completed analysis is
+            reused for identical repeat requests (0 disables).
+        SOCKET_COMPRESS_MIN_BYTES: Result events at least this large are
+            sent deflate-compressed (0 disables compression).
         CORS_ORIGINS: Allowed CORS origins (comma-separated or '*').
         HTTPS_PROXY: HTTPS proxy URL.
         HTTP_PROXY: HTTP proxy URL.
@@ -61,6 +76,18 @@ class Config:
         LANGUAGETOOL_FILTER_HINTS: Suppress Hint-type matches in gated categories.
         LANGUAGETOOL_CONFIDENCE_THRESHOLD: Confidence floor for gated categories.
         PDF_MARGIN_CROP_PERCENT: Percentage of page to crop from margins.
+        PDF_RENDER_WORKERS: Processes rendering PDF reports (0 = thread).
+        PDF_EXTRACT_WORKERS: Processes extracting long uploaded PDFs in
+            page shards (0 = always extract in the request).
+        PDF_PARALLEL_MIN_PAGES: Page count from which uploaded PDFs are
+            extracted in shards.
+        PDF_CACHE_MAX_ENTRIES: Maximum rendered PDF reports kept in memory.
+        PDF_CACHE_TTL_SECONDS: Lifetime of cached PDF reports and jobs.
+        SLOW_PROFILE_ENABLED: Sample the stacks of analyses and keep slow ones.
+        SLOW_PROFILE_THRESHOLD_SECONDS: Analysis duration from which a profile is kept.
+        SLOW_PROFILE_INTERVAL_MS: Milliseconds between stack samples.
+        SLOW_PROFILE_CAPACITY: Slow-analysis profiles kept per worker.
+        SLOW_PROFILE_ADMIN_TOKEN: Token required by the profile admin endpoints.
     """
 
     # --- Flask ---
@@ -70,6 +97,7 @@ class Config:
 
     # --- SpaCy ---
     SPACY_MODEL: str = os.environ.get("SPACY_MODEL", "en_core_web_md")
+    SPACY_PIPELINE_PROFILE: str = os.environ.get("SPACY_PIPELINE_PROFILE", "slim").lower()
 
     # --- LLM / Model Provider ---
     LLM_ENABLED: bool = os.environ.get("LLM_ENABLED", "True").lower() in ("true", "1", "yes")
@@ -86,6 +114,9 @@ class Config:
     LLM_GLOBAL_PASS_MAX_WORDS: int = int(os.environ.get("LLM_GLOBAL_PASS_MAX_WORDS", "5000"))
     LLM_EXCERPT_BUDGET_MAX: int = int(os.environ.get("LLM_EXCERPT_BUDGET_MAX", "8000"))
     BLOCK_CACHE_TTL: int = int(os.environ.get("BLOCK_CACHE_TTL", "3600"))
+    DET_BLOCK_CACHE_MAX_ENTRIES: int = int(
+        os.environ.get("DET_BLOCK_CACHE_MAX_ENTRIES", "5000")
+    )
 
     # --- LLM Block Splitting ---
     LLM_CHUNK_SIZE: int = int(os.environ.get("LLM_CHUNK_SIZE", "3500"))
@@ -106,9 +137,18 @@ class Config:
     # --- Feedback ---
     FEEDBACK_DB_PATH: str = os.environ.get("FEEDBACK_DB_PATH", "data/feedback.db")
     FEEDBACK_PERSISTENT: bool = os.environ.get("FEEDBACK_PERSISTENT", "True").lower() in ("true", "1", "yes")
+    FEEDBACK_FLUSH_INTERVAL_MS: int = int(os.environ.get("FEEDBACK_FLUSH_INTERVAL_MS", "200"))
+    FEEDBACK_FLUSH_BATCH_SIZE: int = int(os.environ.get("FEEDBACK_FLUSH_BATCH_SIZE", "100"))
 
     # --- Sessions ---
     SESSION_TTL_SECONDS: int = int(os.environ.get("SESSION_TTL_SECONDS", "3600"))
+    SESSION_MEMORY_BUDGET_MB: int = int(os.environ.get("SESSION_MEMORY_BUDGET_MB", "512"))
+    ANALYSIS_RESULT_CACHE_SECONDS: float = float(
+        os.environ.get("ANALYSIS_RESULT_CACHE_SECONDS", "30")
+    )
+
+    # --- Socket.IO ---
+    SOCKET_COMPRESS_MIN_BYTES: int = int(os.environ.get("SOCKET_COMPRESS_MIN_BYTES", "8192"))
 
     # --- CORS ---
     CORS_ORIGINS: str = os.environ.get("CORS_ORIGINS", "*")
@@ -153,12 +193,29 @@ class Config:
 
     # --- PDF ---
     PDF_MARGIN_CROP_PERCENT: int = int(os.environ.get("PDF_MARGIN_CROP_PERCENT", "8"))
+    PDF_RENDER_WORKERS: int = int(os.environ.get("PDF_RENDER_WORKERS", "1"))
+    PDF_EXTRACT_WORKERS: int = int(os.environ.get("PDF_EXTRACT_WORKERS", "2"))
+    PDF_PARALLEL_MIN_PAGES: int = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", "64"))
+    PDF_CACHE_MAX_ENTRIES: int = int(os.environ.get("PDF_CACHE_MAX_ENTRIES", "32"))
+    PDF_CACHE_TTL_SECONDS: int = int(os.environ.get("PDF_CACHE_TTL_SECONDS", "600"))
+
+    # --- Slow-analysis profiling ---
+    SLOW_PROFILE_ENABLED: bool = os.environ.get(
+        "SLOW_PROFILE_ENABLED", "False",
+    ).lower() in ("true", "1", "yes")
+    SLOW_PROFILE_THRESHOLD_SECONDS: float = float(
+        os.environ.get("SLOW_PROFILE_THRESHOLD_SECONDS", "20"),
+    )
+    SLOW_PROFILE_INTERVAL_MS: float = float(os.environ.get("SLOW_PROFILE_INTERVAL_MS", "10"))
+    SLOW_PROFILE_CAPACITY: int = int(os.environ.get("SLOW_PROFILE_CAPACITY", "20"))
+    SLOW_PROFILE_ADMIN_TOKEN: str = os.environ.get("SLOW_PROFILE_ADMIN_TOKEN", "")
 
     @classmethod
     def log_summary(cls) -> None:
         """Log a summary of non-secret configuration values."""
         logger.info("Configuration loaded:")
         logger.info("  SPACY_MODEL=%s", cls.SPACY_MODEL)
+        logger.info("  SPACY_PIPELINE_PROFILE=%s", cls.SPACY_PIPELINE_PROFILE)
         logger.info("  LLM_ENABLED=%s", cls.LLM_ENABLED)
         logger.info("  MODEL_PROVIDER=%s", cls.MODEL_PROVIDER)
         logger.info("  MODEL_TEMPERATURE=%.2f", cls.MODEL_TEMPERATURE)
@@ -172,14 +229,34 @@ class Config:
         logger.info("  LLM_CONFIDENCE_THRESHOLD=%.2f", cls.LLM_CONFIDENCE_THRESHOLD)
         logger.info("  LLM_JUDGE_ENABLED=%s", cls.LLM_JUDGE_ENABLED)
         logger.info("  BLOCK_CACHE_TTL=%d", cls.BLOCK_CACHE_TTL)
+        logger.info("  DET_BLOCK_CACHE_MAX_ENTRIES=%d", cls.DET_BLOCK_CACHE_MAX_ENTRIES)
         logger.info("  LLM_CHUNK_SIZE=%d", cls.LLM_CHUNK_SIZE)
         logger.info("  LLM_CHUNK_OVERLAP=%d", cls.LLM_CHUNK_OVERLAP)
         logger.info("  LLM_GLOBAL_MIN_WORDS=%d", cls.LLM_GLOBAL_MIN_WORDS)
         logger.info("  LLM_JUDGE_BATCH_SIZE=%d", cls.LLM_JUDGE_BATCH_SIZE)
         logger.info("  FEEDBACK_PERSISTENT=%s", cls.FEEDBACK_PERSISTENT)
+        logger.info("  FEEDBACK_FLUSH_INTERVAL_MS=%d", cls.FEEDBACK_FLUSH_INTERVAL_MS)
+        logger.info("  FEEDBACK_FLUSH_BATCH_SIZE=%d", cls.FEEDBACK_FLUSH_BATCH_SIZE)
         logger.info("  SESSION_TTL_SECONDS=%d", cls.SESSION_TTL_SECONDS)
+        logger.info("  SESSION_MEMORY_BUDGET_MB=%d", cls.SESSION_MEMORY_BUDGET_MB)
+        logger.info("  ANALYSIS_RESULT_CACHE_SECONDS=%s", cls.ANALYSIS_RESULT_CACHE_SECONDS)
+        logger.info("  SOCKET_COMPRESS_MIN_BYTES=%d", cls.SOCKET_COMPRESS_MIN_BYTES)
         logger.info("  CORS_ORIGINS=%s", cls.CORS_ORIGINS)
         logger.info("  RATE_LIMIT_ENABLED=%s", cls.RATE_LIMIT_ENABLED)
+        logger.info("  PDF_RENDER_WORKERS=%d", cls.PDF_RENDER_WORKERS)
+        logger.info("  PDF_EXTRACT_WORKERS=%d", cls.PDF_EXTRACT_WORKERS)
+        logger.info("  PDF_PARALLEL_MIN_PAGES=%d", cls.PDF_PARALLEL_MIN_PAGES)
+        logger.info("  SLOW_PROFILE_ENABLED=%s", cls.SLOW_PROFILE_ENABLED)
+        if cls.SLOW_PROFILE_ENABLED:
+            logger.info(
+                "  SLOW_PROFILE_THRESHOLD_SECONDS=%.1f", cls.SLOW_PROFILE_THRESHOLD_SECONDS,
+            )
+            logger.info("  SLOW_PROFILE_INTERVAL_MS=%.1f", cls.SLOW_PROFILE_INTERVAL_MS)
+            logger.info("  SLOW_PROFILE_CAPACITY=%d", cls.SLOW_PROFILE_CAPACITY)
+            logger.info(
+                "  SLOW_PROFILE_ADMIN_TOKEN=%s",
+                "(set)" if cls.SLOW_PROFILE_ADMIN_TOKEN else "(unset, endpoints disabled)",
+            )
         logger.info("  LANGUAGETOOL_ENABLED=%s", cls.LANGUAGETOOL_ENABLED)
         if cls.LANGUAGETOOL_ENABLED:
             logger.info("  LANGUAGETOOL_URL=%s", cls.LANGUAGETOOL_URL)
@@ -8,10 +8,20 @@ blocking the WebSocket connection.
 Event constants are defined here for reference by other modules:
     - ``EVENT_ANALYSIS_PROGRESS`` — emitted during each pipeline phase
     - ``EVENT_DETERMINISTIC_COMPLETE`` — emitted after Phase 1
+    - ``EVENT_LANGUAGETOOL_COMPLETE`` — emitted when LanguageTool finishes
     - ``EVENT_LLM_GRANULAR_COMPLETE`` — emitted after Phase 2
     - ``EVENT_LLM_GLOBAL_COMPLETE`` — emitted after Phase 3
     - ``EVENT_ANALYSIS_COMPLETE`` — emitted when all phases finish
     - ``EVENT_LLM_SKIPPED`` — emitted when an LLM phase is skipped
+    - ``EVENT_RESULTS_SNAPSHOT`` — full issue set sent to one client
+      that asked to resynchronise (``resync_results``)
+
+Clients send ``update_viewport`` while an analysis runs to move the
+LLM granular pass to the part of the document on screen; see
+:mod:`app.services.analysis.block_priority`.
+
+The ``*_complete`` result events carry versioned deltas of the issue
+set; see :mod:`app.services.session.result_stream`.
 """
 
 import logging
@@ -27,10 +37,12 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 EVENT_ANALYSIS_PROGRESS = "analysis_progress"
 EVENT_DETERMINISTIC_COMPLETE = "deterministic_complete"
+EVENT_LANGUAGETOOL_COMPLETE = "languagetool_complete"
 EVENT_LLM_GRANULAR_COMPLETE = "llm_granular_complete"
 EVENT_LLM_GLOBAL_COMPLETE = "llm_global_complete"
 EVENT_ANALYSIS_COMPLETE = "analysis_complete"
 EVENT_LLM_SKIPPED = "llm_skipped"
+EVENT_RESULTS_SNAPSHOT = "results_snapshot"
 
 
 def register_events() -> None:
@@ -89,6 +101,69 @@ def handle_join_session(data: dict[str, Any]) -> None:
     logger.info("Client %s joined session room %s", sid, session_id)
 
 
+@socketio.on("resync_results")
+def handle_resync_results(data: dict[str, Any]) -> None:
+    """Send a client the full issue set of a session.
+
+    A client asks for this when a result delta does not apply to the
+    version it holds (it joined the room late or missed an event).
+
+    Args:
+        data: Dictionary with ``session_id`` (required).
+    """
+    from flask import request
+
+    from app.services.session.result_stream import encode_payload
+    from app.services.session.store import get_session_store
+
+    sid = getattr(request, "sid", "unknown")
+    session_id = data.get("session_id") if isinstance(data, dict) else None
+    if not session_id:
+        logger.warning("resync_results called without session_id from sid=%s", sid)
+        return
+
+    snapshot = get_session_store().result_stream(session_id).snapshot()
+    payload = {"session_id": session_id, **snapshot}
+    socketio.emit(EVENT_RESULTS_SNAPSHOT, encode_payload(payload), to=sid)
+    logger.debug(
+        "Sent %d-issue snapshot of %s (version %d) to %s",
+        len(snapshot["added"]), session_id, snapshot["version"], sid,
+    )
+
+
+@socketio.on("update_viewport")
+def handle_update_viewport(data: dict[str, Any]) -> None:
+    """Record the part of the document a client is looking at.
+
+    Granular LLM blocks of the session that have not started yet are
+    reordered so the ones nearest the viewport run next.
+
+    Args:
+        data: Dictionary with ``session_id`` (required) and either
+            ``viewport`` (``{"start", "end"}``) or ``cursor``.
+    """
+    from flask import request
+
+    from app.services.analysis.block_priority import parse_priority_hint
+    from app.services.session.store import get_session_store
+
+    sid = getattr(request, "sid", "unknown")
+    session_id = data.get("session_id") if isinstance(data, dict) else None
+    if not session_id:
+        logger.warning("update_viewport called without session_id from sid=%s", sid)
+        return
+    try:
+        hint = parse_priority_hint(data)
+    except ValueError as exc:
+        socketio.emit("error", {"error": str(exc)}, to=sid)
+        return
+    if hint is None:
+        return
+
+    get_session_store().block_priority(session_id).set_focus(hint)
+    logger.debug("Viewport of %s moved to %d-%d", session_id, *hint)
+
+
 @socketio.on("disconnect")
 def handle_disconnect() -> None:
     """Handle a WebSocket client disconnection.
@@ -111,11 +186,14 @@ def handle_start_analysis(data: dict[str, Any]) -> None:
     launches the analysis pipeline in a background task.
 
     Args:
-        data: Dictionary with ``text`` (required) and
-            ``content_type`` (optional, defaults to ``"concept"``).
+        data: Dictionary with ``text`` (required),
+            ``content_type`` (optional, defaults to ``"concept"``) and
+            an optional ``viewport`` or ``cursor`` priority hint.
     """
     from flask import request
 
+    from app.services.analysis.block_priority import parse_priority_hint
+
     sid = getattr(request, "sid", "unknown")
 
     if not isinstance(data, dict):
@@ -128,6 +206,11 @@ def handle_start_analysis(data: dict[str, Any]) -> None:
         return
 
     content_type = _resolve_content_type(data.get("content_type", "concept"))
+    try:
+        priority_hint = parse_priority_hint(data)
+    except ValueError as exc:
+        socketio.emit("error", {"error": str(exc)}, to=sid)
+        return
 
     logger.info(
         "Starting analysis via WebSocket: sid=%s, content_type=%s, text_length=%d",
@@ -135,7 +218,7 @@ def handle_start_analysis(data: dict[str, Any]) -> None:
     )
 
     socketio.start_background_task(
-        _run_analysis_background, text, content_type, sid,
+        _run_analysis_background, text, content_type, sid, priority_hint,
     )
 
 
@@ -160,7 +243,10 @@ def _resolve_content_type(raw_value: str) -> str:
 
 
 def _run_analysis_background(
-    text: str, content_type: str, socket_sid: str
+    text: str,
+    content_type: str,
+    socket_sid: str,
+    priority_hint: tuple[int, int] | None = None,
 ) -> None:
     """Execute the analysis pipeline in a background task.
 
@@ -171,10 +257,11 @@ def _run_analysis_background(
         text: The text to analyze.
         content_type: Validated content type string.
         socket_sid: Socket.IO session ID for progress emission.
+        priority_hint: Character range the writer is looking at, if sent.
     """
     try:
         from app.services.analysis.orchestrator import analyze
-        analyze(text, content_type, socket_sid=socket_sid)
+        analyze(text, content_type, socket_sid=socket_sid, priority_hint=priority_hint)
     except (RuntimeError, OSError, ValueError) as exc:
         logger.error("Background analysis failed: %s", exc, exc_info=True)
         socketio.emit("error", {
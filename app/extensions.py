@@ -26,21 +26,25 @@ _nlp_instance: Optional[Any] = None
 def get_nlp() -> Any:
     """Return the shared SpaCy Language model, loading it on first call.
 
+    Under the ``slim`` pipeline profile, components none of the
+    registered rules read are not loaded (see
+    ``app.services.analysis.nlp_profile``).
+
     Returns:
         The loaded SpaCy Language pipeline.
 
     Raises:
         OSError: If the configured SpaCy model is not installed.
+        ValueError: If ``SPACY_PIPELINE_PROFILE`` is unknown.
     """
     global _nlp_instance  # noqa: PLW0603
     if _nlp_instance is None:
-        import spacy  # noqa: F811 — deferred import to keep startup fast
-
         from app.config import Config
+        from app.services.analysis.nlp_profile import load_nlp
 
         model_name = Config.SPACY_MODEL
         logger.info("Loading SpaCy model: %s", model_name)
-        _nlp_instance = spacy.load(model_name)
+        _nlp_instance = load_nlp(model_name, Config.SPACY_PIPELINE_PROFILE)
         logger.info("SpaCy model loaded successfully")
     return _nlp_instance
 
@@ -3,7 +3,11 @@
 Delegates text generation to ``models.ModelManager`` which supports
 Ollama, generic OpenAI-compatible APIs, and LlamaStack providers.
 Retries transient failures with exponential backoff and runs
-concurrent block-level analysis via a bounded thread pool.
+concurrent block-level analysis via a bounded thread pool.  Analysis
+calls accept a ``cancel_token`` (``models.cancellation``): a cancelled
+token skips calls that have not been sent and aborts in-flight
+requests, raising ``OperationCancelled`` so callers never mistake a
+cancelled call for an empty result.
 
 Usage:
     from app.llm.client import LLMClient
@@ -14,6 +18,7 @@ Usage:
 """
 
 import logging
+import threading
 from concurrent.futures import ThreadPoolExecutor
 
 from tenacity import (
@@ -37,6 +42,12 @@ from app.llm.prompts import (
     build_judge_prompt,
     build_suggestion_prompt,
 )
+from models.cancellation import (
+    CancellationToken,
+    OperationCancelled,
+    estimate_tokens,
+    get_cancellation_stats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -169,6 +180,7 @@ class LLMClient:
         acronym_context: dict[str, str] | None = None,
         document_outline: str | None = None,
         det_issue_count: int = 0,
+        cancel_token: CancellationToken | None = None,
     ) -> list[dict]:
         """Run granular per-block analysis via the LLM.
 
@@ -181,10 +193,14 @@ class LLMClient:
             document_outline: Compact heading outline of the full document.
             det_issue_count: Phase 1 deterministic issue count (messiness signal
                 for dynamic token budget prediction).
+            cancel_token: Cancels the call when the analysis is superseded.
 
         Returns:
             List of issue dicts with ``source="llm"``, or empty list
             on failure or when the LLM is unavailable.
+
+        Raises:
+            OperationCancelled: If *cancel_token* is cancelled.
         """
         if not self.is_available():
             return []
@@ -204,6 +220,7 @@ class LLMClient:
         )
         return self._safe_analysis_call(
             user_prompt, system_prompt=system_prompt, max_tokens=max_tokens,
+            cancel_token=cancel_token,
         )
 
     def analyze_global(
@@ -214,6 +231,7 @@ class LLMClient:
         document_outline: str | None = None,
         abstract_context: str | None = None,
         det_issue_count: int = 0,
+        cancel_token: CancellationToken | None = None,
     ) -> list[dict]:
         """Run global document-level analysis via the LLM.
 
@@ -229,10 +247,14 @@ class LLMClient:
                 for targeted short-description quality evaluation.
             det_issue_count: Phase 1 deterministic issue count (messiness signal
                 for dynamic token budget prediction).
+            cancel_token: Cancels the call when the analysis is superseded.
 
         Returns:
             List of issue dicts with ``source="llm"``, or empty list
             on failure or when the LLM is unavailable.
+
+        Raises:
+            OperationCancelled: If *cancel_token* is cancelled.
         """
         if not self.is_available():
             return []
@@ -250,6 +272,7 @@ class LLMClient:
         )
         return self._safe_analysis_call(
             user_prompt, system_prompt=system_prompt, max_tokens=max_tokens,
+            cancel_token=cancel_token,
         )
 
     def suggest(
@@ -290,6 +313,7 @@ class LLMClient:
         issues: list[dict],
         document_excerpt: str,
         content_type: str,
+        cancel_token: CancellationToken | None = None,
     ) -> tuple[list[int], list[int]]:
         """Run self-correction judge on a batch of LLM issues.
 
@@ -300,10 +324,14 @@ class LLMClient:
             issues: List of issue dicts to review.
             document_excerpt: Representative excerpt for context.
             content_type: Modular documentation type.
+            cancel_token: Cancels the call when the analysis is superseded.
 
         Returns:
             Tuple of (keep_indices, drop_indices).  On failure,
             all issues are kept (fail-open).
+
+        Raises:
+            OperationCancelled: If *cancel_token* is cancelled.
         """
         if not self.is_available() or not issues:
             return list(range(len(issues))), []
@@ -317,6 +345,7 @@ class LLMClient:
                 user_prompt,
                 system_prompt=system_prompt,
                 response_format=_ANALYSIS_RESPONSE_FORMAT_BASIC,
+                _cancel_token=cancel_token,
             )
             if not raw_text:
                 return list(range(len(issues))), []
@@ -394,6 +423,7 @@ class LLMClient:
         prompt: str,
         system_prompt: str = "",
         max_tokens: int | None = None,
+        cancel_token: CancellationToken | None = None,
     ) -> list[dict]:
         """Call the LLM and parse an analysis response safely.
 
@@ -409,9 +439,13 @@ class LLMClient:
             prompt: The user prompt string.
             system_prompt: Invariant system instructions.
             max_tokens: Optional explicit token budget override.
+            cancel_token: Cancels the call when the analysis is superseded.
 
         Returns:
             Parsed issue list, or empty list on any failure.
+
+        Raises:
+            OperationCancelled: If *cancel_token* is cancelled.
         """
         formats = [self._current_analysis_format]
         if self._current_analysis_format is not _ANALYSIS_RESPONSE_FORMAT_BASIC:
@@ -424,6 +458,7 @@ class LLMClient:
                     "system_prompt": system_prompt,
                     "response_format": fmt,
                     "_result_meta": result_meta,
+                    "_cancel_token": cancel_token,
                 }
                 if max_tokens is not None:
                     gen_kwargs["max_tokens"] = max_tokens
@@ -452,7 +487,7 @@ class LLMClient:
                 # On truncation, retry once with a larger budget
                 if truncated:
                     retried = self._retry_truncated_analysis(
-                        prompt, system_prompt, fmt, max_tokens,
+                        prompt, system_prompt, fmt, max_tokens, cancel_token,
                     )
                     if len(retried) > len(issues):
                         return retried
@@ -497,6 +532,7 @@ class LLMClient:
         system_prompt: str,
         fmt: dict,
         original_max_tokens: int | None,
+        cancel_token: CancellationToken | None = None,
     ) -> list[dict]:
         """Retry a truncated analysis call with 1.5x token budget.
 
@@ -505,6 +541,7 @@ class LLMClient:
             system_prompt: The original system prompt.
             fmt: The response format dict to use.
             original_max_tokens: Token budget from the original call.
+            cancel_token: Cancels the call when the analysis is superseded.
 
         Returns:
             Parsed issue list from the retry, or empty list on failure.
@@ -522,6 +559,7 @@ class LLMClient:
                 response_format=fmt,
                 max_tokens=retry_budget,
                 _timeout_override=75,
+                _cancel_token=cancel_token,
             )
             if not raw_text:
                 return []
@@ -577,7 +615,9 @@ class LLMClient:
 
         Retries automatically on connection and timeout errors.
         Extra keyword arguments (e.g. ``response_format``) are
-        forwarded to the provider.
+        forwarded to the provider.  A ``_cancel_token`` keyword skips
+        the call when already cancelled and aborts it in flight; both
+        outcomes are counted in the cancellation stats.
 
         Args:
             prompt: The prompt text to send.
@@ -591,14 +631,32 @@ class LLMClient:
         Raises:
             ConnectionError: On network failures (retried).
             TimeoutError: When the request exceeds the timeout (retried).
+            OperationCancelled: When ``_cancel_token`` is cancelled
+                (not retried).
         """
         if temperature is None:
             temperature = Config.MODEL_ANALYSIS_TEMPERATURE
         if Config.MODEL_SEED is not None:
             kwargs.setdefault("seed", Config.MODEL_SEED)
-        return self._model_manager.generate_text(
-            prompt, temperature=temperature, **kwargs,
-        )
+        cancel_token = kwargs.get("_cancel_token")
+        max_tokens = int(kwargs.get("max_tokens") or Config.MODEL_MAX_TOKENS)
+        if isinstance(cancel_token, CancellationToken) and cancel_token.cancelled:
+            prompt_tokens = estimate_tokens(prompt) + estimate_tokens(
+                str(kwargs.get("system_prompt", "")),
+            )
+            get_cancellation_stats().record_skipped(prompt_tokens + max_tokens)
+            raise OperationCancelled(cancel_token.reason)
+        _track_in_flight(1)
+        try:
+            return self._model_manager.generate_text(
+                prompt, temperature=temperature, **kwargs,
+            )
+        except OperationCancelled:
+            # The prompt was already sent; only the output is saved.
+            get_cancellation_stats().record_aborted(max_tokens)
+            raise
+        finally:
+            _track_in_flight(-1)
 
 
 # ------------------------------------------------------------------
@@ -607,6 +665,23 @@ class LLMClient:
 
 _client_instance: LLMClient | None = None
 
+# Provider calls currently waiting on a completion, across all clients
+_in_flight_lock = threading.Lock()
+_in_flight_calls: int = 0
+
+
+def _track_in_flight(delta: int) -> None:
+    """Adjust the count of provider calls in flight by *delta*."""
+    global _in_flight_calls  # noqa: PLW0603
+    with _in_flight_lock:
+        _in_flight_calls += delta
+
+
+def calls_in_flight() -> int:
+    """Return the number of provider calls waiting on a completion."""
+    with _in_flight_lock:
+        return _in_flight_calls
+
 
 def _get_client() -> LLMClient:
     """Return a lazily-initialized LLMClient singleton.
@@ -631,6 +706,7 @@ def analyze_block(
     style_guide_excerpts: list[dict] | None = None,
     document_outline: str | None = None,
     det_issue_count: int = 0,
+    cancel_token: CancellationToken | None = None,
 ) -> list[dict]:
     """Module-level wrapper for per-block LLM analysis.
 
@@ -644,6 +720,7 @@ def analyze_block(
         style_guide_excerpts: Relevant style guide excerpt dicts.
         document_outline: Compact heading outline of the full document.
         det_issue_count: Phase 1 deterministic issue count.
+        cancel_token: Cancels the call when the analysis is superseded.
 
     Returns:
         List of issue dicts from the LLM, or empty list.
@@ -654,6 +731,7 @@ def analyze_block(
         acronym_context=acronym_context,
         document_outline=document_outline,
         det_issue_count=det_issue_count,
+        cancel_token=cancel_token,
     )
 
 
@@ -664,6 +742,7 @@ def analyze_global(
     document_outline: str | None = None,
     abstract_context: str | None = None,
     det_issue_count: int = 0,
+    cancel_token: CancellationToken | None = None,
 ) -> list[dict]:
     """Module-level wrapper for full-document LLM analysis.
 
@@ -676,6 +755,7 @@ def analyze_global(
         document_outline: Compact heading outline for structural review.
         abstract_context: Module abstract for short-description quality check.
         det_issue_count: Phase 1 deterministic issue count.
+        cancel_token: Cancels the call when the analysis is superseded.
 
     Returns:
         List of issue dicts from the LLM, or empty list.
@@ -685,6 +765,7 @@ def analyze_global(
         document_outline=document_outline,
         abstract_context=abstract_context,
         det_issue_count=det_issue_count,
+        cancel_token=cancel_token,
     )
 
 
@@ -692,6 +773,7 @@ def judge_issues(
     issues: list[dict],
     document_excerpt: str,
     content_type: str,
+    cancel_token: CancellationToken | None = None,
 ) -> tuple[list[int], list[int]]:
     """Module-level wrapper for LLM judge self-correction.
 
@@ -701,8 +783,11 @@ def judge_issues(
         issues: List of issue dicts to review.
         document_excerpt: Representative excerpt for context.
         content_type: Modular documentation type.
+        cancel_token: Cancels the call when the analysis is superseded.
 
     Returns:
         Tuple of (keep_indices, drop_indices).
     """
-    return _get_client().judge_issues(issues, document_excerpt, content_type)
+    return _get_client().judge_issues(
+        issues, document_excerpt, content_type, cancel_token=cancel_token,
+    )
@@ -10,7 +10,9 @@ Each function returns a ``(system_prompt, user_prompt)`` tuple.
 The system prompt contains invariant instructions (role, constraints,
 response format); the user prompt carries the variable data (text,
 excerpts, content type).  Separating them enables provider-side
-prompt caching and reduces per-call token overhead.
+prompt caching and reduces per-call token overhead.  Granular user
+prompts go further: they open with a prefix shared by every block of
+an analysis, formatted once and cached (``granular_prompt_prefix``).
 
 Usage:
     from app.llm.prompts import build_granular_prompt
@@ -23,10 +25,14 @@ Usage:
 import json
 import logging
 import os
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 import yaml
 
+from models.cancellation import estimate_tokens
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -265,6 +271,135 @@ def _append_negative_boundary_examples(
             })
 
 
+# ---------------------------------------------------------------------------
+# Granular prompt
+# ---------------------------------------------------------------------------
+
+# Shared user-prompt prefixes, keyed by content type, outline and
+# excerpts.  A few analyses run at once, each with one or two excerpt
+# sets, so a small LRU is enough.
+_PREFIX_CACHE_MAX_ENTRIES = 32
+_prefix_cache: OrderedDict[tuple, str] = OrderedDict()
+_prefix_cache_lock = threading.Lock()
+
+_GRANULAR_SYSTEM_PROMPT = (
+    "# ROLE\n"
+    "Technical documentation editor (IBM Style, Red Hat Supplementary, "
+    "accessibility, modular docs). Analyze text for judgment-based "
+    "editorial issues only.\n\n"
+    "## IN SCOPE — CHECK these issues\n"
+    "- Comma splices, run-on sentences, semicolons, colons\n"
+    "- Unclear pronouns and complex sentence structure\n"
+    "- Inconsistent tone\n"
+    "- Wordiness — unnecessary words or phrases that can be simplified\n"
+    "- Minimalism — excessive detail or background that does not help "
+    "the reader complete the task\n"
+    "- Anthropomorphism — attributing human actions to software/"
+    "systems (e.g., 'the system wants' or 'the system applies')\n"
+    "- Technical term formatting — specific commands, CLI utilities, "
+    "file paths, directory names, configuration parameters, "
+    "environment variables, and code elements that would appear "
+    "verbatim in a terminal command or configuration file should "
+    "use backtick formatting (e.g., 'ostree' should be "
+    "`ostree`, 'systemctl' should be `systemctl`). Do NOT flag "
+    "general technical concepts or descriptive phrases (e.g., "
+    "'kernel modules', 'system extensions', 'command line options' "
+    "are prose concepts, not code). Do NOT flag text already "
+    "wrapped in **bold** markers (e.g., **Edit**, **Apply**, "
+    "**Routes**) — these are UI element names already formatted "
+    "with bold per the source document. Do NOT flag product names, "
+    "project names, software component names, specification names, "
+    "standard names, framework names, or protocol names used as "
+    "proper nouns in prose (e.g., Dex, Keycloak, Kubernetes "
+    "Operator, Argo CD, Terraform, CloudEvents, OpenTelemetry, "
+    "OAuth, gRPC, Prometheus) — these are prose references to "
+    "software or standards, not code elements that a user would "
+    "type in a terminal or config file. Do NOT flag feature names, "
+    "capability labels, or conceptual proper nouns (e.g., "
+    "'Agent Mapping Modes', 'Technology Preview', 'Image Updater', "
+    "'Network Policy') — these describe features or concepts, "
+    "not code. "
+    "Do NOT flag Kubernetes resource type names written in "
+    "lowercase prose form (e.g., 'config map', 'network policy', "
+    "'custom resource', 'deployment', 'service', 'secret', "
+    "'pod', 'namespace') — only flag the CamelCase API kind "
+    "(e.g., `ConfigMap`, `NetworkPolicy`) when used as code\n"
+    "- Future tense — use simple present tense instead of 'will' "
+    "(e.g., 'the installation will fail' → 'the installation fails'; "
+    "'will be used' → 'is used')\n"
+    "- Official naming and capitalization — use the official project "
+    "name capitalization (e.g., 'ostree' should be 'OSTree', "
+    "'openshift' should be 'OpenShift')\n"
+    "- Lead-in sentence case — definition list lead-ins after a colon "
+    "should be lowercase (e.g., 'Where:' → 'where:' when following "
+    "a sentence)\n\n"
+    "## OUT OF SCOPE — SKIP (deterministic rules handle reliably)\n"
+    "- Spelling errors\n"
+    "- Product name casing for Red Hat product names specifically\n"
+    "- Number formatting (numerals vs words)\n"
+    "- List punctuation (trailing commas/semicolons)\n\n"
+    "## OUT OF SCOPE — SKIP (standard technical writing)\n"
+    "- 'placeholder' text\n"
+    "- CLI tool names inside backticks\n"
+    "- Text already between single backtick (`) markers in the input — "
+    "this text is ALREADY code-formatted. NEVER suggest backtick "
+    "formatting for text that already has backticks "
+    "(e.g., `ostree` is already formatted, do not flag it)\n"
+    "- Imperative verb at start of procedure steps\n"
+    "- Technical jargon in appropriate context\n"
+    "- Single-step procedures using a bullet instead of a numbered "
+    "list — correct format per modular docs convention\n"
+    "- List items starting with bare verbs — in technical documentation, "
+    "bullet and definition list items commonly begin with present-tense "
+    "verbs ('Provides', 'Prohibits', 'Includes', 'Built for') when the "
+    "subject is implied by a heading or definition term above. Do NOT "
+    "add subjects (e.g., 'The system provides') or restructure these "
+    "items for parallelism — bare-verb list items are standard "
+    "technical writing convention\n"
+    "- Content inside triple-backtick code blocks — code examples "
+    "are context, not prose to edit\n"
+    "- Markdown structural markers (#, -, 1., >, **, `) — these are "
+    "document formatting, not prose to edit\n"
+    "- Text wrapped in **bold** markers — words like **Edit**, "
+    "**Apply**, **Save** are UI element names (button labels, menu "
+    "items, tab names) already formatted with bold. Do NOT suggest "
+    "backtick formatting for these\n"
+    "- Missing lead-in sentences for standard modular docs sections "
+    "(Prerequisites, Verification, Troubleshooting, Additional resources) "
+    "— these section headings are self-explanatory labels that do not "
+    "require introductory text before their content\n"
+    "- 'by using' constructions — 'by using' after a noun is the "
+    "correct grammatical form per IBM Style Guide (not wordiness). "
+    "Do not flag 'by using' as wordy or suggest removing 'by'\n\n"
+    "## BIAS DIRECTIVE\n"
+    "Flag all clear violations of the style guide rules provided. "
+    "When a pattern clearly violates a rule, flag it regardless of "
+    "severity — the scoring engine handles severity weighting. Only skip "
+    "when the text is genuinely ambiguous or when an alternative reading "
+    "makes the usage correct.\n\n"
+    "## RESPONSE FORMAT\n"
+    "Respond with a JSON object containing a \"reasoning\" string "
+    "and an \"issues\" array.\n"
+    "Keep the \"reasoning\" field concise — 2-3 sentences maximum. "
+    "Prioritize the \"issues\" array over detailed reasoning.\n"
+    "In \"reasoning\", briefly confirm which of the above IN SCOPE "
+    "checks you applied and note any categories where you found "
+    "no issues.\n"
+    "Each object in the \"issues\" array:\n"
+    '{"flagged_text":"exact span","message":"explanation",'
+    '"suggestions":["corrected text"],"severity":"low|medium|high",'
+    '"category":"style|grammar|punctuation|structure|audience",'
+    '"sentence":"full sentence","sentence_index":0,"confidence":0.8}\n\n'
+    "IMPORTANT: suggestions must contain at least one concrete "
+    "replacement for the flagged_text. Provide the corrected version "
+    "of the flagged span that fixes the issue. Do not leave "
+    "suggestions empty. Keep suggestions scoped to the flagged_text "
+    "span only — do not rewrite surrounding text.\n\n"
+    "No issues → {\"reasoning\":\"...\",\"issues\":[]}. "
+    "Return ONLY JSON, no additional text."
+)
+
+
 def build_granular_prompt(
     text: str,
     sentences: list[str],
@@ -276,8 +411,12 @@ def build_granular_prompt(
     """Build a per-block granular analysis prompt.
 
     Returns a ``(system_prompt, user_prompt)`` tuple.  The system
-    prompt is invariant across blocks; the user prompt carries the
-    variable content.
+    prompt is invariant across blocks.  The user prompt opens with the
+    sections every block of an analysis shares (see
+    :func:`granular_prompt_prefix`), byte-identical from block to
+    block so providers that cache prompt prefixes (vLLM, LlamaStack)
+    reuse them, and ends with the block's own acronyms, text and
+    sentences.
 
     Args:
         text: The text block to analyse.
@@ -297,144 +436,75 @@ def build_granular_prompt(
     Returns:
         Tuple of (system_prompt, user_prompt).
     """
-    excerpt_section = _format_excerpt_section(style_guide_excerpts)
-    acronym_section = _format_acronym_section(acronym_context, text)
-    examples_section = _format_analysis_examples(content_type)
-    outline_section = _format_document_outline(document_outline)
-    sentences_json = json.dumps(sentences, ensure_ascii=False)
-    content_guidance = _content_type_guidance(content_type)
-
-    system_prompt = (
-        "# ROLE\n"
-        "Technical documentation editor (IBM Style, Red Hat Supplementary, "
-        "accessibility, modular docs). Analyze text for judgment-based "
-        "editorial issues only.\n\n"
-        "## IN SCOPE — CHECK these issues\n"
-        "- Comma splices, run-on sentences, semicolons, colons\n"
-        "- Unclear pronouns and complex sentence structure\n"
-        "- Inconsistent tone\n"
-        "- Wordiness — unnecessary words or phrases that can be simplified\n"
-        "- Minimalism — excessive detail or background that does not help "
-        "the reader complete the task\n"
-        "- Anthropomorphism — attributing human actions to software/"
-        "systems (e.g., 'the system wants' or 'the system applies')\n"
-        "- Technical term formatting — specific commands, CLI utilities, "
-        "file paths, directory names, configuration parameters, "
-        "environment variables, and code elements that would appear "
-        "verbatim in a terminal command or configuration file should "
-        "use backtick formatting (e.g., 'ostree' should be "
-        "`ostree`, 'systemctl' should be `systemctl`). Do NOT flag "
-        "general technical concepts or descriptive phrases (e.g., "
-        "'kernel modules', 'system extensions', 'command line options' "
-        "are prose concepts, not code). Do NOT flag text already "
-        "wrapped in **bold** markers (e.g., **Edit**, **Apply**, "
-        "**Routes**) — these are UI element names already formatted "
-        "with bold per the source document. Do NOT flag product names, "
-        "project names, software component names, specification names, "
-        "standard names, framework names, or protocol names used as "
-        "proper nouns in prose (e.g., Dex, Keycloak, Kubernetes "
-        "Operator, Argo CD, Terraform, CloudEvents, OpenTelemetry, "
-        "OAuth, gRPC, Prometheus) — these are prose references to "
-        "software or standards, not code elements that a user would "
-        "type in a terminal or config file. Do NOT flag feature names, "
-        "capability labels, or conceptual proper nouns (e.g., "
-        "'Agent Mapping Modes', 'Technology Preview', 'Image Updater', "
-        "'Network Policy') — these describe features or concepts, "
-        "not code. "
-        "Do NOT flag Kubernetes resource type names written in "
-        "lowercase prose form (e.g., 'config map', 'network policy', "
-        "'custom resource', 'deployment', 'service', 'secret', "
-        "'pod', 'namespace') — only flag the CamelCase API kind "
-        "(e.g., `ConfigMap`, `NetworkPolicy`) when used as code\n"
-        "- Future tense — use simple present tense instead of 'will' "
-        "(e.g., 'the installation will fail' → 'the installation fails'; "
-        "'will be used' → 'is used')\n"
-        "- Official naming and capitalization — use the official project "
-        "name capitalization (e.g., 'ostree' should be 'OSTree', "
-        "'openshift' should be 'OpenShift')\n"
-        "- Lead-in sentence case — definition list lead-ins after a colon "
-        "should be lowercase (e.g., 'Where:' → 'where:' when following "
-        "a sentence)\n\n"
-        "## OUT OF SCOPE — SKIP (deterministic rules handle reliably)\n"
-        "- Spelling errors\n"
-        "- Product name casing for Red Hat product names specifically\n"
-        "- Number formatting (numerals vs words)\n"
-        "- List punctuation (trailing commas/semicolons)\n\n"
-        "## OUT OF SCOPE — SKIP (standard technical writing)\n"
-        "- 'placeholder' text\n"
-        "- CLI tool names inside backticks\n"
-        "- Text already between single backtick (`) markers in the input — "
-        "this text is ALREADY code-formatted. NEVER suggest backtick "
-        "formatting for text that already has backticks "
-        "(e.g., `ostree` is already formatted, do not flag it)\n"
-        "- Imperative verb at start of procedure steps\n"
-        "- Technical jargon in appropriate context\n"
-        "- Single-step procedures using a bullet instead of a numbered "
-        "list — correct format per modular docs convention\n"
-        "- List items starting with bare verbs — in technical documentation, "
-        "bullet and definition list items commonly begin with present-tense "
-        "verbs ('Provides', 'Prohibits', 'Includes', 'Built for') when the "
-        "subject is implied by a heading or definition term above. Do NOT "
-        "add subjects (e.g., 'The system provides') or restructure these "
-        "items for parallelism — bare-verb list items are standard "
-        "technical writing convention\n"
-        "- Content inside triple-backtick code blocks — code examples "
-        "are context, not prose to edit\n"
-        "- Markdown structural markers (#, -, 1., >, **, `) — these are "
-        "document formatting, not prose to edit\n"
-        "- Text wrapped in **bold** markers — words like **Edit**, "
-        "**Apply**, **Save** are UI element names (button labels, menu "
-        "items, tab names) already formatted with bold. Do NOT suggest "
-        "backtick formatting for these\n"
-        "- Missing lead-in sentences for standard modular docs sections "
-        "(Prerequisites, Verification, Troubleshooting, Additional resources) "
-        "— these section headings are self-explanatory labels that do not "
-        "require introductory text before their content\n"
-        "- 'by using' constructions — 'by using' after a noun is the "
-        "correct grammatical form per IBM Style Guide (not wordiness). "
-        "Do not flag 'by using' as wordy or suggest removing 'by'\n\n"
-        "## BIAS DIRECTIVE\n"
-        "Flag all clear violations of the style guide rules provided. "
-        "When a pattern clearly violates a rule, flag it regardless of "
-        "severity — the scoring engine handles severity weighting. Only skip "
-        "when the text is genuinely ambiguous or when an alternative reading "
-        "makes the usage correct.\n\n"
-        "## RESPONSE FORMAT\n"
-        "Respond with a JSON object containing a \"reasoning\" string "
-        "and an \"issues\" array.\n"
-        "Keep the \"reasoning\" field concise — 2-3 sentences maximum. "
-        "Prioritize the \"issues\" array over detailed reasoning.\n"
-        "In \"reasoning\", briefly confirm which of the above IN SCOPE "
-        "checks you applied and note any categories where you found "
-        "no issues.\n"
-        "Each object in the \"issues\" array:\n"
-        '{"flagged_text":"exact span","message":"explanation",'
-        '"suggestions":["corrected text"],"severity":"low|medium|high",'
-        '"category":"style|grammar|punctuation|structure|audience",'
-        '"sentence":"full sentence","sentence_index":0,"confidence":0.8}\n\n'
-        "IMPORTANT: suggestions must contain at least one concrete "
-        "replacement for the flagged_text. Provide the corrected version "
-        "of the flagged span that fixes the issue. Do not leave "
-        "suggestions empty. Keep suggestions scoped to the flagged_text "
-        "span only — do not rewrite surrounding text.\n\n"
-        "No issues → {\"reasoning\":\"...\",\"issues\":[]}. "
-        "Return ONLY JSON, no additional text."
+    prefix = granular_prompt_prefix(
+        content_type, style_guide_excerpts, document_outline,
     )
-
-    user_prompt = (
-        f"## Document Type: {content_type}\n\n"
-        f"{content_guidance}\n\n"
-        f"{outline_section}"
-        f"{excerpt_section}"
-        f"{acronym_section}"
-        f"{examples_section}"
+    block_section = (
+        f"{_format_acronym_section(acronym_context, text)}"
         "## Text Block\n\n"
         f"```\n{text}\n```\n\n"
         "## Sentences\n\n"
-        f"{sentences_json}"
+        f"{json.dumps(sentences, ensure_ascii=False)}"
     )
+    logger.debug(
+        "Granular prompt tokens: system=%d shared=%d block=%d",
+        estimate_tokens(_GRANULAR_SYSTEM_PROMPT), estimate_tokens(prefix),
+        estimate_tokens(block_section),
+    )
+    return _GRANULAR_SYSTEM_PROMPT, prefix + block_section
 
-    return system_prompt, user_prompt
+
+def granular_prompt_prefix(
+    content_type: str,
+    style_guide_excerpts: list[dict] | None,
+    document_outline: str | None = None,
+) -> str:
+    """Return the part of a granular user prompt shared by all blocks.
+
+    Content-type guidance, the document outline, the style guide
+    excerpts and the analysis examples depend only on the analysis,
+    not on the block, so they are formatted once and cached.  Blocks
+    that start after the excerpts are refined (see the orchestrator's
+    ``_ExcerptSource``) get a second prefix.
+
+    Args:
+        content_type: Modular documentation type.
+        style_guide_excerpts: Relevant style guide excerpt dicts.
+        document_outline: Compact heading outline of the full document.
+
+    Returns:
+        The shared prompt sections, ending with a blank line.
+    """
+    key = (
+        content_type,
+        document_outline or "",
+        tuple(
+            (item.get("guide_name"), item.get("topic"), item.get("excerpt"))
+            for item in style_guide_excerpts or ()
+        ),
+    )
+    with _prefix_cache_lock:
+        prefix = _prefix_cache.get(key)
+        if prefix is not None:
+            _prefix_cache.move_to_end(key)
+            return prefix
+
+    prefix = (
+        f"## Document Type: {content_type}\n\n"
+        f"{_content_type_guidance(content_type)}\n\n"
+        f"{_format_document_outline(document_outline)}"
+        f"{_format_excerpt_section(style_guide_excerpts or [])}"
+        f"{_format_analysis_examples(content_type)}"
+    )
+    with _prefix_cache_lock:
+        _prefix_cache[key] = prefix
+        while len(_prefix_cache) > _PREFIX_CACHE_MAX_ENTRIES:
+            _prefix_cache.popitem(last=False)
+    logger.info(
+        "Built granular prompt prefix for %s: system=%d tokens, shared=%d tokens",
+        content_type, estimate_tokens(_GRANULAR_SYSTEM_PROMPT), estimate_tokens(prefix),
+    )
+    return prefix
 
 
 def build_global_prompt(
@@ -0,0 +1,215 @@
+"""Compact storage and fast JSON encoding for analysis issues.
+
+A long document produces hundreds of issues, and most of their text is
+repeated: many issues share a sentence, and a rule produces the same
+message and citation over and over.  ``compact_issues`` makes equal
+strings share one object — sentences are taken from the document's
+sentence list by ``sentence_index`` where they match — so a session
+holds each distinct string once.
+
+``dumps`` writes a payload containing issue lists straight to JSON
+without building a dict per issue, encoding each distinct string once.
+Its output parses to exactly what ``json.dumps`` of the ``to_dict()``
+form gives, except that a NaN or infinite confidence is written as
+``null`` so the output stays valid JSON.
+"""
+
+import json
+import logging
+import math
+from json.encoder import encode_basestring_ascii
+from typing import Any, Iterable, Optional, Sequence
+
+from app.models.schemas import IssueResponse
+
+logger = logging.getLogger(__name__)
+
+
+class StringTable:
+    """Maps each distinct string to one shared instance."""
+
+    __slots__ = ("_strings",)
+
+    def __init__(self) -> None:
+        """Create an empty table."""
+        self._strings: dict[str, str] = {}
+
+    def intern(self, value: str) -> str:
+        """Return the shared instance equal to *value*.
+
+        Args:
+            value: Any string.
+
+        Returns:
+            The first string seen that equals *value*.
+        """
+        return self._strings.setdefault(value, value)
+
+    def __len__(self) -> int:
+        """Return the number of distinct strings held."""
+        return len(self._strings)
+
+
+def compact_issues(
+    issues: Iterable[IssueResponse],
+    sentences: Optional[Sequence[str]] = None,
+    table: Optional[StringTable] = None,
+) -> StringTable:
+    """Share repeated strings between *issues*, in place.
+
+    Args:
+        issues: Issues to compact.
+        sentences: The document's sentence list; an issue whose
+            sentence equals ``sentences[sentence_index]`` references
+            that string.
+        table: Table to intern into (a new one when omitted), so
+            several batches of one document can share strings.
+
+    Returns:
+        The string table used.
+    """
+    if table is None:
+        table = StringTable()
+    intern = table.intern
+    sentence_count = len(sentences) if sentences is not None else 0
+    for issue in issues:
+        index = issue.sentence_index
+        if 0 <= index < sentence_count and sentences[index] == issue.sentence:
+            issue.sentence = sentences[index]
+        else:
+            issue.sentence = intern(issue.sentence)
+        issue.message = intern(issue.message)
+        issue.style_guide_citation = intern(issue.style_guide_citation)
+        issue.flagged_text = intern(issue.flagged_text)
+        issue.rule_name = intern(issue.rule_name)
+        issue.source = intern(issue.source)
+        issue.suggestions = [intern(s) for s in issue.suggestions]
+        issue.span = [int(issue.span[0]), int(issue.span[1])] if issue.span else [0, 0]
+    return table
+
+
+def issues_to_json(issues: Iterable[IssueResponse]) -> str:
+    """Encode issues as a JSON array.
+
+    Args:
+        issues: Issues to encode.
+
+    Returns:
+        JSON text equivalent to ``json.dumps([i.to_dict() for i in issues])``.
+    """
+    return _IssueEncoder().encode_list(issues)
+
+
+def dumps(payload: dict[str, Any]) -> str:
+    """Encode a payload whose values may include lists of issues.
+
+    Top-level values that are lists of ``IssueResponse`` use the fast
+    issue encoder; everything else goes through ``json.dumps``.
+
+    Args:
+        payload: The payload dictionary.
+
+    Returns:
+        Compact JSON text.
+    """
+    encoder = _IssueEncoder()
+    parts = []
+    for key, value in payload.items():
+        if _is_issue_list(value):
+            encoded = encoder.encode_list(value)
+        else:
+            encoded = json.dumps(value, separators=(",", ":"))
+        parts.append(encode_basestring_ascii(str(key)) + ":" + encoded)
+    return "{" + ",".join(parts) + "}"
+
+
+def to_plain(payload: dict[str, Any]) -> dict[str, Any]:
+    """Replace top-level issue lists in *payload* with their dicts.
+
+    Args:
+        payload: The payload dictionary.
+
+    Returns:
+        A shallow copy safe for any JSON serializer.
+    """
+    return {
+        key: [issue.to_dict() for issue in value] if _is_issue_list(value) else value
+        for key, value in payload.items()
+    }
+
+
+def _is_issue_list(value: Any) -> bool:
+    """Whether *value* is a non-empty list of IssueResponse objects."""
+    return isinstance(value, list) and bool(value) and isinstance(value[0], IssueResponse)
+
+
+# One issue as JSON, in IssueResponse.to_dict() key order, for issues
+# whose numbers are ints and a finite float confidence: repr() of a
+# finite float is its JSON form.  Other issues go through to_dict().
+_ISSUE_TEMPLATE = (
+    '{"id":%s,"source":%s,"category":%s,"rule_name":%s,"flagged_text":%s,'
+    '"message":%s,"suggestions":[%s],"severity":%s,"sentence":%s,'
+    '"sentence_index":%d,"span":[%d,%d],"style_guide_citation":%s,'
+    '"confidence":%r,"status":%s}'
+)
+
+
+class _IssueEncoder:
+    """Encodes issues, caching the JSON form of each distinct string."""
+
+    __slots__ = ("_strings",)
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+
+    def encode_list(self, issues: Iterable[IssueResponse]) -> str:
+        """Encode *issues* as a JSON array."""
+        return "[" + ",".join(self._encode(issue) for issue in issues) + "]"
+
+    def _str(self, value: str) -> str:
+        encoded = self._strings.get(value)
+        if encoded is None:
+            encoded = self._strings[value] = encode_basestring_ascii(value)
+        return encoded
+
+    def _encode(self, issue: IssueResponse) -> str:
+        # Category, severity and status are str enums (or plain
+        # strings); either encodes to the value.
+        s = self._str
+        start, end = issue.span
+        if not (
+            type(issue.sentence_index) is int
+            and type(start) is int
+            and type(end) is int
+            and type(issue.confidence) is float
+            and math.isfinite(issue.confidence)
+        ):
+            return _encode_dict(issue)
+        return _ISSUE_TEMPLATE % (
+            encode_basestring_ascii(issue.id),
+            s(issue.source),
+            s(issue.category),
+            s(issue.rule_name),
+            s(issue.flagged_text),
+            s(issue.message),
+            ",".join([s(x) for x in issue.suggestions]),
+            s(issue.severity),
+            s(issue.sentence),
+            issue.sentence_index,
+            start, end,
+            s(issue.style_guide_citation),
+            issue.confidence,
+            s(issue.status),
+        )
+
+
+def _encode_dict(issue: IssueResponse) -> str:
+    """Encode *issue* through its ``to_dict()`` form.
+
+    A NaN or infinite confidence becomes ``null``.
+    """
+    data = issue.to_dict()
+    confidence = data["confidence"]
+    if isinstance(confidence, float) and not math.isfinite(confidence):
+        data["confidence"] = None
+    return json.dumps(data, separators=(",", ":"))
@@ -51,12 +51,14 @@ class AnalyzeRequest:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueResponse:
     """A single editorial issue found during content analysis.
 
     Represents one flagged problem in the analyzed text, including its
     location, category, severity, suggested fixes, and lifecycle status.
+    Slotted: a session holds hundreds of these.  Repeated strings are
+    shared between issues by :func:`app.models.issue_codec.compact_issues`.
 
     Attributes:
         id: Unique identifier for this issue instance.
@@ -329,3 +331,25 @@ class AnalyzeResponse:
             "report": self.report.to_dict(),
             "detected_content_type": self.detected_content_type,
         }
+
+    def to_json(self) -> str:
+        """Serialize straight to JSON text.
+
+        Equivalent to ``json.dumps(self.to_dict())`` but encodes issues
+        without an intermediate dict each, and each distinct string
+        (shared sentences, messages, citations) only once.
+
+        Returns:
+            Compact JSON text.
+        """
+        from app.models.issue_codec import dumps
+
+        return dumps({
+            "success": True,
+            "session_id": self.session_id,
+            "partial": self.partial,
+            "issues": self.issues,
+            "score": self.score.to_dict(),
+            "report": self.report.to_dict(),
+            "detected_content_type": self.detected_content_type,
+        })
@@ -0,0 +1,227 @@
+"""Viewport-first ordering of LLM granular blocks.
+
+On a long guide the granular pass has hundreds of blocks and only
+``LLM_MAX_CONCURRENT`` run at once, so the order they are started in
+decides when the writer sees feedback for the section on screen.  The
+client sends a priority hint with ``/analyze`` or ``start_analysis``
+(the visible character range, or the cursor offset) and updates it
+with ``update_viewport`` while the analysis runs.
+
+Each session has one ``BlockPriority`` (see
+``SessionStore.block_priority``).  The granular scheduler hands pending
+blocks to its workers through a ``BlockQueue`` that asks the priority
+which block is nearest the viewport each time a worker becomes free,
+so a hint that changes mid-flight reorders the blocks not yet started.
+Without a hint blocks run in document order.
+
+Offsets are in original-text coordinates, the same as issue spans.
+:func:`pending_blocks` reports how many blocks are waiting across the
+process's live queues, for the health endpoint.
+"""
+
+import threading
+import weakref
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Queues of the granular passes now running; entries go with their pass
+_live_queues: "weakref.WeakSet[BlockQueue]" = weakref.WeakSet()
+_live_queues_lock = threading.Lock()
+
+
+class BlockPriority:
+    """The part of a document its writer is looking at.
+
+    Thread-safe: the socket handler updates the focus while scheduler
+    workers read it.
+    """
+
+    def __init__(self) -> None:
+        """Create a priority with no focus (document order)."""
+        self._lock = threading.Lock()
+        self._focus: Optional[tuple[int, int]] = None
+
+    @property
+    def focus(self) -> Optional[tuple[int, int]]:
+        """The focused ``(start, end)`` range, or None."""
+        with self._lock:
+            return self._focus
+
+    def set_focus(self, span: Optional[tuple[int, int]]) -> None:
+        """Focus on a character range; None returns to document order.
+
+        Args:
+            span: ``(start, end)`` in original-text coordinates.  A
+                cursor is an empty range.
+        """
+        with self._lock:
+            self._focus = span
+
+    def distance(self, span: tuple[int, int]) -> int:
+        """Return how far a block lies from the focused range.
+
+        Args:
+            span: The block's ``(start, end)`` range.
+
+        Returns:
+            0 when the block overlaps the focus (or nothing is
+            focused), otherwise the number of characters between them.
+        """
+        focus = self.focus
+        if focus is None:
+            return 0
+        start, end = span
+        focus_start, focus_end = focus
+        if end < focus_start:
+            return focus_start - end
+        if start > focus_end:
+            return start - focus_end
+        return 0
+
+
+class BlockQueue(Generic[T]):
+    """Pending blocks handed out nearest the focus first.
+
+    Items are ordered by :meth:`BlockPriority.distance` of their span,
+    then by position in the document.  The order is decided at every
+    :meth:`pop`, so it follows focus changes.
+    """
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        spans: Sequence[tuple[int, int]],
+        priority: Optional[BlockPriority] = None,
+    ) -> None:
+        """Queue *items* with their document spans.
+
+        Args:
+            items: The pending blocks, in document order.
+            spans: One ``(start, end)`` per item.
+            priority: Focus to order by; document order when None.
+        """
+        self._lock = threading.Lock()
+        self._pending: list[tuple[int, tuple[int, int], T]] = [
+            (position, span, item)
+            for position, (span, item) in enumerate(zip(spans, items))
+        ]
+        self._priority = priority
+        with _live_queues_lock:
+            _live_queues.add(self)
+
+    def pop(self) -> Optional[T]:
+        """Remove and return the most relevant pending item.
+
+        Returns:
+            The item nearest the focus, or None when the queue is empty.
+        """
+        with self._lock:
+            if not self._pending:
+                return None
+            if self._priority is None:
+                return self._pending.pop(0)[2]
+            distance = self._priority.distance
+            best = min(
+                range(len(self._pending)),
+                key=lambda i: (distance(self._pending[i][1]), self._pending[i][0]),
+            )
+            return self._pending.pop(best)[2]
+
+    def __len__(self) -> int:
+        """Return the number of items not yet handed out."""
+        with self._lock:
+            return len(self._pending)
+
+
+def pending_blocks() -> int:
+    """Return the number of granular blocks waiting for a worker.
+
+    Counts every live :class:`BlockQueue` in this process.
+    """
+    with _live_queues_lock:
+        queues = list(_live_queues)
+    return sum(len(queue) for queue in queues)
+
+
+def locate_blocks(
+    blocks: Sequence[str], text: str, offset_map: Sequence[int],
+) -> list[tuple[int, int]]:
+    """Find where each LLM block lies in the original text.
+
+    Blocks are searched for in order in *text* (the text they were cut
+    from), falling back to their first line when they were reformatted,
+    and mapped to original-text coordinates through *offset_map*.  A
+    block that cannot be found is placed where the previous one ended.
+
+    Args:
+        blocks: Text blocks, in document order.
+        text: The text the blocks were cut from.
+        offset_map: Mapping from *text* positions to original-text
+            positions; empty when they coincide.
+
+    Returns:
+        One ``(start, end)`` range per block.
+    """
+    spans: list[tuple[int, int]] = []
+    cursor = 0
+    for block in blocks:
+        start = text.find(block, cursor) if block else -1
+        end = start + len(block)
+        if start < 0:
+            first_line = block.strip().split("\n", 1)[0].strip()
+            start = text.find(first_line, cursor) if first_line else -1
+            end = min(len(text), start + len(block))
+        if start < 0:
+            start = end = spans[-1][1] if spans else 0
+            spans.append((start, end))
+            continue
+        cursor = start + 1
+        spans.append((_to_original(start, offset_map), _to_original(end, offset_map)))
+    return spans
+
+
+def _to_original(position: int, offset_map: Sequence[int]) -> int:
+    """Map a position through *offset_map*, clamping to its ends."""
+    if not offset_map:
+        return position
+    return offset_map[max(0, min(position, len(offset_map) - 1))]
+
+
+def parse_priority_hint(data: dict[str, Any]) -> Optional[tuple[int, int]]:
+    """Read the priority hint of an analysis or viewport request.
+
+    Accepts ``{"viewport": {"start": int, "end": int}}`` or
+    ``{"cursor": int}``; the viewport wins when both are given.
+
+    Args:
+        data: The request payload.
+
+    Returns:
+        ``(start, end)`` in original-text coordinates, or None when the
+        payload carries no hint.
+
+    Raises:
+        ValueError: If the hint is present but malformed.
+    """
+    viewport = data.get("viewport")
+    if viewport is not None:
+        if not isinstance(viewport, dict):
+            raise ValueError("Field 'viewport' must be an object with 'start' and 'end'")
+        start, end = viewport.get("start"), viewport.get("end")
+        if not _is_offset(start) or not _is_offset(end) or end < start:
+            raise ValueError(
+                "Field 'viewport' needs non-negative integer 'start' <= 'end'"
+            )
+        return start, end
+    cursor = data.get("cursor")
+    if cursor is not None:
+        if not _is_offset(cursor):
+            raise ValueError("Field 'cursor' must be a non-negative integer")
+        return cursor, cursor
+    return None
+
+
+def _is_offset(value: Any) -> bool:
+    """Whether *value* is a non-negative int (bools excluded)."""
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
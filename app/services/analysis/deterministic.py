@@ -6,11 +6,13 @@ IssueResponse dataclass with proper category mapping, span calculation,
 confidence scoring, and style guide citations.
 """
 
+import functools
 import logging
 import uuid
 from typing import Any
 
 from app.models.enums import IssueCategory, IssueSeverity, IssueStatus
+from app.models.issue_codec import compact_issues
 from app.models.schemas import IssueResponse
 from rules import get_registry
 from style_guides.registry import (
@@ -99,6 +101,8 @@ def analyze(
 
     # Deduplicate issues with identical flagged_text + sentence
     issues = _deduplicate_issues(issues)
+    # Reference the block's sentence strings and share repeated messages
+    compact_issues(issues, sentences)
 
     logger.info("Normalized to %d issues after filtering", len(issues))
     return issues
@@ -302,12 +306,14 @@ def _resolve_span(
     return [0, 0]
 
 
+@functools.lru_cache(maxsize=None)
 def _resolve_citation(rule_type: str) -> str:
     """Retrieve the formatted style guide citation for a rule.
 
     Uses ``format_citation`` first for page-level citations. When
     that falls back to the generic default, attempts ``get_citation``
-    to extract a topic-qualified citation instead.
+    to extract a topic-qualified citation instead.  Cached so every
+    issue of a rule shares one citation string.
 
     Args:
         rule_type: The rule's type identifier string.
@@ -17,6 +17,7 @@ import logging
 import os
 import re
 import uuid
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -100,6 +101,15 @@ _HINT_GATED_CATEGORIES: frozenset[str] = frozenset({
     "STYLE",
 })
 
+# LT categories suppressed when the flagged text is a known domain term.
+# GRAMMAR is deliberately absent — known terms can still have grammar errors.
+_REGISTRY_GATED_CATEGORIES: frozenset[str] = frozenset({
+    "TYPOS",
+    "CASING",
+    "CONFUSED_WORDS",
+    "STYLE",
+})
+
 # ---------------------------------------------------------------------------
 # Domain-aware spelling allowlist — loaded from YAML
 # ---------------------------------------------------------------------------
@@ -200,14 +210,63 @@ class _Batch:
 # UTF-16 offset conversion
 # ---------------------------------------------------------------------------
 
-def _utf16_to_codepoint_offset(text: str, utf16_offset: int) -> int:
-    """Convert a Java UTF-16 code-unit offset to a Python character index.
+def _build_utf16_offset_table(text: str) -> list[int] | None:
+    """Build a UTF-16 code-unit → Python index table for *text*.
 
     Java strings use UTF-16 internally, so characters outside the Basic
     Multilingual Plane (emojis, math symbols) occupy 2 code units in
     Java but 1 codepoint in Python.  Without conversion, every LT
     offset after such a character would be shifted.
 
+    The table is built once per batch so each match offset resolves
+    in O(1).  ``table[u]`` is the Python index for code unit ``u``; a
+    unit pointing between the two halves of a surrogate pair maps
+    past the astral character, as decoding the truncated prefix would.
+
+    Args:
+        text: The Python string that was sent to LanguageTool.
+
+    Returns:
+        A list of ``utf16_length + 1`` indices, or None when *text* has
+        no astral-plane characters and offsets map one-to-one.
+    """
+    if not text or max(text) < "\U00010000":
+        return None
+    table: list[int] = []
+    for idx, ch in enumerate(text):
+        table.append(idx)
+        if ch >= "\U00010000":
+            table.append(idx + 1)
+    table.append(len(text))
+    return table
+
+
+def _resolve_utf16_offset(
+    table: list[int] | None, text_length: int, utf16_offset: int,
+) -> int:
+    """Look up a UTF-16 offset in a table from ``_build_utf16_offset_table``.
+
+    Args:
+        table: The batch's offset table, or None for identity mapping.
+        text_length: Python length of the batch text.
+        utf16_offset: The character offset from LT's JSON response.
+
+    Returns:
+        The corresponding Python string index, clamped to the text.
+    """
+    if utf16_offset <= 0:
+        return 0
+    if table is None:
+        return min(utf16_offset, text_length)
+    return table[min(utf16_offset, len(table) - 1)]
+
+
+def _utf16_to_codepoint_offset(text: str, utf16_offset: int) -> int:
+    """Convert a Java UTF-16 code-unit offset to a Python character index.
+
+    Convenience wrapper for a single lookup; batch processing builds
+    the table once with ``_build_utf16_offset_table`` instead.
+
     Args:
         text: The Python string that was sent to LanguageTool.
         utf16_offset: The character offset from LT's JSON response.
@@ -215,12 +274,9 @@ def _utf16_to_codepoint_offset(text: str, utf16_offset: int) -> int:
     Returns:
         The corresponding Python string index.
     """
-    encoded = text.encode("utf-16-le")
-    byte_offset = utf16_offset * 2
-    if byte_offset > len(encoded):
-        byte_offset = len(encoded)
-    sliced = encoded[:byte_offset]
-    return len(sliced.decode("utf-16-le", errors="replace"))
+    return _resolve_utf16_offset(
+        _build_utf16_offset_table(text), len(text), utf16_offset,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -332,31 +388,41 @@ def _find_entry_for_offset(
     entries: list[_BatchEntry],
     py_offset: int,
     match_length: int,
+    starts: list[int] | None = None,
 ) -> _BatchEntry | None:
     """Find the batch entry that owns a given offset.
 
     Discards cross-boundary matches (where the flagged span bleeds
     from one block into the next across the ``\\n\\n`` separator).
+    Entries are ordered and non-overlapping, so the owner is found by
+    binary search over their start offsets.
 
     Args:
         entries: Batch entries with offset ranges.
         py_offset: Python codepoint offset within the batch.
         match_length: Length of the flagged text.
+        starts: Pre-computed ``batch_start`` of every entry; built on
+            the fly when omitted.
 
     Returns:
         The owning entry, or None if the match spans a boundary.
     """
-    for entry in entries:
-        if entry.batch_start <= py_offset < entry.batch_end:
-            if py_offset + match_length > entry.batch_end:
-                logger.debug(
-                    "Discarding cross-boundary LT match at offset %d "
-                    "(block ends at %d, match length %d)",
-                    py_offset, entry.batch_end, match_length,
-                )
-                return None
-            return entry
-    return None
+    if starts is None:
+        starts = [entry.batch_start for entry in entries]
+    pos = bisect_right(starts, py_offset) - 1
+    if pos < 0:
+        return None
+    entry = entries[pos]
+    if py_offset >= entry.batch_end:
+        return None
+    if py_offset + match_length > entry.batch_end:
+        logger.debug(
+            "Discarding cross-boundary LT match at offset %d "
+            "(block ends at %d, match length %d)",
+            py_offset, entry.batch_end, match_length,
+        )
+        return None
+    return entry
 
 
 def _map_lt_match_to_issue(
@@ -523,6 +589,23 @@ def _call_languagetool(
 # ---------------------------------------------------------------------------
 
 
+def _classify_flagged_text(flagged: str) -> tuple[bool, bool, bool, bool]:
+    """Evaluate the text-only FP guards for a flagged string.
+
+    Args:
+        flagged: The flagged text extracted from the batch.
+
+    Returns:
+        Tuple of ``(technical, allowlisted, known_term, likely_code)``.
+    """
+    return (
+        _is_technical_content(flagged),
+        flagged.strip(".,;:!?()\"'").lower() in _SPELLING_ALLOWLIST,
+        is_known_term(flagged),
+        is_likely_code(flagged),
+    )
+
+
 def _should_skip_match(
     rule_id: str,
     flagged: str,
@@ -531,6 +614,7 @@ def _should_skip_match(
     lt_category: str = "",
     confidence: float = 1.0,
     match_type: str = "",
+    text_verdicts: dict[str, tuple[bool, bool, bool, bool]] | None = None,
 ) -> bool:
     """Return True if a match should be discarded by FP guards.
 
@@ -552,6 +636,9 @@ def _should_skip_match(
         lt_category: LanguageTool rule category ID (e.g. TYPOS, GRAMMAR).
         confidence: Rule confidence from LT response (default 1.0).
         match_type: Value of ``match.type.typeName`` (e.g. ``Hint``).
+        text_verdicts: Optional per-batch memo of
+            ``_classify_flagged_text`` results, so repeated flagged
+            words are classified once.
 
     Returns:
         True if the match should be skipped.
@@ -566,25 +653,29 @@ def _should_skip_match(
         )
         return True
 
-    if _is_technical_content(flagged):
+    if text_verdicts is None:
+        verdicts = _classify_flagged_text(flagged)
+    else:
+        verdicts = text_verdicts.get(flagged)
+        if verdicts is None:
+            verdicts = text_verdicts[flagged] = _classify_flagged_text(flagged)
+    technical, allowlisted, known_term, likely_code = verdicts
+
+    if technical:
         logger.debug(
             "Skipping LT match on technical content: %r", flagged,
         )
         return True
 
-    if rule_id == "MORFOLOGIK_RULE_EN_US":
-        clean_word = flagged.strip(".,;:!?()\"'").lower()
-        if clean_word in _SPELLING_ALLOWLIST:
-            logger.debug(
-                "Skipping LT spelling FP on allowlisted term: %r",
-                flagged,
-            )
-            return True
+    if rule_id == "MORFOLOGIK_RULE_EN_US" and allowlisted:
+        logger.debug(
+            "Skipping LT spelling FP on allowlisted term: %r",
+            flagged,
+        )
+        return True
 
     # Unified term registry — case-sensitive exact match on correct forms.
-    # Do NOT suppress GRAMMAR — known terms can still have grammar errors.
-    _registry_categories = {"TYPOS", "CASING", "CONFUSED_WORDS", "STYLE"}
-    if lt_category in _registry_categories and is_known_term(flagged):
+    if lt_category in _REGISTRY_GATED_CATEGORIES and known_term:
         logger.debug(
             "Skipping LT match on known term: %r (category=%s)",
             flagged, lt_category,
@@ -616,7 +707,7 @@ def _should_skip_match(
         return True
 
     # Heuristic code detection for terms not in any config
-    if is_likely_code(flagged):
+    if likely_code:
         logger.debug(
             "Skipping LT match on code-like content: %r", flagged,
         )
@@ -633,7 +724,9 @@ def _process_batch_matches(
     """Convert raw LT matches into filtered IssueResponse objects.
 
     Handles UTF-16 offset conversion, block resolution, FP guards,
-    and mapping to the CEA issue schema.
+    and mapping to the CEA issue schema.  The offset table, entry
+    start offsets and text-guard verdicts are computed once per batch
+    and shared by all matches.
 
     Args:
         batch: The batch that produced these matches.
@@ -644,6 +737,13 @@ def _process_batch_matches(
         List of IssueResponse objects that survived all guards.
     """
     issues: list[IssueResponse] = []
+    if not matches:
+        return issues
+
+    offset_table = _build_utf16_offset_table(batch.text)
+    text_length = len(batch.text)
+    starts = [entry.batch_start for entry in batch.entries]
+    text_verdicts: dict[str, tuple[bool, bool, bool, bool]] = {}
 
     for match in matches:
         rule_obj = match.get("rule", {})
@@ -658,15 +758,17 @@ def _process_batch_matches(
 
         # UTF-16 → codepoint conversion
         raw_offset = match.get("offset", 0)
-        py_offset = _utf16_to_codepoint_offset(batch.text, raw_offset)
+        py_offset = _resolve_utf16_offset(offset_table, text_length, raw_offset)
         match_length_utf16 = match.get("length", 0)
-        py_end = _utf16_to_codepoint_offset(
-            batch.text, raw_offset + match_length_utf16,
+        py_end = _resolve_utf16_offset(
+            offset_table, text_length, raw_offset + match_length_utf16,
         )
         py_length = py_end - py_offset
 
         # Find owning block; discard cross-boundary matches
-        entry = _find_entry_for_offset(batch.entries, py_offset, py_length)
+        entry = _find_entry_for_offset(
+            batch.entries, py_offset, py_length, starts,
+        )
         if entry is None:
             continue
 
@@ -675,7 +777,7 @@ def _process_batch_matches(
 
         if _should_skip_match(rule_id, flagged, block_local_offset,
                               entry.code_ranges, lt_category,
-                              match_confidence, match_type):
+                              match_confidence, match_type, text_verdicts):
             continue
 
         issue = _map_lt_match_to_issue(
@@ -695,6 +797,7 @@ def _process_batch_matches(
 def check_blocks(
     blocks: list,
     original_text: str = "",
+    cancel_token: Any = None,
 ) -> list[IssueResponse]:
     """Analyze prose blocks via LanguageTool and return CEA issues.
 
@@ -705,6 +808,8 @@ def check_blocks(
     Args:
         blocks: Parsed document blocks (Block dataclass instances).
         original_text: Full original document text for span refinement.
+        cancel_token: Optional ``CancellationToken``; remaining batches
+            are skipped once it is cancelled.
 
     Returns:
         List of IssueResponse objects from LanguageTool analysis.
@@ -734,6 +839,12 @@ def check_blocks(
     all_issues: list[IssueResponse] = []
 
     for batch_idx, batch in enumerate(batches):
+        if cancel_token is not None and cancel_token.cancelled:
+            logger.info(
+                "LanguageTool cancelled, skipping %d batch(es)",
+                len(batches) - batch_idx,
+            )
+            return []
         matches = _call_languagetool(
             batch.text, disabled_rules_str, disabled_categories,
         )
@@ -0,0 +1,185 @@
+"""Demand-driven SpaCy pipeline profile.
+
+Each rule declares the SpaCy annotations it reads (``NLP_ANNOTATIONS``
+in ``rules.base_rule``) and the registry unions them per block type
+(``RulesRegistry.nlp_annotations``).  This module maps those
+annotations to the trained components that produce them, so that:
+
+* ``load_nlp`` excludes components no registered rule needs from the
+  loaded pipeline, and drops the static word vectors when no kept
+  component embeds them (the md pipeline's ``tok2vec`` does, so they
+  stay while the tagger or parser is kept);
+* ``disabled_components`` lists the components a single ``nlp()`` call
+  can skip for one block type.
+
+Tokenization is always available.  Components this module does not
+know about are never excluded or disabled.
+
+With ``SPACY_PIPELINE_PROFILE=full`` the whole pipeline is loaded and
+run, which is how parity with the slim profile is checked.
+
+Usage:
+    from app.services.analysis.nlp_profile import block_disabled_components
+
+    doc = nlp(text, disable=block_disabled_components(nlp, "paragraph"))
+"""
+
+import logging
+from typing import Any, Iterable, Optional
+
+from rules.base_rule import (
+    NLP_DEPENDENCIES,
+    NLP_ENTITIES,
+    NLP_LEMMAS,
+    NLP_POS,
+    NLP_SENTENCES,
+)
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SLIM = "slim"
+PROFILE_FULL = "full"
+
+# Annotations the application reads outside the rules: sentence
+# segmentation in the preprocessor and the per-block sentence split.
+APP_NLP_ANNOTATIONS = frozenset({NLP_SENTENCES})
+
+# Components of the stock English pipelines producing each annotation.
+# The rule-based lemmatizer reads the POS the tagger and attribute
+# ruler assign.
+_ANNOTATION_COMPONENTS: dict[str, tuple[str, ...]] = {
+    NLP_SENTENCES: ("parser",),
+    NLP_DEPENDENCIES: ("parser",),
+    NLP_POS: ("tagger", "attribute_ruler"),
+    NLP_LEMMAS: ("tagger", "attribute_ruler", "lemmatizer"),
+    NLP_ENTITIES: ("ner",),
+}
+
+# The shared embedding layer and the components listening to it.
+_TOK2VEC = "tok2vec"
+_TOK2VEC_LISTENERS = frozenset({"tagger", "parser"})
+
+_KNOWN_COMPONENTS = frozenset(
+    {_TOK2VEC}.union(*_ANNOTATION_COMPONENTS.values())
+)
+
+
+def required_components(annotations: Iterable[str]) -> frozenset[str]:
+    """Return the pipeline components that produce *annotations*.
+
+    Args:
+        annotations: Annotation names from ``rules.base_rule``.
+
+    Returns:
+        Component names, including ``tok2vec`` when a listener of it
+        is required.
+    """
+    required: set[str] = set()
+    for annotation in annotations:
+        required.update(_ANNOTATION_COMPONENTS.get(annotation, ()))
+    if required & _TOK2VEC_LISTENERS:
+        required.add(_TOK2VEC)
+    return frozenset(required)
+
+
+def excluded_components(annotations: Iterable[str]) -> list[str]:
+    """Return the known components not needed for *annotations*.
+
+    Args:
+        annotations: Annotation names from ``rules.base_rule``.
+
+    Returns:
+        Sorted component names safe to exclude or disable.
+    """
+    return sorted(_KNOWN_COMPONENTS - required_components(annotations))
+
+
+def disabled_components(nlp: Any, annotations: Iterable[str]) -> list[str]:
+    """Return the enabled components of *nlp* one call can skip.
+
+    Args:
+        nlp: A SpaCy Language pipeline.
+        annotations: Annotations the caller will read from the Doc.
+
+    Returns:
+        Component names to pass as ``disable=``, in pipeline order;
+        empty when every component is needed.
+    """
+    skippable = set(excluded_components(annotations))
+    return [name for name in getattr(nlp, "pipe_names", ()) if name in skippable]
+
+
+def pipeline_annotations(block_type: Optional[str] = None) -> frozenset[str]:
+    """Return the annotations the rules and the application read.
+
+    Args:
+        block_type: Block type whose rules are considered, or None for
+            every registered rule.
+
+    Returns:
+        The registry's union for *block_type* plus
+        ``APP_NLP_ANNOTATIONS``.
+    """
+    from rules import get_registry
+
+    return get_registry().nlp_annotations(block_type) | APP_NLP_ANNOTATIONS
+
+
+def block_disabled_components(nlp: Any, block_type: str) -> list[str]:
+    """Return the components to skip when parsing one block.
+
+    Args:
+        nlp: The shared SpaCy pipeline.
+        block_type: The block's type.
+
+    Returns:
+        Component names to pass as ``disable=``; always empty under
+        the ``full`` profile.
+    """
+    from app.config import Config
+
+    if Config.SPACY_PIPELINE_PROFILE == PROFILE_FULL:
+        return []
+    return disabled_components(nlp, pipeline_annotations(block_type))
+
+
+def load_nlp(model_name: str, profile: str = PROFILE_SLIM) -> Any:
+    """Load a SpaCy pipeline for *profile*.
+
+    Args:
+        model_name: Installed SpaCy package name.
+        profile: ``slim`` to exclude components the rules never read,
+            ``full`` for the whole pipeline.
+
+    Returns:
+        The loaded Language pipeline.
+
+    Raises:
+        OSError: If the model is not installed.
+        ValueError: If *profile* is unknown.
+    """
+    import spacy
+
+    if profile == PROFILE_FULL:
+        return spacy.load(model_name)
+    if profile != PROFILE_SLIM:
+        raise ValueError(
+            f"Unknown SpaCy pipeline profile {profile!r}; "
+            f"expected '{PROFILE_SLIM}' or '{PROFILE_FULL}'"
+        )
+
+    annotations = pipeline_annotations()
+    nlp = spacy.load(model_name, exclude=excluded_components(annotations))
+    if nlp.vocab.vectors.size and not _uses_static_vectors(nlp):
+        nlp.vocab.reset_vectors(width=0)
+        logger.info("Dropped static vectors of %s: no component embeds them", model_name)
+    logger.info(
+        "SpaCy pipeline profile %s: annotations=%s components=%s",
+        profile, sorted(annotations), nlp.pipe_names,
+    )
+    return nlp
+
+
+def _uses_static_vectors(nlp: Any) -> bool:
+    """Whether any component's model config embeds the static vectors."""
+    return "include_static_vectors = true" in nlp.config.to_str()
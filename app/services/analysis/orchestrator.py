@@ -5,38 +5,72 @@ LLM granular (per-block), and LLM global (full-document). Streams
 partial results via Socket.IO as each phase completes.
 
 Phase 1 (deterministic) returns immediately with partial=True.
-Phases 2 and 3 run in the background and emit WebSocket events
-when complete. LLM failures are non-fatal.
+Background phases run as a dependency graph: LanguageTool and LLM
+granular start right after preprocessing, overlapping Phase 1; LLM
+global, the judge and the final merge start as soon as their inputs
+are ready.  Each phase emits WebSocket events when complete; result
+events carry versioned deltas of the session's issue set rather than
+the full list.  LLM failures are non-fatal.
+
+Every run holds a cancellation token from the session store.  When the
+same session is re-analysed (or the run is cancelled) the token fires:
+queued LLM calls are dropped, in-flight ones are aborted, and the
+superseded run never writes to the session or emits completion.
 
 The granular LLM pass splits text into paragraph blocks and processes
 them concurrently (up to LLM_MAX_CONCURRENT workers) for performance.
 """
 
+import dataclasses
 import hashlib
+import json
 import logging
 import re
 import threading
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from difflib import SequenceMatcher
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any, Optional
 
 from app.config import Config
 from app.models.enums import IssueCategory, IssueSeverity, IssueStatus
+from app.models.issue_codec import compact_issues
 from app.models.schemas import (
     AnalyzeResponse,
     IssueResponse,
     ReportResponse,
     ScoreResponse,
 )
+from app.services.analysis.block_priority import BlockPriority, BlockQueue, locate_blocks
 from app.services.analysis.deterministic import analyze as run_deterministic
 from app.services.analysis.merger import (
     merge as merge_issues,
     deduplicate_llm_issues,
 )
+from app.services.analysis.nlp_profile import block_disabled_components
 from app.services.analysis.preprocessor import _block_to_markdown, preprocess
+from app.services.analysis.pipeline import PhaseGraph
+from app.services.analysis.slow_profiles import bind_capture, get_slow_profiler, track
+from app.services.analysis.single_flight import (
+    Flight,
+    Subscriber,
+    analysis_key,
+    get_single_flight,
+)
 from app.services.analysis.scorer import calculate_score
+from app.services.analysis.text_index import (
+    DocumentTextIndex,
+    find_ignoring_inline_markers,
+)
+from app.services.session.memory import estimate_prep_bytes
+from app.services.session.result_stream import encode_payload
+from models.cancellation import (
+    CancellationToken,
+    OperationCancelled,
+    estimate_tokens,
+    get_cancellation_stats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -135,12 +169,26 @@ def analyze(
     session_id: Optional[str] = None,
     blocks: Optional[list] = None,
     user_selected: bool = False,
+    priority_hint: Optional[tuple[int, int]] = None,
 ) -> AnalyzeResponse:
     """Run the full three-phase analysis pipeline.
 
     Phase 1 (deterministic) executes synchronously and returns
-    immediately. Phases 2 and 3 (LLM) run in the background and
-    emit Socket.IO events on completion.
+    immediately. When LLM analysis is enabled, LanguageTool and the
+    LLM granular pass start right after preprocessing and run in the
+    background alongside Phase 1; the global pass, judge and final
+    merge follow as their inputs become available (see
+    :class:`~app.services.analysis.pipeline.PhaseGraph`).  Each phase
+    emits Socket.IO events on completion.
+
+    Identical concurrent requests share one run (see
+    :mod:`~app.services.analysis.single_flight`): a request that
+    matches a running analysis waits for its deterministic response,
+    and receives its later events and final result in its own session.
+    A request matching an analysis completed moments ago is answered
+    from that result.  With ``SLOW_PROFILE_ENABLED`` the run is
+    stack-sampled and kept when slow (see
+    :mod:`~app.services.analysis.slow_profiles`).
 
     Args:
         text: Raw text content to analyze.
@@ -157,6 +205,10 @@ def analyze(
         user_selected: Whether the user explicitly selected the content type
             via the popup or badge override.  When True, the auto-detected
             type does not override the user's choice.
+        priority_hint: Character range ``(start, end)`` the writer is
+            looking at; granular LLM blocks nearest it run first (see
+            :mod:`~app.services.analysis.block_priority`).  When None the
+            session's last known viewport is kept.
 
     Returns:
         AnalyzeResponse with deterministic results and partial=True
@@ -164,11 +216,81 @@ def analyze(
     """
     if not session_id:
         session_id = str(uuid.uuid4())
+    if priority_hint is not None:
+        _focus_session(session_id, priority_hint)
+    key = analysis_key(
+        text, content_type, file_type, blocks, user_selected,
+        _analysis_config_version(),
+    )
+    flights = get_single_flight()
+    completed = flights.cached(key)
+    if completed is not None:
+        logger.info("Session %s reuses a completed identical analysis", session_id)
+        return _serve_completed(completed, session_id, socket_sid)
+
+    # Supersedes (and cancels) a run still in progress for this session.
+    cancel_token = _begin_analysis(session_id)
+    subscriber = Subscriber(session_id, socket_sid, cancel_token, request={
+        "text": text,
+        "content_type": content_type,
+        "file_type": file_type,
+        "blocks": blocks,
+        "user_selected": user_selected,
+    })
+    flight: Optional[Flight]
+    flight, leading = flights.join(key, subscriber)
+    if leading:
+        subscriber.request = None
+    else:
+        response = _follow_flight(flight, subscriber)
+        if response is not None:
+            return response
+        flight = None
+    profiler = get_slow_profiler()
+    capture = profiler.begin(session_id) if profiler is not None else None
+    try:
+        with track(capture, "request"):
+            return _lead_analysis(
+                text, content_type, file_type, socket_sid, session_id, blocks,
+                user_selected, cancel_token, flight,
+            )
+    except Exception as exc:
+        _fail_flight(flight, exc)
+        raise
+
+
+def _lead_analysis(
+    text: str,
+    content_type: str,
+    file_type: Optional[str],
+    socket_sid: Optional[str],
+    session_id: str,
+    blocks: Optional[list],
+    user_selected: bool,
+    cancel_token: CancellationToken,
+    flight: Optional[Flight],
+) -> AnalyzeResponse:
+    """Run the pipeline for one session and the followers of its flight.
+
+    Args:
+        text: Raw text content to analyze.
+        content_type: Modular documentation type.
+        file_type: Original file format, if uploaded.
+        socket_sid: Socket.IO session ID for progress emission.
+        session_id: The session the run stores its results in.
+        blocks: Optional list of Block objects from a parser.
+        user_selected: Whether the user explicitly selected the content type.
+        cancel_token: Token returned by _begin_analysis() for the session.
+        flight: The flight this run leads, or None when it runs alone.
+
+    Returns:
+        AnalyzeResponse with deterministic results and partial=True
+        when LLM analysis will follow asynchronously.
+    """
     logger.info(
         "Starting analysis session=%s, content_type=%s, file_type=%s",
         session_id, content_type, file_type,
     )
-
     # Phase 0: Preprocessing
     _emit_progress(socket_sid, session_id, "preprocessing", "Preprocessing text", 5)
     prep = preprocess(text, blocks=blocks, file_type=file_type)
@@ -185,11 +307,133 @@ def analyze(
     if acronym_context:
         logger.info("Collected %d acronym definitions", len(acronym_context))
 
+    # LanguageTool and LLM granular only need preprocessed blocks, so
+    # they start now and overlap with the deterministic phase.
+    llm_enabled = Config.LLM_ENABLED and analyze_block is not None
+    pipeline = None
+    if llm_enabled:
+        pipeline = _start_llm_pipeline(
+            session_id, socket_sid, prep, content_type, acronym_context,
+            cancel_token, flight,
+        )
+
     # Phase 1: Deterministic analysis
     _emit_progress(socket_sid, session_id, "deterministic", "Running style checks", 20)
+    # Until the later phases are scheduled nothing else closes the phase
+    # graph, so any failure up to then must abort it.
+    try:
+        det_issues = _run_deterministic_phase(prep, content_type, acronym_context, blocks, text)
+        # Block and full-text passes produce separate copies of the same
+        # sentences and messages; keep one of each for the session.
+        compact_issues(det_issues, prep.get("sentences"))
+
+        # Calculate preliminary score and report
+        _t0 = time.monotonic()
+        score = calculate_score(det_issues, prep["word_count"])
+        report = _build_report(prep, score)
+        logger.info("response_path: score+report %.3fs", time.monotonic() - _t0)
+
+        _t1 = time.monotonic()
+        _emit_progress(socket_sid, session_id, "deterministic_complete", "Style checks complete", 50)
+        _publish_results(
+            socket_sid, session_id, "deterministic_complete", det_issues, cancel_token,
+            fan_out=False,
+            score=score.to_dict(),
+            report=report.to_dict(),
+            detected_content_type=content_type,
+        )
+        _emit_event(socket_sid, "stage_progress", {
+            "session_id": session_id,
+            "phase": "deterministic",
+            "status": "done",
+        })
+        logger.info("response_path: socket_emit %.3fs", time.monotonic() - _t1)
+
+        partial = pipeline is not None
+
+        _t2 = time.monotonic()
+        response = AnalyzeResponse(
+            session_id=session_id,
+            issues=det_issues,
+            score=score,
+            report=report,
+            partial=partial,
+            detected_content_type=content_type,
+        )
+        if flight is not None:
+            flight.set_first(_copy_response(response, ""))
+
+        # Store session so suggestion requests can find it.  When background
+        # phases already run, update the provisional session they hold.
+        logger.debug("Storing session_id=%s with %d issues", session_id, len(response.issues))
+        if cancel_token.cancelled:
+            # A newer run owns the session now; do not overwrite it.
+            logger.info("Analysis %s superseded, not storing results", session_id)
+        elif pipeline is not None:
+            _update_stored_session(session_id, response)
+        else:
+            _store_session(session_id, response)
+
+        logger.debug(
+            "llm_enabled=%s partial=%s det_issues=%d",
+            llm_enabled, partial, len(det_issues),
+        )
+        if pipeline is not None:
+            logger.debug("Scheduling remaining LLM phases")
+            _schedule_llm_phases(
+                pipeline, session_id, socket_sid, det_issues, content_type,
+            )
+    except Exception:
+        if pipeline is not None:
+            _abort_llm_pipeline(pipeline, session_id)
+        else:
+            _finish_analysis(session_id, cancel_token)
+        raise
+
+    if pipeline is not None:
+        # Only the slimmed copy outlives the request; it is what the
+        # run holds against the memory budget until it finishes.
+        _track_analysis_memory(session_id, cancel_token, pipeline.prep)
+    else:
+        logger.debug("LLM DISABLED, skipping phases 2+3")
+        _finish_analysis(session_id, cancel_token)
+        _emit_progress(socket_sid, session_id, "analysis_complete", "Analysis complete", 100)
+        _publish_results(
+            socket_sid, session_id, "analysis_complete", det_issues, cancel_token,
+            replace=True,
+            fan_out=False,
+            score=score.to_dict(),
+            report=report.to_dict(),
+            detected_content_type=content_type,
+        )
+        _end_flight(flight, response)
+    logger.info("response_path: store+schedule %.3fs", time.monotonic() - _t2)
+
+    return response
+
+
+def _run_deterministic_phase(
+    prep: dict[str, Any],
+    content_type: str,
+    acronym_context: dict[str, str] | None,
+    blocks: Optional[list],
+    text: str,
+) -> list[IssueResponse]:
+    """Run the deterministic phase: block + full-text rules, then structure.
+
+    Args:
+        prep: Preprocessed data from ``preprocess()``.
+        content_type: Modular documentation type.
+        acronym_context: Known acronym definitions from the document.
+        blocks: Parser blocks passed to ``analyze()``, if any.
+        text: Raw text passed to ``analyze()``.
+
+    Returns:
+        Deterministic issues in original-text coordinates.
+    """
     logger.debug(
-        "LLM_ENABLED=%s analyze_block_imported=%s file_type=%s",
-        Config.LLM_ENABLED, analyze_block is not None, file_type,
+        "LLM_ENABLED=%s analyze_block_imported=%s",
+        Config.LLM_ENABLED, analyze_block is not None,
     )
     logger.debug(
         "cleaned_text_len=%d blocks=%d lite_markers_len=%d",
@@ -244,329 +488,585 @@ def analyze(
             i, iss.rule_name, iss.span, iss.flagged_text[:80] if iss.flagged_text else "",
         )
 
-    # Calculate preliminary score and report
-    _t0 = time.monotonic()
-    score = calculate_score(det_issues, prep["word_count"])
-    report = _build_report(prep, score)
-    logger.info("response_path: score+report %.3fs", time.monotonic() - _t0)
+    return det_issues
 
-    _t1 = time.monotonic()
-    _emit_progress(socket_sid, session_id, "deterministic_complete", "Style checks complete", 50)
-    _emit_event(socket_sid, "deterministic_complete", {
-        "session_id": session_id,
-        "issues": [i.to_dict() for i in det_issues],
-        "score": score.to_dict(),
-        "report": report.to_dict(),
-        "detected_content_type": content_type,
-    })
-    _emit_event(socket_sid, "stage_progress", {
-        "session_id": session_id,
-        "phase": "deterministic",
-        "status": "done",
-    })
-    logger.info("response_path: socket_emit %.3fs", time.monotonic() - _t1)
 
-    # Determine whether LLM phases should run
-    llm_enabled = Config.LLM_ENABLED and analyze_block is not None
-    partial = llm_enabled
+# ---------------------------------------------------------------------------
+# Background phase pipeline
+# ---------------------------------------------------------------------------
 
-    _t2 = time.monotonic()
-    response = AnalyzeResponse(
-        session_id=session_id,
-        issues=det_issues,
-        score=score,
-        report=report,
-        partial=partial,
-        detected_content_type=content_type,
-    )
+# Worker threads for background phases.  At most LanguageTool, granular
+# and global run at once; the final merge waits on LanguageTool while
+# the judge runs.
+_PIPELINE_MAX_WORKERS = 4
 
-    # Store session so suggestion requests can find it
-    logger.debug("Storing session_id=%s with %d issues", session_id, len(response.issues))
-    _store_session(session_id, response)
 
-    logger.debug(
-        "llm_enabled=%s partial=%s det_issues=%d",
-        llm_enabled, partial, len(det_issues),
-    )
-    if llm_enabled:
-        logger.debug("Scheduling LLM phases in background")
-        _schedule_llm_phases(
-            session_id, socket_sid, prep, det_issues, content_type, acronym_context,
-        )
-    else:
-        logger.debug("LLM DISABLED, skipping phases 2+3")
-        _emit_progress(socket_sid, session_id, "analysis_complete", "Analysis complete", 100)
-        _emit_event(socket_sid, "analysis_complete", {
-            "session_id": session_id,
-            "issues": [i.to_dict() for i in det_issues],
-            "score": score.to_dict(),
-            "report": report.to_dict(),
-            "detected_content_type": content_type,
-        })
-    logger.info("response_path: store+schedule %.3fs", time.monotonic() - _t2)
+class _ExcerptSource:
+    """Style guide excerpts for granular prompts, refined after Phase 1.
 
-    return response
+    Granular blocks start before deterministic issues exist, so the
+    source begins with the excerpts that apply to every document of
+    the content type.  :meth:`refine` swaps in the issue-driven
+    selection; blocks submitted afterwards pick it up when they run.
+    The block cache key does not include excerpts, so cached results
+    stay valid either way.
+    """
 
+    def __init__(self, content_type: str) -> None:
+        """Select the provisional excerpts for *content_type*.
+
+        Args:
+            content_type: Modular documentation type.
+        """
+        self._content_type = content_type
+        self._lock = threading.Lock()
+        self._excerpts: list[dict] = _select_style_guide_excerpts([], content_type)
+        self._det_issue_count: int = 0
+
+    def refine(self, det_issues: list[IssueResponse]) -> list[dict]:
+        """Re-select excerpts from the deterministic issues.
+
+        Args:
+            det_issues: Deterministic issues from Phase 1.
+
+        Returns:
+            The refined excerpt list.
+        """
+        excerpts = _select_style_guide_excerpts(det_issues, self._content_type)
+        with self._lock:
+            self._excerpts = excerpts
+            self._det_issue_count = len(det_issues)
+        return excerpts
 
-# ---------------------------------------------------------------------------
-# LLM phase scheduling
-# ---------------------------------------------------------------------------
+    def snapshot(self) -> tuple[list[dict], int]:
+        """Return the current ``(excerpts, det_issue_count)`` pair."""
+        with self._lock:
+            return self._excerpts, self._det_issue_count
 
 
-def _schedule_llm_phases(
+@dataclasses.dataclass(frozen=True)
+class _Pipeline:
+    """Background phases of one analysis run."""
+
+    graph: PhaseGraph
+    excerpt_source: _ExcerptSource
+    cancel_token: CancellationToken | None
+    prep: dict[str, Any]
+    flight: Optional[Flight] = None
+
+
+# Preprocessing results the background phases never read.  The spaCy
+# Doc is only used by the deterministic phase.
+_FOREGROUND_ONLY_PREP_KEYS = frozenset({"spacy_doc"})
+
+
+def _background_prep(prep: dict[str, Any]) -> dict[str, Any]:
+    """Copy *prep* without the data the LLM phases do not use.
+
+    The background phases outlive the request by tens of seconds, so
+    whatever their ``prep`` references stays alive that long.  The copy
+    drops the spaCy Doc, keeps only the offset map the LLM resolver
+    uses (see ``_resolve_llm_text_sources``) and holds blocks without
+    their ``char_map``, which only the deterministic and LanguageTool
+    passes read.  The report fields are computed before copying so the
+    copy carries the memoized readability, and the heading outline both
+    LLM passes send is built here once as ``document_outline``.
+
+    Args:
+        prep: Preprocessed text data from preprocess().
+
+    Returns:
+        A new dictionary sharing the remaining values with *prep*.
+    """
+    slim = {
+        key: value for key, value in prep.items()
+        if key not in _FOREGROUND_ONLY_PREP_KEYS
+    }
+    if prep.get("blocks") and prep.get("lite_markers"):
+        slim.pop("offset_map", None)
+    else:
+        slim.pop("lite_markers_offset_map", None)
+    if prep.get("blocks"):
+        slim["blocks"] = _blocks_without_char_maps(prep["blocks"])
+    slim["document_outline"] = _build_document_outline(prep.get("blocks", []))
+    return slim
+
+
+def _blocks_without_char_maps(blocks: list) -> list:
+    """Return shallow copies of *blocks* (and children) with no char_map."""
+    return [
+        dataclasses.replace(
+            block,
+            char_map=None,
+            children=_blocks_without_char_maps(block.children),
+        )
+        if dataclasses.is_dataclass(block) else block
+        for block in blocks
+    ]
+
+
+def _languagetool_prep(prep: dict[str, Any]) -> dict[str, Any]:
+    """Return the part of *prep* the LanguageTool phase reads."""
+    return {
+        "blocks": prep.get("blocks", []),
+        "original_text": prep.get("original_text", ""),
+    }
+
+
+def _start_llm_pipeline(
     session_id: str,
     socket_sid: Optional[str],
     prep: dict[str, Any],
-    det_issues: list[IssueResponse],
     content_type: str,
     acronym_context: dict[str, str] | None = None,
-) -> None:
-    """Schedule LLM granular and global passes in the background.
-
-    Uses the Socket.IO server's start_background_task to avoid
-    blocking the HTTP response. Falls back to synchronous execution
-    if Socket.IO background tasks are unavailable.
+    cancel_token: CancellationToken | None = None,
+    flight: Optional[Flight] = None,
+) -> _Pipeline:
+    """Start the phases that only need preprocessed text.
+
+    LanguageTool and LLM granular analysis are launched right after
+    preprocessing so they overlap with the deterministic phase.  A
+    provisional session (no issues, ``partial=True``) is stored first
+    so the phases' cancellation checks find the session.  The phases
+    receive slimmed copies of *prep* (see ``_background_prep``) so the
+    full preprocessing result is freed when the request returns.
 
     Args:
         session_id: Unique analysis session identifier.
         socket_sid: Socket.IO session ID for progress emission.
         prep: Preprocessed text data from preprocess().
-        det_issues: Deterministic issues from Phase 1.
         content_type: Modular documentation type.
         acronym_context: Known acronym definitions from the document.
+        cancel_token: Token of this run; every phase receives it.
+        flight: The flight this run leads, if any; its followers get
+            the final result.
+
+    Returns:
+        The running pipeline.
     """
+    score = calculate_score([], prep["word_count"])
+    _store_session(session_id, AnalyzeResponse(
+        session_id=session_id,
+        issues=[],
+        score=score,
+        report=_build_report(prep, score),
+        partial=True,
+        detected_content_type=content_type,
+    ))
+
+    background = _background_prep(prep)
+    graph = PhaseGraph(_PIPELINE_MAX_WORKERS, name=session_id)
     try:
-        from app.extensions import socketio as sio
-        logger.debug("Starting background LLM task via socketio")
-        sio.start_background_task(
-            _run_llm_phases,
-            session_id, socket_sid, prep, det_issues, content_type,
-            acronym_context,
+        excerpt_source = _ExcerptSource(content_type)
+        if Config.LANGUAGETOOL_ENABLED:
+            graph.add(
+                "languagetool", _languagetool_phase,
+                session_id, socket_sid, _languagetool_prep(prep), cancel_token,
+            )
+        graph.add(
+            "granular", _granular_phase,
+            session_id, socket_sid, background, content_type, acronym_context,
+            excerpt_source, cancel_token,
         )
-    except (ImportError, AttributeError, RuntimeError) as exc:
-        logger.warning("Cannot start background LLM task: %s", exc)
-        _emit_event(socket_sid, "llm_skipped", {
-            "session_id": session_id,
-            "reason": str(exc),
-        })
+    except Exception:
+        graph.close()
+        raise
+    logger.debug("Started LanguageTool and granular phases for %s", session_id)
+    return _Pipeline(graph, excerpt_source, cancel_token, background, flight)
 
 
-def _run_llm_phases(
+def _schedule_llm_phases(
+    pipeline: _Pipeline,
     session_id: str,
     socket_sid: Optional[str],
-    prep: dict[str, Any],
     det_issues: list[IssueResponse],
     content_type: str,
-    acronym_context: dict[str, str] | None = None,
 ) -> None:
-    """Execute LLM granular and global passes in parallel.
-
-    Granular and global are independent (both use preprocessed text)
-    and are launched concurrently.  The judge pass runs after both
-    complete since it reviews combined LLM issues.
+    """Feed Phase 1 results into the pipeline and add the later phases.
 
-    Checks for session cancellation within each phase.  Emits progress
-    and completion events via Socket.IO.
+    Refines the granular excerpts, then registers the global pass
+    (needs deterministic issues), the judge (needs both LLM passes)
+    and the final merge (needs the judge and LanguageTool).
 
     Args:
+        pipeline: The pipeline returned by _start_llm_pipeline().
         session_id: Unique analysis session identifier.
         socket_sid: Socket.IO session ID for progress emission.
-        prep: Preprocessed text data.
         det_issues: Deterministic issues from Phase 1.
         content_type: Modular documentation type.
-        acronym_context: Known acronym definitions from the document.
     """
-    logger.debug("_run_llm_phases STARTED session=%s", session_id)
+    graph, cancel_token, prep = pipeline.graph, pipeline.cancel_token, pipeline.prep
+    excerpt_source = pipeline.excerpt_source
+    excerpts = excerpt_source.refine(det_issues)
+    logger.debug("Refined to %d excerpts", len(excerpts))
+
+    graph.provide("deterministic", det_issues)
+    graph.add(
+        "global", _global_phase,
+        session_id, socket_sid, prep, content_type, excerpts, len(det_issues),
+        cancel_token,
+        after=("deterministic",),
+    )
+    graph.add(
+        "judge", _judge_phase,
+        graph, session_id, socket_sid, prep, content_type, cancel_token,
+        after=("granular", "global"),
+    )
+    graph.add(
+        "finalize", _finalize_phase,
+        graph, session_id, socket_sid, prep, det_issues, content_type,
+        cancel_token, pipeline.flight,
+        after=("judge",),
+    )
+    graph.close()
 
-    # Select style guide excerpts based on deterministic findings
-    excerpts = _select_style_guide_excerpts(det_issues, content_type)
-    logger.debug("Selected %d excerpts", len(excerpts))
 
-    # Build document outline for LLM section-level awareness
-    doc_outline = _build_document_outline(prep.get("blocks", []))
-    abstract_text = _extract_abstract(prep.get("blocks", []))
+def _abort_llm_pipeline(pipeline: _Pipeline, session_id: str) -> None:
+    """Stop early-started phases after the request path failed.
 
-    # ------------------------------------------------------------------
-    # Launch parallel phases: LT + granular + global
-    # ------------------------------------------------------------------
-    phase_executor = ThreadPoolExecutor(max_workers=3)
+    Cancelling the run's token drops queued LLM calls and aborts the
+    ones in flight.  Closing the graph lets it shut down, and release
+    a slow-analysis profile it holds, once those phases return.
 
-    # LanguageTool (parallel)
-    lt_future = None
-    if Config.LANGUAGETOOL_ENABLED and not _is_cancelled(session_id):
-        logger.debug("Starting LanguageTool phase (parallel)")
-        _emit_event(socket_sid, "stage_progress", {
-            "session_id": session_id,
-            "phase": "languagetool",
-            "status": "started",
-        })
-        lt_future = phase_executor.submit(
-            _run_languagetool_phase, prep,
-        )
+    Args:
+        pipeline: The pipeline returned by _start_llm_pipeline().
+        session_id: Unique analysis session identifier.
+    """
+    if pipeline.cancel_token is not None:
+        pipeline.cancel_token.cancel("analysis failed")
+    try:
+        _get_session_store().cancel_analysis(session_id)
+    except (ImportError, AttributeError, RuntimeError) as exc:
+        logger.debug("Could not cancel session %s: %s", session_id, exc)
+    pipeline.graph.close()
 
-    # LLM granular (parallel)
-    granular_future = None
-    blocks_total = len(prep.get("blocks", []))
-    if not _is_cancelled(session_id):
-        logger.debug("Starting granular phase (parallel)")
-        _emit_event(socket_sid, "stage_progress", {
-            "session_id": session_id,
-            "phase": "llm_granular",
-            "status": "started",
-            "blocks_total": blocks_total,
-        })
-        granular_future = phase_executor.submit(
-            _run_llm_granular,
-            session_id, socket_sid, prep, content_type, acronym_context,
-            style_guide_excerpts=excerpts,
-            document_outline=doc_outline,
-            det_issue_count=len(det_issues),
-        )
 
-    # LLM global (parallel — no data dependency on granular)
-    global_future = None
-    if not _is_cancelled(session_id):
-        logger.debug("Starting global phase (parallel with granular)")
-        _emit_event(socket_sid, "stage_progress", {
-            "session_id": session_id,
-            "phase": "llm_global",
-            "status": "started",
-        })
-        global_future = phase_executor.submit(
-            _run_llm_global,
-            session_id, socket_sid, prep, content_type,
-            style_guide_excerpts=excerpts,
-            document_outline=doc_outline,
-            abstract_context=abstract_text,
-            det_issue_count=len(det_issues),
+def _languagetool_phase(
+    session_id: str,
+    socket_sid: Optional[str],
+    prep: dict[str, Any],
+    cancel_token: CancellationToken | None = None,
+) -> list[IssueResponse]:
+    """Run LanguageTool and emit ``languagetool_complete`` when done.
+
+    Args:
+        session_id: Unique analysis session identifier.
+        socket_sid: Socket.IO session ID for progress emission.
+        prep: Preprocessed text data.
+        cancel_token: Token of this analysis run.
+
+    Returns:
+        LanguageTool issues in original-text coordinates.
+    """
+    if _is_cancelled(session_id, cancel_token):
+        return []
+    _broadcast_event(socket_sid, "stage_progress", {
+        "session_id": session_id,
+        "phase": "languagetool",
+        "status": "started",
+    })
+    lt_issues = _run_languagetool_phase(prep, cancel_token)
+    logger.info("LanguageTool produced %d issues", len(lt_issues))
+    if not _is_cancelled(session_id, cancel_token):
+        _publish_results(
+            socket_sid, session_id, "languagetool_complete", lt_issues, cancel_token,
         )
+    _broadcast_event(socket_sid, "stage_progress", {
+        "session_id": session_id,
+        "phase": "languagetool",
+        "status": "done",
+    })
+    return lt_issues
 
-    # ------------------------------------------------------------------
-    # Collect results — each phase is error-isolated
-    # ------------------------------------------------------------------
-    granular_issues: list[IssueResponse] = []
-    if granular_future is not None:
-        try:
-            granular_issues = granular_future.result()
-            logger.debug("Granular produced %d issues", len(granular_issues))
-        except Exception as exc:
-            logger.warning("Granular phase failed: %s", exc)
-        _emit_event(socket_sid, "stage_progress", {
+
+def _granular_phase(
+    session_id: str,
+    socket_sid: Optional[str],
+    prep: dict[str, Any],
+    content_type: str,
+    acronym_context: dict[str, str] | None,
+    excerpt_source: _ExcerptSource,
+    cancel_token: CancellationToken | None = None,
+) -> list[IssueResponse]:
+    """Run the LLM granular pass with stage progress events.
+
+    Args:
+        session_id: Unique analysis session identifier.
+        socket_sid: Socket.IO session ID for progress emission.
+        prep: Preprocessed text data.
+        content_type: Modular documentation type.
+        acronym_context: Known acronym definitions from the document.
+        excerpt_source: Excerpts read by each block when it runs.
+        cancel_token: Token of this analysis run.
+
+    Returns:
+        LLM granular issues.
+    """
+    if _is_cancelled(session_id, cancel_token):
+        return []
+    _broadcast_event(socket_sid, "stage_progress", {
+        "session_id": session_id,
+        "phase": "llm_granular",
+        "status": "started",
+        "blocks_total": len(prep.get("blocks", [])),
+    })
+    try:
+        issues = _run_llm_granular(
+            session_id, socket_sid, prep, content_type, acronym_context,
+            document_outline=prep["document_outline"],
+            excerpt_source=excerpt_source,
+            cancel_token=cancel_token,
+        )
+        logger.debug("Granular produced %d issues", len(issues))
+        return issues
+    finally:
+        _broadcast_event(socket_sid, "stage_progress", {
             "session_id": session_id,
             "phase": "llm_granular",
             "status": "done",
         })
 
-    global_issues: list[IssueResponse] = []
-    if global_future is not None:
-        try:
-            global_issues = global_future.result()
-            logger.debug("Global produced %d issues", len(global_issues))
-        except Exception as exc:
-            logger.warning("Global phase failed: %s", exc)
-        _emit_event(socket_sid, "stage_progress", {
+
+def _global_phase(
+    session_id: str,
+    socket_sid: Optional[str],
+    prep: dict[str, Any],
+    content_type: str,
+    excerpts: list[dict],
+    det_issue_count: int,
+    cancel_token: CancellationToken | None = None,
+) -> list[IssueResponse]:
+    """Run the LLM global pass with stage progress events.
+
+    Args:
+        session_id: Unique analysis session identifier.
+        socket_sid: Socket.IO session ID for progress emission.
+        prep: Preprocessed text data.
+        content_type: Modular documentation type.
+        excerpts: Style guide excerpts selected from Phase 1 issues.
+        det_issue_count: Phase 1 deterministic issue count for token budget.
+        cancel_token: Token of this analysis run.
+
+    Returns:
+        LLM global issues.
+    """
+    if _is_cancelled(session_id, cancel_token):
+        return []
+    _broadcast_event(socket_sid, "stage_progress", {
+        "session_id": session_id,
+        "phase": "llm_global",
+        "status": "started",
+    })
+    try:
+        issues = _run_llm_global(
+            session_id, socket_sid, prep, content_type,
+            style_guide_excerpts=excerpts,
+            document_outline=prep["document_outline"],
+            abstract_context=_extract_abstract(prep.get("blocks", [])),
+            det_issue_count=det_issue_count,
+            cancel_token=cancel_token,
+        )
+        logger.debug("Global produced %d issues", len(issues))
+        return issues
+    finally:
+        _broadcast_event(socket_sid, "stage_progress", {
             "session_id": session_id,
             "phase": "llm_global",
             "status": "done",
         })
 
-    lt_issues: list[IssueResponse] = []
-    if lt_future is not None and not _is_cancelled(session_id):
-        try:
-            lt_issues = lt_future.result(
-                timeout=Config.LANGUAGETOOL_TIMEOUT + 2,
-            )
-            logger.info("LanguageTool produced %d issues", len(lt_issues))
-        except TimeoutError:
-            logger.warning("LanguageTool phase timed out")
-        except Exception as exc:
-            logger.warning("LanguageTool phase failed: %s", exc)
-        _emit_event(socket_sid, "stage_progress", {
-            "session_id": session_id,
-            "phase": "languagetool",
-            "status": "done",
-        })
 
-    phase_executor.shutdown(wait=False)
+def _judge_phase(
+    graph: PhaseGraph,
+    session_id: str,
+    socket_sid: Optional[str],
+    prep: dict[str, Any],
+    content_type: str,
+    cancel_token: CancellationToken | None = None,
+) -> list[IssueResponse]:
+    """Deduplicate granular + global issues and run the optional judge.
 
-    # Merge granular + global into a single LLM issues list, dedup before judge
+    Args:
+        graph: The phase graph holding the LLM pass results.
+        session_id: Unique analysis session identifier.
+        socket_sid: Socket.IO session ID for progress emission.
+        prep: Preprocessed text data.
+        content_type: Modular documentation type.
+        cancel_token: Token of this analysis run.
+
+    Returns:
+        The LLM issues that survive deduplication and judging.
+    """
+    granular_issues = graph.result("granular", [])
+    global_issues = graph.result("global", [])
     raw_count = len(granular_issues) + len(global_issues)
     llm_issues = deduplicate_llm_issues(granular_issues + global_issues)
     logger.info("Pre-judge dedup: %d -> %d LLM issues", raw_count, len(llm_issues))
 
-    # Phase 2C: LLM judge self-correction (optional)
-    if not _is_cancelled(session_id) and llm_issues and Config.LLM_JUDGE_ENABLED:
-        _emit_event(socket_sid, "stage_progress", {
+    if not _is_cancelled(session_id, cancel_token) and llm_issues and Config.LLM_JUDGE_ENABLED:
+        _broadcast_event(socket_sid, "stage_progress", {
             "session_id": session_id,
             "phase": "llm_judge",
             "status": "started",
             "issues_total": len(llm_issues),
         })
         document_excerpt = prep.get("lite_markers") or prep.get("text", "")
-        llm_issues = _run_judge_pass(llm_issues, document_excerpt, content_type)
-        _emit_event(socket_sid, "stage_progress", {
+        try:
+            llm_issues = _run_judge_pass(
+                llm_issues, document_excerpt, content_type, cancel_token,
+            )
+        except OperationCancelled:
+            logger.info("Judge pass cancelled for %s", session_id)
+        _broadcast_event(socket_sid, "stage_progress", {
             "session_id": session_id,
             "phase": "llm_judge",
             "status": "done",
         })
+    return llm_issues
+
 
-    # Merge and emit final results
+def _finalize_phase(
+    graph: PhaseGraph,
+    session_id: str,
+    socket_sid: Optional[str],
+    prep: dict[str, Any],
+    det_issues: list[IssueResponse],
+    content_type: str,
+    cancel_token: CancellationToken | None = None,
+    flight: Optional[Flight] = None,
+) -> None:
+    """Merge all phase results, update the session and emit completion.
+
+    LanguageTool usually finished long before the LLM passes; its
+    result is awaited with the same grace period as before.  The run's
+    cancellation token is released when this phase ends, and the
+    flight it leads (if any) hands the result to its followers.
+
+    Args:
+        graph: The phase graph holding the phase results.
+        session_id: Unique analysis session identifier.
+        socket_sid: Socket.IO session ID for progress emission.
+        prep: Preprocessed text data.
+        det_issues: Deterministic issues from Phase 1.
+        content_type: Modular documentation type.
+        cancel_token: Token of this analysis run.
+        flight: The flight this run leads, if any.
+    """
+    response: Optional[AnalyzeResponse] = None
+    try:
+        response = _merge_and_complete(
+            graph, session_id, socket_sid, prep, det_issues, content_type,
+            cancel_token,
+        )
+    except Exception:
+        # Nothing waits on this phase; tell the client instead of
+        # leaving it on the partial results.
+        _emit_event(socket_sid, "analysis_error", {
+            "session_id": session_id,
+            "error": "Analysis failed due to an internal error",
+        })
+        raise
+    finally:
+        if cancel_token is not None:
+            _finish_analysis(session_id, cancel_token)
+        _end_flight(flight, response)
+
+
+def _merge_and_complete(
+    graph: PhaseGraph,
+    session_id: str,
+    socket_sid: Optional[str],
+    prep: dict[str, Any],
+    det_issues: list[IssueResponse],
+    content_type: str,
+    cancel_token: CancellationToken | None,
+) -> Optional[AnalyzeResponse]:
+    """Merge phase results and publish them unless the run was cancelled.
+
+    Args:
+        graph: The phase graph holding the phase results.
+        session_id: Unique analysis session identifier.
+        socket_sid: Socket.IO session ID for progress emission.
+        prep: Preprocessed text data.
+        det_issues: Deterministic issues from Phase 1.
+        content_type: Modular documentation type.
+        cancel_token: Token of this analysis run.
+
+    Returns:
+        The final response, or None if the run was cancelled.
+    """
+    llm_issues = graph.result("judge", [])
+    lt_issues = graph.result(
+        "languagetool", [], timeout=Config.LANGUAGETOOL_TIMEOUT + 2,
+    )
     logger.debug(
         "Total LLM issues=%d, LT issues=%d, merging with det=%d",
         len(llm_issues), len(lt_issues), len(det_issues),
     )
-    if not _is_cancelled(session_id):
-        merged = merge_issues(
-            det_issues, llm_issues, Config.CONFIDENCE_THRESHOLD,
-            blocks=prep.get("blocks"),
-            lt_issues=lt_issues,
-        )
-        score = calculate_score(merged, prep["word_count"])
-        report = _build_report(prep, score)
-        logger.debug("FINAL merged=%d issues, emitting analysis_complete", len(merged))
+    if _is_cancelled(session_id, cancel_token):
+        return None
 
-        # Log final merged results
-        for i, iss in enumerate(merged):
-            logger.debug(
-                "FINAL merged[%d]: source=%s rule=%s span=%s "
-                "flagged=%r",
-                i, iss.source, iss.rule_name, iss.span,
-                iss.flagged_text[:80] if iss.flagged_text else "",
-            )
+    merged = merge_issues(
+        det_issues, llm_issues, Config.CONFIDENCE_THRESHOLD,
+        blocks=prep.get("blocks"),
+        lt_issues=lt_issues,
+    )
+    compact_issues(merged, prep.get("sentences"))
+    score = calculate_score(merged, prep["word_count"])
+    report = _build_report(prep, score)
+    logger.debug("FINAL merged=%d issues, emitting analysis_complete", len(merged))
 
-        # Update session store with final merged results
-        updated_response = AnalyzeResponse(
-            session_id=session_id,
-            issues=merged,
-            score=score,
-            report=report,
-            partial=False,
-            detected_content_type=content_type,
-        )
+    # Log final merged results
+    for i, iss in enumerate(merged):
         logger.debug(
-            "Updating stored session %s with %d merged issues",
-            session_id, len(merged),
+            "FINAL merged[%d]: source=%s rule=%s span=%s "
+            "flagged=%r",
+            i, iss.source, iss.rule_name, iss.span,
+            iss.flagged_text[:80] if iss.flagged_text else "",
         )
-        _update_stored_session(session_id, updated_response)
 
-        _emit_progress(socket_sid, session_id, "analysis_complete", "Analysis complete", 100)
-        _emit_event(socket_sid, "analysis_complete", {
-            "session_id": session_id,
-            "issues": [i.to_dict() for i in merged],
-            "score": score.to_dict(),
-            "report": report.to_dict(),
-            "detected_content_type": content_type,
-        })
+    # Update session store with final merged results
+    updated_response = AnalyzeResponse(
+        session_id=session_id,
+        issues=merged,
+        score=score,
+        report=report,
+        partial=False,
+        detected_content_type=content_type,
+    )
+    logger.debug(
+        "Updating stored session %s with %d merged issues",
+        session_id, len(merged),
+    )
+    _update_stored_session(session_id, updated_response)
+
+    _emit_progress(socket_sid, session_id, "analysis_complete", "Analysis complete", 100)
+    _publish_results(
+        socket_sid, session_id, "analysis_complete", merged, cancel_token,
+        replace=True,
+        fan_out=False,
+        score=score.to_dict(),
+        report=report.to_dict(),
+        detected_content_type=content_type,
+    )
+    logger.info("Background phases for %s: %s", session_id, {
+        name: round(seconds, 3) for name, seconds in graph.durations().items()
+    })
+    return updated_response
 
 
-def _run_languagetool_phase(prep: dict[str, Any]) -> list[IssueResponse]:
+def _run_languagetool_phase(
+    prep: dict[str, Any], cancel_token: CancellationToken | None = None,
+) -> list[IssueResponse]:
     """Run LanguageTool analysis on prose blocks.
 
-    Called in a background thread, parallel with the LLM granular pass.
+    Called in a background thread right after preprocessing, parallel
+    with the deterministic phase and the LLM granular pass.
     Gracefully returns an empty list on any failure.
 
     Args:
         prep: Preprocessed text data containing blocks and original text.
+        cancel_token: Skips remaining batches once cancelled.
 
     Returns:
         List of IssueResponse from LanguageTool, empty on failure.
@@ -577,7 +1077,9 @@ def _run_languagetool_phase(prep: dict[str, Any]) -> list[IssueResponse]:
         if not blocks:
             return []
         original_text = prep.get("original_text", "")
-        return check_blocks(blocks, original_text=original_text)
+        return check_blocks(
+            blocks, original_text=original_text, cancel_token=cancel_token,
+        )
     except ImportError:
         logger.warning("languagetool_client not available")
         return []
@@ -667,7 +1169,11 @@ def _analyze_blocks_deterministic(
 
     Each block is analysed with its own ``block_type``, and the
     resulting spans are mapped directly to original-text coordinates
-    using ``block.char_map`` and ``block.start_pos``.
+    using ``block.char_map`` and ``block.start_pos``.  Block-relative
+    results are cached (see :func:`_det_block_cache_key`), so on
+    re-analysis only blocks whose content changed run spaCy and the
+    rules; unchanged blocks reuse their cached issues re-offset to the
+    block's current position.
 
     Args:
         blocks: Parsed Block objects from the parser.
@@ -680,11 +1186,20 @@ def _analyze_blocks_deterministic(
     from app.extensions import get_nlp
     nlp = get_nlp()
     all_issues: list[IssueResponse] = []
+    text_index = DocumentTextIndex(original_text)
+    cache_context = _det_block_cache_context(content_type, acronym_context)
+    stats = {"hits": 0, "misses": 0}
 
     for block in blocks:
         if block.should_skip_analysis or not (block.content and block.content.strip()):
             continue
 
+        # Yield between blocks so background phases started after
+        # preprocessing (LanguageTool, LLM granular) can send their
+        # requests while rules run; under gevent this loop would
+        # otherwise hold the hub until Phase 1 finishes.
+        time.sleep(0)
+
         # Single-step numbered procedure detection: if an ordered list
         # has exactly 1 item, flag it — should use bullet, not number.
         single_step = _check_single_step_procedure(block, original_text)
@@ -697,9 +1212,18 @@ def _analyze_blocks_deterministic(
                 continue
             issues = _analyze_single_block_deterministic(
                 target, content_type, nlp, original_text, acronym_context,
+                text_index=text_index,
+                cache_context=cache_context,
+                stats=stats,
             )
             all_issues.extend(issues)
 
+    if stats["hits"]:
+        logger.info(
+            "Deterministic block cache: %d hits, %d misses",
+            stats["hits"], stats["misses"],
+        )
+
     # Cross-block dedup: remove issues with the same rule_name and
     # flagged_text that appear across different blocks (e.g. AsciiDoc
     # conditional ifdef/endif branches that contain near-identical text).
@@ -1011,6 +1535,9 @@ def _analyze_single_block_deterministic(
     nlp: Any,
     original_text: str,
     acronym_context: dict[str, str] | None = None,
+    text_index: DocumentTextIndex | None = None,
+    cache_context: str | None = None,
+    stats: dict[str, int] | None = None,
 ) -> list[IssueResponse]:
     """Analyse a single block with its block_type and remap spans.
 
@@ -1025,6 +1552,11 @@ def _analyze_single_block_deterministic(
         content_type: Modular documentation type.
         nlp: SpaCy language model instance.
         original_text: The whitespace-normalized but uncleaned text.
+        text_index: Shared search index over *original_text*.
+        cache_context: Result of :func:`_det_block_cache_context`; when
+            given, block-relative issues are served from and stored in
+            the deterministic block cache.
+        stats: Optional ``hits``/``misses`` counters to update.
 
     Returns:
         Issues with spans mapped to original-text coordinates.
@@ -1032,7 +1564,22 @@ def _analyze_single_block_deterministic(
     block_text = block.content
     block_type = block.block_type or "paragraph"
 
-    doc = nlp(block_text)
+    cache_key = (
+        _det_block_cache_key(block, block_type, cache_context)
+        if cache_context is not None else None
+    )
+    cached = _get_cached_det_block(cache_key) if cache_key else None
+    if cached is not None:
+        if stats is not None:
+            stats["hits"] += 1
+        issues = cached
+        _map_block_issues_to_original(issues, block, original_text, text_index)
+        return issues
+    if stats is not None:
+        stats["misses"] += 1
+
+    disable = block_disabled_components(nlp, block_type)
+    doc = nlp(block_text, disable=disable) if disable else nlp(block_text)
     sentences = [s.text.strip() for s in doc.sents if s.text.strip()]
     if not sentences:
         sentences = [block_text]
@@ -1053,7 +1600,9 @@ def _analyze_single_block_deterministic(
         acronym_context=acronym_context,
     )
 
-    _map_block_issues_to_original(issues, block, original_text)
+    if cache_key:
+        _cache_det_block(cache_key, issues)
+    _map_block_issues_to_original(issues, block, original_text, text_index)
     return issues
 
 
@@ -1124,6 +1673,7 @@ def _map_block_issues_to_original(
     issues: list[IssueResponse],
     block: Any,
     original_text: str,
+    text_index: DocumentTextIndex | None = None,
 ) -> None:
     """Map per-block issue spans to original-text coordinates.
 
@@ -1142,6 +1692,8 @@ def _map_block_issues_to_original(
         issues: Issues with spans relative to ``block.content``.
         block: The parsed Block object that produced these issues.
         original_text: The whitespace-normalized but uncleaned text.
+        text_index: Shared search index over *original_text*, reused
+            across blocks.
     """
     char_map = getattr(block, "char_map", None)
     orig_len = len(original_text)
@@ -1186,7 +1738,7 @@ def _map_block_issues_to_original(
 
         result = _find_flagged_in_text(
             original_text, flagged, search_from, search_to,
-            position_hint=orig_approx,
+            position_hint=orig_approx, index=text_index,
         )
         if result:
             issue.span = [result[0], result[1]]
@@ -1204,7 +1756,7 @@ def _map_block_issues_to_original(
             block_to = min(orig_len, block.end_pos + 200)
         result = _find_flagged_in_text(
             original_text, flagged, block_from, block_to,
-            position_hint=orig_approx,
+            position_hint=orig_approx, index=text_index,
         )
         if result:
             issue.span = [result[0], result[1]]
@@ -1281,6 +1833,8 @@ def _run_llm_granular(
     style_guide_excerpts: list[dict] | None = None,
     document_outline: str | None = None,
     det_issue_count: int = 0,
+    excerpt_source: _ExcerptSource | None = None,
+    cancel_token: CancellationToken | None = None,
 ) -> list[IssueResponse]:
     """Run the LLM granular (per-block) analysis pass.
 
@@ -1297,11 +1851,15 @@ def _run_llm_granular(
         style_guide_excerpts: Relevant style guide excerpt dicts.
         document_outline: Compact heading outline of the full document.
         det_issue_count: Phase 1 deterministic issue count for token budget.
+        excerpt_source: When given, each block reads its excerpts and
+            issue count from it as it runs, overriding the two above.
+        cancel_token: Token of this analysis run; cancelling it drops
+            queued blocks and aborts in-flight LLM calls.
 
     Returns:
-        List of LLM-detected issues, empty on failure.
+        List of LLM-detected issues, empty on failure or cancellation.
     """
-    if _is_cancelled(session_id):
+    if _is_cancelled(session_id, cancel_token):
         return []
 
     _emit_progress(socket_sid, session_id, "llm_granular", "Running AI analysis", 60)
@@ -1309,6 +1867,7 @@ def _run_llm_granular(
     try:
         if analyze_block is not None:
             text_blocks, resolve_text, remap_offset = _resolve_llm_text_sources(prep)
+            block_spans = locate_blocks(text_blocks, resolve_text, remap_offset)
             progress_ctx = {
                 "socket_sid": socket_sid,
                 "session_id": session_id,
@@ -1321,6 +1880,10 @@ def _run_llm_granular(
                 document_outline=document_outline,
                 progress_context=progress_ctx,
                 det_issue_count=det_issue_count,
+                excerpt_source=excerpt_source,
+                cancel_token=cancel_token,
+                block_spans=block_spans,
+                priority=_block_priority(session_id),
             )
             issues = _parse_llm_results(results, "llm_granular", resolve_text)
             for i, iss in enumerate(issues):
@@ -1342,14 +1905,15 @@ def _run_llm_granular(
             issues = _strip_backtick_suggestions(
                 issues, prep.get("original_text", ""),
             )
-            _emit_event(socket_sid, "llm_granular_complete", {
-                "session_id": session_id,
-                "issues": [i.to_dict() for i in issues],
-            })
+            _publish_results(
+                socket_sid, session_id, "llm_granular_complete", issues, cancel_token,
+            )
             return issues
+    except OperationCancelled:
+        logger.info("LLM granular pass cancelled for %s", session_id)
     except (ConnectionError, TimeoutError, ValueError, KeyError) as exc:
         logger.warning("LLM granular pass failed: %s", exc)
-        _emit_event(socket_sid, "llm_skipped", {
+        _broadcast_event(socket_sid, "llm_skipped", {
             "session_id": session_id,
             "phase": "granular",
             "reason": str(exc),
@@ -1368,6 +1932,10 @@ def _run_incremental_blocks(
     document_outline: str | None = None,
     progress_context: dict[str, Any] | None = None,
     det_issue_count: int = 0,
+    excerpt_source: _ExcerptSource | None = None,
+    cancel_token: CancellationToken | None = None,
+    block_spans: list[tuple[int, int]] | None = None,
+    priority: BlockPriority | None = None,
 ) -> list[dict[str, Any]]:
     """Analyze blocks incrementally, skipping unchanged ones.
 
@@ -1387,9 +1955,17 @@ def _run_incremental_blocks(
         acronym_context: Known acronym definitions.
         style_guide_excerpts: Relevant style guide excerpt dicts.
         document_outline: Compact heading outline of the full document.
+        excerpt_source: Optional live excerpt source (see _run_llm_granular).
+        cancel_token: Token of this analysis run.
+        block_spans: Original-text range of each block, for *priority*.
+        priority: The writer's viewport; blocks nearest it run first.
 
     Returns:
         Combined list of raw issue dicts from all blocks.
+
+    Raises:
+        OperationCancelled: If the run is cancelled; no block data is
+            stored, so the next run does not reuse partial results.
     """
     block_hashes = [
         _block_cache_key(b, content_type) for b in blocks
@@ -1405,6 +1981,10 @@ def _run_incremental_blocks(
             document_outline=document_outline,
             progress_context=progress_context,
             det_issue_count=det_issue_count,
+            excerpt_source=excerpt_source,
+            cancel_token=cancel_token,
+            block_spans=block_spans,
+            priority=priority,
         )
         _store_block_data(
             session_id, block_hashes, blocks, results,
@@ -1436,6 +2016,10 @@ def _run_incremental_blocks(
         document_outline=document_outline,
         progress_context=progress_context,
         det_issue_count=det_issue_count,
+        excerpt_source=excerpt_source,
+        cancel_token=cancel_token,
+        block_spans=[block_spans[i] for i in changed_indices] if block_spans else None,
+        priority=priority,
     )
 
     # Build per-block issue mapping for changed blocks
@@ -1521,6 +2105,7 @@ def _run_llm_global(
     document_outline: str | None = None,
     abstract_context: str | None = None,
     det_issue_count: int = 0,
+    cancel_token: CancellationToken | None = None,
 ) -> list[IssueResponse]:
     """Run the LLM global (full-document) analysis pass.
 
@@ -1538,11 +2123,13 @@ def _run_llm_global(
         abstract_context: First paragraph after heading (module abstract)
             for targeted short-description quality evaluation.
         det_issue_count: Phase 1 deterministic issue count for token budget.
+        cancel_token: Token of this analysis run.
 
     Returns:
-        List of LLM-detected issues, empty on failure or skip.
+        List of LLM-detected issues, empty on failure, skip or
+        cancellation.
     """
-    if _is_cancelled(session_id):
+    if _is_cancelled(session_id, cancel_token):
         return []
 
     if prep["word_count"] < _GLOBAL_PASS_MIN_WORDS:
@@ -1574,6 +2161,7 @@ def _run_llm_global(
                 document_outline=document_outline,
                 abstract_context=abstract_context,
                 det_issue_count=det_issue_count,
+                cancel_token=cancel_token,
             )
             issues = _parse_llm_results(results, "llm_global", global_text)
             for i, iss in enumerate(issues):
@@ -1595,14 +2183,15 @@ def _run_llm_global(
             issues = _strip_backtick_suggestions(
                 issues, prep.get("original_text", ""),
             )
-            _emit_event(socket_sid, "llm_global_complete", {
-                "session_id": session_id,
-                "issues": [i.to_dict() for i in issues],
-            })
+            _publish_results(
+                socket_sid, session_id, "llm_global_complete", issues, cancel_token,
+            )
             return issues
+    except OperationCancelled:
+        logger.info("LLM global pass cancelled for %s", session_id)
     except (ConnectionError, TimeoutError, ValueError, KeyError) as exc:
         logger.warning("LLM global pass failed: %s", exc)
-        _emit_event(socket_sid, "llm_skipped", {
+        _broadcast_event(socket_sid, "llm_skipped", {
             "session_id": session_id,
             "phase": "global",
             "reason": str(exc),
@@ -1620,6 +2209,7 @@ def _run_judge_pass(
     issues: list[IssueResponse],
     document_excerpt: str,
     content_type: str,
+    cancel_token: CancellationToken | None = None,
 ) -> list[IssueResponse]:
     """Run self-correction judge pass on LLM issues.
 
@@ -1631,20 +2221,28 @@ def _run_judge_pass(
         issues: LLM-generated issues to review.
         document_excerpt: Representative excerpt for context.
         content_type: Modular documentation type.
+        cancel_token: Token of this analysis run.
 
     Returns:
         Filtered list with false positives removed.
+
+    Raises:
+        OperationCancelled: If the run is cancelled.
     """
     if not issues or judge_issues is None:
         return issues
 
     if len(issues) <= _JUDGE_BATCH_SIZE:
-        return _judge_single_batch(issues, document_excerpt, content_type)
+        return _judge_single_batch(
+            issues, document_excerpt, content_type, cancel_token,
+        )
 
     kept: list[IssueResponse] = []
     for batch_start in range(0, len(issues), _JUDGE_BATCH_SIZE):
         batch = issues[batch_start:batch_start + _JUDGE_BATCH_SIZE]
-        kept.extend(_judge_single_batch(batch, document_excerpt, content_type))
+        kept.extend(_judge_single_batch(
+            batch, document_excerpt, content_type, cancel_token,
+        ))
 
     logger.info(
         "Judge pass: %d → %d issues (%d dropped)",
@@ -1657,6 +2255,7 @@ def _judge_single_batch(
     issues: list[IssueResponse],
     document_excerpt: str,
     content_type: str,
+    cancel_token: CancellationToken | None = None,
 ) -> list[IssueResponse]:
     """Run judge on a single batch of issues.
 
@@ -1667,6 +2266,7 @@ def _judge_single_batch(
         issues: Batch of issues to review.
         document_excerpt: Representative excerpt for context.
         content_type: Modular documentation type.
+        cancel_token: Token of this analysis run.
 
     Returns:
         Issues that the judge decided to keep.
@@ -1683,7 +2283,7 @@ def _judge_single_batch(
     ]
 
     keep_indices, drop_indices = judge_issues(
-        issue_dicts, document_excerpt, content_type,
+        issue_dicts, document_excerpt, content_type, cancel_token=cancel_token,
     )
 
     keep_set = set(keep_indices)
@@ -1716,6 +2316,11 @@ _ACRONYM_DEF_REV_RE = re.compile(
     r"\(([A-Z][A-Z0-9]{1,10})\)\s+([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)+)",
 )
 
+# An "(ACRONYM)" that could close a forward definition.
+_ACRONYM_PAREN_RE = re.compile(r"\s\([A-Z][A-Z0-9]{1,10}\)")
+# Characters an expansion in _ACRONYM_DEF_RE can consist of.
+_EXPANSION_CHAR_RE = re.compile(r"[a-zA-Z\s]")
+
 
 def _collect_acronyms(text: str) -> dict[str, str]:
     """Scan text for acronym definitions.
@@ -1731,9 +2336,17 @@ def _collect_acronyms(text: str) -> dict[str, str]:
         ``{"CSI": "Container Storage Interface"}``.
     """
     acronyms: dict[str, str] = {}
-    for match in _ACRONYM_DEF_RE.finditer(text):
-        expansion, abbrev = match.group(1).strip(), match.group(2)
-        acronyms[abbrev] = expansion
+    # A forward definition ends at an "(ACRONYM)" and its expansion lies
+    # in the run of letters and spaces just before it, so only those runs
+    # are searched instead of every capitalised word in the document.
+    for paren in _ACRONYM_PAREN_RE.finditer(text):
+        run_start = paren.start()
+        while run_start > 0 and _EXPANSION_CHAR_RE.match(text, run_start - 1):
+            run_start -= 1
+        match = _ACRONYM_DEF_RE.search(text, run_start, paren.end())
+        if match:
+            expansion, abbrev = match.group(1).strip(), match.group(2)
+            acronyms[abbrev] = expansion
     for match in _ACRONYM_DEF_REV_RE.finditer(text):
         abbrev, expansion = match.group(1), match.group(2).strip()
         if abbrev not in acronyms:
@@ -1803,34 +2416,140 @@ def _block_cache_key(block_text: str, content_type: str) -> str:
     ).hexdigest()
 
 
-def _get_cached_block(key: str) -> list[dict[str, Any]] | None:
-    """Retrieve cached LLM results for a block if still valid.
+def _get_cached_block(key: str) -> list[dict[str, Any]] | None:
+    """Retrieve cached LLM results for a block if still valid.
+
+    Args:
+        key: Cache key from ``_block_cache_key()``.
+
+    Returns:
+        Cached issue list, or ``None`` on miss / expiry.
+    """
+    ttl = Config.BLOCK_CACHE_TTL
+    with _block_cache_lock:
+        entry = _block_cache.get(key)
+        if entry and time.time() - entry["ts"] < ttl:
+            return entry["issues"]
+        if entry:
+            del _block_cache[key]
+    return None
+
+
+def _cache_block(key: str, issues: list[dict[str, Any]]) -> None:
+    """Store LLM results for a block in the cache.
+
+    Args:
+        key: Cache key from ``_block_cache_key()``.
+        issues: Raw issue dicts returned by the LLM.
+    """
+    with _block_cache_lock:
+        _block_cache[key] = {"issues": issues, "ts": time.time()}
+
+
+# ---------------------------------------------------------------------------
+# Block-level deterministic result cache
+# ---------------------------------------------------------------------------
+
+# LRU of block-relative deterministic issues, keyed by
+# _det_block_cache_key().  Entries hold private copies; every hit hands
+# out fresh copies with new IDs because callers remap spans in place and
+# the same block text may occur several times in one document.
+_det_block_cache: OrderedDict[str, tuple[list[IssueResponse], float]] = OrderedDict()
+_det_block_cache_lock = threading.Lock()
+
+
+def _det_block_cache_context(
+    content_type: str,
+    acronym_context: dict[str, str] | None,
+) -> str:
+    """Build the per-analysis part of the deterministic cache key.
+
+    Combines the content type, the rule-set version (rules, mappings
+    and rule configs), and a hash of the acronym context, which the
+    definitions rule reads.
+
+    Args:
+        content_type: Modular documentation type.
+        acronym_context: Document-wide acronym definitions.
+
+    Returns:
+        String shared by every block key of one analysis.
+    """
+    from rules import get_registry
+
+    acronyms = json.dumps(acronym_context or {}, sort_keys=True)
+    acronym_hash = hashlib.sha256(acronyms.encode()).hexdigest()[:16]
+    return f"{content_type}|{get_registry().ruleset_version}|{acronym_hash}"
+
+
+def _det_block_cache_key(block: Any, block_type: str, context: str) -> str:
+    """Compute the deterministic cache key for one block.
+
+    ``inline_content`` is part of the key because inline code and bold
+    code ranges (and ``char_map``) are derived from it.
+
+    Args:
+        block: The parsed Block object.
+        block_type: Effective block type used for rule selection.
+        context: Result of :func:`_det_block_cache_context`.
+
+    Returns:
+        Hex digest string.
+    """
+    inline = getattr(block, "inline_content", "") or ""
+    return hashlib.sha256(
+        f"{block.content}\x1f{inline}\x1f{block_type}\x1f{context}".encode(),
+    ).hexdigest()
+
+
+def _copy_block_issues(issues: list[IssueResponse]) -> list[IssueResponse]:
+    """Copy issues with fresh IDs and independent mutable fields."""
+    return [
+        dataclasses.replace(
+            issue,
+            id=str(uuid.uuid4()),
+            span=list(issue.span),
+            suggestions=list(issue.suggestions),
+        )
+        for issue in issues
+    ]
+
+
+def _get_cached_det_block(key: str) -> list[IssueResponse] | None:
+    """Retrieve block-relative deterministic issues if still valid.
 
     Args:
-        key: Cache key from ``_block_cache_key()``.
+        key: Cache key from ``_det_block_cache_key()``.
 
     Returns:
-        Cached issue list, or ``None`` on miss / expiry.
+        Fresh copies of the cached issues, or ``None`` on miss / expiry.
     """
     ttl = Config.BLOCK_CACHE_TTL
-    with _block_cache_lock:
-        entry = _block_cache.get(key)
-        if entry and time.time() - entry["ts"] < ttl:
-            return entry["issues"]
-        if entry:
-            del _block_cache[key]
-    return None
+    with _det_block_cache_lock:
+        entry = _det_block_cache.get(key)
+        if entry is None:
+            return None
+        issues, ts = entry
+        if time.time() - ts >= ttl:
+            del _det_block_cache[key]
+            return None
+        _det_block_cache.move_to_end(key)
+    return _copy_block_issues(issues)
 
 
-def _cache_block(key: str, issues: list[dict[str, Any]]) -> None:
-    """Store LLM results for a block in the cache.
+def _cache_det_block(key: str, issues: list[IssueResponse]) -> None:
+    """Store block-relative deterministic issues, evicting the oldest.
 
     Args:
-        key: Cache key from ``_block_cache_key()``.
-        issues: Raw issue dicts returned by the LLM.
+        key: Cache key from ``_det_block_cache_key()``.
+        issues: Issues with spans relative to ``block.content``.
     """
-    with _block_cache_lock:
-        _block_cache[key] = {"issues": issues, "ts": time.time()}
+    entry = (_copy_block_issues(issues), time.time())
+    with _det_block_cache_lock:
+        _det_block_cache[key] = entry
+        _det_block_cache.move_to_end(key)
+        while len(_det_block_cache) > Config.DET_BLOCK_CACHE_MAX_ENTRIES:
+            _det_block_cache.popitem(last=False)
 
 
 # ---------------------------------------------------------------------------
@@ -1848,6 +2567,19 @@ _MAX_SEMANTIC_CHUNK_CHARS: int = Config.LLM_CHUNK_SIZE
 # Keep overlap <= 2 when chunk size is 3500 to avoid > 25% overhead.
 _OVERLAP_BLOCK_COUNT: int = Config.LLM_CHUNK_OVERLAP
 
+# Content-defined chunking: a chunk never ends before _CDC_MIN_FRACTION
+# of LLM_CHUNK_SIZE new characters, and past that ends after roughly
+# _CDC_SPREAD_FRACTION more on average (about 70% of the chunk size in
+# total).  A larger minimum means fewer, fuller chunks but more forced
+# cuts at the maximum, which shift like greedy boundaries do.  The
+# boundary hash covers the last _CDC_WINDOW_BLOCKS blocks.
+_CDC_MIN_FRACTION = 0.4
+_CDC_SPREAD_FRACTION = 0.3
+_CDC_WINDOW_BLOCKS = 2
+_CDC_HASH_BASE = 0x100000001B3
+_CDC_HASH_MASK = (1 << 64) - 1
+_CDC_HASH_BASE_POW = pow(_CDC_HASH_BASE, _CDC_WINDOW_BLOCKS, 1 << 64)
+
 # Minimum word count for the global (full-document) LLM pass — configurable
 # via LLM_GLOBAL_MIN_WORDS.  At 300, short docs skip the global pass
 # entirely, saving 60-70s of LLM time.
@@ -1895,10 +2627,12 @@ def _split_into_semantic_chunks(
 ) -> list[str]:
     """Group parsed blocks into LLM-sized Markdown chunks with overlap.
 
-    Never splits inside a block. Only splits on block boundaries.
-    Repeats the last ``_OVERLAP_BLOCK_COUNT`` blocks from the previous
-    chunk at the start of the next chunk so the LLM has cross-boundary
-    context continuity.
+    Never splits inside a block. Only splits on block boundaries, which
+    are content-defined (see :func:`_group_with_overlap`) so that
+    unchanged regions of an edited document keep their chunks and
+    block cache entries.  Repeats the last ``_OVERLAP_BLOCK_COUNT``
+    blocks from the previous chunk at the start of the next chunk so
+    the LLM has cross-boundary context continuity.
 
     Args:
         blocks: List of Block dataclass instances from a parser.
@@ -1934,8 +2668,19 @@ def _group_with_overlap(
     parts: list[str],
     max_chars: int,
 ) -> list[str]:
-    """Group Markdown parts into chunks with trailing-block overlap.
-
+    """Group Markdown parts into content-defined chunks with overlap.
+
+    Chunk boundaries are chosen by a rolling hash over the hashes of
+    the last ``_CDC_WINDOW_BLOCKS`` blocks, so whether a chunk ends
+    after a block depends only on that block and its predecessors --
+    not on where the chunk started.  Inserting or editing a block near
+    the top of a document therefore changes only the chunk (or two,
+    with overlap) around the edit; later chunks keep their text and
+    their block cache keys.  Greedy packing shifted every later
+    boundary instead.
+
+    A chunk never ends before ``max_chars * _CDC_MIN_FRACTION`` new
+    characters and is always cut before it would exceed *max_chars*.
     The last ``_OVERLAP_BLOCK_COUNT`` blocks of each chunk are
     repeated at the start of the next chunk for context continuity.
 
@@ -1949,34 +2694,96 @@ def _group_with_overlap(
     if not parts:
         return [""]
 
+    min_chars = int(max_chars * _CDC_MIN_FRACTION)
+    # Expected characters past the minimum before a hash boundary.
+    spread_chars = max(1, int(max_chars * _CDC_SPREAD_FRACTION))
+
     chunks: list[str] = []
     current: list[str] = []
     current_len = 0
+    fresh_len = 0  # characters excluding the carried-over overlap
+    fresh_count = 0
+    window: list[int] = []
+    roll = 0
+
+    def _flush() -> None:
+        nonlocal current, current_len, fresh_len, fresh_count
+        chunks.append("\n\n".join(current))
+        # Carry the last N blocks as overlap into the next chunk.
+        # Guard: if the chunk has fewer blocks than the overlap
+        # count, skip overlap entirely to prevent full-chunk
+        # duplication.
+        if len(current) > _OVERLAP_BLOCK_COUNT:
+            current = current[len(current) - _OVERLAP_BLOCK_COUNT:]
+        else:
+            current = []
+        current_len = sum(len(p) for p in current)
+        fresh_len = 0
+        fresh_count = 0
 
     for part in parts:
         part_len = len(part)
         if current_len + part_len > max_chars and current:
-            chunks.append("\n\n".join(current))
-            # Carry the last N blocks as overlap into the next chunk.
-            # Guard: if the chunk has fewer blocks than the overlap
-            # count, skip overlap entirely to prevent full-chunk
-            # duplication.
-            if len(current) > _OVERLAP_BLOCK_COUNT:
-                overlap = current[-_OVERLAP_BLOCK_COUNT:]
+            if fresh_count:
+                _flush()
             else:
-                overlap = []
-            current = list(overlap)
-            current_len = sum(len(p) for p in current)
+                # Only overlap is pending: drop it rather than emit a
+                # chunk that merely repeats the previous one.
+                current, current_len = [], 0
 
         current.append(part)
         current_len += part_len
+        fresh_len += part_len
+        fresh_count += 1
 
-    if current:
+        digest = _part_digest(part)
+        window.append(digest)
+        roll = (roll * _CDC_HASH_BASE + digest) & _CDC_HASH_MASK
+        if len(window) > _CDC_WINDOW_BLOCKS:
+            roll = (roll - window.pop(0) * _CDC_HASH_BASE_POW) & _CDC_HASH_MASK
+
+        if fresh_len >= min_chars and _is_content_boundary(roll, part_len, spread_chars):
+            _flush()
+
+    if fresh_count:
         chunks.append("\n\n".join(current))
 
     return chunks if chunks else [""]
 
 
+def _part_digest(part: str) -> int:
+    """Return a 64-bit content hash of one Markdown block.
+
+    Args:
+        part: Markdown text of a block.
+
+    Returns:
+        Unsigned 64-bit integer digest.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(part.encode(), digest_size=8).digest(), "big",
+    )
+
+
+def _is_content_boundary(roll: int, part_len: int, spread_chars: int) -> bool:
+    """Decide from the rolling hash whether a chunk may end here.
+
+    The probability of a boundary is proportional to the block's
+    length, so chunks average about *spread_chars* characters past the
+    minimum regardless of how long individual blocks are.
+
+    Args:
+        roll: Rolling hash of the trailing block window.
+        part_len: Length of the block just added.
+        spread_chars: Expected characters between boundaries.
+
+    Returns:
+        True if the chunk should end after this block.
+    """
+    threshold = min(1.0, part_len / spread_chars) * _CDC_HASH_MASK
+    return roll < threshold
+
+
 def _analyze_blocks(
     blocks: list[str],
     sentences: list[str],
@@ -1986,6 +2793,10 @@ def _analyze_blocks(
     document_outline: str | None = None,
     progress_context: dict[str, Any] | None = None,
     det_issue_count: int = 0,
+    excerpt_source: _ExcerptSource | None = None,
+    cancel_token: CancellationToken | None = None,
+    block_spans: list[tuple[int, int]] | None = None,
+    priority: BlockPriority | None = None,
 ) -> list[dict[str, Any]]:
     """Run LLM analysis on blocks, using parallelism when beneficial.
 
@@ -2002,9 +2813,16 @@ def _analyze_blocks(
         progress_context: Optional dict with socket_sid, session_id,
             blocks_total for per-block progress events.
         det_issue_count: Phase 1 deterministic issue count for token budget.
+        excerpt_source: Optional live excerpt source (see _run_llm_granular).
+        cancel_token: Token of this analysis run.
+        block_spans: Original-text range of each block, for *priority*.
+        priority: The writer's viewport; blocks nearest it run first.
 
     Returns:
         Combined list of raw issue dicts from all blocks.
+
+    Raises:
+        OperationCancelled: If the run is cancelled.
     """
     assert analyze_block is not None  # guarded by caller
     if len(blocks) <= 1:
@@ -2013,12 +2831,15 @@ def _analyze_blocks(
         if cached is not None:
             logger.debug("Single-block cache hit (key=%s)", key[:12])
             return cached
+        if excerpt_source is not None:
+            style_guide_excerpts, det_issue_count = excerpt_source.snapshot()
         results = analyze_block(
             blocks[0], sentences, content_type,
             acronym_context=acronym_context,
             style_guide_excerpts=style_guide_excerpts,
             document_outline=document_outline,
             det_issue_count=det_issue_count,
+            cancel_token=cancel_token,
         )
         _cache_block(key, results)
         return results
@@ -2029,6 +2850,10 @@ def _analyze_blocks(
         document_outline=document_outline,
         progress_context=progress_context,
         det_issue_count=det_issue_count,
+        excerpt_source=excerpt_source,
+        cancel_token=cancel_token,
+        block_spans=block_spans,
+        priority=priority,
     )
 
 
@@ -2040,6 +2865,10 @@ def _analyze_blocks_parallel(
     document_outline: str | None = None,
     progress_context: dict[str, Any] | None = None,
     det_issue_count: int = 0,
+    excerpt_source: _ExcerptSource | None = None,
+    cancel_token: CancellationToken | None = None,
+    block_spans: list[tuple[int, int]] | None = None,
+    priority: BlockPriority | None = None,
 ) -> list[dict[str, Any]]:
     """Execute multiple block analyses concurrently.
 
@@ -2048,6 +2877,14 @@ def _analyze_blocks_parallel(
     individual blocks are logged and skipped so that successful blocks
     still contribute results.
 
+    Each free worker starts the pending block nearest the writer's
+    viewport (see ``_submit_block_futures``), so feedback for the
+    section on screen arrives first even on a long document.
+
+    On cancellation the pool is shut down without waiting: blocks
+    still queued are dropped (and counted as skipped calls) and the
+    blocks in flight are aborted by the token.
+
     Args:
         blocks: List of text blocks.
         content_type: Modular documentation type.
@@ -2056,9 +2893,16 @@ def _analyze_blocks_parallel(
         document_outline: Compact heading outline of the full document.
         progress_context: Optional dict for per-block progress events.
         det_issue_count: Phase 1 deterministic issue count for token budget.
+        excerpt_source: Optional live excerpt source (see _run_llm_granular).
+        cancel_token: Token of this analysis run.
+        block_spans: Original-text range of each block, for *priority*.
+        priority: The writer's viewport; document order when None.
 
     Returns:
         Combined list of raw issue dicts from all successful blocks.
+
+    Raises:
+        OperationCancelled: If the run is cancelled.
     """
     max_workers = min(len(blocks), Config.LLM_MAX_CONCURRENT)
     logger.info(
@@ -2066,22 +2910,64 @@ def _analyze_blocks_parallel(
         len(blocks), max_workers,
     )
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures: dict[Any, int] = {}
+    unregister = None
+    try:
         futures, cached_results = _submit_block_futures(
             executor, blocks, content_type, acronym_context,
             style_guide_excerpts=style_guide_excerpts,
             document_outline=document_outline,
             det_issue_count=det_issue_count,
+            excerpt_source=excerpt_source,
+            cancel_token=cancel_token,
+            workers=max_workers,
+            block_spans=block_spans,
+            priority=priority,
         )
+        if cancel_token is not None:
+            # Cancelling queued futures also wakes the collector below.
+            unregister = cancel_token.add_callback(
+                lambda: [future.cancel() for future in list(futures)],
+            )
         cached_offset = len(cached_results) if progress_context else 0
         sid = progress_context.get("session_id", "") if progress_context else ""
         new_results = _collect_block_results(
             futures, progress_context, cached_offset, session_id=sid,
+            cancel_token=cancel_token,
         )
-
+    finally:
+        if unregister is not None:
+            unregister()
+        # Never wait for queued blocks: after a normal run every future
+        # is already done; otherwise the blocks not yet started are
+        # cancelled so the workers stop picking them up.
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if cancel_token is not None and cancel_token.cancelled:
+        _record_dropped_blocks(futures, blocks)
+        raise OperationCancelled(cancel_token.reason)
     return cached_results + new_results
 
 
+def _record_dropped_blocks(futures: dict[Any, int], blocks: list[str]) -> None:
+    """Count queued block analyses that cancellation dropped.
+
+    Args:
+        futures: Mapping of block futures to block indices.
+        blocks: The text blocks the futures were submitted for.
+    """
+    dropped = [idx for future, idx in futures.items() if future.cancelled()]
+    if not dropped:
+        return
+    get_cancellation_stats().record_skipped(
+        sum(estimate_tokens(blocks[idx]) for idx in dropped), calls=len(dropped),
+    )
+    logger.info("Dropped %d queued block(s) after cancellation", len(dropped))
+
+
 def _submit_block_futures(
     executor: ThreadPoolExecutor,
     blocks: list[str],
@@ -2090,11 +2976,23 @@ def _submit_block_futures(
     style_guide_excerpts: list[dict] | None = None,
     document_outline: str | None = None,
     det_issue_count: int = 0,
+    excerpt_source: _ExcerptSource | None = None,
+    cancel_token: CancellationToken | None = None,
+    workers: int = 1,
+    block_spans: list[tuple[int, int]] | None = None,
+    priority: BlockPriority | None = None,
 ) -> tuple[dict[Any, int], list[dict[str, Any]]]:
-    """Submit each block to the executor, skipping cache hits.
+    """Queue each block for the executor's workers, skipping cache hits.
+
+    Checks the block cache before queueing.  Cached results are
+    returned directly and the block is not queued.
 
-    Checks the block cache before submitting.  Cached results are
-    returned directly and the block is not submitted to the executor.
+    The executor's own queue is first-in first-out, so instead of one
+    task per block it runs *workers* loops that each take the pending
+    block nearest the viewport from a :class:`BlockQueue` when they
+    become free.  A viewport update therefore reorders the blocks not
+    yet started.  Every block still gets its own future; cancelling a
+    future before its block starts drops the block.
 
     Args:
         executor: The thread pool executor.
@@ -2104,12 +3002,20 @@ def _submit_block_futures(
         style_guide_excerpts: Relevant style guide excerpt dicts.
         document_outline: Compact heading outline of the full document.
         det_issue_count: Phase 1 deterministic issue count for token budget.
+        excerpt_source: Optional live excerpt source (see _run_llm_granular).
+        cancel_token: Token passed to every block's LLM call.
+        workers: Number of worker loops to start (the executor's size).
+        block_spans: Original-text range of each block; without it the
+            blocks run in document order.
+        priority: The writer's viewport.
 
     Returns:
         Tuple of (futures mapping, cached issue list).
     """
     futures: dict[Any, int] = {}
     cached_results: list[dict[str, Any]] = []
+    pending: list[tuple[Future, tuple]] = []
+    pending_spans: list[tuple[int, int]] = []
 
     for i, block in enumerate(blocks):
         key = _block_cache_key(block, content_type)
@@ -2119,17 +3025,45 @@ def _submit_block_futures(
             cached_results.extend(cached)
             continue
 
-        block_sentences = _extract_block_sentences(block)
-        future = executor.submit(
-            _analyze_and_cache_block, block, block_sentences,
-            content_type, key, acronym_context, style_guide_excerpts,
-            document_outline, det_issue_count,
-        )
+        future: Future = Future()
         futures[future] = i
+        pending.append((future, (
+            block, _extract_block_sentences(block),
+            content_type, key, acronym_context, style_guide_excerpts,
+            document_outline, det_issue_count, excerpt_source, cancel_token,
+        )))
+        pending_spans.append(block_spans[i] if block_spans else (i, i))
+
+    queue = BlockQueue(pending, pending_spans, priority if block_spans else None)
+    for _ in range(min(workers, len(pending))):
+        executor.submit(bind_capture(_block_worker, "llm-block"), queue, cancel_token)
 
     return futures, cached_results
 
 
+def _block_worker(
+    queue: BlockQueue, cancel_token: CancellationToken | None,
+) -> None:
+    """Run queued blocks until the queue is empty.
+
+    Args:
+        queue: Pending ``(future, arguments)`` pairs from
+            ``_submit_block_futures``.
+        cancel_token: Token of this analysis run; once cancelled, the
+            remaining blocks are dropped rather than started.
+    """
+    while (item := queue.pop()) is not None:
+        future, args = item
+        if cancel_token is not None and cancel_token.cancelled:
+            future.cancel()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(_analyze_and_cache_block(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+
 def _analyze_and_cache_block(
     block: str,
     sentences: list[str],
@@ -2139,9 +3073,15 @@ def _analyze_and_cache_block(
     style_guide_excerpts: list[dict] | None = None,
     document_outline: str | None = None,
     det_issue_count: int = 0,
+    excerpt_source: _ExcerptSource | None = None,
+    cancel_token: CancellationToken | None = None,
 ) -> list[dict[str, Any]]:
     """Analyze a single block and store results in the cache.
 
+    With an *excerpt_source*, excerpts and the issue count are read
+    when the block starts running, so blocks queued behind Phase 1
+    use the excerpts refined from deterministic issues.
+
     Args:
         block: The text block to analyse.
         sentences: Extracted sentences from the block.
@@ -2151,17 +3091,25 @@ def _analyze_and_cache_block(
         style_guide_excerpts: Relevant style guide excerpt dicts.
         document_outline: Compact heading outline of the full document.
         det_issue_count: Phase 1 deterministic issue count for token budget.
+        excerpt_source: Optional live excerpt source (see _run_llm_granular).
+        cancel_token: Token of this analysis run.
 
     Returns:
         Raw issue dicts from the LLM.
+
+    Raises:
+        OperationCancelled: If the run is cancelled (nothing is cached).
     """
     assert analyze_block is not None  # guarded by caller
+    if excerpt_source is not None:
+        style_guide_excerpts, det_issue_count = excerpt_source.snapshot()
     results = analyze_block(
         block, sentences, content_type,
         acronym_context=acronym_context,
         style_guide_excerpts=style_guide_excerpts,
         document_outline=document_outline,
         det_issue_count=det_issue_count,
+        cancel_token=cancel_token,
     )
     _cache_block(cache_key, results)
     return results
@@ -2172,6 +3120,7 @@ def _collect_block_results(
     progress_context: dict[str, Any] | None = None,
     cached_offset: int = 0,
     session_id: str = "",
+    cancel_token: CancellationToken | None = None,
 ) -> list[dict[str, Any]]:
     """Collect results from completed block futures.
 
@@ -2190,6 +3139,7 @@ def _collect_block_results(
         cached_offset: Number of already-cached blocks to add to
             the done counter (incremental analysis).
         session_id: Analysis session identifier for cancellation checks.
+        cancel_token: Token of this analysis run.
 
     Returns:
         Combined list of raw issue dicts, ordered by block index.
@@ -2197,7 +3147,9 @@ def _collect_block_results(
     indexed_results: list[tuple[int, list[dict[str, Any]]]] = []
     blocks_done = cached_offset
     for future in as_completed(futures):
-        if session_id and _is_cancelled(session_id):
+        if (cancel_token is not None and cancel_token.cancelled) or (
+            session_id and _is_cancelled(session_id)
+        ):
             logger.info("Analysis cancelled, discarding remaining blocks")
             break
         block_idx = futures[future]
@@ -2209,7 +3161,7 @@ def _collect_block_results(
         indexed_results.append((block_idx, block_issues))
         blocks_done += 1
         if progress_context:
-            _emit_event(
+            _broadcast_event(
                 progress_context["socket_sid"],
                 "stage_progress",
                 {
@@ -2272,6 +3224,7 @@ def _parse_llm_results(
         List of IssueResponse instances.
     """
     issues: list[IssueResponse] = []
+    text_index = DocumentTextIndex(original_text)
     for raw in results:
         try:
             raw["source"] = source
@@ -2288,7 +3241,7 @@ def _parse_llm_results(
                 )
                 continue
 
-            _resolve_llm_span(issue, original_text)
+            _resolve_llm_span(issue, original_text, text_index)
 
             # Strip lite-markers Markdown prefixes from suggestions,
             # message, and flagged_text so Accept doesn't insert
@@ -2502,7 +3455,11 @@ def _resolve_via_sentence_context(
     return [start, start + len(flagged)]
 
 
-def _resolve_llm_span(issue: IssueResponse, text: str) -> None:
+def _resolve_llm_span(
+    issue: IssueResponse,
+    text: str,
+    index: DocumentTextIndex | None = None,
+) -> None:
     """Compute character span for an LLM issue by text search.
 
     Finds the ``flagged_text`` in the original text and sets the span
@@ -2514,14 +3471,18 @@ def _resolve_llm_span(issue: IssueResponse, text: str) -> None:
     Args:
         issue: IssueResponse to update — modified in place.
         text: The original text to search in.
+        index: Search index over *text*; pass one shared index when
+            resolving many issues against the same text.
     """
     if not text or not issue.flagged_text:
         return
     if issue.span != [0, 0]:
         return
 
+    if index is None:
+        index = DocumentTextIndex(text)
     flagged = issue.flagged_text
-    text_lower = text.lower()
+    text_lower = index.lower
     flagged_lower = flagged.lower()
     logger.debug(
         "_resolve_llm_span: rule=%s flagged=%r (len=%d) text_len=%d",
@@ -2570,13 +3531,13 @@ def _resolve_llm_span(issue: IssueResponse, text: str) -> None:
         if idx >= 0:
             issue.span = [idx, idx + len(cleaned_flagged)]
             return
-        s, e = _find_ignoring_inline_markers(text, cleaned_flagged)
+        s, e = index.find_ignoring_inline_markers(cleaned_flagged)
         if s >= 0:
             issue.span = [s, e]
             return
 
     # Strategy 6: fuzzy anchor — LLM may return slightly altered text
-    _resolve_llm_span_fuzzy(issue, text)
+    _resolve_llm_span_fuzzy(issue, text, index)
 
     if issue.span == [0, 0]:
         logger.info(
@@ -2592,14 +3553,18 @@ _FUZZY_MATCH_THRESHOLD = 0.85
 
 
 def _resolve_llm_span_fuzzy(
-    issue: IssueResponse, text: str,
+    issue: IssueResponse,
+    text: str,
+    index: DocumentTextIndex | None = None,
 ) -> None:
     """Find an approximate match for flagged_text using SequenceMatcher.
 
     Slides a window across the source text at multiple length variants
     (``len(flagged) ± 2``), scoring each window with
     ``SequenceMatcher.ratio()``.  The best match above
-    ``_FUZZY_MATCH_THRESHOLD`` wins.
+    ``_FUZZY_MATCH_THRESHOLD`` wins.  Windows that cannot reach the
+    threshold are pruned via the index's bigram table (see
+    :meth:`DocumentTextIndex.find_fuzzy`).
 
     Length variants handle the common case where the LLM corrected a
     typo by adding or removing a character (e.g., source ``"utilizess"``
@@ -2612,32 +3577,21 @@ def _resolve_llm_span_fuzzy(
     Args:
         issue: IssueResponse to update — modified in place.
         text: The source text to search in.
+        index: Search index over *text*.
     """
     flagged = issue.flagged_text
     if not flagged or len(flagged) < 8:
         return
 
-    best_ratio = 0.0
-    best_start = -1
-    best_window = 0
+    if index is None:
+        index = DocumentTextIndex(text)
 
     # Slide in steps for performance — step of 1 char would be slow
     step = max(1, len(flagged) // 4)
 
-    for delta in (-2, -1, 0, 1, 2):
-        window = len(flagged) + delta
-        if window < 4:
-            continue
-
-        for start in range(0, len(text) - window + 1, step):
-            candidate = text[start:start + window]
-            ratio = SequenceMatcher(None, flagged, candidate).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_start = start
-                best_window = window
-
-    if best_ratio >= _FUZZY_MATCH_THRESHOLD and best_start >= 0:
+    match = index.find_fuzzy(flagged, _FUZZY_MATCH_THRESHOLD, step)
+    if match is not None:
+        best_start, best_window, best_ratio = match
         issue.span = [best_start, best_start + best_window]
         logger.debug(
             "Fuzzy anchor matched at [%d,%d] ratio=%.2f for %r",
@@ -2669,9 +3623,12 @@ def _remap_issues_to_original(
 
     map_len = len(offset_map)
     orig_len = len(original_text)
+    text_index = DocumentTextIndex(original_text)
 
     for issue in issues:
-        _remap_single_issue(issue, offset_map, original_text, map_len, orig_len)
+        _remap_single_issue(
+            issue, offset_map, original_text, map_len, orig_len, text_index,
+        )
 
 
 # Regexes to strip Markdown markers added by lite_markers format.
@@ -2729,6 +3686,8 @@ def _find_ignoring_inline_markers(
 
     Builds a marker-stripped copy of *text* with a position map back
     to the original, then searches for *target* in the stripped copy.
+    Use :meth:`DocumentTextIndex.find_ignoring_inline_markers` when
+    searching the same text repeatedly.
 
     Args:
         text: The region of original text to search in (may contain
@@ -2739,31 +3698,7 @@ def _find_ignoring_inline_markers(
         ``(start, end)`` positions in the original *text*, or
         ``(-1, -1)`` if not found.
     """
-    stripped_chars: list[str] = []
-    pos_map: list[int] = []
-    i = 0
-    while i < len(text):
-        # Skip ** (bold marker — two consecutive asterisks)
-        if i + 1 < len(text) and text[i] == '*' and text[i + 1] == '*':
-            i += 2
-            continue
-        # Skip single backtick (inline code marker)
-        if text[i] == '`':
-            i += 1
-            continue
-        stripped_chars.append(text[i])
-        pos_map.append(i)
-        i += 1
-
-    stripped = ''.join(stripped_chars)
-    idx = stripped.find(target)
-    if idx < 0:
-        return -1, -1
-
-    start = pos_map[idx]
-    end_idx = idx + len(target) - 1
-    end = pos_map[end_idx] + 1 if end_idx < len(pos_map) else len(text)
-    return start, end
+    return find_ignoring_inline_markers(text, target)
 
 
 def _find_closest_match(
@@ -2809,6 +3744,7 @@ def _find_flagged_in_text(
     search_from: int = 0,
     search_to: int | None = None,
     position_hint: int | None = None,
+    index: DocumentTextIndex | None = None,
 ) -> tuple[int, int, str] | None:
     """Search for flagged text in a region using multiple strategies.
 
@@ -2827,6 +3763,9 @@ def _find_flagged_in_text(
         search_to: End of the search region (default: end of text).
         position_hint: Expected position in *text* — used to
             disambiguate when multiple matches exist.
+        index: Optional search index over *text*.  When given, the
+            case-insensitive and marker-tolerant strategies query its
+            prebuilt views instead of lowering/stripping the region.
 
     Returns:
         Tuple of ``(start, end, matched_text)`` or ``None`` if not found.
@@ -2845,18 +3784,22 @@ def _find_flagged_in_text(
         return idx, idx + len(flagged), flagged
 
     # Strategy 2: case-insensitive match
-    region = text[search_from:search_to]
-    region_lower = region.lower()
     flagged_lower = flagged.lower()
+    if index is not None and index.lower_aligned:
+        haystack, base = index.lower, 0
+        lo, hi = search_from, search_to
+    else:
+        region = text[search_from:search_to]
+        haystack, base = region.lower(), search_from
+        lo, hi = 0, len(region)
     if position_hint is not None:
         idx_lower = _find_closest_match(
-            region_lower, flagged_lower, 0, len(region),
-            position_hint - search_from,
+            haystack, flagged_lower, lo, hi, position_hint - base,
         )
     else:
-        idx_lower = region_lower.find(flagged_lower)
+        idx_lower = haystack.find(flagged_lower, lo, hi)
     if idx_lower >= 0:
-        actual = search_from + idx_lower
+        actual = base + idx_lower
         return actual, actual + len(flagged), text[actual:actual + len(flagged)]
 
     # Strategy 3: strip Markdown markers from lite-markers format
@@ -2875,10 +3818,16 @@ def _find_flagged_in_text(
     # LLM flagged text may have Markdown backticks/bold from lite-markers
     # while the original text has AsciiDoc formatting. Strip both.
     cleaned_target = _strip_markdown_inline(_strip_lite_markers(flagged))
-    s, e = _find_ignoring_inline_markers(region, cleaned_target)
-    if s >= 0:
-        actual_s = search_from + s
-        actual_e = search_from + e
+    if index is not None:
+        actual_s, actual_e = index.find_ignoring_inline_markers(
+            cleaned_target, search_from, search_to,
+        )
+    else:
+        s, e = _find_ignoring_inline_markers(
+            text[search_from:search_to], cleaned_target,
+        )
+        actual_s, actual_e = (search_from + s, search_from + e) if s >= 0 else (-1, -1)
+    if actual_s >= 0:
         return actual_s, actual_e, text[actual_s:actual_e]
 
     return None
@@ -2890,6 +3839,7 @@ def _remap_single_issue(
     original_text: str,
     map_len: int,
     orig_len: int,
+    text_index: DocumentTextIndex | None = None,
 ) -> None:
     """Remap a single issue's span to original-text coordinates.
 
@@ -2905,6 +3855,7 @@ def _remap_single_issue(
         original_text: The uncleaned text to search in.
         map_len: Length of offset_map.
         orig_len: Length of original_text.
+        text_index: Shared search index over *original_text*.
     """
     span = issue.span
     flagged = issue.flagged_text or ""
@@ -2915,7 +3866,7 @@ def _remap_single_issue(
     )
 
     if not span or span == [0, 0]:
-        _remap_unresolved_span(issue, original_text, flagged)
+        _remap_unresolved_span(issue, original_text, flagged, text_index)
         return
 
     start, end = span[0], span[1]
@@ -2935,7 +3886,9 @@ def _remap_single_issue(
     search_from = max(0, orig_start - len(flagged) * 3 - 200)
     search_to = min(orig_len, orig_start + len(flagged) * 3 + 200)
 
-    result = _find_flagged_in_text(original_text, flagged, search_from, search_to)
+    result = _find_flagged_in_text(
+        original_text, flagged, search_from, search_to, index=text_index,
+    )
     if result:
         issue.span = [result[0], result[1]]
         issue.flagged_text = result[2]
@@ -2943,7 +3896,9 @@ def _remap_single_issue(
         return
 
     # Fallback: search entire document for issues that drifted far
-    result = _find_flagged_in_text(original_text, flagged, 0, orig_len)
+    result = _find_flagged_in_text(
+        original_text, flagged, 0, orig_len, index=text_index,
+    )
     if result:
         issue.span = [result[0], result[1]]
         issue.flagged_text = result[2]
@@ -2965,6 +3920,7 @@ def _remap_unresolved_span(
     issue: IssueResponse,
     original_text: str,
     flagged: str,
+    text_index: DocumentTextIndex | None = None,
 ) -> None:
     """Search for flagged_text in the full original text for unresolved spans.
 
@@ -2974,11 +3930,12 @@ def _remap_unresolved_span(
         issue: IssueResponse to update — modified in place.
         original_text: The uncleaned source text to search in.
         flagged: The flagged text to locate.
+        text_index: Shared search index over *original_text*.
     """
     if not flagged:
         return
 
-    result = _find_flagged_in_text(original_text, flagged)
+    result = _find_flagged_in_text(original_text, flagged, index=text_index)
     if result:
         issue.span = [result[0], result[1]]
         issue.flagged_text = result[2]
@@ -2993,6 +3950,10 @@ def _build_report(
 ) -> ReportResponse:
     """Build a statistical report from preprocessed data and scoring.
 
+    Readability is derived from the token statistics ``preprocess``
+    collected and memoized in *prep*, so the deterministic-complete
+    and final report builds score the document only once.
+
     Args:
         prep: Preprocessed text data.
         score: Calculated score response.
@@ -3003,9 +3964,19 @@ def _build_report(
     from app.services.reporting.llm_consumability import (
         calculate_llm_consumability,
     )
-    from app.services.reporting.readability import calculate_readability
+    from app.services.reporting.readability import (
+        calculate_readability,
+        readability_from_statistics,
+    )
 
-    readability = calculate_readability(prep["text"])
+    readability = prep.get("readability")
+    if readability is None:
+        stats = prep.get("text_statistics")
+        if stats is not None:
+            readability = readability_from_statistics(stats)
+        else:
+            readability = calculate_readability(prep["text"])
+        prep["readability"] = readability
 
     llm_consumability = calculate_llm_consumability(
         blocks=prep.get("blocks", []),
@@ -3037,15 +4008,324 @@ def _build_report(
     )
 
 
-def _is_cancelled(session_id: str) -> bool:
+# ---------------------------------------------------------------------------
+# Single-flight coalescing
+# ---------------------------------------------------------------------------
+
+# How long a follower waits for the leader's deterministic response
+# before running the analysis itself.
+_FOLLOW_TIMEOUT_SECONDS = 120.0
+
+# How long the final result waits for a follower that has not stored
+# its deterministic session yet.
+_FOLLOWER_READY_TIMEOUT_SECONDS = 30.0
+
+
+def _analysis_config_version() -> str:
+    """Fingerprint the settings that change analysis results.
+
+    Returns:
+        String that changes whenever rules or result-affecting
+        configuration change.
+    """
+    from rules import get_registry
+
+    return "|".join(str(value) for value in (
+        get_registry().ruleset_version,
+        Config.LLM_ENABLED and analyze_block is not None,
+        Config.LANGUAGETOOL_ENABLED,
+        Config.LLM_JUDGE_ENABLED,
+        Config.MODEL_PROVIDER,
+        Config.MODEL_ANALYSIS_TEMPERATURE,
+        Config.CONFIDENCE_THRESHOLD,
+        Config.LLM_CONFIDENCE_THRESHOLD,
+    ))
+
+
+def _copy_response(response: AnalyzeResponse, session_id: str) -> AnalyzeResponse:
+    """Copy *response* for another session.
+
+    Issues are copied so accept/dismiss in one session does not show
+    in another; their IDs are kept so result deltas line up.  The
+    source session's statuses may already be on *response* (the
+    session store transfers them onto the stored issues), so every
+    copied issue starts OPEN and the score is recomputed if any was
+    not.
+
+    Args:
+        response: The response to copy.
+        session_id: Session ID of the copy.
+
+    Returns:
+        A response sharing only immutable data with *response*.
+    """
+    issues = [dataclasses.replace(issue, status=IssueStatus.OPEN) for issue in response.issues]
+    if all(issue.status == IssueStatus.OPEN for issue in response.issues):
+        score = dataclasses.replace(response.score)
+    else:
+        score = calculate_score(issues, response.report.word_count)
+    return dataclasses.replace(response, session_id=session_id, issues=issues, score=score)
+
+
+def _serve_completed(
+    template: AnalyzeResponse, session_id: str, socket_sid: Optional[str],
+) -> AnalyzeResponse:
+    """Answer a request from a recently completed identical analysis.
+
+    Args:
+        template: The cached final response.
+        session_id: The requesting session.
+        socket_sid: Socket.IO session ID of the requester, if any.
+
+    Returns:
+        The session's copy of the result.
+    """
+    cancel_token = _begin_analysis(session_id)
+    response = _copy_response(template, session_id)
+    _store_session(session_id, response)
+    _finish_analysis(session_id, cancel_token)
+    _emit_progress(socket_sid, session_id, "analysis_complete", "Analysis complete", 100)
+    _publish_results(
+        socket_sid, session_id, "analysis_complete", response.issues, cancel_token,
+        replace=True,
+        fan_out=False,
+        score=response.score.to_dict(),
+        report=response.report.to_dict(),
+        detected_content_type=response.detected_content_type,
+    )
+    return response
+
+
+def _follow_flight(flight: Flight, subscriber: Subscriber) -> Optional[AnalyzeResponse]:
+    """Wait for the leader's deterministic response and adopt a copy.
+
+    The copy is stored in the follower's session and published to its
+    clients; later phase events and the final result reach it through
+    the leader's run.
+
+    Args:
+        flight: The flight being followed.
+        subscriber: The follower.
+
+    Returns:
+        The follower's response, or None if the leader failed or took
+        too long, in which case the caller runs the analysis itself.
+    """
+    try:
+        template = flight.wait_first(_FOLLOW_TIMEOUT_SECONDS)
+    except Exception as exc:
+        logger.warning(
+            "Shared analysis led by %s unavailable for %s (%s); running separately",
+            flight.leader.session_id, subscriber.session_id, exc or type(exc).__name__,
+        )
+        get_single_flight().leave(flight, subscriber)
+        return None
+
+    session_id, socket_sid = subscriber.session_id, subscriber.socket_sid
+    response = _copy_response(template, session_id)
+    if subscriber.live:
+        _store_session(session_id, response)
+        _publish_results(
+            socket_sid, session_id, "deterministic_complete", response.issues,
+            subscriber.cancel_token,
+            fan_out=False,
+            score=response.score.to_dict(),
+            report=response.report.to_dict(),
+            detected_content_type=response.detected_content_type,
+        )
+        _emit_event(socket_sid, "stage_progress", {
+            "session_id": session_id,
+            "phase": "deterministic",
+            "status": "done",
+        })
+    subscriber.ready.set()
+    return response
+
+
+def _fail_flight(flight: Optional[Flight], exc: BaseException) -> None:
+    """End a flight whose leader failed before producing results.
+
+    Waiting followers wake up and run the analysis themselves.
+
+    Args:
+        flight: The flight, or None when the run leads none.
+        exc: The leader's exception.
+    """
+    if flight is None:
+        return
+    flight.fail_first(exc)
+    get_single_flight().finish(flight, None)
+
+
+def _end_flight(flight: Optional[Flight], response: Optional[AnalyzeResponse]) -> None:
+    """Deliver the leader's final result to its followers and end the flight.
+
+    Without a result (the leader was cancelled), the first follower
+    still waiting takes the run over.
+
+    Args:
+        flight: The flight, or None when the run leads none.
+        response: The leader's final response, or None.
+    """
+    if flight is None:
+        return
+    flights = get_single_flight()
+    template = None
+    if response is not None and not response.partial:
+        template = _copy_response(response, "")
+    followers = flights.finish(flight, template)
+    if template is not None:
+        for follower in followers:
+            _deliver_final(follower, template)
+        return
+    successor = flights.hand_over(flight, followers)
+    if successor is not None:
+        threading.Thread(
+            target=_take_over, args=(successor,),
+            daemon=True, name=f"takeover-{successor.leader.session_id}",
+        ).start()
+
+
+def _deliver_final(follower: Subscriber, template: AnalyzeResponse) -> None:
+    """Store and publish a copy of the final result for one follower.
+
+    Args:
+        follower: The follower.
+        template: The leader's final response.
+    """
+    if not follower.ready.wait(_FOLLOWER_READY_TIMEOUT_SECONDS) or not follower.live:
+        return
+    response = _copy_response(template, follower.session_id)
+    _update_stored_session(follower.session_id, response)
+    _publish_results(
+        follower.socket_sid, follower.session_id, "analysis_complete",
+        response.issues, follower.cancel_token,
+        replace=True,
+        fan_out=False,
+        score=response.score.to_dict(),
+        report=response.report.to_dict(),
+        detected_content_type=response.detected_content_type,
+    )
+    _finish_analysis(follower.session_id, follower.cancel_token)
+
+
+def _take_over(flight: Flight) -> None:
+    """Run a flight whose previous leader was cancelled.
+
+    The new leader is a follower whose session already holds the
+    deterministic result; the run repeats the analysis for it with its
+    own request and token.
+
+    Args:
+        flight: The flight returned by ``SingleFlight.hand_over``.
+    """
+    leader = flight.leader
+    request, leader.request = leader.request, None
+    try:
+        _lead_analysis(
+            request["text"], request["content_type"], request["file_type"],
+            leader.socket_sid, leader.session_id, request["blocks"],
+            request["user_selected"], leader.cancel_token, flight,
+        )
+    except Exception as exc:
+        _fail_flight(flight, exc)
+        logger.error(
+            "Take-over analysis for %s failed: %s", leader.session_id, exc, exc_info=True,
+        )
+
+
+def _begin_analysis(session_id: str) -> CancellationToken:
+    """Register a new run for *session_id*, cancelling any older run.
+
+    Args:
+        session_id: The session identifier.
+
+    Returns:
+        The new run's cancellation token (a private, never-cancelled
+        token when the session store is unavailable).
+    """
+    try:
+        return _get_session_store().begin_analysis(session_id)
+    except (ImportError, AttributeError, RuntimeError) as exc:
+        logger.debug("Could not register analysis %s: %s", session_id, exc)
+        return CancellationToken()
+
+
+def _block_priority(session_id: str) -> Optional[BlockPriority]:
+    """Return the viewport priority of *session_id*, if the store is up.
+
+    Args:
+        session_id: The session identifier.
+
+    Returns:
+        The session's BlockPriority, or None (document order).
+    """
+    try:
+        return _get_session_store().block_priority(session_id)
+    except (ImportError, AttributeError, RuntimeError) as exc:
+        logger.debug("No block priority for %s: %s", session_id, exc)
+        return None
+
+
+def _focus_session(session_id: str, span: tuple[int, int]) -> None:
+    """Record the character range the writer of *session_id* is viewing.
+
+    Args:
+        session_id: The session identifier.
+        span: ``(start, end)`` in original-text coordinates.
+    """
+    priority = _block_priority(session_id)
+    if priority is not None:
+        priority.set_focus(span)
+
+
+def _track_analysis_memory(
+    session_id: str, cancel_token: CancellationToken, prep: dict[str, Any],
+) -> None:
+    """Report the memory held by a run's preprocessing data.
+
+    Args:
+        session_id: The session identifier.
+        cancel_token: The token returned by _begin_analysis().
+        prep: The preprocessing data the run keeps alive.
+    """
+    try:
+        store = _get_session_store()
+        store.track_analysis_memory(
+            session_id, cancel_token, estimate_prep_bytes(prep),
+        )
+    except (ImportError, AttributeError, RuntimeError) as exc:
+        logger.debug("Could not track memory of analysis %s: %s", session_id, exc)
+
+
+def _finish_analysis(session_id: str, cancel_token: CancellationToken) -> None:
+    """Release the run's cancellation token in the session store.
+
+    Args:
+        session_id: The session identifier.
+        cancel_token: The token returned by _begin_analysis().
+    """
+    try:
+        _get_session_store().finish_analysis(session_id, cancel_token)
+    except (ImportError, AttributeError, RuntimeError) as exc:
+        logger.debug("Could not release analysis %s: %s", session_id, exc)
+
+
+def _is_cancelled(
+    session_id: str, cancel_token: CancellationToken | None = None,
+) -> bool:
     """Check whether an analysis session has been superseded.
 
     Args:
         session_id: The session identifier to check.
+        cancel_token: The run's token; a cancelled token short-circuits
+            the session store lookup.
 
     Returns:
         True if the session should be aborted.
     """
+    if cancel_token is not None and cancel_token.cancelled:
+        return True
     try:
         store = _get_session_store()
         return not store.is_analysis_current(session_id)
@@ -3104,7 +4384,7 @@ def _emit_progress(
     """
     if socket_sid is None:
         return
-    _emit_event(socket_sid, "progress_update", {
+    _broadcast_event(socket_sid, "progress_update", {
         "session_id": session_id,
         "step": stage,
         "status": "running",
@@ -3113,6 +4393,81 @@ def _emit_progress(
     })
 
 
+def _publish_results(
+    socket_sid: Optional[str],
+    session_id: str,
+    event: str,
+    issues: list[IssueResponse],
+    cancel_token: CancellationToken | None,
+    replace: bool = False,
+    fan_out: bool = True,
+    **fields: Any,
+) -> None:
+    """Emit a result event carrying only the change in the issue set.
+
+    Phase events add their issues to what the session's clients hold;
+    ``analysis_complete`` passes *replace* so issues dropped by the
+    merge are removed.  Issues are sent once: later events list only
+    additions, removals and status changes against a version number
+    (see :class:`ResultStream`), and large payloads are compressed.
+    Nothing is sent for a cancelled or superseded run.
+
+    With *fan_out*, the event is also published to the sessions
+    following this run (identical requests sharing it), each through
+    its own result stream.  Events whose issues every session must
+    hold privately (the deterministic and final results) pass False
+    and are delivered per session instead.
+
+    Args:
+        socket_sid: Socket.IO session ID (fallback target).
+        session_id: Analysis session identifier.
+        event: Event name to emit.
+        issues: Issues produced by the phase (or the full result set).
+        cancel_token: Token of the publishing run.
+        replace: Whether *issues* is the complete result set.
+        fan_out: Whether to publish to the run's followers too.
+        **fields: Extra payload fields (score, report, ...).
+    """
+    if cancel_token is not None and cancel_token.cancelled:
+        return
+    try:
+        stream = _get_session_store().result_stream(session_id)
+    except (ImportError, AttributeError, RuntimeError) as exc:
+        logger.warning("Result stream unavailable for %s: %s", session_id, exc)
+        return
+
+    def _send(delta: dict[str, Any]) -> None:
+        payload = {"session_id": session_id, "count": len(issues), **fields, **delta}
+        _emit_event(socket_sid, event, encode_payload(payload))
+
+    stream.publish(cancel_token, issues, _send, replace=replace)
+    if fan_out:
+        for follower in get_single_flight().followers(session_id):
+            _publish_results(
+                follower.socket_sid, follower.session_id, event, issues,
+                follower.cancel_token, replace=replace, fan_out=False, **fields,
+            )
+
+
+def _broadcast_event(
+    socket_sid: Optional[str], event: str, data: dict[str, Any]
+) -> None:
+    """Emit an event to a session and to the sessions following its run.
+
+    Args:
+        socket_sid: Socket.IO session ID (fallback target).
+        event: Event name to emit.
+        data: Event payload dictionary; followers receive a copy with
+            their own ``session_id``.
+    """
+    _emit_event(socket_sid, event, data)
+    session_id = data.get("session_id")
+    if not session_id:
+        return
+    for follower in get_single_flight().followers(session_id):
+        _emit_event(follower.socket_sid, event, {**data, "session_id": follower.session_id})
+
+
 def _emit_event(
     socket_sid: Optional[str], event: str, data: dict[str, Any]
 ) -> None:
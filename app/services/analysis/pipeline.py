@@ -0,0 +1,271 @@
+"""Dependency-graph runner for the background analysis phases.
+
+The orchestrator's background work — LanguageTool, LLM granular, LLM
+global, the judge pass and the final merge — forms a small DAG rather
+than a sequence.  LanguageTool and granular analysis only need the
+preprocessed blocks, global analysis needs the deterministic issues,
+the judge needs both LLM passes, and the final merge needs everything.
+
+``PhaseGraph`` submits each phase to a thread pool the moment its
+dependencies have finished, so end-to-end wall time approaches the
+longest dependency chain instead of the sum of all phases.  Results
+computed outside the graph (the synchronous deterministic phase) are
+injected with :meth:`PhaseGraph.provide`.
+
+A graph created by a task that a slow-analysis profile tracks (see
+:mod:`~app.services.analysis.slow_profiles`) tracks its phases with the
+same capture and holds it open until the last phase has finished.
+
+A phase that raises does not block its dependents: they still run and
+read the failed phase's result through :meth:`PhaseGraph.result`, which
+returns the caller's default.  This keeps every phase error-isolated,
+as the sequential pipeline was.  The exception is logged with its
+traceback when the phase fails, whether or not anything reads it.
+
+Usage:
+    from app.services.analysis.pipeline import PhaseGraph
+
+    graph = PhaseGraph(max_workers=4)
+    graph.add("languagetool", run_lt, prep)
+    graph.add("judge", run_judge, graph, after=("granular", "global"))
+    graph.provide("deterministic", det_issues)
+    graph.close()
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Iterable, Optional
+
+from app.services.analysis.slow_profiles import current_capture, track
+
+logger = logging.getLogger(__name__)
+
+
+class PhaseGraph:
+    """Run named phases as soon as the phases they depend on finish.
+
+    Phases may be added in any order; a dependency that has not been
+    added or provided yet is simply waited for.  Call :meth:`close`
+    once every phase has been registered so the worker pool is shut
+    down after the last phase completes.
+
+    Attributes:
+        name: Label used in log messages (typically the session ID).
+    """
+
+    def __init__(self, max_workers: int, name: str = "") -> None:
+        """Create a graph backed by a pool of *max_workers* threads.
+
+        Args:
+            max_workers: Maximum number of phases running at once.
+            name: Label used in log messages.
+        """
+        self.name: str = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="phase",
+        )
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+        self._registered: set[str] = set()
+        self._durations: dict[str, float] = {}
+        self._started_at: float = time.monotonic()
+        self._closed: bool = False
+        self._shut_down: bool = False
+        self._capture = current_capture()
+        if self._capture is not None:
+            self._capture.hold()
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        after: Iterable[str] = (),
+        **kwargs: Any,
+    ) -> Future:
+        """Register a phase that runs once all *after* phases are done.
+
+        Args:
+            name: Unique phase name.
+            func: Callable executed in the worker pool.
+            *args: Positional arguments for *func*.
+            after: Names of phases that must finish first.
+            **kwargs: Keyword arguments for *func*.
+
+        Returns:
+            Future resolved with the phase's return value.
+
+        Raises:
+            ValueError: If a phase with *name* already exists.
+        """
+        deps = [self._future(dep) for dep in after]
+        future = self._register(name)
+        pending = [len(deps)]
+        pending_lock = threading.Lock()
+
+        def _dependency_done(_: Future) -> None:
+            with pending_lock:
+                pending[0] -= 1
+                ready = pending[0] == 0
+            if ready:
+                self._submit(name, future, func, args, kwargs)
+
+        if not deps:
+            self._submit(name, future, func, args, kwargs)
+        for dep in deps:
+            dep.add_done_callback(_dependency_done)
+        return future
+
+    def provide(self, name: str, value: Any) -> None:
+        """Resolve phase *name* with a value computed outside the graph.
+
+        Args:
+            name: Unique phase name.
+            value: The phase's result.
+
+        Raises:
+            ValueError: If a phase with *name* already exists.
+        """
+        future = self._register(name)
+        with self._lock:
+            self._durations[name] = time.monotonic() - self._started_at
+        future.set_result(value)
+
+    def close(self) -> None:
+        """Declare that no more phases will be added.
+
+        Dependencies that were never added or provided are resolved
+        with None so their dependents still run.  The worker pool shuts
+        down once every phase is done.
+        """
+        with self._lock:
+            self._closed = True
+            missing = [
+                future for name, future in self._futures.items()
+                if name not in self._registered
+            ]
+        for future in missing:
+            future.set_result(None)
+        self._maybe_shut_down()
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def result(
+        self, name: str, default: Any = None, timeout: Optional[float] = None,
+    ) -> Any:
+        """Wait for phase *name* and return its result.
+
+        Args:
+            name: Phase name.
+            default: Value returned when the phase failed, timed out or
+                was never registered.
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            The phase's result, or *default*.
+        """
+        with self._lock:
+            future = self._futures.get(name)
+            registered = name in self._registered
+        if future is None or not registered:
+            return default
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            logger.warning("Phase %s timed out after %ss (%s)", name, timeout, self.name)
+        except Exception as exc:
+            logger.warning("Phase %s failed: %s (%s)", name, exc, self.name)
+        return default
+
+    def durations(self) -> dict[str, float]:
+        """Return seconds each finished phase ran (provided: time to provide)."""
+        with self._lock:
+            return dict(self._durations)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _register(self, name: str) -> Future:
+        """Create the future for *name*, reusing a placeholder if waited on."""
+        with self._lock:
+            if name in self._registered:
+                raise ValueError(f"Phase '{name}' already registered")
+            self._registered.add(name)
+            future = self._futures.get(name)
+            if future is None:
+                future = self._futures[name] = Future()
+        future.add_done_callback(lambda _: self._maybe_shut_down())
+        return future
+
+    def _future(self, name: str) -> Future:
+        """Return the future for *name*, creating a placeholder if needed."""
+        with self._lock:
+            future = self._futures.get(name)
+            if future is None:
+                future = self._futures[name] = Future()
+            return future
+
+    def _submit(
+        self,
+        name: str,
+        future: Future,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Run *func* in the pool and resolve *future* with its outcome."""
+
+        def _run() -> None:
+            started = time.monotonic()
+            try:
+                with track(self._capture, f"phase:{name}"):
+                    value = func(*args, **kwargs)
+            except BaseException as exc:
+                self._record(name, started)
+                logger.exception("Phase %s raised (%s)", name, self.name)
+                future.set_exception(exc)
+                return
+            self._record(name, started)
+            future.set_result(value)
+
+        try:
+            self._executor.submit(_run)
+        except RuntimeError as exc:
+            logger.warning("Cannot start phase %s: %s (%s)", name, exc, self.name)
+            future.set_exception(exc)
+
+    def _record(self, name: str, started: float) -> None:
+        """Store and log the duration of phase *name*."""
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self._durations[name] = elapsed
+        logger.info(
+            "phase %s: %.3fs (t+%.3fs, %s)",
+            name, elapsed, time.monotonic() - self._started_at, self.name,
+        )
+
+    def _maybe_shut_down(self) -> None:
+        """Shut the pool down once closed and every phase has finished."""
+        with self._lock:
+            if self._shut_down or not self._closed:
+                return
+            if not all(f.done() for f in self._futures.values()):
+                return
+            self._shut_down = True
+        self._executor.shutdown(wait=False)
+        if self._capture is not None:
+            self._capture.release()
+        logger.debug(
+            "Phase graph %s finished in %.3fs",
+            self.name, time.monotonic() - self._started_at,
+        )
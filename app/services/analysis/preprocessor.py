@@ -15,18 +15,15 @@ import re
 from typing import Any
 
 from app.extensions import get_nlp
+from app.services.analysis.text_statistics import (  # noqa: F401 — re-export
+    compute_text_statistics,
+    count_syllables,
+)
+from app.services.analysis.tracked_text import TrackedText
+from app.services.parsing.sniffer import sniff
 
 logger = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Pre-compiled patterns for syllable counting
-# ---------------------------------------------------------------------------
-_VOWEL_GROUPS_RE = re.compile(r"[aeiouy]+", re.IGNORECASE)
-_SILENT_E_RE = re.compile(r"[^aeiou]e$", re.IGNORECASE)
-_LE_ENDING_RE = re.compile(r"le$", re.IGNORECASE)
-_ED_ENDING_RE = re.compile(r"[^aeiouy]ed$", re.IGNORECASE)
-_ES_ENDING_RE = re.compile(r"[^aeiouy]es$", re.IGNORECASE)
-
 # Whitespace normalization (identical to frontend normalization)
 _CRLF_RE = re.compile(r"\r\n")
 _TAB_RE = re.compile(r"\t")
@@ -35,69 +32,74 @@ _MULTI_SPACE_RE = re.compile(r" {2,}")
 # ---------------------------------------------------------------------------
 # AsciiDoc / markup cleaning patterns
 # Ported from legacy/structural_parsing/asciidoc/types.py:112-143
+#
+# Each entry is (pattern, replacement, hint); the hint is a literal every
+# match contains, so a pass is skipped when the text lacks it (see
+# TrackedText.sub).  Order matters: later patterns see the text left by
+# earlier ones.
 # ---------------------------------------------------------------------------
-_MARKUP_SUBS: list[tuple[re.Pattern[str], str]] = [
+_MARKUP_SUBS: list[tuple[re.Pattern[str], str, str]] = [
     # --- Delimited blocks (must come first to remove non-prose content) ---
     # Delete code/listing blocks: ---- ... ----
-    (re.compile(r"^-{4,}\s*$.*?^-{4,}\s*$", re.MULTILINE | re.DOTALL), ""),
+    (re.compile(r"^-{4,}\s*$.*?^-{4,}\s*$", re.MULTILINE | re.DOTALL), "", "\n----"),
     # Delete comment blocks: //// ... ////
-    (re.compile(r"^/{4,}\s*$.*?^/{4,}\s*$", re.MULTILINE | re.DOTALL), ""),
+    (re.compile(r"^/{4,}\s*$.*?^/{4,}\s*$", re.MULTILINE | re.DOTALL), "", "\n////"),
     # Delete passthrough blocks: ++++ ... ++++
-    (re.compile(r"^\+{4,}\s*$.*?^\+{4,}\s*$", re.MULTILINE | re.DOTALL), ""),
+    (re.compile(r"^\+{4,}\s*$.*?^\+{4,}\s*$", re.MULTILINE | re.DOTALL), "", "\n++++"),
     # Delete example blocks: ==== ... ==== (4+ equals, not headings which use 1-6)
-    (re.compile(r"^={4,}\s*$.*?^={4,}\s*$", re.MULTILINE | re.DOTALL), ""),
+    (re.compile(r"^={4,}\s*$.*?^={4,}\s*$", re.MULTILINE | re.DOTALL), "", "\n===="),
     # Delete sidebar blocks: **** ... ****
-    (re.compile(r"^\*{4,}\s*$.*?^\*{4,}\s*$", re.MULTILINE | re.DOTALL), ""),
+    (re.compile(r"^\*{4,}\s*$.*?^\*{4,}\s*$", re.MULTILINE | re.DOTALL), "", "\n****"),
     # --- Single-line constructs (must come after delimited blocks) ---
     # Delete single-line comments: // text (not block comment delimiters ////)
-    (re.compile(r"^[ \t]*//[^/].*$|^[ \t]*//\s*$", re.MULTILINE), ""),
+    (re.compile(r"^[ \t]*//[^/].*$|^[ \t]*//\s*$", re.MULTILINE), "", "//"),
     # Delete conditional directives: ifdef::, ifndef::, ifeval::, endif::
-    (re.compile(r"^[ \t]*(?:ifdef|ifndef|ifeval|endif)::[^\n]*$", re.MULTILINE), ""),
+    (re.compile(r"^[ \t]*(?:ifdef|ifndef|ifeval|endif)::[^\n]*$", re.MULTILINE), "", "::"),
     # --- Block-level elements ---
     # Delete standalone block attribute lines: [source,bash], [id="..."], etc.
-    (re.compile(r"^\[[^\]]+\]\s*$", re.MULTILINE), ""),
+    (re.compile(r"^\[[^\]]+\]\s*$", re.MULTILINE), "", "\n["),
     # Delete block continuation markers (+ alone on a line)
-    (re.compile(r"^\+\s*$", re.MULTILINE), ""),
+    (re.compile(r"^\+\s*$", re.MULTILINE), "", "\n+"),
     # Delete attribute entries: :key: value, :!key: unset (metadata, not prose)
-    (re.compile(r"^:!?[\w-]+:.*$", re.MULTILINE), ""),
+    (re.compile(r"^:!?[\w-]+:.*$", re.MULTILINE), "", "\n:"),
     # Delete image directives: image::path[alt text]
-    (re.compile(r"^image::[^\[]*\[[^\]]*\]\s*$", re.MULTILINE), ""),
+    (re.compile(r"^image::[^\[]*\[[^\]]*\]\s*$", re.MULTILINE), "", "\nimage::"),
     # --- Heading and list markers ---
     # Strip heading markers: "= Title" → "Title"
-    (re.compile(r"^(={1,3})\s+", re.MULTILINE), ""),
+    (re.compile(r"^(={1,3})\s+", re.MULTILINE), "", "\n="),
     # Strip block title prefix: ".Title" → "Title" (no space after dot)
-    (re.compile(r"^\.(?=\S)", re.MULTILINE), ""),
+    (re.compile(r"^\.(?=\S)", re.MULTILINE), "", "\n."),
     # Strip ordered list markers: ". Step text" → "Step text"
-    (re.compile(r"^\.\s+(?=\S)", re.MULTILINE), ""),
+    (re.compile(r"^\.\s+(?=\S)", re.MULTILINE), "", "\n."),
     # Strip unordered list markers: "* Item text" → "Item text"
-    (re.compile(r"^\*\s+", re.MULTILINE), ""),
+    (re.compile(r"^\*\s+", re.MULTILINE), "", "\n*"),
     # Strip definition list marker: "term::" → "term"
-    (re.compile(r"::(?=\s*$)", re.MULTILINE), ""),
+    (re.compile(r"::(?=\s*$)", re.MULTILINE), "", "::"),
     # --- Inline macros ---
     # Strip xref macro: xref:target[display text] → display text
-    (re.compile(r"xref:[^\[]+\[([^\]]*)\]"), r"\1"),
+    (re.compile(r"xref:[^\[]+\[([^\]]*)\]"), r"\1", "xref:"),
     # Strip link macro: link:URL[display text] → display text
-    (re.compile(r"link:https?://[^\s\[\]]+\[([^\]]*)\]"), r"\1"),
+    (re.compile(r"link:https?://[^\s\[\]]+\[([^\]]*)\]"), r"\1", "link:"),
     # Strip mailto macro: mailto:addr[text] → text
-    (re.compile(r"mailto:[^\[]+\[([^\]]*)\]"), r"\1"),
+    (re.compile(r"mailto:[^\[]+\[([^\]]*)\]"), r"\1", "mailto:"),
     # --- Inline formatting ---
     # Strip bold: **text** → text
-    (re.compile(r"\*\*(.+?)\*\*"), r"\1"),
+    (re.compile(r"\*\*(.+?)\*\*"), r"\1", "**"),
     # Strip italic (unconstrained): __text__ → text
-    (re.compile(r"__(.+?)__"), r"\1"),
+    (re.compile(r"__(.+?)__"), r"\1", "__"),
     # Replace backtick monospace with placeholder: `command` → placeholder
     # Code references should not be analysed as prose
-    (re.compile(r"`([^`]+)`"), "placeholder"),
+    (re.compile(r"`([^`]+)`"), "placeholder", "`"),
     # Replace plus monospace with placeholder: +text+ → placeholder
-    (re.compile(r"(?<!\w)\+([^+]+)\+(?!\w)"), "placeholder"),
+    (re.compile(r"(?<!\w)\+([^+]+)\+(?!\w)"), "placeholder", "+"),
     # Replace attribute references: {prod-short} → placeholder
-    (re.compile(r"\{[a-zA-Z][a-zA-Z0-9_-]*\}"), "placeholder"),
+    (re.compile(r"\{[a-zA-Z][a-zA-Z0-9_-]*\}"), "placeholder", "{"),
     # Replace angle-bracket variable placeholders: <root_disk> → placeholder
-    (re.compile(r"<[a-zA-Z_][\w-]*>"), "placeholder"),
+    (re.compile(r"<[a-zA-Z_][\w-]*>"), "placeholder", "<"),
     # Delete standalone URLs (not already handled by link macro)
-    (re.compile(r"https?://[^\s\[\]]+"), ""),
+    (re.compile(r"https?://[^\s\[\]]+"), "", "://"),
     # Collapse runs of blank lines to a single blank line
-    (re.compile(r"\n{3,}"), "\n\n"),
+    (re.compile(r"\n{3,}"), "\n\n", "\n\n\n"),
 ]
 
 
@@ -105,89 +107,24 @@ _MARKUP_SUBS: list[tuple[re.Pattern[str], str]] = [
 _POST_CLEANUP_RE = re.compile(r" {2,}")
 
 
-def _apply_sub_tracked(
-    text: str,
-    offset_map: list[int],
-    pattern: re.Pattern[str],
-    replacement: str,
-) -> tuple[str, list[int]]:
-    """Apply a single regex substitution while maintaining the offset map.
-
-    Tracks how each character in the result maps back to positions in
-    the original text, enabling span remapping after all substitutions.
-
-    Three replacement modes are supported:
-    - Empty string (``""``) — deletion, no characters emitted.
-    - Group reference (``r"\\1"``) — characters map to their group positions.
-    - Fixed text (e.g. ``"placeholder"``) — characters map to match start.
-
-    Args:
-        text: Current text to apply the substitution to.
-        offset_map: Current position mapping (length = len(text) + 1).
-        pattern: Compiled regex pattern to match.
-        replacement: Replacement string.
-
-    Returns:
-        Tuple of (new_text, new_offset_map).
-    """
-    new_chars: list[str] = []
-    new_map: list[int] = []
-    last_end = 0
-    is_group_ref = replacement == r"\1"
-
-    for match in pattern.finditer(text):
-        # Copy unchanged characters before the match
-        for i in range(last_end, match.start()):
-            new_chars.append(text[i])
-            new_map.append(offset_map[i])
-
-        if replacement == "":
-            pass  # Deletion — no characters to add
-        elif is_group_ref:
-            # Group extraction — each char maps to its group position
-            group_start = match.start(1)
-            group_text = match.group(1)
-            for i, ch in enumerate(group_text):
-                new_chars.append(ch)
-                new_map.append(offset_map[group_start + i])
-        else:
-            # Fixed replacement (e.g., "placeholder", "\n\n")
-            orig_start = offset_map[match.start()]
-            for ch in replacement:
-                new_chars.append(ch)
-                new_map.append(orig_start)
-
-        last_end = match.end()
-
-    # Copy remaining characters after the last match
-    for i in range(last_end, len(text)):
-        new_chars.append(text[i])
-        new_map.append(offset_map[i])
-
-    # End sentinel — maps to the original end position
-    new_map.append(offset_map[len(text)])
-
-    return "".join(new_chars), new_map
-
-
 # Markdown-specific cleanup patterns (lighter than AsciiDoc)
-_MARKDOWN_SUBS: list[tuple[re.Pattern[str], str]] = [
+_MARKDOWN_SUBS: list[tuple[re.Pattern[str], str, str]] = [
     # Delete fenced code blocks: ``` ... ```
-    (re.compile(r"^`{3,}[^\n]*$.*?^`{3,}\s*$", re.MULTILINE | re.DOTALL), ""),
+    (re.compile(r"^`{3,}[^\n]*$.*?^`{3,}\s*$", re.MULTILINE | re.DOTALL), "", "\n```"),
     # Strip heading markers: "# Title" → "Title"
-    (re.compile(r"^#{1,6}\s+", re.MULTILINE), ""),
+    (re.compile(r"^#{1,6}\s+", re.MULTILINE), "", "\n#"),
     # Strip bold: **text** → text
-    (re.compile(r"\*\*(.+?)\*\*"), r"\1"),
+    (re.compile(r"\*\*(.+?)\*\*"), r"\1", "**"),
     # Strip italic: *text* → text (single asterisk)
-    (re.compile(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)"), r"\1"),
+    (re.compile(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)"), r"\1", "*"),
     # Replace backtick code with placeholder: `code` → placeholder
-    (re.compile(r"`([^`]+)`"), "placeholder"),
+    (re.compile(r"`([^`]+)`"), "placeholder", "`"),
     # Strip inline links: [text](url) → text
-    (re.compile(r"\[([^\]]+)\]\([^\)]+\)"), r"\1"),
+    (re.compile(r"\[([^\]]+)\]\([^\)]+\)"), r"\1", "]("),
     # Delete standalone URLs
-    (re.compile(r"https?://[^\s\[\]]+"), ""),
+    (re.compile(r"https?://[^\s\[\]]+"), "", "://"),
     # Collapse runs of blank lines
-    (re.compile(r"\n{3,}"), "\n\n"),
+    (re.compile(r"\n{3,}"), "\n\n", "\n\n\n"),
 ]
 
 
@@ -211,33 +148,26 @@ def _clean_markup_with_mapping(
         the cleaned text. The map has length ``len(cleaned_text) + 1``;
         the final entry is a sentinel mapping to the input text length.
     """
-    offset_map = list(range(len(text) + 1))
-    current = text
-
-    subs = _select_cleanup_patterns(file_type)
-    for pattern, replacement in subs:
-        current, offset_map = _apply_sub_tracked(
-            current, offset_map, pattern, replacement,
-        )
+    tracked = TrackedText(text)
+    for pattern, replacement, hint in _select_cleanup_patterns(file_type):
+        tracked.sub(pattern, replacement, hint)
 
     # Collapse multi-spaces that may result from deletions
-    current, offset_map = _apply_sub_tracked(
-        current, offset_map, _POST_CLEANUP_RE, " ",
-    )
+    tracked.sub(_POST_CLEANUP_RE, " ", "  ")
 
-    return current, offset_map
+    return tracked.text, tracked.offset_map()
 
 
 def _select_cleanup_patterns(
     file_type: str | None,
-) -> list[tuple[re.Pattern[str], str]]:
+) -> list[tuple[re.Pattern[str], str, str]]:
     """Return markup cleanup patterns appropriate for the file format.
 
     Args:
         file_type: File format string or None.
 
     Returns:
-        List of (pattern, replacement) tuples.
+        List of (pattern, replacement, hint) tuples.
     """
     if file_type == "markdown":
         return _MARKDOWN_SUBS
@@ -488,17 +418,15 @@ def preprocess(
     doc = nlp(cleaned)
 
     sentences = _extract_sentences(doc)
-    words = _extract_words(doc)
-    word_count = len(words)
+    text_statistics = compute_text_statistics(doc)
+    word_count = text_statistics.word_count
     paragraph_count = _count_paragraphs(cleaned)
 
-    unique_words = len({w.lower() for w in words}) if words else 0
-    vocabulary_diversity = round(
-        unique_words / word_count if word_count > 0 else 0.0, 4,
-    )
+    unique_words = text_statistics.unique_words
+    vocabulary_diversity = round(text_statistics.vocabulary_diversity, 4)
 
     avg_words = _safe_divide(word_count, len(sentences))
-    avg_syllables = _compute_avg_syllables(words)
+    avg_syllables = text_statistics.avg_syllables_per_word
 
     # Build lite_markers from blocks if available
     if blocks:
@@ -541,72 +469,11 @@ def preprocess(
         "avg_syllables_per_word": round(avg_syllables, 2),
         "unique_words": unique_words,
         "vocabulary_diversity": vocabulary_diversity,
+        "text_statistics": text_statistics,
         "detected_content_type": _detect_content_type(text),
     }
 
 
-# ---------------------------------------------------------------------------
-# Content-type detection — 4-tier weighted multi-type scoring engine
-# ---------------------------------------------------------------------------
-
-# Tier 1: Metadata — instant win (AsciiDoc attribute)
-_CONTENT_TYPE_ATTR_RE = re.compile(
-    r":_mod-docs-content-type:\s*(CONCEPT|PROCEDURE|REFERENCE|ASSEMBLY)",
-    re.IGNORECASE,
-)
-
-# Tier 2: Structural markers — high confidence (+20 each)
-# Optional dot prefix handles both AsciiDoc (.Procedure) and plain text (Procedure).
-# Trap 3 fix: \s*$ handles non-breaking spaces from browser paste.
-_STRUCT_PROCEDURE_RE = re.compile(
-    r"^(?:\.)?(Procedure|Prerequisites|Verification|Troubleshooting)\s*$",
-    re.MULTILINE,
-)
-_STRUCT_REFERENCE_RE = re.compile(
-    r"^(?:\.)?(Additional resources|Related information)\s*$",
-    re.MULTILINE | re.IGNORECASE,
-)
-
-# Tier 3: Lexical title guard — medium confidence (+10)
-# (?:=\s+)? handles both AsciiDoc headings and plain-text headings.
-_CONCEPT_TITLE_RE = re.compile(
-    r"^(?:=\s+)?(About|Understanding|Architecture|Introduction)\b",
-    re.MULTILINE | re.IGNORECASE,
-)
-_PROCEDURE_TITLE_RE = re.compile(
-    r"^(?:=\s+)?(Configuring|Creating|Installing|Managing|Updating|"
-    r"Using|Adding|Removing|Deploying|Enabling|Setting)\b",
-    re.MULTILINE | re.IGNORECASE,
-)
-_REFERENCE_TITLE_RE = re.compile(
-    r"^(?:=\s+)?.*(?:Reference|Parameters|Properties|Commands|"
-    r"Variables|Attributes)\s*$",
-    re.MULTILINE | re.IGNORECASE,
-)
-
-# Tier 4: Content shape — low confidence (+5)
-_NUMBERED_STEPS_RE = re.compile(r"^\d+\.\s+[A-Z]", re.MULTILINE)
-_IMPERATIVE_STEPS_RE = re.compile(
-    r"^\d+\.\s+(?:Click|Select|Enter|Run|Type|Open|Navigate|Configure|"
-    r"Set|Add|Remove|Create|Install|Enable|Disable|Verify|Check|Ensure)\b",
-    re.MULTILINE,
-)
-_OPTIONAL_PREFIX_RE = re.compile(r"^Optional:", re.MULTILINE)
-_TABLE_MARKER_RE = re.compile(r"^\|===", re.MULTILINE)
-_DEF_LIST_RE = re.compile(r"::\s*$", re.MULTILINE)
-
-# Release notes structural signals — used to refine REFERENCE → release_notes
-_RELEASE_NOTES_TITLE_RE = re.compile(
-    r"^=\s+.*\brelease\s+notes\b", re.IGNORECASE | re.MULTILINE,
-)
-_RELEASE_NOTES_SECTIONS_RE = re.compile(
-    r"^==\s+(?:New features|Fixed issues|Known issues|"
-    r"Errata updates|Technology Preview|Deprecated.*functionality|"
-    r"Removed.*functionality|Breaking changes)",
-    re.IGNORECASE | re.MULTILINE,
-)
-
-
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -615,129 +482,24 @@ _RELEASE_NOTES_SECTIONS_RE = re.compile(
 def _detect_content_type(text: str) -> str | None:
     """Detect modular documentation content type via 4-tier weighted scoring.
 
-    Uses a multi-type scoring dictionary that tracks points for procedure,
-    concept, and reference simultaneously.  The type with the highest score
-    wins, provided it meets the minimum threshold of 5 points.
+    The type with the highest score wins, provided it meets the minimum
+    threshold of 5 points.  Tiers (highest to lowest confidence):
 
-    Tiers (highest to lowest confidence):
         1. Metadata — ``:_mod-docs-content-type:`` attribute (instant win)
         2. Structural markers — standalone headings like Procedure (+20 each)
         3. Lexical title guard — naming conventions like gerund titles (+10)
         4. Content shape — numbered steps, tables, definition lists (+5)
 
+    The signals are gathered by the document sniffer's single pass, so
+    a text already profiled for format detection is not scanned again.
+
     Args:
         text: Raw input text (before markup cleaning).
 
     Returns:
         Detected content type string, or None if ambiguous.
     """
-    # Tier 1: explicit AsciiDoc attribute → instant win
-    attr_match = _CONTENT_TYPE_ATTR_RE.search(text)
-    if attr_match:
-        declared = attr_match.group(1).lower()
-        if declared == "reference" and _is_release_notes(text):
-            return "release_notes"
-        return declared
-
-    # Tiers 2-4: multi-type scoring
-    scores: dict[str, int] = {"procedure": 0, "concept": 0, "reference": 0}
-
-    # Tier 2: structural markers (+20 each)
-    _score_structural_markers(text, scores)
-
-    # Tier 3: lexical title guard (+10)
-    _score_title_patterns(text, scores)
-
-    # Tier 4: content shape (+5)
-    _score_content_shape(text, scores)
-
-    # Winner takes all — must meet threshold of 5
-    best = max(scores, key=scores.get)
-    if scores[best] >= 5:
-        return best
-
-    return None
-
-
-def _is_release_notes(text: str) -> bool:
-    """Check if text has release notes structural patterns.
-
-    Used to refine ``reference`` → ``release_notes`` when the document
-    declares ``:_mod-docs-content-type: REFERENCE`` but has strong
-    release notes signals (Red Hat convention).
-
-    Requires reinforcing evidence to avoid false refinement:
-    title AND 1+ section heading, OR 3+ section headings alone.
-
-    Args:
-        text: Raw input text.
-
-    Returns:
-        True if release notes structure is detected.
-    """
-    has_title = bool(_RELEASE_NOTES_TITLE_RE.search(text))
-    section_count = len(_RELEASE_NOTES_SECTIONS_RE.findall(text))
-    return (has_title and section_count >= 1) or section_count >= 3
-
-
-def _score_structural_markers(text: str, scores: dict[str, int]) -> None:
-    """Score Tier 2 structural markers into the scores dict.
-
-    Args:
-        text: Raw input text.
-        scores: Mutable scores dictionary to update.
-    """
-    proc_markers = _STRUCT_PROCEDURE_RE.findall(text)
-    if proc_markers:
-        marker_lower = {m.lower() for m in proc_markers}
-        if "procedure" in marker_lower:
-            scores["procedure"] += 20
-        if "prerequisites" in marker_lower:
-            scores["procedure"] += 20
-        if "verification" in marker_lower:
-            scores["procedure"] += 20
-        if "troubleshooting" in marker_lower:
-            scores["procedure"] += 20
-
-    if _STRUCT_REFERENCE_RE.search(text):
-        scores["reference"] += 20
-
-
-def _score_title_patterns(text: str, scores: dict[str, int]) -> None:
-    """Score Tier 3 lexical title patterns into the scores dict.
-
-    Args:
-        text: Raw input text.
-        scores: Mutable scores dictionary to update.
-    """
-    if _CONCEPT_TITLE_RE.search(text):
-        scores["concept"] += 10
-    if _PROCEDURE_TITLE_RE.search(text):
-        scores["procedure"] += 10
-    if _REFERENCE_TITLE_RE.search(text):
-        scores["reference"] += 10
-
-
-def _score_content_shape(text: str, scores: dict[str, int]) -> None:
-    """Score Tier 4 content shape signals into the scores dict.
-
-    Args:
-        text: Raw input text.
-        scores: Mutable scores dictionary to update.
-    """
-    numbered = len(_NUMBERED_STEPS_RE.findall(text))
-    if numbered >= 3:
-        scores["procedure"] += 5
-    imperative = len(_IMPERATIVE_STEPS_RE.findall(text))
-    if imperative >= 2:
-        scores["procedure"] += 5
-    if _OPTIONAL_PREFIX_RE.search(text):
-        scores["procedure"] += 5
-
-    tables = len(_TABLE_MARKER_RE.findall(text))
-    def_lists = len(_DEF_LIST_RE.findall(text))
-    if tables > 0 or def_lists > 2:
-        scores["reference"] += 5
+    return sniff(text).content_type
 
 
 def _clean_markup(text: str) -> str:
@@ -757,7 +519,7 @@ def _clean_markup(text: str) -> str:
         Text with markup syntax stripped; prose content preserved.
     """
     result = text
-    for pattern, replacement in _MARKUP_SUBS:
+    for pattern, replacement, _hint in _MARKUP_SUBS:
         result = pattern.sub(replacement, result)
     return result
 
@@ -808,21 +570,6 @@ def _extract_sentences(doc: Any) -> list[str]:
     return sentences if sentences else [""]
 
 
-def _extract_words(doc: Any) -> list[str]:
-    """Extract word tokens from a SpaCy Doc, excluding punctuation and whitespace.
-
-    Args:
-        doc: SpaCy Doc object.
-
-    Returns:
-        List of word strings.
-    """
-    return [
-        token.text for token in doc
-        if not token.is_punct and not token.is_space
-    ]
-
-
 def _count_paragraphs(text: str) -> int:
     """Count paragraphs by splitting on double newlines.
 
@@ -849,53 +596,3 @@ def _safe_divide(numerator: float, denominator: int) -> float:
     if denominator == 0:
         return 0.0
     return numerator / denominator
-
-
-def _compute_avg_syllables(words: list[str]) -> float:
-    """Compute the average syllable count across a list of words.
-
-    Args:
-        words: List of word strings.
-
-    Returns:
-        Mean syllables per word, or 0.0 if the list is empty.
-    """
-    if not words:
-        return 0.0
-    total = sum(count_syllables(w) for w in words)
-    return total / len(words)
-
-
-def count_syllables(word: str) -> int:
-    """Estimate the syllable count of a single English word.
-
-    Uses a regex-based heuristic: counts vowel groups and applies
-    adjustments for silent-e, -le endings, and -ed/-es suffixes.
-
-    Args:
-        word: A single English word (no spaces).
-
-    Returns:
-        Estimated syllable count (minimum 1).
-    """
-    word = word.lower().strip()
-    if not word:
-        return 1
-
-    # Count vowel groups
-    vowel_groups = _VOWEL_GROUPS_RE.findall(word)
-    count = len(vowel_groups)
-
-    # Adjust for silent-e at end (e.g., "make" -> 1 syllable, not 2)
-    if _SILENT_E_RE.search(word) and not _LE_ENDING_RE.search(word):
-        count -= 1
-
-    # Adjust for -ed ending that does not add a syllable (e.g., "walked")
-    if _ED_ENDING_RE.search(word) and len(word) > 3:
-        count -= 1
-
-    # Adjust for -es ending that does not add a syllable (e.g., "makes")
-    if _ES_ENDING_RE.search(word) and len(word) > 3:
-        count -= 1
-
-    return max(count, 1)
@@ -76,65 +76,115 @@ def calculate_score(
         ScoreResponse with score, label, color, category counts,
         and per-guide compliance percentages.
     """
-    scorable = _filter_scorable(issues)
-    penalty = _compute_penalty(scorable)
-    normalizer = _compute_normalizer(word_count)
-    raw_score = 100.0 - (penalty / normalizer)
-    score = max(_SCORE_FLOOR, int(round(raw_score)))
-    label, color = _get_label_and_color(score)
-    category_counts = _count_by_category(issues)
-    compliance = _compute_compliance(issues, word_count)
-
-    logger.info(
-        "Score: %d (%s), %d scorable issues, penalty=%.2f, normalizer=%.2f",
-        score, label, len(scorable), penalty, normalizer,
-    )
-
-    return ScoreResponse(
-        score=score,
-        color=color,
-        label=label,
-        total_issues=len(issues),
-        category_counts=category_counts,
-        compliance=compliance,
-    )
+    return ScoreLedger(issues, word_count).to_score()
 
 
-# ---------------------------------------------------------------------------
-# Internal helpers
-# ---------------------------------------------------------------------------
-
+class ScoreLedger:
+    """Running score totals that absorb issue status changes in O(1).
 
-def _filter_scorable(issues: list[IssueResponse]) -> list[IssueResponse]:
-    """Filter out dismissed and accepted issues from scoring.
+    Instead of re-filtering and re-penalizing every issue on each
+    accept/dismiss, the ledger keeps counts of open issues per
+    (severity, category) pair and per style guide.  A status change
+    adjusts at most one pair counter and one guide counter, and the
+    score is rebuilt from these bounded tables.
 
-    Args:
-        issues: All detected issues.
-
-    Returns:
-        Only issues with OPEN status.
+    Attributes:
+        word_count: Document word count used for normalization.
+        total_issues: Number of issues regardless of status.
+        category_counts: Issues per category value (all statuses).
+        open_count: Number of OPEN (scorable) issues.
     """
-    return [
-        issue for issue in issues
-        if issue.status == IssueStatus.OPEN
-    ]
 
+    def __init__(self, issues: list[IssueResponse], word_count: int) -> None:
+        """Build the ledger from a full issue list.
+
+        Args:
+            issues: All detected issues.
+            word_count: Total number of words in the document.
+        """
+        self.word_count: int = word_count
+        self.total_issues: int = len(issues)
+        self.category_counts: dict[str, int] = _count_by_category(issues)
+        self.open_count: int = 0
+        self._penalty_counts: dict[tuple[object, object], int] = {}
+        self._guide_counts: dict[str, int] = dict.fromkeys(_STYLE_GUIDES, 0)
+        for issue in issues:
+            if issue.status == IssueStatus.OPEN:
+                self._adjust(issue, 1)
+
+    def apply_status_change(
+        self,
+        issue: IssueResponse,
+        old_status: IssueStatus,
+        new_status: IssueStatus,
+    ) -> None:
+        """Account for one issue moving between statuses.
+
+        Only transitions into or out of OPEN affect the score.
+
+        Args:
+            issue: The issue whose status changed.
+            old_status: Status before the change.
+            new_status: Status after the change.
+        """
+        was_open = old_status == IssueStatus.OPEN
+        is_open = new_status == IssueStatus.OPEN
+        if was_open != is_open:
+            self._adjust(issue, 1 if is_open else -1)
+
+    def to_score(self) -> ScoreResponse:
+        """Compute the current ScoreResponse from the running totals.
+
+        Returns:
+            ScoreResponse with score, label, color, category counts,
+            and per-guide compliance percentages.
+        """
+        penalty = 0.0
+        for (severity, category), count in self._penalty_counts.items():
+            weight = _SEVERITY_WEIGHTS.get(severity, 2.0)
+            multiplier = _CATEGORY_MULTIPLIERS.get(category, 1.0)
+            penalty += weight * multiplier * count
+        normalizer = _compute_normalizer(self.word_count)
+        raw_score = 100.0 - (penalty / normalizer)
+        score = max(_SCORE_FLOOR, int(round(raw_score)))
+        label, color = _get_label_and_color(score)
+
+        logger.info(
+            "Score: %d (%s), %d scorable issues, penalty=%.2f, normalizer=%.2f",
+            score, label, self.open_count, penalty, normalizer,
+        )
+
+        return ScoreResponse(
+            score=score,
+            color=color,
+            label=label,
+            total_issues=self.total_issues,
+            category_counts=dict(self.category_counts),
+            compliance=_compute_compliance(self._guide_counts, self.word_count),
+        )
+
+    def _adjust(self, issue: IssueResponse, delta: int) -> None:
+        """Add (``delta=1``) or remove (``delta=-1``) an open issue.
+
+        Args:
+            issue: The issue entering or leaving the OPEN set.
+            delta: +1 or -1.
+        """
+        self.open_count += delta
+        key = (issue.severity, issue.category)
+        remaining = self._penalty_counts.get(key, 0) + delta
+        if remaining:
+            self._penalty_counts[key] = remaining
+        else:
+            self._penalty_counts.pop(key, None)
+        guide = _guide_for_citation(issue.style_guide_citation)
+        if guide is not None:
+            self._guide_counts[guide] += delta
 
-def _compute_penalty(scorable: list[IssueResponse]) -> float:
-    """Sum severity-weighted, category-multiplied penalties.
 
-    Args:
-        scorable: Issues to include in the penalty calculation.
-
-    Returns:
-        Total penalty value.
-    """
-    total = 0.0
-    for issue in scorable:
-        weight = _SEVERITY_WEIGHTS.get(issue.severity, 2.0)
-        multiplier = _CATEGORY_MULTIPLIERS.get(issue.category, 1.0)
-        total += weight * multiplier
-    return total
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
 
 
 def _compute_normalizer(word_count: int) -> float:
@@ -185,39 +235,41 @@ def _count_by_category(issues: list[IssueResponse]) -> dict[str, int]:
     return counts
 
 
+def _guide_for_citation(citation: str) -> str | None:
+    """Return the first style guide named in a citation.
+
+    Args:
+        citation: The issue's style guide citation string.
+
+    Returns:
+        The matching guide name, or None if no known guide is cited.
+    """
+    for guide in _STYLE_GUIDES:
+        if guide in citation:
+            return guide
+    return None
+
+
 def _compute_compliance(
-    issues: list[IssueResponse], word_count: int
+    guide_counts: dict[str, int], word_count: int
 ) -> dict[str, float]:
     """Compute per-style-guide compliance percentages.
 
-    Compliance is estimated as 1.0 minus the ratio of issues
+    Compliance is estimated as 1.0 minus the ratio of open issues
     citing a given guide to total words, capped at [0.0, 1.0].
     Guides with no issues receive 1.0 compliance.
 
     Args:
-        issues: All detected issues.
+        guide_counts: Open issue counts keyed by guide name.
         word_count: Total number of words.
 
     Returns:
         Dictionary mapping guide names to compliance floats.
     """
-    guide_issue_counts: dict[str, int] = {}
-    for guide in _STYLE_GUIDES:
-        guide_issue_counts[guide] = 0
-
-    for issue in issues:
-        if issue.status != IssueStatus.OPEN:
-            continue
-        citation = issue.style_guide_citation
-        for guide in _STYLE_GUIDES:
-            if guide in citation:
-                guide_issue_counts[guide] = guide_issue_counts.get(guide, 0) + 1
-                break
-
     compliance: dict[str, float] = {}
     effective_count = max(word_count, 1)
     for guide in _STYLE_GUIDES:
-        count = guide_issue_counts.get(guide, 0)
+        count = guide_counts.get(guide, 0)
         ratio = count / effective_count
         compliance[guide] = round(max(0.0, min(1.0, 1.0 - ratio)), 4)
 
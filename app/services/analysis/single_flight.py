@@ -0,0 +1,380 @@
+"""Coalescing of identical concurrent analyses.
+
+Editors often analyse the same module at the same moment — a shared
+review, or one tab firing both the HTTP ``/analyze`` request and the
+Socket.IO ``start_analysis`` event.  Without coordination every request
+repeats parsing, spaCy, the rules, LanguageTool and the LLM passes.
+
+A ``Flight`` is one running analysis.  The first request for a key
+*leads* it and runs the pipeline; identical requests that arrive while
+it runs *follow* it: they wait for the leader's deterministic response,
+take a private copy for their own session, and receive the leader's
+later events re-addressed to their session (see the orchestrator's
+``_publish_results`` and ``_emit_event``).  When the leader finishes,
+its final response is delivered to every follower and kept for a few
+seconds so immediate repeats are answered from memory.
+
+Keys are built by :func:`analysis_key` from the exact text (issue spans
+are offsets into it, so only byte-identical documents can share
+results), the parsed block structure, the content type, the file type
+and a fingerprint of the configuration that affects results.
+
+This module only keeps the bookkeeping; running phases and emitting
+events stay in the orchestrator.
+
+Usage:
+    from app.services.analysis.single_flight import get_single_flight
+
+    flights = get_single_flight()
+    flight, leading = flights.join(key, subscriber)
+"""
+
+import dataclasses
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Iterable, Optional
+
+from app.config import Config
+from app.models.schemas import AnalyzeResponse
+from models.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+# Completed results kept for immediate repeats.
+_RESULT_CACHE_MAX_ENTRIES = 32
+
+
+@dataclasses.dataclass
+class Subscriber:
+    """One request attached to a flight.
+
+    Attributes:
+        session_id: The request's own analysis session.
+        socket_sid: Socket.IO client that sent the request, if any.
+        cancel_token: Token of the request's run; a cancelled follower
+            receives nothing more.
+        request: The follower's own analysis arguments, kept so it can
+            take over the flight if the leader is cancelled.  None for
+            the leader.
+        ready: Set once the follower's session has been stored, so the
+            final result is never written before it.
+    """
+
+    session_id: str
+    socket_sid: Optional[str]
+    cancel_token: CancellationToken
+    request: Optional[dict[str, Any]] = None
+    ready: threading.Event = dataclasses.field(default_factory=threading.Event)
+
+    @property
+    def live(self) -> bool:
+        """Whether the subscriber still wants results."""
+        return not self.cancel_token.cancelled
+
+
+class Flight:
+    """One in-flight analysis shared by identical requests.
+
+    Attributes:
+        key: The coalescing key.
+        leader: The subscriber whose run computes the results.
+        followers: Subscribers sharing the leader's results.
+    """
+
+    def __init__(self, key: str, leader: Subscriber) -> None:
+        """Create a flight led by *leader*.
+
+        Args:
+            key: The coalescing key.
+            leader: The subscriber running the pipeline.
+        """
+        self.key: str = key
+        self.leader: Subscriber = leader
+        self.followers: list[Subscriber] = []
+        self._first: Future = Future()
+
+    def set_first(self, response: AnalyzeResponse) -> None:
+        """Publish the deterministic response to waiting followers.
+
+        Args:
+            response: A private copy of the leader's first response;
+                followers copy it again and never modify it.
+        """
+        if not self._first.done():
+            self._first.set_result(response)
+
+    def fail_first(self, exc: BaseException) -> None:
+        """Wake waiting followers with the leader's failure.
+
+        Args:
+            exc: The exception the leader's deterministic phase raised.
+        """
+        if not self._first.done():
+            self._first.set_exception(exc)
+
+    def wait_first(self, timeout: float) -> AnalyzeResponse:
+        """Wait for the leader's deterministic response.
+
+        Args:
+            timeout: Seconds to wait.
+
+        Returns:
+            The response template passed to :meth:`set_first`.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the leader is too slow.
+            Exception: Whatever the leader's deterministic phase raised.
+        """
+        return self._first.result(timeout=timeout)
+
+
+class SingleFlight:
+    """Registry of running flights and recently completed results.
+
+    Attributes:
+        result_ttl: Seconds a completed result is served to repeats
+            (0 disables the result cache).
+    """
+
+    def __init__(self, result_ttl: Optional[float] = None) -> None:
+        """Create an empty registry.
+
+        Args:
+            result_ttl: Result cache lifetime in seconds.  Defaults to
+                ``Config.ANALYSIS_RESULT_CACHE_SECONDS``.
+        """
+        self.result_ttl: float = (
+            result_ttl if result_ttl is not None else Config.ANALYSIS_RESULT_CACHE_SECONDS
+        )
+        self._lock = threading.Lock()
+        self._flights: dict[str, Flight] = {}
+        self._led: dict[str, Flight] = {}
+        self._results: OrderedDict[str, tuple[AnalyzeResponse, float]] = OrderedDict()
+
+    def cached(self, key: str) -> Optional[AnalyzeResponse]:
+        """Return a completed result for *key* if it is still fresh.
+
+        Args:
+            key: The coalescing key.
+
+        Returns:
+            The cached response template, or None.
+        """
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            response, expires = entry
+            if time.monotonic() >= expires:
+                del self._results[key]
+                return None
+            self._results.move_to_end(key)
+            return response
+
+    def join(self, key: str, subscriber: Subscriber) -> tuple[Flight, bool]:
+        """Attach *subscriber* to the running flight for *key*, or start one.
+
+        A flight whose leader has been cancelled is not joined: its
+        results may never arrive.
+
+        Args:
+            key: The coalescing key.
+            subscriber: The new request.
+
+        Returns:
+            Tuple of (flight, True if *subscriber* leads it).
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and flight.leader.live:
+                flight.followers.append(subscriber)
+                logger.info(
+                    "Session %s follows analysis %s (%d followers)",
+                    subscriber.session_id, flight.leader.session_id,
+                    len(flight.followers),
+                )
+                return flight, False
+            flight = Flight(key, subscriber)
+            self._register_locked(flight)
+            return flight, True
+
+    def leave(self, flight: Flight, subscriber: Subscriber) -> None:
+        """Detach a follower that stopped waiting for *flight*.
+
+        Args:
+            flight: The flight the follower joined.
+            subscriber: The follower.
+        """
+        with self._lock:
+            if subscriber in flight.followers:
+                flight.followers.remove(subscriber)
+
+    def followers(self, leader_session_id: str) -> list[Subscriber]:
+        """Return the live followers of the flight led by a session.
+
+        Args:
+            leader_session_id: Session ID of a leader.
+
+        Returns:
+            Live followers, empty when the session leads no flight.
+        """
+        with self._lock:
+            flight = self._led.get(leader_session_id)
+            if flight is None:
+                return []
+            return [f for f in flight.followers if f.live]
+
+    def finish(
+        self, flight: Flight, response: Optional[AnalyzeResponse],
+    ) -> list[Subscriber]:
+        """End *flight* and cache its final result.
+
+        Args:
+            flight: The finishing flight.
+            response: Private copy of the final response, or None when
+                the leader produced no result (failed or cancelled).
+
+        Returns:
+            The flight's live followers at the moment it ended; no
+            subscriber can join it afterwards.
+        """
+        with self._lock:
+            self._unregister_locked(flight)
+            if response is not None and self.result_ttl > 0:
+                self._results[flight.key] = (
+                    response, time.monotonic() + self.result_ttl,
+                )
+                self._results.move_to_end(flight.key)
+                while len(self._results) > _RESULT_CACHE_MAX_ENTRIES:
+                    self._results.popitem(last=False)
+            return [f for f in flight.followers if f.live]
+
+    def hand_over(
+        self, flight: Flight, followers: list[Subscriber],
+    ) -> Optional[Flight]:
+        """Start a new flight for *flight*'s key led by its first follower.
+
+        Used when the leader was cancelled but followers still want
+        results.  Subscribers that joined a newer flight for the key in
+        the meantime are attached to that one instead.
+
+        Args:
+            flight: The ended flight.
+            followers: Its live followers, as returned by :meth:`finish`.
+
+        Returns:
+            The new flight to run, or None if there is nothing to run
+            (no live follower, or a newer flight took them all).
+        """
+        live = [f for f in followers if f.live]
+        if not live:
+            return None
+        with self._lock:
+            current = self._flights.get(flight.key)
+            if current is not None and current.leader.live:
+                current.followers.extend(live)
+                return None
+            successor = Flight(flight.key, live[0])
+            successor.followers = live[1:]
+            self._register_locked(successor)
+        logger.info(
+            "Leader %s of shared analysis cancelled; %s takes over",
+            flight.leader.session_id, successor.leader.session_id,
+        )
+        return successor
+
+    def stats(self) -> dict[str, int]:
+        """Return counts of running flights, followers and cached results.
+
+        Returns:
+            Dict with ``flights``, ``followers`` and ``cached_results``.
+        """
+        with self._lock:
+            return {
+                "flights": len(self._flights),
+                "followers": sum(len(f.followers) for f in self._flights.values()),
+                "cached_results": len(self._results),
+            }
+
+    def _register_locked(self, flight: Flight) -> None:
+        """Index *flight* by key and leader session.  Caller holds ``_lock``."""
+        self._flights[flight.key] = flight
+        self._led[flight.leader.session_id] = flight
+
+    def _unregister_locked(self, flight: Flight) -> None:
+        """Remove *flight* from the indexes it still owns.  Caller holds ``_lock``."""
+        if self._flights.get(flight.key) is flight:
+            del self._flights[flight.key]
+        if self._led.get(flight.leader.session_id) is flight:
+            del self._led[flight.leader.session_id]
+
+
+def analysis_key(
+    text: str,
+    content_type: str,
+    file_type: Optional[str],
+    blocks: Optional[Iterable[Any]],
+    user_selected: bool,
+    config_version: str,
+) -> str:
+    """Build the coalescing key of an analysis request.
+
+    Args:
+        text: The exact text to analyze.
+        content_type: Requested content type.
+        file_type: Original file format, if any.
+        blocks: Parsed blocks; pasted HTML can give the same text a
+            different structure.
+        user_selected: Whether the content type was chosen explicitly
+            (an auto-detected type may otherwise override it).
+        config_version: Fingerprint of the result-affecting settings.
+
+    Returns:
+        Hex digest identifying the request.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{content_type}|{file_type}|{user_selected}|{config_version}\0".encode())
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    _update_with_blocks(digest, blocks or ())
+    return digest.hexdigest()
+
+
+def _update_with_blocks(digest: Any, blocks: Iterable[Any]) -> None:
+    """Feed the structure of *blocks* (and their children) into *digest*."""
+    for block in blocks:
+        digest.update(
+            f"\0{getattr(block, 'block_type', '')}|{getattr(block, 'start_pos', '')}"
+            f"|{getattr(block, 'end_pos', '')}|{getattr(block, 'level', '')}|".encode()
+        )
+        digest.update(str(getattr(block, "inline_content", "")).encode("utf-8", "surrogatepass"))
+        children = getattr(block, "children", None)
+        if children:
+            digest.update(b"[")
+            _update_with_blocks(digest, children)
+            digest.update(b"]")
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_single_flight_instance: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide flight registry, creating it on first use.
+
+    Returns:
+        The shared SingleFlight instance.
+    """
+    global _single_flight_instance  # noqa: PLW0603
+    if _single_flight_instance is None:
+        with _single_flight_lock:
+            if _single_flight_instance is None:
+                _single_flight_instance = SingleFlight()
+    return _single_flight_instance
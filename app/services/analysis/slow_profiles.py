@@ -0,0 +1,505 @@
+"""Stack-sampling profiles of slow analyses.
+
+When ``SLOW_PROFILE_ENABLED`` is set, every analysis run carries a
+:class:`ProfileCapture`.  A sampler on a native OS thread (so it keeps
+running while a gevent worker is busy in the rules) wakes every
+``SLOW_PROFILE_INTERVAL_MS`` and records the stack of each task working
+for a capture: the request that called ``orchestrator.analyze``, the
+background phases of its ``PhaseGraph`` and the LLM block workers the
+granular phase starts.  Tasks join a capture with
+:meth:`ProfileCapture.track`; a ``PhaseGraph`` created inside a tracked
+task tracks its phases with the same capture, and :func:`bind_capture`
+carries it into other pools.
+
+A capture ends when the request and every background phase it started
+are done.  Runs that took at least ``SLOW_PROFILE_THRESHOLD_SECONDS``
+are kept, tagged with the request's correlation ID, in a ring buffer of
+``SLOW_PROFILE_CAPACITY`` captures per worker; the rest are dropped.
+Kept captures export as collapsed stacks (``flamegraph.pl``,
+speedscope, ``inferno``) or as a speedscope JSON file, one profile per
+task kind.
+
+Samples are taken of suspended greenlets too, so time spent waiting on
+LanguageTool or the model shows up under the waiting call.
+
+Usage:
+    from app.services.analysis.slow_profiles import get_slow_profiler, track
+
+    profiler = get_slow_profiler()
+    capture = profiler.begin(session_id) if profiler is not None else None
+    with track(capture, "request"):
+        ...
+"""
+
+import collections
+import contextlib
+import datetime
+import functools
+import importlib
+import itertools
+import logging
+import os
+import sys
+import time
+from types import CodeType, FrameType
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from flask import g, has_request_context
+
+from app.config import Config
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Frames kept per sample, innermost first when cut
+_MAX_STACK_DEPTH = 128
+
+# Distinct stacks kept per capture; later new stacks count as one
+_MAX_STACKS_PER_CAPTURE = 10_000
+_TRUNCATED_STACK: Tuple[str, ...] = ("(more stacks than the capture keeps)",)
+
+# Longest gap one sample may stand for (e.g. after the host stalled)
+_MAX_SAMPLE_WEIGHT_SECONDS = 1.0
+
+_SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+def _native(module: str, name: str) -> Any:
+    """Return *module.name* as it was before gevent monkey-patching."""
+    try:
+        from gevent import monkey
+    except ImportError:
+        return getattr(importlib.import_module(module), name)
+    return monkey.get_original(module, name)
+
+
+_start_native_thread = _native("_thread", "start_new_thread")
+_native_get_ident = _native("_thread", "get_ident")
+_native_lock = _native("_thread", "allocate_lock")
+_native_sleep = _native("time", "sleep")
+
+
+def _current_greenlet() -> Any:
+    """Return the running greenlet when threads are greenlets, else None."""
+    try:
+        from gevent import monkey
+    except ImportError:
+        return None
+    if not monkey.is_module_patched("threading"):
+        return None
+    import greenlet
+    return greenlet.getcurrent()
+
+
+def _caller_frame() -> FrameType:
+    """Return the frame that entered the tracked block.
+
+    Skips the ``track`` context managers and ``contextlib``; the frame
+    left holds the ``with`` statement, so it stays on the task's stack
+    while the block runs.
+    """
+    frame = sys._getframe(1)
+    while frame.f_back is not None and (
+        frame.f_code.co_filename == contextlib.__file__
+        or (frame.f_code.co_filename == __file__ and frame.f_code.co_name == "track")
+    ):
+        frame = frame.f_back
+    return frame
+
+
+def _request_id() -> str:
+    """Return the correlation ID of the current HTTP request, if any."""
+    if has_request_context():
+        return str(getattr(g, "request_id", "") or "")
+    return ""
+
+
+class _Task:
+    """A thread or greenlet sampled for a capture.
+
+    Attributes:
+        kind: Label of the work it does (e.g. ``request``).
+        thread_id: Native ident of the OS thread it runs on.
+        greenlet: The greenlet, when threads are greenlets.
+        root: The frame that joined the capture; stacks stop there.
+    """
+
+    __slots__ = ("kind", "thread_id", "greenlet", "root")
+
+    def __init__(self, kind: str, root: FrameType) -> None:
+        self.kind = kind
+        self.thread_id = _native_get_ident()
+        self.greenlet = _current_greenlet()
+        self.root = root
+
+
+class ProfileCapture:
+    """Stack samples of one analysis run.
+
+    Attributes:
+        id: Unique capture ID.
+        session_id: The analysis session.
+        request_id: Correlation ID of the request that started it.
+        started_at: Wall-clock start (UTC).
+        duration: Seconds from start to the end of the last task; 0
+            while running.
+        samples: Sampled seconds per ``(task kind, frames...)`` stack,
+            outermost frame first.  Each sample weighs the time since
+            the previous one, so stacks holding the GIL (which delays
+            the sampler) are not under-counted.
+        sample_count: Number of stacks recorded.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, profiler: "SlowAnalysisProfiler", session_id: str, request_id: str) -> None:
+        """Create a running capture.
+
+        Args:
+            profiler: The profiler that samples it.
+            session_id: The analysis session.
+            request_id: Correlation ID of the starting request.
+        """
+        self.id = f"{int(time.time())}-{next(self._ids)}"
+        self.session_id = session_id
+        self.request_id = request_id
+        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+        self.duration = 0.0
+        self.samples: Dict[Tuple[str, ...], float] = collections.defaultdict(float)
+        self.sample_count = 0
+        self._profiler = profiler
+        self._started = time.monotonic()
+        self._holds = 0
+        self._tasks: List[_Task] = []
+
+    @property
+    def interval(self) -> float:
+        """Seconds between samples."""
+        return self._profiler.interval
+
+    @contextlib.contextmanager
+    def track(self, kind: str) -> Iterator["ProfileCapture"]:
+        """Sample the calling thread or greenlet while the block runs.
+
+        Args:
+            kind: Label of the work, used as the stack's root frame.
+
+        Yields:
+            This capture.
+        """
+        task = _Task(kind, _caller_frame())
+        self.hold()
+        with self._profiler.lock:
+            self._tasks.append(task)
+        try:
+            yield self
+        finally:
+            with self._profiler.lock:
+                self._tasks.remove(task)
+            self.release()
+
+    def hold(self) -> None:
+        """Keep the capture running until a matching :meth:`release`."""
+        with self._profiler.lock:
+            self._holds += 1
+
+    def release(self) -> None:
+        """Drop a hold; the last one ends the capture."""
+        with self._profiler.lock:
+            self._holds -= 1
+            ended = self._holds == 0
+        if ended:
+            self.duration = time.monotonic() - self._started
+            self._profiler.end(self)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the capture's metadata as a JSON-serialisable dict."""
+        with self._profiler.lock:
+            count = self.sample_count
+            kinds = sorted({stack[0] for stack in self.samples})
+        return {
+            "id": self.id,
+            "session_id": self.session_id,
+            "request_id": self.request_id,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "duration_seconds": round(self.duration, 3),
+            "samples": count,
+            "interval_ms": self.interval * 1000,
+            "tasks": kinds,
+        }
+
+    def collapsed(self) -> str:
+        """Return the samples in collapsed-stack format.
+
+        One line per stack, ``task;outer;...;inner milliseconds``, as
+        read by ``flamegraph.pl``, ``inferno`` and speedscope.
+        """
+        with self._profiler.lock:
+            stacks = sorted(self.samples.items())
+        return "".join(
+            f"{';'.join(stack)} {max(round(seconds * 1000), 1)}\n" for stack, seconds in stacks
+        )
+
+    def speedscope(self) -> Dict[str, Any]:
+        """Return the samples as a speedscope file, one profile per task kind."""
+        with self._profiler.lock:
+            stacks = sorted(self.samples.items())
+        frames: Dict[str, int] = {}
+        profiles: Dict[str, Dict[str, Any]] = {}
+        for stack, seconds in stacks:
+            kind, frame_names = stack[0], stack[1:]
+            profile = profiles.setdefault(kind, {
+                "type": "sampled",
+                "name": kind,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": 0.0,
+                "samples": [],
+                "weights": [],
+            })
+            profile["samples"].append([frames.setdefault(name, len(frames)) for name in frame_names])
+            profile["weights"].append(seconds)
+            profile["endValue"] += seconds
+        return {
+            "$schema": _SPEEDSCOPE_SCHEMA,
+            "name": f"analysis {self.session_id} ({self.request_id or 'no request id'})",
+            "exporter": "content-editorial-assistant",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": name} for name in frames]},
+            "profiles": list(profiles.values()),
+        }
+
+
+class SlowAnalysisProfiler:
+    """Samples running captures and keeps the slow ones.
+
+    Attributes:
+        threshold: Seconds from which a run is kept.
+        interval: Seconds between samples.
+        lock: Native lock guarding captures and their samples.
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        interval: Optional[float] = None,
+        capacity: Optional[int] = None,
+    ) -> None:
+        """Create an idle profiler.
+
+        Args:
+            threshold: Seconds from which a run is kept.  Defaults to
+                ``Config.SLOW_PROFILE_THRESHOLD_SECONDS``.
+            interval: Seconds between samples.  Defaults to
+                ``Config.SLOW_PROFILE_INTERVAL_MS``.
+            capacity: Captures kept; the oldest is dropped first.
+                Defaults to ``Config.SLOW_PROFILE_CAPACITY``.
+        """
+        if threshold is None:
+            threshold = Config.SLOW_PROFILE_THRESHOLD_SECONDS
+        if interval is None:
+            interval = Config.SLOW_PROFILE_INTERVAL_MS / 1000
+        if capacity is None:
+            capacity = Config.SLOW_PROFILE_CAPACITY
+        self.threshold = threshold
+        self.interval = max(interval, 0.001)
+        self.lock = _native_lock()
+        self._running: List[ProfileCapture] = []
+        self._kept: Deque[ProfileCapture] = collections.deque(maxlen=max(capacity, 1))
+        self._sampling = False
+        self._labels: Dict[CodeType, str] = {}
+        self._root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+    def begin(self, session_id: str) -> ProfileCapture:
+        """Start a capture for an analysis run.
+
+        The caller tracks at least one task with it; the capture ends
+        when the last tracked task (or other hold) is released.
+
+        Args:
+            session_id: The analysis session.
+
+        Returns:
+            The running capture.
+        """
+        capture = ProfileCapture(self, session_id, _request_id())
+        with self.lock:
+            self._running.append(capture)
+            start = not self._sampling
+            self._sampling = True
+        if start:
+            _start_native_thread(self._sample_loop, ())
+        return capture
+
+    def end(self, capture: ProfileCapture) -> None:
+        """Stop sampling *capture* and keep it if it was slow.
+
+        Args:
+            capture: A capture whose last hold was released.
+        """
+        with self.lock:
+            if capture in self._running:
+                self._running.remove(capture)
+            kept = capture.duration >= self.threshold
+            if kept:
+                self._kept.append(capture)
+        if kept:
+            logger.info(
+                "Kept profile %s of slow analysis %s (%.1fs, request %s)",
+                capture.id, capture.session_id, capture.duration, capture.request_id or "-",
+            )
+
+    def captures(self) -> List[ProfileCapture]:
+        """Return the kept captures, newest first."""
+        with self.lock:
+            return list(reversed(self._kept))
+
+    def get(self, capture_id: str) -> Optional[ProfileCapture]:
+        """Return the kept capture with *capture_id*, or None."""
+        with self.lock:
+            return next((c for c in self._kept if c.id == capture_id), None)
+
+    def sample(self, weight: Optional[float] = None) -> None:
+        """Record one stack for every task of every running capture.
+
+        Args:
+            weight: Seconds the sample stands for; the interval when None.
+        """
+        if weight is None:
+            weight = self.interval
+        frames = sys._current_frames()
+        with self.lock:
+            for capture in self._running:
+                for task in capture._tasks:
+                    stack = self._stack(task, frames)
+                    if stack is None:
+                        continue
+                    if stack not in capture.samples and len(capture.samples) >= _MAX_STACKS_PER_CAPTURE:
+                        stack = (task.kind,) + _TRUNCATED_STACK
+                    capture.samples[stack] += weight
+                    capture.sample_count += 1
+
+    def _sample_loop(self) -> None:
+        """Sample until no capture is running (native thread)."""
+        last = time.monotonic()
+        while True:
+            _native_sleep(self.interval)
+            with self.lock:
+                if not self._running:
+                    self._sampling = False
+                    return
+            now = time.monotonic()
+            try:
+                self.sample(min(now - last, _MAX_SAMPLE_WEIGHT_SECONDS))
+            except Exception:  # noqa: BLE001 - the sampler must not die mid-analysis
+                logger.exception("Profile sampling failed")
+            last = now
+
+    def _stack(self, task: _Task, frames: Dict[int, FrameType]) -> Optional[Tuple[str, ...]]:
+        """Return *task*'s stack from its root frame, or None if unseen.
+
+        A suspended greenlet's frame comes from the greenlet; a running
+        task's from its OS thread, which is accepted only if the task's
+        root frame is on it (otherwise another greenlet is running).
+        """
+        leaf = getattr(task.greenlet, "gr_frame", None) if task.greenlet is not None else None
+        if leaf is None:
+            leaf = frames.get(task.thread_id)
+        names: List[str] = []
+        frame = leaf
+        while frame is not None and frame is not task.root:
+            names.append(self._label(frame.f_code))
+            frame = frame.f_back
+        if frame is None:
+            return None
+        names.append(self._label(frame.f_code))
+        return (task.kind,) + tuple(reversed(names[:_MAX_STACK_DEPTH]))
+
+    def _label(self, code: CodeType) -> str:
+        """Return ``function (path:line)`` for a code object."""
+        label = self._labels.get(code)
+        if label is None:
+            path = code.co_filename
+            if path.startswith(self._root):
+                path = os.path.relpath(path, self._root)
+            label = self._labels[code] = f"{code.co_qualname} ({path}:{code.co_firstlineno})"
+        return label
+
+
+@contextlib.contextmanager
+def track(capture: Optional[ProfileCapture], kind: str) -> Iterator[Optional[ProfileCapture]]:
+    """Track the calling task with *capture*, or do nothing without one.
+
+    Args:
+        capture: The run's capture, or None when profiling is off.
+        kind: Label of the work.
+
+    Yields:
+        *capture*.
+    """
+    if capture is None:
+        yield None
+        return
+    with capture.track(kind):
+        yield capture
+
+
+def current_capture() -> Optional[ProfileCapture]:
+    """Return the capture tracking the calling task, if any."""
+    profiler = _slow_profiler_instance
+    if profiler is None:
+        return None
+    thread_id, greenlet = _native_get_ident(), _current_greenlet()
+    with profiler.lock:
+        for capture in profiler._running:
+            for task in capture._tasks:
+                if task.thread_id == thread_id and task.greenlet is greenlet:
+                    return capture
+    return None
+
+
+def bind_capture(func: F, kind: str) -> F:
+    """Wrap *func* to run tracked by the caller's capture.
+
+    For work handed to another pool; returns *func* unchanged when the
+    caller is not tracked.
+
+    Args:
+        func: The callable.
+        kind: Label of the work it does.
+
+    Returns:
+        The callable to submit.
+    """
+    capture = current_capture()
+    if capture is None:
+        return func
+
+    @functools.wraps(func)
+    def run(*args: Any, **kwargs: Any) -> Any:
+        with capture.track(kind):
+            return func(*args, **kwargs)
+
+    return run  # type: ignore[return-value]
+
+
+_slow_profiler_instance: Optional[SlowAnalysisProfiler] = None
+_slow_profiler_lock = _native_lock()
+
+
+def get_slow_profiler() -> Optional[SlowAnalysisProfiler]:
+    """Return the process-wide profiler, or None when profiling is off.
+
+    Returns:
+        The shared SlowAnalysisProfiler, created on first use when
+        ``SLOW_PROFILE_ENABLED`` is set.
+    """
+    global _slow_profiler_instance  # noqa: PLW0603
+    if not Config.SLOW_PROFILE_ENABLED:
+        return None
+    if _slow_profiler_instance is None:
+        with _slow_profiler_lock:
+            if _slow_profiler_instance is None:
+                _slow_profiler_instance = SlowAnalysisProfiler()
+    return _slow_profiler_instance
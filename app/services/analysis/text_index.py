@@ -0,0 +1,348 @@
+"""Per-document text index for LLM and deterministic span resolution.
+
+Span resolution searches the same original text once per issue with
+several strategies (exact, case-insensitive, inline-marker tolerant,
+fuzzy).  Rebuilding the lowercased copy, the marker-stripped
+projection, or sliding a fuzzy window over the whole document for
+every issue makes remapping O(issues x document length).
+
+``DocumentTextIndex`` builds each derived view lazily, once per
+document, and answers the queries all strategies need:
+
+* a lowercased copy (``lower``) for case-insensitive search,
+* a ``**``/backtick-stripped projection with a position map back to
+  the original text, and
+* a character-bigram position table used to prune fuzzy-match
+  windows without changing which window wins.
+
+Usage:
+    from app.services.analysis.text_index import DocumentTextIndex
+
+    index = DocumentTextIndex(original_text)
+    start, end = index.find_ignoring_inline_markers("bold text")
+"""
+
+import logging
+import math
+import re
+from array import array
+from bisect import bisect_left
+from difflib import SequenceMatcher
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Inline markers skipped by the tolerant search: ``**`` (bold) and a
+# single backtick (inline code).  Alternation order matters — ``**`` is
+# consumed as a pair before a lone ``*`` would be kept.
+_INLINE_MARKER_RE = re.compile(r"\*\*|`")
+
+# Lowercasing of capital sigma depends on its neighbours, so slices of
+# a lowercased document may differ from lowercased slices.
+_CONTEXT_SENSITIVE_LOWER = "Σ"
+
+
+def project_inline_markers(text: str) -> tuple[str, array, set[int]]:
+    """Strip ``**`` and backtick markers, keeping a map to *text*.
+
+    Args:
+        text: Text that may contain inline formatting markers.
+
+    Returns:
+        Tuple of ``(stripped, pos_map, pair_tails)`` where
+        ``pos_map[i]`` is the position in *text* of ``stripped[i]`` and
+        ``pair_tails`` holds the positions of the second ``*`` of every
+        skipped ``**`` pair.
+    """
+    pieces: list[str] = []
+    pos_map = array("q")
+    pair_tails: set[int] = set()
+    prev = 0
+    for match in _INLINE_MARKER_RE.finditer(text):
+        start = match.start()
+        if start > prev:
+            pieces.append(text[prev:start])
+            pos_map.extend(range(prev, start))
+        if match.end() - start == 2:
+            pair_tails.add(start + 1)
+        prev = match.end()
+    if prev < len(text):
+        pieces.append(text[prev:])
+        pos_map.extend(range(prev, len(text)))
+    return "".join(pieces), pos_map, pair_tails
+
+
+def find_ignoring_inline_markers(text: str, target: str) -> tuple[int, int]:
+    """Find *target* in *text*, skipping ``**`` and backtick markers.
+
+    Args:
+        text: Text to search (may contain inline formatting markers).
+        target: The clean text to find (without markers).
+
+    Returns:
+        ``(start, end)`` positions in *text*, or ``(-1, -1)`` if not found.
+    """
+    stripped, pos_map, _ = project_inline_markers(text)
+    idx = stripped.find(target)
+    if idx < 0:
+        return -1, -1
+
+    start = pos_map[idx]
+    end_idx = idx + len(target) - 1
+    end = pos_map[end_idx] + 1 if end_idx < len(pos_map) else len(text)
+    return start, end
+
+
+class DocumentTextIndex:
+    """Lazily built search views over one document's text.
+
+    Every view is derived on first use and reused by subsequent
+    queries, so an index shared by all issues of an analysis costs one
+    pass per view regardless of the number of issues.
+
+    Attributes:
+        text: The indexed document text.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Create an index over *text*.
+
+        Args:
+            text: The document text to index.
+        """
+        self.text: str = text
+        self._lower: Optional[str] = None
+        self._lower_aligned: Optional[bool] = None
+        self._stripped: Optional[str] = None
+        self._pos_map: Optional[array] = None
+        self._pair_tails: Optional[set[int]] = None
+        self._bigrams: Optional[dict[str, array]] = None
+
+    # ------------------------------------------------------------------
+    # Case-insensitive view
+    # ------------------------------------------------------------------
+
+    @property
+    def lower(self) -> str:
+        """The lowercased document text."""
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def lower_aligned(self) -> bool:
+        """Whether ``lower[i]`` corresponds to ``text[i]`` for every ``i``.
+
+        False when lowercasing changes the length (e.g. dotted capital
+        I) or is context-sensitive (capital sigma); callers then lower
+        their search region instead of slicing ``lower``.
+        """
+        if self._lower_aligned is None:
+            self._lower_aligned = (
+                len(self.lower) == len(self.text)
+                and _CONTEXT_SENSITIVE_LOWER not in self.text
+            )
+        return self._lower_aligned
+
+    # ------------------------------------------------------------------
+    # Marker-stripped projection
+    # ------------------------------------------------------------------
+
+    def find_ignoring_inline_markers(
+        self, target: str, start: int = 0, end: Optional[int] = None,
+    ) -> tuple[int, int]:
+        """Find *target* in ``text[start:end]``, skipping inline markers.
+
+        Equivalent to :func:`find_ignoring_inline_markers` applied to
+        the region, but searches the document-wide projection.  Falls
+        back to projecting the region when a boundary splits a ``**``
+        pair, where the region's own pairing would differ.
+
+        Args:
+            target: The clean text to find (without markers).
+            start: Start of the search region.
+            end: End of the search region (default: end of text).
+
+        Returns:
+            ``(start, end)`` positions in the document text, or
+            ``(-1, -1)`` if not found.
+        """
+        if end is None or end > len(self.text):
+            end = len(self.text)
+        if self._stripped is None:
+            self._stripped, self._pos_map, self._pair_tails = (
+                project_inline_markers(self.text)
+            )
+        pos_map = self._pos_map
+
+        if not target or start in self._pair_tails or end in self._pair_tails:
+            s, e = find_ignoring_inline_markers(self.text[start:end], target)
+            return (s + start, e + start) if s >= 0 else (-1, -1)
+
+        idx = self._stripped.find(
+            target, bisect_left(pos_map, start), bisect_left(pos_map, end),
+        )
+        if idx < 0:
+            return -1, -1
+        return pos_map[idx], pos_map[idx + len(target) - 1] + 1
+
+    # ------------------------------------------------------------------
+    # Fuzzy matching
+    # ------------------------------------------------------------------
+
+    def find_fuzzy(
+        self, pattern: str, threshold: float, step: int,
+        deltas: tuple[int, ...] = (-2, -1, 0, 1, 2),
+    ) -> Optional[tuple[int, int, float]]:
+        """Find the window of *text* most similar to *pattern*.
+
+        Scans windows of ``len(pattern) + delta`` characters starting
+        at every multiple of *step* and returns the first window with
+        the highest ``SequenceMatcher(None, pattern, window).ratio()``,
+        exactly as a full scan would.  Windows that provably cannot
+        reach *threshold* are skipped:
+
+        * a window scoring ``>= threshold`` needs ``M`` matched
+          characters with ``2M / (L + W) >= threshold``; its matching
+          blocks then pair at least ``3M - L - W - 1`` of the pattern's
+          bigrams with bigrams in the window, so windows sharing fewer
+          bigrams (counted from the bigram position table) are skipped;
+        * ``quick_ratio()`` bounds the ratio from above, so windows
+          whose bound cannot beat the current best are skipped.
+
+        Args:
+            pattern: The text to approximate.
+            threshold: Minimum ratio for a match.
+            step: Distance between candidate window starts.
+            deltas: Window-length offsets to try, in order.
+
+        Returns:
+            ``(start, window_length, ratio)`` of the best window scoring
+            at least *threshold*, or None.
+        """
+        text = self.text
+        length = len(pattern)
+        windows = [
+            length + delta for delta in deltas
+            if 4 <= length + delta <= len(text)
+        ]
+        if not windows:
+            return None
+
+        votes = self._window_votes(
+            pattern, max(windows), step, (len(text) - min(windows)) // step,
+        )
+
+        best_ratio = 0.0
+        best_start = -1
+        best_window = 0
+        for window in windows:
+            last = (len(text) - window) // step
+            needed = _min_shared_bigrams(length, window, threshold)
+            for k in range(last + 1):
+                if votes[k] < needed:
+                    continue
+                start = k * step
+                matcher = SequenceMatcher(None, pattern, text[start:start + window])
+                bound = matcher.quick_ratio()
+                if bound < threshold or bound <= best_ratio:
+                    continue
+                ratio = matcher.ratio()
+                if ratio > best_ratio:
+                    best_ratio = ratio
+                    best_start = start
+                    best_window = window
+
+        if best_start < 0 or best_ratio < threshold:
+            return None
+        return best_start, best_window, best_ratio
+
+    def _bigram_table(self) -> dict[str, array]:
+        """Return the bigram -> sorted start positions table."""
+        if self._bigrams is None:
+            table: dict[str, array] = {}
+            text = self.text
+            for pos in range(len(text) - 1):
+                gram = text[pos:pos + 2]
+                positions = table.get(gram)
+                if positions is None:
+                    positions = table[gram] = array("q")
+                positions.append(pos)
+            self._bigrams = table
+            logger.debug(
+                "Built bigram table: %d grams over %d chars", len(table), len(text),
+            )
+        return self._bigrams
+
+    def _window_votes(
+        self, pattern: str, window: int, step: int, last: int,
+    ) -> list[int]:
+        """Count bigrams each candidate window shares with *pattern*.
+
+        Window ``k`` covers ``text[k*step : k*step + window]``.  Shared
+        bigrams are counted as a multiset intersection (each bigram at
+        most as often as it occurs in the pattern).  Windows are swept
+        left to right over the merged occurrence positions of the
+        pattern's bigrams, so the cost is proportional to those
+        occurrences rather than to the document length.
+
+        Args:
+            pattern: The text being approximated.
+            window: Window length (the largest one tried; a shorter
+                window at the same start never shares more bigrams).
+            step: Distance between window starts.
+            last: Index of the last window.
+
+        Returns:
+            Shared-bigram count per window index ``0..last``.
+        """
+        pattern_counts: dict[str, int] = {}
+        for i in range(len(pattern) - 1):
+            gram = pattern[i:i + 2]
+            pattern_counts[gram] = pattern_counts.get(gram, 0) + 1
+
+        table = self._bigram_table()
+        events = sorted(
+            pos for gram in pattern_counts if gram in table for pos in table[gram]
+        )
+        text = self.text
+        window_counts = dict.fromkeys(pattern_counts, 0)
+        votes = [0] * (last + 1)
+        span = window - 2
+        shared = 0
+        lo = hi = 0
+        for k in range(last + 1):
+            left = k * step
+            right = left + span
+            while hi < len(events) and events[hi] <= right:
+                gram = text[events[hi]:events[hi] + 2]
+                if window_counts[gram] < pattern_counts[gram]:
+                    shared += 1
+                window_counts[gram] += 1
+                hi += 1
+            while lo < hi and events[lo] < left:
+                gram = text[events[lo]:events[lo] + 2]
+                window_counts[gram] -= 1
+                if window_counts[gram] < pattern_counts[gram]:
+                    shared -= 1
+                lo += 1
+            votes[k] = shared
+        return votes
+
+
+def _min_shared_bigrams(length: int, window: int, threshold: float) -> int:
+    """Minimum pattern bigrams a window scoring >= *threshold* contains.
+
+    Args:
+        length: Pattern length ``L``.
+        window: Window length ``W``.
+        threshold: Similarity threshold.
+
+    Returns:
+        Lower bound on shared bigrams (may be <= 0, meaning no pruning).
+    """
+    total = length + window
+    matched = max(0, math.ceil(threshold * total / 2) - 1)
+    while 2.0 * matched / total < threshold:
+        matched += 1
+    return 3 * matched - total - 1
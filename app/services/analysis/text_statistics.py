@@ -0,0 +1,283 @@
+"""Single-pass document statistics for reports and readability scoring.
+
+``preprocess`` already tokenizes the cleaned text with SpaCy.  This
+module walks those tokens once and collects every count the report
+needs — word, sentence, syllable, letter, complex-word and pronoun
+counts — so readability formulas and the LLM consumability score no
+longer re-tokenize the text or re-count syllables.
+
+Two word models are tracked in the same pass:
+
+* **Token words** — SpaCy tokens that are neither punctuation nor
+  whitespace.  These back ``word_count``, ``unique_words`` and
+  ``avg_syllables_per_word`` in the report, as before.
+* **Readability words** — whitespace-delimited chunks containing at
+  least one word character, matching how ``textstat`` counts words
+  (``don't`` and ``built-in`` are one word each).  These back the
+  Flesch, Flesch-Kincaid, Gunning Fog and Coleman-Liau formulas.
+
+Usage:
+    from app.services.analysis.text_statistics import compute_text_statistics
+
+    stats = compute_text_statistics(nlp(cleaned_text))
+    stats.flesch_reading_ease()
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Pre-compiled patterns for syllable counting
+# ---------------------------------------------------------------------------
+_VOWEL_GROUPS_RE = re.compile(r"[aeiouy]+", re.IGNORECASE)
+_SILENT_E_RE = re.compile(r"[^aeiou]e$", re.IGNORECASE)
+_LE_ENDING_RE = re.compile(r"le$", re.IGNORECASE)
+_ED_ENDING_RE = re.compile(r"[^aeiouy]ed$", re.IGNORECASE)
+_ES_ENDING_RE = re.compile(r"[^aeiouy]es$", re.IGNORECASE)
+
+# Distinct words seen across documents are bounded in practice; the
+# cache keeps syllable counting O(1) for repeated vocabulary.
+_SYLLABLE_CACHE_SIZE = 65536
+
+# Sentences with this many readability words or fewer (headings,
+# labels, list fragments) are ignored, as textstat does.
+_SHORT_SENTENCE_WORDS = 2
+
+# Polysyllabic threshold for Gunning Fog "complex" words.
+_COMPLEX_WORD_SYLLABLES = 3
+
+# Pronouns counted for the LLM consumability ambiguity estimate.
+_PRONOUNS: frozenset[str] = frozenset({
+    "he", "she", "it", "they", "this", "that", "these", "those",
+    "its", "their", "his", "her",
+})
+
+
+@lru_cache(maxsize=_SYLLABLE_CACHE_SIZE)
+def count_syllables(word: str) -> int:
+    """Estimate the syllable count of a single English word.
+
+    Uses a regex-based heuristic: counts vowel groups and applies
+    adjustments for silent-e, -le endings, and -ed/-es suffixes.
+    Results are memoized per word.
+
+    Args:
+        word: A single English word (no spaces).
+
+    Returns:
+        Estimated syllable count (minimum 1).
+    """
+    word = word.lower().strip()
+    if not word:
+        return 1
+
+    # Count vowel groups
+    vowel_groups = _VOWEL_GROUPS_RE.findall(word)
+    count = len(vowel_groups)
+
+    # Adjust for silent-e at end (e.g., "make" -> 1 syllable, not 2)
+    if _SILENT_E_RE.search(word) and not _LE_ENDING_RE.search(word):
+        count -= 1
+
+    # Adjust for -ed ending that does not add a syllable (e.g., "walked")
+    if _ED_ENDING_RE.search(word) and len(word) > 3:
+        count -= 1
+
+    # Adjust for -es ending that does not add a syllable (e.g., "makes")
+    if _ES_ENDING_RE.search(word) and len(word) > 3:
+        count -= 1
+
+    return max(count, 1)
+
+
+def _safe_divide(numerator: float, denominator: int) -> float:
+    """Divide safely, returning 0.0 when the denominator is zero.
+
+    Args:
+        numerator: The dividend.
+        denominator: The divisor.
+
+    Returns:
+        Result of division, or 0.0 if denominator is zero.
+    """
+    if denominator == 0:
+        return 0.0
+    return numerator / denominator
+
+
+@dataclass(frozen=True)
+class TextStatistics:
+    """Counts collected in one pass over a SpaCy Doc.
+
+    Attributes:
+        word_count: Token words (non-punctuation, non-space tokens).
+        unique_words: Distinct lowercased token words.
+        token_syllables: Total syllables over token words.
+        pronoun_count: Token words that are ambiguous pronouns.
+        readability_words: Whitespace-delimited words, as textstat counts.
+        readability_sentences: Sentences with more than two readability
+            words (minimum 1 when any words exist).
+        syllable_count: Total syllables over readability words.
+        letter_count: Word characters (letters, digits, underscore).
+        complex_word_count: Readability words with three or more syllables.
+    """
+
+    word_count: int = 0
+    unique_words: int = 0
+    token_syllables: int = 0
+    pronoun_count: int = 0
+    readability_words: int = 0
+    readability_sentences: int = 0
+    syllable_count: int = 0
+    letter_count: int = 0
+    complex_word_count: int = 0
+
+    @property
+    def avg_syllables_per_word(self) -> float:
+        """Mean syllables per token word."""
+        return _safe_divide(self.token_syllables, self.word_count)
+
+    @property
+    def vocabulary_diversity(self) -> float:
+        """Type-token ratio over token words."""
+        return _safe_divide(self.unique_words, self.word_count)
+
+    def flesch_reading_ease(self) -> float:
+        """Flesch Reading Ease (206.835 - 1.015 ASL - 84.6 ASW)."""
+        wps = _safe_divide(self.readability_words, self.readability_sentences)
+        spw = _safe_divide(self.syllable_count, self.readability_words)
+        if wps == 0 or spw == 0:
+            return 0.0
+        return 206.835 - 1.015 * wps - 84.6 * spw
+
+    def flesch_kincaid_grade(self) -> float:
+        """Flesch-Kincaid Grade (0.39 ASL + 11.8 ASW - 15.59)."""
+        wps = _safe_divide(self.readability_words, self.readability_sentences)
+        spw = _safe_divide(self.syllable_count, self.readability_words)
+        if wps == 0 or spw == 0:
+            return 0.0
+        return 0.39 * wps + 11.8 * spw - 15.59
+
+    def gunning_fog(self) -> float:
+        """Gunning Fog (0.4 x (ASL + percentage of complex words))."""
+        if self.readability_words == 0:
+            return 0.0
+        wps = _safe_divide(self.readability_words, self.readability_sentences)
+        complex_pct = 100 * self.complex_word_count / self.readability_words
+        return 0.4 * (wps + complex_pct)
+
+    def coleman_liau_index(self) -> float:
+        """Coleman-Liau (0.058 L - 0.296 S - 15.8, per 100 words)."""
+        letters = 100 * _safe_divide(self.letter_count, self.readability_words)
+        sentences = 100 * _safe_divide(
+            self.readability_sentences, self.readability_words,
+        )
+        if letters == 0 or sentences == 0:
+            return 0.0
+        return 0.058 * letters - 0.296 * sentences - 15.8
+
+
+def compute_text_statistics(doc: Any) -> TextStatistics:
+    """Collect report and readability counts in one pass over *doc*.
+
+    Readability words are whitespace-delimited chunks of adjacent
+    tokens; a chunk counts when it contains at least one word
+    character, and its syllables are counted on those characters
+    (``built-in`` -> ``builtin``).  Sentence boundaries are SpaCy
+    sentence starts and newlines, so headings and list items do not
+    merge into the following sentence.
+
+    Args:
+        doc: SpaCy Doc (or any iterable of token-like objects with
+            ``text``, ``is_punct``, ``is_space``, ``whitespace_`` and
+            ``is_sent_start``).
+
+    Returns:
+        The collected TextStatistics.
+    """
+    word_count = 0
+    token_syllables = 0
+    pronoun_count = 0
+    vocabulary: set[str] = set()
+
+    readability_words = 0
+    readability_sentences = 0
+    syllable_count = 0
+    letter_count = 0
+    complex_words = 0
+
+    chunk: list[str] = []
+    sentence_words = 0
+
+    def _close_chunk() -> None:
+        nonlocal readability_words, syllable_count, complex_words, sentence_words
+        if not chunk:
+            return
+        word = "".join(chunk)
+        chunk.clear()
+        readability_words += 1
+        sentence_words += 1
+        syllables = count_syllables(word)
+        syllable_count += syllables
+        if syllables >= _COMPLEX_WORD_SYLLABLES:
+            complex_words += 1
+
+    def _close_sentence() -> None:
+        nonlocal readability_sentences, sentence_words
+        _close_chunk()
+        if sentence_words > _SHORT_SENTENCE_WORDS:
+            readability_sentences += 1
+        sentence_words = 0
+
+    for token in doc:
+        text = token.text
+        if token.is_space:
+            if "\n" in text:
+                _close_sentence()
+            else:
+                _close_chunk()
+            continue
+        if token.is_sent_start:
+            _close_sentence()
+
+        word_chars = [ch for ch in text if ch.isalnum() or ch == "_"]
+        if word_chars:
+            chunk.extend(word_chars)
+            letter_count += len(word_chars)
+
+        if not token.is_punct:
+            lowered = text.lower()
+            word_count += 1
+            vocabulary.add(lowered)
+            token_syllables += count_syllables(text)
+            if lowered in _PRONOUNS:
+                pronoun_count += 1
+
+        if token.whitespace_:
+            _close_chunk()
+    _close_sentence()
+
+    if readability_words and not readability_sentences:
+        readability_sentences = 1
+
+    stats = TextStatistics(
+        word_count=word_count,
+        unique_words=len(vocabulary),
+        token_syllables=token_syllables,
+        pronoun_count=pronoun_count,
+        readability_words=readability_words,
+        readability_sentences=readability_sentences,
+        syllable_count=syllable_count,
+        letter_count=letter_count,
+        complex_word_count=complex_words,
+    )
+    logger.debug(
+        "Text statistics: %d words, %d readability sentences, %d syllables",
+        word_count, readability_sentences, syllable_count,
+    )
+    return stats
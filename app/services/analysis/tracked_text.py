@@ -0,0 +1,178 @@
+"""Regex rewriting that keeps a map back to the input text.
+
+Markup cleaning applies an ordered list of substitutions, and every
+span found in the cleaned text has to be remapped to the text the
+writer submitted.  :class:`TrackedText` applies those substitutions one
+after another but never rebuilds a per-character offset map between
+them.  The map is held as segments — runs of positions that either
+advance with the input (copied text) or all point at one input
+position (fixed replacement text) — and each substitution composes its
+edits onto the segments.  The full list is materialized once, by
+:meth:`TrackedText.offset_map`.
+
+A substitution may carry a *hint*: a literal that every match must
+contain.  When the current text does not contain it, the pass is
+skipped without running the regex.
+"""
+
+import bisect
+import re
+from typing import Optional
+
+# Replacement that keeps the first group of each match
+GROUP_REF = r"\1"
+
+
+class TrackedText:
+    """Text under a series of regex rewrites, mapped to the input.
+
+    Segment *i* covers output positions ``starts[i]`` up to the next
+    segment's start (the last one runs through the end sentinel at
+    ``len(text)``) and maps position *p* to
+    ``sources[i] + (p - starts[i]) * steps[i]``.  ``steps[i]`` is 1
+    for copied text and 0 for inserted text.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Start with the identity map over *text*.
+
+        Args:
+            text: The input text.
+        """
+        self.text = text
+        self._starts: list[int] = [0]
+        self._sources: list[int] = [0]
+        self._steps: list[int] = [1]
+
+    def sub(
+        self,
+        pattern: re.Pattern[str],
+        replacement: str,
+        hint: Optional[str] = None,
+    ) -> int:
+        """Replace every match of *pattern*, keeping the map current.
+
+        Three replacement modes are supported:
+        - Empty string (``""``) — deletion, no characters emitted.
+        - Group reference (``r"\\1"``) — characters map to their group positions.
+        - Fixed text (e.g. ``"placeholder"``) — characters map to match start.
+
+        Args:
+            pattern: Compiled regex pattern to match.
+            replacement: Replacement string.
+            hint: Literal every match contains, or None.  A hint that
+                starts with a newline also matches at the start of the
+                text, for patterns anchored with ``^``.
+
+        Returns:
+            Number of replacements made.
+        """
+        text = self.text
+        if hint is not None and hint not in text and not (
+            hint[0] == "\n" and text.startswith(hint[1:])
+        ):
+            return 0
+
+        pieces: list[str] = []
+        composed = _Segments()
+        out = 0
+        last_end = 0
+        count = 0
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            pieces.append(text[last_end:start])
+            out = self._copy(composed, last_end, start, out)
+            if replacement == GROUP_REF:
+                group_start, group_end = match.span(1)
+                pieces.append(text[group_start:group_end])
+                out = self._copy(composed, group_start, group_end, out)
+            elif replacement:
+                pieces.append(replacement)
+                composed.add(out, self._source(start), 0)
+                out += len(replacement)
+            last_end = end
+            count += 1
+
+        if count:
+            pieces.append(text[last_end:])
+            # The tail copy includes the end sentinel
+            self._copy(composed, last_end, len(text) + 1, out)
+            self.text = "".join(pieces)
+            self._starts, self._sources, self._steps = (
+                composed.starts, composed.sources, composed.steps,
+            )
+        return count
+
+    def offset_map(self) -> list[int]:
+        """Return the input position of every output position.
+
+        Returns:
+            List of length ``len(text) + 1``; the last entry maps the
+            end of the output to the end of the input.
+        """
+        offsets: list[int] = []
+        ends = self._starts[1:] + [len(self.text) + 1]
+        for start, end, source, step in zip(
+            self._starts, ends, self._sources, self._steps,
+        ):
+            if step:
+                offsets += range(source, source + end - start)
+            else:
+                offsets += [source] * (end - start)
+        return offsets
+
+    def _source(self, pos: int) -> int:
+        """Return the input position of output position *pos*."""
+        index = bisect.bisect_right(self._starts, pos) - 1
+        return self._sources[index] + (pos - self._starts[index]) * self._steps[index]
+
+    def _copy(self, composed: "_Segments", start: int, end: int, out: int) -> int:
+        """Map current positions ``start:end`` to *out* onwards.
+
+        Args:
+            composed: Segments of the text being built.
+            start: First current position copied.
+            end: Position after the last one copied.
+            out: Output position of *start*.
+
+        Returns:
+            Output position after the copy.
+        """
+        starts = self._starts
+        index = bisect.bisect_right(starts, start) - 1
+        while start < end:
+            seg_start = starts[index]
+            seg_end = starts[index + 1] if index + 1 < len(starts) else end
+            step = self._steps[index]
+            composed.add(out, self._sources[index] + (start - seg_start) * step, step)
+            taken = min(end, seg_end) - start
+            start += taken
+            out += taken
+            index += 1
+        return out
+
+
+class _Segments:
+    """Segments of an offset map under construction, merged as added."""
+
+    def __init__(self) -> None:
+        """Start with no segments."""
+        self.starts: list[int] = []
+        self.sources: list[int] = []
+        self.steps: list[int] = []
+
+    def add(self, start: int, source: int, step: int) -> None:
+        """Begin a segment at output *start*, unless it continues the last one.
+
+        Args:
+            start: Output position the segment begins at.
+            source: Input position of *start*.
+            step: 1 for copied text, 0 for inserted text.
+        """
+        if self.starts and self.steps[-1] == step and (
+            self.sources[-1] + (start - self.starts[-1]) * step == source
+        ):
+            return
+        self.starts.append(start)
+        self.sources.append(source)
+        self.steps.append(step)
@@ -4,18 +4,36 @@ Stores user feedback (thumbs up/down) on detected issues for false
 positive tracking and rule quality monitoring. Falls back to an
 in-memory SQLite database when persistent storage is unavailable.
 
+Writes are write-behind: ``store_feedback`` queues the entry and a
+background writer inserts queued entries in one transaction every
+``FEEDBACK_FLUSH_INTERVAL_MS`` (sooner once ``FEEDBACK_FLUSH_BATCH_SIZE``
+are waiting).  The same transaction adds them to a per-rule counter
+table, so ``get_rule_feedback_stats`` is a primary-key lookup rather
+than an aggregate over every feedback row, and cheap enough to call
+during analysis.  Entries still queued are counted in the statistics
+of the process that queued them.  File databases use WAL so readers
+and the writers of other worker processes do not block each other.
+
+When a write fails the entries stay queued and the writer retries
+after a delay that doubles with each failure, up to
+``_MAX_RETRY_DELAY`` seconds.  The queue holds at most ``max_pending``
+entries; while it is full ``store_feedback`` refuses new entries.
+
 Usage:
     from app.services.feedback.store import get_feedback_store
 
     store = get_feedback_store()
-    row_id = store.store_feedback("s1", "i1", "passive_voice", True)
+    store.store_feedback("s1", "i1", "passive_voice", True)
     stats = store.get_rule_feedback_stats("passive_voice")
 """
 
+import atexit
+import datetime
 import logging
 import os
 import sqlite3
 import threading
+import time
 from typing import Optional
 
 from app.config import Config
@@ -34,26 +52,69 @@ CREATE TABLE IF NOT EXISTS feedback (
 )
 """
 
-_INSERT_SQL = """
-INSERT INTO feedback (session_id, issue_id, rule_type, thumbs_up, comment)
-VALUES (?, ?, ?, ?, ?)
+_CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_feedback_rule_type ON feedback (rule_type)
 """
 
-_STATS_SQL = """
+_CREATE_STATS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS rule_feedback_stats (
+    rule_type TEXT PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    positive INTEGER NOT NULL DEFAULT 0,
+    negative INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+_STATS_TABLE_EXISTS_SQL = """
+SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rule_feedback_stats'
+"""
+
+_BACKFILL_STATS_SQL = """
+INSERT INTO rule_feedback_stats (rule_type, total, positive, negative)
 SELECT
-    COUNT(*) AS total,
-    SUM(CASE WHEN thumbs_up = 1 THEN 1 ELSE 0 END) AS positive,
-    SUM(CASE WHEN thumbs_up = 0 THEN 1 ELSE 0 END) AS negative
+    rule_type,
+    COUNT(*),
+    SUM(CASE WHEN thumbs_up = 1 THEN 1 ELSE 0 END),
+    SUM(CASE WHEN thumbs_up = 0 THEN 1 ELSE 0 END)
 FROM feedback
-WHERE rule_type = ?
+GROUP BY rule_type
+"""
+
+_INSERT_SQL = """
+INSERT INTO feedback (session_id, issue_id, rule_type, thumbs_up, comment, created_at)
+VALUES (?, ?, ?, ?, ?, ?)
 """
 
+_UPSERT_STATS_SQL = """
+INSERT INTO rule_feedback_stats (rule_type, total, positive, negative)
+VALUES (?, ?, ?, ?)
+ON CONFLICT (rule_type) DO UPDATE SET
+    total = total + excluded.total,
+    positive = positive + excluded.positive,
+    negative = negative + excluded.negative
+"""
+
+_STATS_SQL = """
+SELECT total, positive, negative FROM rule_feedback_stats WHERE rule_type = ?
+"""
+
+# Format of SQLite's CURRENT_TIMESTAMP (UTC)
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Default cap on entries waiting to be written
+_MAX_PENDING = 10_000
+
+# Bounds of the delay before retrying a failed write, in seconds
+_MIN_RETRY_DELAY = 0.1
+_MAX_RETRY_DELAY = 30.0
+
 
 class FeedbackStore:
     """SQLite-backed store for user feedback on editorial issues.
 
     Persists thumbs up/down feedback with optional comments. Provides
-    aggregate statistics per rule type for false positive rate tracking.
+    aggregate statistics per rule type for false positive tracking,
+    kept as counters updated in the same transaction as the inserts.
 
     The store uses parameterized queries exclusively and creates the
     database directory structure on initialization if needed.
@@ -62,9 +123,25 @@ class FeedbackStore:
         _db_path: Path to the SQLite database file, or ":memory:".
         _connection: The SQLite connection instance.
         _lock: Threading lock for thread-safe database access.
+        _flush_interval: Seconds a queued entry may wait to be written.
+        _batch_size: Queued entries that trigger a write straight away.
+        _max_pending: Queued entries beyond which new ones are refused.
+        _pending: Entries queued for the next write, as insert rows.
+        _pending_counts: ``[total, positive, negative]`` per rule type
+            of the queued entries.
+        _pending_cond: Condition guarding the queue and waking the
+            writer thread.
+        _closing: Set by :meth:`close` to stop the writer thread.
+        _writer_thread: Daemon thread that writes queued entries.
     """
 
-    def __init__(self, db_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        flush_interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        max_pending: int = _MAX_PENDING,
+    ) -> None:
         """Initialize the feedback store and create the schema.
 
         If ``db_path`` is not provided, uses the configured
@@ -74,12 +151,38 @@ class FeedbackStore:
         Args:
             db_path: Path to the SQLite database file. Use ``:memory:``
                 for a non-persistent in-memory database.
+            flush_interval: Seconds a queued entry may wait to be
+                written. Defaults to ``FEEDBACK_FLUSH_INTERVAL_MS``.
+            batch_size: Queued entries that are written without
+                waiting for the interval. Defaults to
+                ``FEEDBACK_FLUSH_BATCH_SIZE``.
+            max_pending: Queued entries beyond which
+                :meth:`store_feedback` refuses new ones; never less
+                than ``batch_size``.
         """
+        if flush_interval is None:
+            flush_interval = Config.FEEDBACK_FLUSH_INTERVAL_MS / 1000
+        if batch_size is None:
+            batch_size = Config.FEEDBACK_FLUSH_BATCH_SIZE
         self._db_path: str = self._resolve_db_path(db_path)
         self._lock: threading.Lock = threading.Lock()
         self._connection: sqlite3.Connection = self._create_connection()
         self._initialize_schema()
 
+        self._flush_interval: float = max(0.0, flush_interval)
+        self._batch_size: int = max(1, batch_size)
+        self._max_pending: int = max(self._batch_size, max_pending)
+        self._pending: list[tuple] = []
+        self._pending_counts: dict[str, list[int]] = {}
+        self._pending_cond: threading.Condition = threading.Condition()
+        self._closing: bool = False
+        self._writer_thread: threading.Thread = threading.Thread(
+            target=self._writer_loop,
+            daemon=True,
+            name="feedback-writer",
+        )
+        self._writer_thread.start()
+
     def store_feedback(
         self,
         session_id: str,
@@ -87,8 +190,12 @@ class FeedbackStore:
         rule_type: str,
         thumbs_up: bool,
         comment: Optional[str] = None,
-    ) -> int:
-        """Store a feedback entry for an issue.
+    ) -> None:
+        """Queue a feedback entry for an issue.
+
+        The entry is written by the background writer with the next
+        batch; it counts towards :meth:`get_rule_feedback_stats` at
+        once. Call :meth:`flush` to write it now.
 
         Args:
             session_id: The analysis session identifier.
@@ -97,26 +204,37 @@ class FeedbackStore:
             thumbs_up: True for positive feedback, False for negative.
             comment: Optional user comment.
 
-        Returns:
-            The auto-incremented row ID of the inserted record.
+        Raises:
+            RuntimeError: If the store has been closed, or the queue is
+                full because writes keep failing.
         """
-        with self._lock:
-            cursor = self._connection.execute(
-                _INSERT_SQL,
-                (session_id, issue_id, rule_type, thumbs_up, comment),
-            )
-            self._connection.commit()
-            row_id = cursor.lastrowid
+        created_at = datetime.datetime.now(datetime.timezone.utc).strftime(_TIMESTAMP_FORMAT)
+        with self._pending_cond:
+            if self._closing:
+                raise RuntimeError("Feedback store is closed")
+            if len(self._pending) >= self._max_pending:
+                logger.warning(
+                    "Feedback queue is full (%d entries), dropping feedback for rule=%s",
+                    len(self._pending), rule_type,
+                )
+                raise RuntimeError("Feedback queue is full")
+            self._pending.append((session_id, issue_id, rule_type, thumbs_up, comment, created_at))
+            _add_counts(self._pending_counts, rule_type, thumbs_up, 1)
+            queued = len(self._pending)
+            if queued == 1 or queued >= self._batch_size:
+                self._pending_cond.notify()
 
         logger.info(
-            "Stored feedback row %d: rule=%s, thumbs_up=%s",
-            row_id, rule_type, thumbs_up,
+            "Queued feedback: rule=%s, thumbs_up=%s (%d pending)",
+            rule_type, thumbs_up, queued,
         )
-        return row_id
 
     def get_rule_feedback_stats(self, rule_type: str) -> dict[str, object]:
         """Get aggregate feedback statistics for a rule type.
 
+        Reads the rule's counters, plus entries this store has queued
+        but not yet written.
+
         Args:
             rule_type: The rule identifier to query.
 
@@ -128,11 +246,11 @@ class FeedbackStore:
         """
         with self._lock:
             cursor = self._connection.execute(_STATS_SQL, (rule_type,))
-            row = cursor.fetchone()
+            row = cursor.fetchone() or (0, 0, 0)
+            with self._pending_cond:
+                pending = self._pending_counts.get(rule_type, (0, 0, 0))
+                total, positive, negative = (stored + queued for stored, queued in zip(row, pending))
 
-        total = row[0] or 0
-        positive = row[1] or 0
-        negative = row[2] or 0
         false_positive_rate = negative / total if total > 0 else 0.0
 
         return {
@@ -142,10 +260,99 @@ class FeedbackStore:
             "false_positive_rate": round(false_positive_rate, 4),
         }
 
+    def flush(self) -> int:
+        """Write every queued entry and its counters in one transaction.
+
+        Returns:
+            The number of entries written.
+
+        Raises:
+            sqlite3.Error: If the write fails; the entries stay queued.
+        """
+        with self._lock:
+            with self._pending_cond:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            counts: dict[str, list[int]] = {}
+            for entry in batch:
+                _add_counts(counts, entry[2], entry[3], 1)
+            try:
+                with self._connection:
+                    self._connection.executemany(_INSERT_SQL, batch)
+                    self._connection.executemany(
+                        _UPSERT_STATS_SQL,
+                        [(rule_type, *values) for rule_type, values in counts.items()],
+                    )
+            except sqlite3.Error:
+                with self._pending_cond:
+                    self._pending[:0] = batch
+                raise
+
+            with self._pending_cond:
+                for entry in batch:
+                    _add_counts(self._pending_counts, entry[2], entry[3], -1)
+
+        logger.debug("Wrote %d feedback entries for %d rules", len(batch), len(counts))
+        return len(batch)
+
+    def close(self) -> None:
+        """Write the queued entries, stop the writer and close the database."""
+        with self._pending_cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._pending_cond.notify()
+        self._writer_thread.join(timeout=5)
+        try:
+            self.flush()
+        except sqlite3.Error as exc:
+            logger.error("Lost queued feedback on close: %s", exc)
+        with self._lock:
+            self._connection.close()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _writer_loop(self) -> None:
+        """Write queued entries in batches until the store is closed.
+
+        After a failed write the writer sleeps before retrying, however
+        many entries are queued, doubling the delay with each failure.
+        """
+        retry_delay = 0.0
+        while True:
+            with self._pending_cond:
+                while not self._pending and not self._closing:
+                    self._pending_cond.wait()
+                if retry_delay:
+                    self._wait_closing(retry_delay)
+                elif len(self._pending) < self._batch_size and not self._closing:
+                    self._pending_cond.wait(self._flush_interval)
+                if self._closing:
+                    return
+            try:
+                self.flush()
+            except sqlite3.Error as exc:
+                retry_delay = min(max(retry_delay * 2, self._flush_interval, _MIN_RETRY_DELAY), _MAX_RETRY_DELAY)
+                logger.error("Failed to write feedback batch, retrying in %.1fs: %s", retry_delay, exc)
+            else:
+                retry_delay = 0.0
+
+    def _wait_closing(self, timeout: float) -> None:
+        """Wait *timeout* seconds or until :meth:`close` is called.
+
+        Must be called with ``_pending_cond`` held. Unlike a plain wait
+        on the condition, new entries do not end it early.
+        """
+        deadline = time.monotonic() + timeout
+        remaining = timeout
+        while remaining > 0 and not self._closing:
+            self._pending_cond.wait(remaining)
+            remaining = deadline - time.monotonic()
+
     @staticmethod
     def _resolve_db_path(db_path: Optional[str]) -> str:
         """Determine the database path from arguments and configuration.
@@ -170,7 +377,7 @@ class FeedbackStore:
 
         Creates the parent directory if the path is a file path and the
         directory does not exist. Falls back to ``:memory:`` if directory
-        creation fails.
+        creation fails. File databases are switched to WAL.
 
         Returns:
             An open SQLite connection.
@@ -179,6 +386,12 @@ class FeedbackStore:
             self._ensure_directory()
 
         connection = sqlite3.connect(self._db_path, check_same_thread=False)
+        if self._db_path != ":memory:":
+            mode = connection.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if mode.lower() == "wal":
+                connection.execute("PRAGMA synchronous=NORMAL")
+            else:
+                logger.warning("Feedback database journal mode is %s, not WAL", mode)
         logger.info("Feedback database connected at: %s", self._db_path)
         return connection
 
@@ -203,13 +416,36 @@ class FeedbackStore:
             self._db_path = ":memory:"
 
     def _initialize_schema(self) -> None:
-        """Create the feedback table if it does not exist."""
+        """Create the tables and index if they do not exist.
+
+        A database from before the counter table existed has its
+        counters filled from the feedback rows, once.
+        """
         with self._lock:
-            self._connection.execute(_CREATE_TABLE_SQL)
-            self._connection.commit()
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute(_CREATE_TABLE_SQL)
+                self._connection.execute(_CREATE_INDEX_SQL)
+                backfill = self._connection.execute(_STATS_TABLE_EXISTS_SQL).fetchone() is None
+                self._connection.execute(_CREATE_STATS_TABLE_SQL)
+                if backfill:
+                    self._connection.execute(_BACKFILL_STATS_SQL)
+                self._connection.commit()
+            except sqlite3.Error:
+                self._connection.rollback()
+                raise
         logger.info("Feedback database schema initialized")
 
 
+def _add_counts(counts: dict[str, list[int]], rule_type: str, thumbs_up: bool, step: int) -> None:
+    """Add *step* entries of *rule_type* to ``[total, positive, negative]`` counters."""
+    values = counts.setdefault(rule_type, [0, 0, 0])
+    values[0] += step
+    values[1 if thumbs_up else 2] += step
+    if values[0] == 0:
+        del counts[rule_type]
+
+
 # ---------------------------------------------------------------------------
 # Module-level singleton
 # ---------------------------------------------------------------------------
@@ -222,6 +458,7 @@ def get_feedback_store() -> FeedbackStore:
     """Return the singleton FeedbackStore instance.
 
     Creates the store on first call. Thread-safe via a module-level lock.
+    Queued feedback is written when the process exits.
 
     Returns:
         The shared FeedbackStore instance.
@@ -231,4 +468,5 @@ def get_feedback_store() -> FeedbackStore:
         with _store_lock:
             if _store_instance is None:
                 _store_instance = FeedbackStore()
+                atexit.register(_store_instance.close)
     return _store_instance
@@ -120,7 +120,9 @@ def detect_format(content: str, filename: Optional[str] = None) -> FileType:
     If a *filename* is provided its extension is checked first and, for
     unambiguous binary formats (PDF, DOCX), returned immediately.  For
     text-based formats the extension adds a bonus to the scoring but
-    content patterns can still override.
+    content patterns can still override.  Scoring is done by
+    :func:`~app.services.parsing.sniffer.sniff`, whose profile later
+    stages reuse.
 
     Args:
         content: Raw document content to analyse.
@@ -137,51 +139,9 @@ def detect_format(content: str, filename: Optional[str] = None) -> FileType:
     if ext_type in (FileType.PDF, FileType.DOCX):
         return ext_type
 
-    scores: dict[FileType, int] = {
-        FileType.ASCIIDOC: 0,
-        FileType.MARKDOWN: 0,
-        FileType.DITA: 0,
-        FileType.HTML: 0,
-        FileType.XML: 0,
-    }
-
-    # Extension bonus (gives a nudge but does not dominate)
-    if ext_type in scores:
-        scores[ext_type] += 3
-
-    # Full-content patterns (DITA, HTML, XML)
-    scores[FileType.DITA] += _score_full_patterns(content, _DITA_FULL_PATTERNS)
-    scores[FileType.HTML] += _score_full_patterns(content, _HTML_PATTERNS)
-    scores[FileType.XML] += _score_full_patterns(content, _XML_PATTERNS)
-
-    # Line-by-line patterns (AsciiDoc, Markdown)
-    lines = content.split("\n")
-    scan_limit = min(_MAX_SCAN_LINES, len(lines))
-    for line in lines[:scan_limit]:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        scores[FileType.ASCIIDOC] += _score_line_patterns(stripped, _ASCIIDOC_PATTERNS)
-        # Definition list terms (ending with ::) are AsciiDoc-only;
-        # skip Markdown scoring for these lines to prevent false wins.
-        if not stripped.endswith("::"):
-            scores[FileType.MARKDOWN] += _score_line_patterns(
-                stripped, _MARKDOWN_PATTERNS
-            )
-
-    best_format = max(scores, key=lambda ft: scores[ft])
-    best_score = scores[best_format]
-
-    if best_score == 0:
-        logger.debug("No markup patterns detected; falling back to PLAINTEXT")
-        return FileType.PLAINTEXT
-
-    logger.debug(
-        "Format detection scores: %s -> %s",
-        {ft.value: s for ft, s in scores.items() if s > 0},
-        best_format.value,
-    )
-    return best_format
+    from app.services.parsing.sniffer import sniff
+
+    return sniff(content, filename).file_type
 
 
 def _filetype_from_extension(filename: Optional[str]) -> Optional[FileType]:
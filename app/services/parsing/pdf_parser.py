@@ -2,10 +2,24 @@
 
 Applies a noise-removal pipeline to exclude headers, footers, watermarks,
 and margin content before producing blocks for analysis.
+
+Long documents (``PDF_PARALLEL_MIN_PAGES`` pages or more) are extracted
+in shards of consecutive pages by a small process pool
+(``PDF_EXTRACT_WORKERS``).  Headers and footers are then detected on an
+evenly spaced sample of pages rather than on every page, and shards are
+cleaned and turned into blocks in page order as they arrive, so only a
+few shards of raw span data are held at once.
 """
 
 import logging
-from typing import Optional
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, Optional
 
 import fitz  # pymupdf
 
@@ -26,6 +40,12 @@ _REPEATED_TEXT_THRESHOLD = 3
 # Font-size bump (relative to median) that suggests a heading
 _HEADING_SIZE_RATIO = 1.3
 
+# Consecutive pages extracted by one worker task
+_SHARD_PAGES = 16
+
+# Pages sampled for header/footer detection in sharded mode
+_REPEATED_SAMPLE_PAGES = 32
+
 
 class PdfParser(BaseParser):
     """Parser for PDF documents.
@@ -70,9 +90,14 @@ class PdfParser(BaseParser):
             )
 
         try:
-            raw_page_blocks = self._extract_raw_blocks(doc)
-            cleaned = self._remove_noise(raw_page_blocks, doc)
-            blocks = self._to_blocks(cleaned)
+            page_count = len(doc)
+            blocks = None
+            if _use_shards(page_count):
+                blocks = self._parse_sharded(content, doc)
+            if blocks is None:
+                raw_page_blocks = self._extract_raw_blocks(doc)
+                cleaned = self._remove_noise(raw_page_blocks, doc)
+                blocks = self._to_blocks(cleaned)
         finally:
             doc.close()
 
@@ -84,7 +109,7 @@ class PdfParser(BaseParser):
         return ParseResult(
             blocks=blocks,
             plain_text=plain_text,
-            metadata={"filename": filename, "pages": len(raw_page_blocks)},
+            metadata={"filename": filename, "pages": page_count},
         )
 
     # ------------------------------------------------------------------
@@ -109,21 +134,51 @@ class PdfParser(BaseParser):
         Returns a list of pages, each page being a list of block dicts
         with keys: text, bbox, font_size, is_bold, page_num.
         """
-        all_pages: list[list[dict]] = []
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_blocks: list[dict] = []
-            text_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
-
-            for block in text_dict.get("blocks", []):
-                if block.get("type") != 0:
-                    continue
-                block_info = _parse_text_block(block, page_num)
-                if block_info is not None:
-                    page_blocks.append(block_info)
-
-            all_pages.append(page_blocks)
-        return all_pages
+        return [_extract_page(doc[page_num], page_num) for page_num in range(len(doc))]
+
+    # ------------------------------------------------------------------
+    # Sharded extraction
+    # ------------------------------------------------------------------
+
+    def _parse_sharded(self, content: str, doc: fitz.Document) -> Optional[list[Block]]:
+        """Extract a long document in page shards on the worker pool.
+
+        Args:
+            content: File path to the PDF or raw PDF bytes.
+            doc: The open document, used for the header/footer sample.
+
+        Returns:
+            Blocks in page order, or None if the pool failed and the
+            caller should extract serially.
+        """
+        repeated = _detect_repeated_texts(
+            [_extract_page(doc[n], n) for n in _sample_pages(len(doc))]
+        )
+
+        temp_path: Optional[str] = None
+        path = content
+        if isinstance(content, bytes):
+            fd, temp_path = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(content)
+            path = temp_path
+        try:
+            margin_pct = Config.PDF_MARGIN_CROP_PERCENT / 100.0
+            cleaned = (
+                blk
+                for page_num, page_blocks, width, height in _iter_shards(path, len(doc))
+                for blk in _clean_page(
+                    page_blocks, page_num, width, height, repeated, margin_pct,
+                )
+            )
+            return self._to_blocks(cleaned)
+        except (BrokenProcessPool, RuntimeError) as exc:
+            logger.warning("PdfParser: sharded extraction failed (%s), extracting serially", exc)
+            _discard_pool()
+            return None
+        finally:
+            if temp_path:
+                os.unlink(temp_path)
 
     # ------------------------------------------------------------------
     # Noise removal pipeline
@@ -144,41 +199,10 @@ class PdfParser(BaseParser):
         repeated = _detect_repeated_texts(pages)
 
         for page_num, page_blocks in enumerate(pages):
-            page = doc[page_num]
-            page_height = page.rect.height
-            page_width = page.rect.width
-            top_margin = page_height * margin_pct
-            bottom_margin = page_height * (1.0 - margin_pct)
-
-            for blk in page_blocks:
-                bbox = blk["bbox"]
-
-                # Margin crop
-                if bbox[1] < top_margin or bbox[3] > bottom_margin:
-                    logger.debug(
-                        "PdfParser: margin-cropped text on page %d: %s",
-                        page_num + 1, blk["text"][:60],
-                    )
-                    continue
-
-                # Repeated text (headers/footers)
-                text_key = (blk["text"].strip(), round(bbox[1], 1))
-                if text_key in repeated:
-                    logger.debug(
-                        "PdfParser: repeated-text excluded on page %d: %s",
-                        page_num + 1, blk["text"][:60],
-                    )
-                    continue
-
-                # Watermark detection
-                if _is_watermark(blk, page_width):
-                    logger.debug(
-                        "PdfParser: watermark excluded on page %d: %s",
-                        page_num + 1, blk["text"][:60],
-                    )
-                    continue
-
-                cleaned.append(blk)
+            rect = doc[page_num].rect
+            cleaned.extend(_clean_page(
+                page_blocks, page_num, rect.width, rect.height, repeated, margin_pct,
+            ))
 
         return cleaned
 
@@ -187,7 +211,7 @@ class PdfParser(BaseParser):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _to_blocks(cleaned: list[dict]) -> list[Block]:
+    def _to_blocks(cleaned: Iterable[dict]) -> list[Block]:
         """Convert cleaned text block dicts to Block objects."""
         blocks: list[Block] = []
         offset = 0
@@ -224,6 +248,74 @@ class PdfParser(BaseParser):
 # ------------------------------------------------------------------
 
 
+def _extract_page(page: fitz.Page, page_num: int) -> list[dict]:
+    """Extract the text block dicts of one page."""
+    page_blocks: list[dict] = []
+    text_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
+
+    for block in text_dict.get("blocks", []):
+        if block.get("type") != 0:
+            continue
+        block_info = _parse_text_block(block, page_num)
+        if block_info is not None:
+            page_blocks.append(block_info)
+    return page_blocks
+
+
+def _clean_page(
+    page_blocks: list[dict],
+    page_num: int,
+    page_width: float,
+    page_height: float,
+    repeated: set[tuple[str, float]],
+    margin_pct: float,
+) -> list[dict]:
+    """Drop margin, repeated-text, and watermark blocks from one page."""
+    top_margin = page_height * margin_pct
+    bottom_margin = page_height * (1.0 - margin_pct)
+    kept: list[dict] = []
+
+    for blk in page_blocks:
+        bbox = blk["bbox"]
+
+        # Margin crop
+        if bbox[1] < top_margin or bbox[3] > bottom_margin:
+            logger.debug(
+                "PdfParser: margin-cropped text on page %d: %s",
+                page_num + 1, blk["text"][:60],
+            )
+            continue
+
+        # Repeated text (headers/footers)
+        text_key = (blk["text"].strip(), round(bbox[1], 1))
+        if text_key in repeated:
+            logger.debug(
+                "PdfParser: repeated-text excluded on page %d: %s",
+                page_num + 1, blk["text"][:60],
+            )
+            continue
+
+        # Watermark detection
+        if _is_watermark(blk, page_width):
+            logger.debug(
+                "PdfParser: watermark excluded on page %d: %s",
+                page_num + 1, blk["text"][:60],
+            )
+            continue
+
+        kept.append(blk)
+
+    return kept
+
+
+def _sample_pages(page_count: int) -> list[int]:
+    """Return evenly spaced page numbers for header/footer detection."""
+    if page_count <= _REPEATED_SAMPLE_PAGES:
+        return list(range(page_count))
+    step = page_count / _REPEATED_SAMPLE_PAGES
+    return [int(i * step) for i in range(_REPEATED_SAMPLE_PAGES)]
+
+
 def _parse_text_block(block: dict, page_num: int) -> Optional[dict]:
     """Extract text, bbox, and font info from a PyMuPDF block dict."""
     lines = block.get("lines", [])
@@ -278,6 +370,67 @@ def _detect_repeated_texts(
     return {k for k, v in counts.items() if v >= _REPEATED_TEXT_THRESHOLD}
 
 
+def _extract_shard(path: str, start: int, stop: int) -> list[tuple[list[dict], float, float]]:
+    """Extract pages ``start`` to ``stop - 1`` in a worker process.
+
+    Args:
+        path: File path to the PDF.
+        start: First page number.
+        stop: Page number after the last one.
+
+    Returns:
+        One ``(blocks, width, height)`` tuple per page.
+    """
+    with fitz.open(path) as doc:
+        return [
+            (_extract_page(doc[n], n), doc[n].rect.width, doc[n].rect.height)
+            for n in range(start, stop)
+        ]
+
+
+def _iter_shards(path: str, page_count: int) -> Iterator[tuple[int, list[dict], float, float]]:
+    """Yield extracted pages in page order from the worker pool.
+
+    At most two shards per worker are in flight, so memory does not
+    grow with the length of the document.
+
+    Args:
+        path: File path to the PDF.
+        page_count: Number of pages in the document.
+
+    Yields:
+        ``(page_num, blocks, width, height)`` for each page.
+    """
+    pool = _get_pool()
+    starts = iter(range(0, page_count, _SHARD_PAGES))
+    pending: deque[tuple[int, Future]] = deque()
+    window = 2 * Config.PDF_EXTRACT_WORKERS
+    try:
+        while True:
+            while len(pending) < window:
+                start = next(starts, None)
+                if start is None:
+                    break
+                stop = min(start + _SHARD_PAGES, page_count)
+                pending.append((start, pool.submit(_extract_shard, path, start, stop)))
+            if not pending:
+                return
+            start, future = pending.popleft()
+            for offset, (page_blocks, width, height) in enumerate(future.result()):
+                yield start + offset, page_blocks, width, height
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def _use_shards(page_count: int) -> bool:
+    """Whether a document of *page_count* pages is extracted in shards."""
+    return (
+        Config.PDF_EXTRACT_WORKERS > 0
+        and page_count >= max(Config.PDF_PARALLEL_MIN_PAGES, 2 * _SHARD_PAGES)
+    )
+
+
 def _is_watermark(blk: dict, page_width: float) -> bool:
     """Return True if *blk* looks like a watermark."""
     if blk["font_size"] < _WATERMARK_FONT_SIZE:
@@ -302,3 +455,36 @@ def _estimate_heading_level(font_size: float) -> int:
     return 6
 
 
+# ---------------------------------------------------------------------------
+# Extraction pool
+# ---------------------------------------------------------------------------
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the page-extraction pool, creating it on first use."""
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None:
+            # Spawn, not fork: forking a gevent-patched, threaded worker
+            # copies held locks and the hub into the children.
+            _pool = ProcessPoolExecutor(
+                max_workers=Config.PDF_EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(
+                "PDF extraction process pool started (workers=%d)",
+                Config.PDF_EXTRACT_WORKERS,
+            )
+        return _pool
+
+
+def _discard_pool() -> None:
+    """Drop a broken pool so the next sharded parse starts a new one."""
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,317 @@
+"""Single-pass document sniffer.
+
+Before any rule runs, an analysis needs the document's markup format
+(to pick a parser), its modular documentation content type, and a few
+cheap facts about the text.  Rather than scanning the text once for
+format scoring and again for the content-type regex battery, both are
+gathered together.
+
+:func:`sniff` makes one pass over the lines of the raw text and returns
+a :class:`DocumentProfile`:
+
+* format scores use the same weighted patterns as before, over the
+  first ``_MAX_SCAN_LINES`` lines; the DITA/HTML/XML full-content
+  patterns only run when the text contains markup that could match;
+* content-type signals (the 4-tier engine) are matched per line, and
+  matching stops once the ``:_mod-docs-content-type:`` attribute has
+  decided the type;
+* line and character counts are recorded on the way.
+
+Profiles of recent texts are memoized, so every stage that asks about
+the same text (``/analyze``, ``detect_and_parse``, ``preprocess``)
+shares one scan.
+"""
+
+import dataclasses
+import io
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from app.models.enums import FileType
+from app.services.parsing.format_detector import (
+    _ASCIIDOC_PATTERNS,
+    _DITA_FULL_PATTERNS,
+    _HTML_PATTERNS,
+    _MARKDOWN_PATTERNS,
+    _MAX_SCAN_LINES,
+    _XML_PATTERNS,
+    _filetype_from_extension,
+    _score_full_patterns,
+    _score_line_patterns,
+)
+
+logger = logging.getLogger(__name__)
+
+# Profiles kept for repeat lookups of the same text
+_PROFILE_CACHE_MAX_ENTRIES = 8
+
+# ---------------------------------------------------------------------------
+# Content-type signals, matched against one line at a time
+# ---------------------------------------------------------------------------
+
+# Tier 1: Metadata — instant win (AsciiDoc attribute)
+_CONTENT_TYPE_ATTR_RE = re.compile(
+    r":_mod-docs-content-type:\s*(CONCEPT|PROCEDURE|REFERENCE|ASSEMBLY)",
+    re.IGNORECASE,
+)
+
+# Tier 2: Structural markers — high confidence (+20 each)
+# Optional dot prefix handles both AsciiDoc (.Procedure) and plain text (Procedure).
+# Trap 3 fix: \s*$ handles non-breaking spaces from browser paste.
+_STRUCT_PROCEDURE_RE = re.compile(
+    r"(?:\.)?(Procedure|Prerequisites|Verification|Troubleshooting)\s*$",
+)
+_STRUCT_REFERENCE_RE = re.compile(
+    r"(?:\.)?(Additional resources|Related information)\s*$",
+    re.IGNORECASE,
+)
+
+# Tier 3: Lexical title guard — medium confidence (+10)
+# (?:=\s+)? handles both AsciiDoc headings and plain-text headings.
+_CONCEPT_TITLE_RE = re.compile(
+    r"(?:=\s+)?(About|Understanding|Architecture|Introduction)\b",
+    re.IGNORECASE,
+)
+_PROCEDURE_TITLE_RE = re.compile(
+    r"(?:=\s+)?(Configuring|Creating|Installing|Managing|Updating|"
+    r"Using|Adding|Removing|Deploying|Enabling|Setting)\b",
+    re.IGNORECASE,
+)
+_REFERENCE_TITLE_RE = re.compile(
+    r".*(?:Reference|Parameters|Properties|Commands|Variables|Attributes)\s*$",
+    re.IGNORECASE,
+)
+
+# Tier 4: Content shape — low confidence (+5)
+_NUMBERED_STEPS_RE = re.compile(r"\d+\.\s+[A-Z]")
+_IMPERATIVE_STEPS_RE = re.compile(
+    r"\d+\.\s+(?:Click|Select|Enter|Run|Type|Open|Navigate|Configure|"
+    r"Set|Add|Remove|Create|Install|Enable|Disable|Verify|Check|Ensure)\b",
+)
+
+# Release notes structural signals — used to refine REFERENCE → release_notes
+_RELEASE_NOTES_TITLE_RE = re.compile(r"=\s+.*\brelease\s+notes\b", re.IGNORECASE)
+_RELEASE_NOTES_SECTIONS_RE = re.compile(
+    r"==\s+(?:New features|Fixed issues|Known issues|"
+    r"Errata updates|Technology Preview|Deprecated.*functionality|"
+    r"Removed.*functionality|Breaking changes)",
+    re.IGNORECASE,
+)
+
+# First characters a line must start with for each family of signals
+_STRUCT_FIRST = frozenset(".PVTARar")
+_TITLE_FIRST = frozenset("=AUICMRDESauicmrdes")
+# Last characters of the reference title words
+_REFERENCE_LAST = frozenset("eEsS")
+
+
+@dataclasses.dataclass
+class DocumentProfile:
+    """What one pass over a document's raw text found.
+
+    Attributes:
+        file_type: Detected markup format.
+        format_scores: Weighted pattern score per candidate format.
+        content_type: Detected modular documentation type, or None
+            when ambiguous.
+        line_count: Number of lines.
+        blank_line_count: Number of blank lines.
+        char_count: Number of characters.
+    """
+
+    file_type: FileType
+    format_scores: dict[FileType, int]
+    content_type: Optional[str]
+    line_count: int
+    blank_line_count: int
+    char_count: int
+
+
+class _ContentTypeSignals:
+    """Content-type evidence accumulated line by line."""
+
+    def __init__(self) -> None:
+        """Start with no evidence."""
+        self.declared: Optional[str] = None
+        self.procedure_markers: set[str] = set()
+        self.reference_marker = False
+        self.concept_title = False
+        self.procedure_title = False
+        self.reference_title = False
+        self.numbered_steps = 0
+        self.imperative_steps = 0
+        self.optional_prefix = False
+        self.table_markers = 0
+        self.def_lists = 0
+        self.release_title = False
+        self.release_sections = 0
+
+    def feed(self, line: str) -> None:
+        """Record the signals of one non-blank line.
+
+        Args:
+            line: The line, without its newline.
+        """
+        first = line[0]
+        if first == "=":
+            if _RELEASE_NOTES_TITLE_RE.match(line):
+                self.release_title = True
+            if line.startswith("==") and _RELEASE_NOTES_SECTIONS_RE.match(line):
+                self.release_sections += 1
+        if self.declared is None and ":_" in line:
+            match = _CONTENT_TYPE_ATTR_RE.search(line)
+            if match:
+                self.declared = match.group(1).lower()
+        if self.declared is not None:
+            return
+
+        if first in _STRUCT_FIRST:
+            match = _STRUCT_PROCEDURE_RE.match(line)
+            if match:
+                self.procedure_markers.add(match.group(1).lower())
+            elif _STRUCT_REFERENCE_RE.match(line):
+                self.reference_marker = True
+        if first in _TITLE_FIRST:
+            if _CONCEPT_TITLE_RE.match(line):
+                self.concept_title = True
+            if _PROCEDURE_TITLE_RE.match(line):
+                self.procedure_title = True
+        tail = line.rstrip()
+        if tail and tail[-1] in _REFERENCE_LAST and _REFERENCE_TITLE_RE.match(line):
+            self.reference_title = True
+        if first.isdigit():
+            if _NUMBERED_STEPS_RE.match(line):
+                self.numbered_steps += 1
+            if _IMPERATIVE_STEPS_RE.match(line):
+                self.imperative_steps += 1
+        elif first == "O" and line.startswith("Optional:"):
+            self.optional_prefix = True
+        elif first == "|" and line.startswith("|==="):
+            self.table_markers += 1
+        if tail.endswith("::"):
+            self.def_lists += 1
+
+    def content_type(self) -> Optional[str]:
+        """Return the detected type, or None if below the threshold."""
+        if self.declared is not None:
+            if self.declared == "reference" and self._is_release_notes():
+                return "release_notes"
+            return self.declared
+
+        scores: dict[str, int] = {"procedure": 0, "concept": 0, "reference": 0}
+        scores["procedure"] += 20 * len(self.procedure_markers)
+        if self.reference_marker:
+            scores["reference"] += 20
+        if self.concept_title:
+            scores["concept"] += 10
+        if self.procedure_title:
+            scores["procedure"] += 10
+        if self.reference_title:
+            scores["reference"] += 10
+        if self.numbered_steps >= 3:
+            scores["procedure"] += 5
+        if self.imperative_steps >= 2:
+            scores["procedure"] += 5
+        if self.optional_prefix:
+            scores["procedure"] += 5
+        if self.table_markers > 0 or self.def_lists > 2:
+            scores["reference"] += 5
+
+        # Winner takes all — must meet threshold of 5
+        best = max(scores, key=scores.get)
+        return best if scores[best] >= 5 else None
+
+    def _is_release_notes(self) -> bool:
+        """Title and 1+ release section, or 3+ release sections alone."""
+        return (
+            (self.release_title and self.release_sections >= 1)
+            or self.release_sections >= 3
+        )
+
+
+def sniff(content: str, filename: Optional[str] = None) -> DocumentProfile:
+    """Profile *content* in one pass, reusing a recent profile if any.
+
+    Args:
+        content: Raw document text.
+        filename: Optional filename whose extension hints the format.
+
+    Returns:
+        The document's profile.  Callers must not modify it.
+    """
+    key = (content, filename)
+    with _cache_lock:
+        profile = _cache.get(key)
+        if profile is not None:
+            _cache.move_to_end(key)
+            return profile
+
+    profile = _sniff(content, filename)
+    with _cache_lock:
+        _cache[key] = profile
+        while len(_cache) > _PROFILE_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return profile
+
+
+def _sniff(content: str, filename: Optional[str]) -> DocumentProfile:
+    """Scan *content* and build its profile (uncached)."""
+    scores: dict[FileType, int] = {
+        FileType.ASCIIDOC: 0,
+        FileType.MARKDOWN: 0,
+        FileType.DITA: 0,
+        FileType.HTML: 0,
+        FileType.XML: 0,
+    }
+    ext_type = _filetype_from_extension(filename)
+    # Extension bonus (gives a nudge but does not dominate)
+    if ext_type in scores:
+        scores[ext_type] += 3
+
+    # Full-content patterns (DITA, HTML, XML) all need a tag or xmlns
+    if "<" in content or "xmlns" in content:
+        scores[FileType.DITA] += _score_full_patterns(content, _DITA_FULL_PATTERNS)
+        scores[FileType.HTML] += _score_full_patterns(content, _HTML_PATTERNS)
+        scores[FileType.XML] += _score_full_patterns(content, _XML_PATTERNS)
+
+    signals = _ContentTypeSignals()
+    text_lines = 0
+    for line_number, line in enumerate(io.StringIO(content, newline="\n"), start=1):
+        line = line.rstrip("\n")
+        if not line or line.isspace():
+            continue
+        text_lines += 1
+        if line_number <= _MAX_SCAN_LINES:
+            stripped = line.strip()
+            scores[FileType.ASCIIDOC] += _score_line_patterns(stripped, _ASCIIDOC_PATTERNS)
+            # Definition list terms (ending with ::) are AsciiDoc-only;
+            # skip Markdown scoring for these lines to prevent false wins.
+            if not stripped.endswith("::"):
+                scores[FileType.MARKDOWN] += _score_line_patterns(
+                    stripped, _MARKDOWN_PATTERNS,
+                )
+        signals.feed(line)
+    line_count = content.count("\n") + 1
+
+    best_format = max(scores, key=lambda ft: scores[ft])
+    file_type = best_format if scores[best_format] > 0 else FileType.PLAINTEXT
+    logger.debug(
+        "Format detection scores: %s -> %s",
+        {ft.value: s for ft, s in scores.items() if s > 0},
+        file_type.value,
+    )
+    return DocumentProfile(
+        file_type=file_type,
+        format_scores=scores,
+        content_type=signals.content_type(),
+        line_count=line_count,
+        blank_line_count=line_count - text_lines,
+        char_count=len(content),
+    )
+
+
+_cache: OrderedDict[tuple[str, Optional[str]], DocumentProfile] = OrderedDict()
+_cache_lock = threading.Lock()
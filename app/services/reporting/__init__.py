@@ -1,6 +1,9 @@
 """Reporting service — issue aggregation, scoring, and export formatting."""
 
 from app.services.reporting.builder import build_report
-from app.services.reporting.readability import calculate_readability
+from app.services.reporting.readability import (
+    calculate_readability,
+    readability_from_statistics,
+)
 
-__all__ = ["build_report", "calculate_readability"]
+__all__ = ["build_report", "calculate_readability", "readability_from_statistics"]
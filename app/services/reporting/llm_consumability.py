@@ -192,9 +192,12 @@ def _score_content_clarity(
         flesch_score = max(30, int(flesch))
 
     # --- Pronoun density (ambiguity approximation) ---
-    text = prep.get("text", "")
     word_count = prep.get("word_count", 0)
-    pronoun_matches = len(_PRONOUN_RE.findall(text))
+    stats = prep.get("text_statistics")
+    if stats is not None:
+        pronoun_matches = stats.pronoun_count
+    else:
+        pronoun_matches = len(_PRONOUN_RE.findall(prep.get("text", "")))
     pronoun_density = _safe_divide(pronoun_matches, word_count)
     if pronoun_density < 0.05:
         pronoun_score = 100
@@ -10,6 +10,7 @@ import io
 import logging
 import math
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 from reportlab.lib import colors
@@ -195,8 +196,14 @@ def _assess_color(good: bool) -> str:
 
 # ── Styles ───────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
 def _build_styles() -> dict[str, ParagraphStyle]:
-    """Create PDF paragraph styles."""
+    """Create PDF paragraph styles.
+
+    The style sheet is static, so it is built once per process and
+    shared by every report.  Callers must treat the result as
+    read-only.
+    """
     base = getSampleStyleSheet()
     return {
         "title": ParagraphStyle(
@@ -0,0 +1,414 @@
+"""Cached, off-loop PDF report rendering with a job-style API.
+
+ReportLab rendering is CPU-bound and would block the gevent worker if
+run on the request greenlet.  This module renders reports in a small
+process pool, caches the resulting bytes keyed by
+``(session_id, session_version)`` so unchanged sessions are served
+instantly, and tracks submitted renders as jobs that clients can poll
+and download.
+
+Usage:
+    from app.services.reporting.pdf_jobs import get_pdf_job_manager
+
+    manager = get_pdf_job_manager()
+    job = manager.submit(session_id)
+    ...
+    pdf_bytes = manager.get_result(job["job_id"])
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Optional
+
+from app.config import Config
+from app.services.reporting.pdf_generator import generate_pdf_report
+
+logger = logging.getLogger(__name__)
+
+# Job lifecycle states exposed through the API
+JOB_PENDING = "pending"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+class SessionNotFoundError(LookupError):
+    """Raised when a PDF is requested for an unknown or expired session."""
+
+
+class PdfJobManager:
+    """Render PDF reports off the event loop and cache the results.
+
+    Attributes:
+        _cache: LRU mapping of ``(session_id, version)`` to
+            ``(pdf_bytes, created_at)``.
+        _jobs: Mapping of job IDs to job metadata dicts.
+        _inflight: Mapping of cache keys to the job rendering them, so
+            concurrent requests for the same report share one render.
+        _lock: Threading lock guarding all mutable state.
+        _executor: Lazily created process (or thread) pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cache_max_entries: Optional[int] = None,
+        cache_ttl_seconds: Optional[int] = None,
+    ) -> None:
+        """Initialize the job manager.
+
+        Args:
+            max_workers: Render processes.  ``0`` renders in a
+                background thread instead of a process pool.  Defaults
+                to ``PDF_RENDER_WORKERS``.
+            cache_max_entries: Maximum cached PDFs.  Defaults to
+                ``PDF_CACHE_MAX_ENTRIES``.
+            cache_ttl_seconds: Lifetime of cached PDFs and finished
+                jobs.  Defaults to ``PDF_CACHE_TTL_SECONDS``.
+        """
+        self._max_workers: int = (
+            max_workers if max_workers is not None else Config.PDF_RENDER_WORKERS
+        )
+        self._cache_max_entries: int = (
+            cache_max_entries if cache_max_entries is not None
+            else Config.PDF_CACHE_MAX_ENTRIES
+        )
+        self._ttl_seconds: int = (
+            cache_ttl_seconds if cache_ttl_seconds is not None
+            else Config.PDF_CACHE_TTL_SECONDS
+        )
+        self._cache: OrderedDict[tuple[str, int], tuple[bytes, float]] = OrderedDict()
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._inflight: dict[tuple[str, int], str] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, session_id: str) -> dict[str, Any]:
+        """Submit a PDF render for a session, reusing cached output.
+
+        Args:
+            session_id: The analysis session identifier.
+
+        Returns:
+            Public job status dict (see :meth:`get_job`).
+
+        Raises:
+            SessionNotFoundError: If the session does not exist.
+            Exception: Whatever starting the render raised; the job is
+                marked failed first.
+        """
+        key, payload = self._snapshot(session_id)
+
+        with self._lock:
+            self._purge_expired_locked()
+            if self._get_cached_locked(key) is not None:
+                job_id = self._new_job_locked(key, JOB_DONE)
+                return self._job_status(job_id, self._jobs[job_id])
+
+            inflight_id = self._inflight.get(key)
+            if inflight_id is not None and inflight_id in self._jobs:
+                return self._job_status(inflight_id, self._jobs[inflight_id])
+
+            job_id = self._new_job_locked(key, JOB_PENDING)
+            self._inflight[key] = job_id
+
+        try:
+            future = self._submit_render(payload)
+        except Exception as exc:
+            self._finish_job(job_id, error=exc)
+            raise
+        future.add_done_callback(
+            lambda fut, jid=job_id: self._on_render_done(jid, fut),
+        )
+        logger.info("Submitted PDF job %s for session %s (version %d)", job_id, *key)
+        return self.get_job(job_id) or {"job_id": job_id, "status": JOB_PENDING}
+
+    def get_job(self, job_id: str) -> Optional[dict[str, Any]]:
+        """Return the public status of a job.
+
+        Args:
+            job_id: The job identifier.
+
+        Returns:
+            Dict with ``job_id``, ``session_id``, ``status`` and
+            ``error``, or None if the job is unknown or expired.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return self._job_status(job_id, job)
+
+    def get_result(self, job_id: str) -> Optional[bytes]:
+        """Return the rendered PDF bytes for a finished job.
+
+        Args:
+            job_id: The job identifier.
+
+        Returns:
+            PDF bytes, or None if the job is unknown, unfinished,
+            failed, or its output has been evicted from the cache.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] != JOB_DONE:
+                return None
+            return self._get_cached_locked(job["key"])
+
+    def render(self, session_id: str) -> bytes:
+        """Render (or fetch from cache) a session's PDF, blocking cooperatively.
+
+        Waits on the job's future, which yields to other greenlets
+        under gevent instead of holding the worker.  A pending job has
+        its future from the moment it is created, so concurrent calls
+        for the same report all wait on the one render.
+
+        Args:
+            session_id: The analysis session identifier.
+
+        Returns:
+            PDF file content as bytes.
+
+        Raises:
+            SessionNotFoundError: If the session does not exist.
+            RuntimeError: If rendering failed.
+        """
+        job = self.submit(session_id)
+        job_id = job["job_id"]
+        with self._lock:
+            future = self._jobs[job_id].get("future")
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as exc:
+                raise RuntimeError(f"PDF rendering failed: {exc}") from exc
+        result = self.get_result(job_id)
+        if result is None:
+            error = (self.get_job(job_id) or {}).get("error") or "result unavailable"
+            raise RuntimeError(f"PDF rendering failed: {error}")
+        return result
+
+    def shutdown(self) -> None:
+        """Shut down the render pool without waiting for running jobs."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _snapshot(session_id: str) -> tuple[tuple[str, int], dict[str, Any]]:
+        """Capture the cache key and serialized render inputs for a session.
+
+        The version is read before the response so a concurrent status
+        change can only make the payload newer than its key, never
+        older; the next request then sees the bumped version.
+
+        Args:
+            session_id: The analysis session identifier.
+
+        Returns:
+            Tuple of (cache key, keyword arguments for the renderer).
+
+        Raises:
+            SessionNotFoundError: If the session does not exist.
+        """
+        from app.services.session.store import get_session_store
+
+        store = get_session_store()
+        version = store.get_session_version(session_id)
+        session = store.get_session(session_id)
+        if version is None or session is None:
+            raise SessionNotFoundError(session_id)
+
+        payload = {
+            "report_data": session.report.to_dict(),
+            "score_data": session.score.to_dict(),
+            "issues_data": [issue.to_dict() for issue in session.issues],
+        }
+        return (session_id, version), payload
+
+    def _submit_render(self, payload: dict[str, Any]) -> Future:
+        """Submit a render to the pool, recreating it if it broke.
+
+        Args:
+            payload: Keyword arguments for ``generate_pdf_report``.
+
+        Returns:
+            Future resolving to the PDF bytes.
+        """
+        executor = self._get_executor()
+        try:
+            return executor.submit(generate_pdf_report, **payload)
+        except (BrokenProcessPool, RuntimeError) as exc:
+            logger.warning("PDF render pool unusable (%s), recreating", exc)
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            return self._get_executor().submit(generate_pdf_report, **payload)
+
+    def _get_executor(self) -> Executor:
+        """Return the render pool, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                if self._max_workers > 0:
+                    # Spawn, not fork: forking a gevent-patched, threaded
+                    # worker copies held locks and the hub into the children.
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self._max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                    logger.info("PDF render process pool started (workers=%d)", self._max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="pdf-render",
+                    )
+                    logger.info("PDF render running in a background thread")
+            return self._executor
+
+    def _on_render_done(self, job_id: str, future: Future) -> None:
+        """Record a finished render in the cache and job table.
+
+        Args:
+            job_id: The job the future belongs to.
+            future: The completed render future.
+        """
+        try:
+            pdf_bytes = future.result()
+        except Exception as exc:
+            self._finish_job(job_id, error=exc)
+            return
+        self._finish_job(job_id, pdf_bytes=pdf_bytes)
+
+    def _finish_job(
+        self,
+        job_id: str,
+        pdf_bytes: Optional[bytes] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Record a job's outcome and resolve its future.
+
+        The job table is updated before the future, so a caller woken
+        by the future sees the final status.
+
+        Args:
+            job_id: The job that finished.
+            pdf_bytes: The rendered PDF, when the render succeeded.
+            error: Why the render failed, otherwise.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            self._inflight.pop(job["key"], None)
+            if error is not None:
+                job["status"] = JOB_FAILED
+                job["error"] = str(error) or error.__class__.__name__
+                logger.error("PDF job %s failed: %s", job_id, job["error"])
+            else:
+                self._put_cached_locked(job["key"], pdf_bytes)
+                job["status"] = JOB_DONE
+            future = job["future"]
+        if error is not None:
+            future.set_exception(error)
+            return
+        future.set_result(pdf_bytes)
+        logger.info("PDF job %s done (%d bytes)", job_id, len(pdf_bytes))
+
+    def _new_job_locked(self, key: tuple[str, int], status: str) -> str:
+        """Create a job record.  Caller must hold ``_lock``.
+
+        A pending job gets a future at once, resolved by
+        :meth:`_finish_job` with the render's outcome.
+        """
+        job_id = str(uuid.uuid4())
+        self._jobs[job_id] = {
+            "key": key,
+            "status": status,
+            "error": None,
+            "future": Future() if status == JOB_PENDING else None,
+            "created_at": time.time(),
+        }
+        return job_id
+
+    @staticmethod
+    def _job_status(job_id: str, job: dict[str, Any]) -> dict[str, Any]:
+        """Build the public representation of a job record."""
+        return {
+            "job_id": job_id,
+            "session_id": job["key"][0],
+            "status": job["status"],
+            "error": job["error"],
+        }
+
+    def _get_cached_locked(self, key: tuple[str, int]) -> Optional[bytes]:
+        """Look up a cached PDF, refreshing LRU order.  Caller holds ``_lock``."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        pdf_bytes, created_at = entry
+        if time.time() - created_at > self._ttl_seconds:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return pdf_bytes
+
+    def _put_cached_locked(self, key: tuple[str, int], pdf_bytes: bytes) -> None:
+        """Insert a PDF into the LRU cache.  Caller holds ``_lock``.
+
+        Older versions of the same session are dropped since they can
+        never be requested again.
+        """
+        stale = [k for k in self._cache if k[0] == key[0] and k[1] < key[1]]
+        for old_key in stale:
+            del self._cache[old_key]
+        self._cache[key] = (pdf_bytes, time.time())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def _purge_expired_locked(self) -> None:
+        """Drop finished jobs older than the TTL.  Caller holds ``_lock``."""
+        cutoff = time.time() - self._ttl_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job["status"] != JOB_PENDING and job["created_at"] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_manager_instance: Optional[PdfJobManager] = None
+_manager_lock: threading.Lock = threading.Lock()
+
+
+def get_pdf_job_manager() -> PdfJobManager:
+    """Return the singleton PdfJobManager instance.
+
+    Creates the manager on first call. Thread-safe via a module-level lock.
+
+    Returns:
+        The shared PdfJobManager instance.
+    """
+    global _manager_instance  # noqa: PLW0603
+    if _manager_instance is None:
+        with _manager_lock:
+            if _manager_instance is None:
+                _manager_instance = PdfJobManager()
+    return _manager_instance
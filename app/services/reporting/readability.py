@@ -1,8 +1,13 @@
 """Readability metric calculations for analyzed content.
 
-Computes four standard readability metrics using the textstat library.
-Each metric returns a numeric score and explanatory help text suitable
-for display in the statistical report panel.
+Computes four standard readability metrics.  Each metric returns a
+numeric score and explanatory help text suitable for display in the
+statistical report panel.
+
+``readability_from_statistics`` scores the counts ``preprocess``
+already collected from its SpaCy tokens and is what the analysis
+pipeline uses.  ``calculate_readability`` scores raw text with the
+textstat library for callers that only have a string.
 """
 
 import logging
@@ -10,6 +15,8 @@ from typing import Any
 
 import textstat
 
+from app.services.analysis.text_statistics import TextStatistics
+
 logger = logging.getLogger(__name__)
 
 _MIN_WORDS_FOR_READABILITY = 3
@@ -18,6 +25,7 @@ _METRIC_DEFINITIONS: list[dict[str, Any]] = [
     {
         "name": "Flesch Reading Ease",
         "func": textstat.flesch_reading_ease,
+        "stat": TextStatistics.flesch_reading_ease,
         "help_text": (
             "Measures how easy text is to read. 60-70 is ideal for "
             "technical documentation. Higher scores mean easier reading."
@@ -26,6 +34,7 @@ _METRIC_DEFINITIONS: list[dict[str, Any]] = [
     {
         "name": "Flesch-Kincaid Grade",
         "func": textstat.flesch_kincaid_grade,
+        "stat": TextStatistics.flesch_kincaid_grade,
         "help_text": (
             "US school grade level needed to understand the text. "
             "8-12 is ideal for technical documentation."
@@ -34,6 +43,7 @@ _METRIC_DEFINITIONS: list[dict[str, Any]] = [
     {
         "name": "Gunning Fog",
         "func": textstat.gunning_fog,
+        "stat": TextStatistics.gunning_fog,
         "help_text": (
             "Readability weighted by complex words. "
             "12-14 is ideal for technical documentation."
@@ -42,6 +52,7 @@ _METRIC_DEFINITIONS: list[dict[str, Any]] = [
     {
         "name": "Coleman-Liau",
         "func": textstat.coleman_liau_index,
+        "stat": TextStatistics.coleman_liau_index,
         "help_text": (
             "Based on character count per word and sentence length. "
             "10-14 is typical for technical writing."
@@ -120,6 +131,34 @@ def calculate_readability(text: str) -> dict[str, dict[str, object]]:
     return results
 
 
+def readability_from_statistics(
+    stats: TextStatistics,
+) -> dict[str, dict[str, object]]:
+    """Calculate the four readability metrics from precomputed counts.
+
+    Produces the same structure as ``calculate_readability`` without
+    re-tokenizing the text or re-counting syllables.
+
+    Args:
+        stats: Counts collected by ``compute_text_statistics``.
+
+    Returns:
+        Dictionary keyed by metric name, where each value is a dict
+        containing 'score' (float) and 'help_text' (str).
+    """
+    if stats.readability_words < _MIN_WORDS_FOR_READABILITY:
+        logger.info("Text too short for readability analysis; returning zero scores")
+        return _build_zero_scores()
+
+    return {
+        definition["name"]: {
+            "score": round(float(definition["stat"](stats)), 2),
+            "help_text": definition["help_text"],
+        }
+        for definition in _METRIC_DEFINITIONS
+    }
+
+
 def _build_zero_scores() -> dict[str, dict[str, object]]:
     """Build a result dict with zero scores for all metrics.
 
@@ -0,0 +1,133 @@
+"""Approximate memory accounting for sessions and running analyses.
+
+The estimates walk the stored objects and add up ``sys.getsizeof`` for
+each distinct object, so strings shared between issues (see
+``compact_issues``) are counted once.  They are meant for budgeting —
+deciding when to evict idle sessions — not for exact measurement:
+interpreter overhead, allocator slack and objects reachable only
+through C extensions are not included.
+
+A spaCy ``Doc`` keeps its tokens in C arrays that ``getsizeof`` cannot
+see, so it is charged a fixed cost per token instead.
+"""
+
+import sys
+from enum import Enum
+from typing import Any
+
+from app.models.schemas import AnalyzeResponse
+
+# Estimated bytes per token of a parsed spaCy Doc: the TokenC struct,
+# lexeme references and the tok2vec tensor row of the md pipeline.
+_SPACY_TOKEN_BYTES = 600
+
+# Atomic values whose size is getsizeof() alone.
+_ATOMIC = frozenset({str, bytes, bytearray, int, float, bool, type(None)})
+
+# Size of one int object outside the small-int cache.  Offset maps and
+# char maps are long int lists; they are charged this per element
+# rather than walked.
+_INT_BYTES = sys.getsizeof(1 << 20)
+
+
+def estimate_bytes(value: Any) -> int:
+    """Approximate the memory held by *value* and everything it references.
+
+    Containers, dataclasses and slotted objects are walked; each object
+    is counted once however often it is referenced.  Enum members and
+    classes are shared by the whole process and count as zero.
+
+    Args:
+        value: Any object.
+
+    Returns:
+        Estimated size in bytes.
+    """
+    return _walk(value, set())
+
+
+def estimate_response_bytes(response: AnalyzeResponse) -> int:
+    """Approximate the memory held by a stored analysis response.
+
+    Args:
+        response: The analysis response.
+
+    Returns:
+        Estimated size in bytes.
+    """
+    return estimate_bytes(response)
+
+
+def estimate_prep_bytes(prep: dict[str, Any]) -> int:
+    """Approximate the memory held by a preprocessing result.
+
+    Args:
+        prep: A ``preprocess()`` result, or a slimmed copy of one.
+
+    Returns:
+        Estimated size in bytes, including the spaCy Doc if present.
+    """
+    seen: set[int] = set()
+    total = sys.getsizeof(prep)
+    for key, value in prep.items():
+        if key == "spacy_doc":
+            total += _doc_bytes(value)
+        else:
+            total += _walk(value, seen)
+    return total
+
+
+def _doc_bytes(doc: Any) -> int:
+    """Charge a spaCy Doc by its token count."""
+    if doc is None:
+        return 0
+    try:
+        return len(doc) * _SPACY_TOKEN_BYTES
+    except TypeError:
+        return sys.getsizeof(doc)
+
+
+def _walk(root: Any, seen: set[int]) -> int:
+    """Sum getsizeof over objects reachable from *root* not yet in *seen*."""
+    total = 0
+    stack = [root]
+    getsizeof = sys.getsizeof
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (Enum, type)):
+            continue
+        seen.add(id(obj))
+        total += getsizeof(obj)
+        if type(obj) in _ATOMIC:
+            continue
+        if isinstance(obj, dict):
+            children: Any = obj.values()
+            stack.extend(obj.keys())
+        elif isinstance(obj, list) and obj and type(obj[0]) is int:
+            total += len(obj) * _INT_BYTES
+            continue
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            children = obj
+        elif hasattr(obj, "__dict__"):
+            # Attribute names are interned and shared by every instance,
+            # so only the values are walked.
+            instance_vars = vars(obj)
+            seen.add(id(instance_vars))
+            total += getsizeof(instance_vars)
+            children = instance_vars.values()
+        else:
+            children = [
+                getattr(obj, slot)
+                for slot in getattr(type(obj), "__slots__", ())
+                if hasattr(obj, slot)
+            ]
+        # Strings and numbers are leaves: size them here instead of
+        # round-tripping them through the stack.
+        for child in children:
+            if type(child) in _ATOMIC:
+                if id(child) not in seen:
+                    seen.add(id(child))
+                    total += getsizeof(child)
+            else:
+                stack.append(child)
+    return total
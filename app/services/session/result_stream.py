@@ -0,0 +1,230 @@
+"""Versioned issue deltas for Socket.IO result events.
+
+Each analysis session has a ``ResultStream`` that remembers which
+issues the browser has already been sent.  Result events carry only
+the difference against the previous event:
+
+    {
+        "version": 3,          # version after applying this event
+        "base_version": 2,     # version the client must be at
+        "added": [...],        # new or changed issues, in full
+        "removed": [...],      # issue IDs no longer in the result set
+        "status": {id: status} # status-only changes
+    }
+
+A client whose version does not match ``base_version`` (it joined late
+or missed an event) asks for a snapshot instead of applying the delta.
+``base_version`` 0 starts a new analysis run.
+
+Deltas hold the ``IssueResponse`` objects; :func:`encode_payload`
+turns them into the wire form.  Payloads above
+``Config.SOCKET_COMPRESS_MIN_BYTES`` are encoded with the direct issue
+JSON encoder and zlib-compressed into a binary attachment; the browser
+inflates them with ``DecompressionStream('deflate')``.
+"""
+
+import json
+import logging
+import threading
+import zlib
+from typing import Any, Callable, Iterable, Optional
+
+from app.config import Config
+from app.models.enums import IssueStatus
+from app.models.issue_codec import dumps, to_plain
+from app.models.schemas import IssueResponse
+
+logger = logging.getLogger(__name__)
+
+# Compression level for result payloads: close to level 9 on the
+# repetitive issue JSON at a fraction of the CPU.
+_COMPRESS_LEVEL = 6
+
+
+class ResultStream:
+    """The issue set one session's clients have been sent.
+
+    The stream belongs to one analysis run at a time.  ``restart()``
+    hands it to a new run; deltas requested by any other run are
+    refused so a superseded run cannot interleave its versions.
+
+    Attributes:
+        version: Number of deltas published since the last restart.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty stream owned by no run."""
+        self.version: int = 0
+        self._lock = threading.Lock()
+        self._owner: Any = None
+        self._issues: dict[str, IssueResponse] = {}
+        self._prints: dict[str, tuple] = {}
+        self._statuses: dict[str, str] = {}
+
+    def restart(self, owner: Any) -> None:
+        """Start a new run: forget sent issues and reset the version.
+
+        Args:
+            owner: Identity of the run (its cancellation token).
+        """
+        with self._lock:
+            self._owner = owner
+            self.version = 0
+            self._issues.clear()
+            self._prints.clear()
+            self._statuses.clear()
+
+    def publish(
+        self,
+        owner: Any,
+        issues: Iterable[IssueResponse],
+        send: Callable[[dict[str, Any]], None],
+        replace: bool = False,
+    ) -> Optional[dict[str, Any]]:
+        """Compute the delta for *issues* and hand it to *send*.
+
+        *send* runs under the stream lock so events reach the socket in
+        version order even when phases finish concurrently.
+
+        Args:
+            owner: The run publishing; must match the last restart.
+            issues: Issues to add (or the complete result set when
+                *replace* is True).
+            send: Callback that emits the delta payload.
+            replace: When True, issues not in *issues* are removed.
+
+        Returns:
+            The delta payload, or None if *owner* no longer owns the
+            stream and nothing was sent.
+        """
+        with self._lock:
+            if owner is not self._owner:
+                logger.debug("Result delta from a superseded run dropped")
+                return None
+            delta = self._delta_locked(list(issues), replace)
+            send(delta)
+            return delta
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the full current result set at the current version.
+
+        Used to resynchronise a client that missed an event.  Issues
+        are serialised as they are now, so statuses the user changed
+        since they were sent are current.
+
+        Returns:
+            A payload with ``reset`` set and every issue in ``added``.
+        """
+        with self._lock:
+            return {
+                "version": self.version,
+                "base_version": self.version,
+                "reset": True,
+                "added": list(self._issues.values()),
+                "removed": [],
+                "status": {},
+            }
+
+    def _delta_locked(
+        self, issues: list[IssueResponse], replace: bool,
+    ) -> dict[str, Any]:
+        """Diff *issues* against the sent set and record them as sent."""
+        added: list[IssueResponse] = []
+        status: dict[str, str] = {}
+        seen: set[str] = set()
+        for issue in issues:
+            seen.add(issue.id)
+            fingerprint = _fingerprint(issue)
+            issue_status = _status_value(issue)
+            if self._prints.get(issue.id) != fingerprint:
+                added.append(issue)
+            elif self._statuses.get(issue.id) != issue_status:
+                status[issue.id] = issue_status
+            self._issues[issue.id] = issue
+            self._prints[issue.id] = fingerprint
+            self._statuses[issue.id] = issue_status
+
+        removed: list[str] = []
+        if replace:
+            removed = [issue_id for issue_id in self._issues if issue_id not in seen]
+            for issue_id in removed:
+                del self._issues[issue_id]
+                del self._prints[issue_id]
+                del self._statuses[issue_id]
+
+        base = self.version
+        self.version += 1
+        return {
+            "version": self.version,
+            "base_version": base,
+            "added": added,
+            "removed": removed,
+            "status": status,
+        }
+
+
+def encode_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Compress a large event payload into a binary attachment.
+
+    ``session_id`` stays in the clear so room targeting and client-side
+    filtering work without inflating the payload.
+
+    Args:
+        payload: The event payload; top-level issue lists may hold
+            ``IssueResponse`` objects.
+
+    Returns:
+        The payload with issues as dicts when its JSON is smaller than
+        ``Config.SOCKET_COMPRESS_MIN_BYTES`` (or compression is off),
+        otherwise ``{"session_id", "encoding": "deflate", "data"}``.
+    """
+    threshold = Config.SOCKET_COMPRESS_MIN_BYTES
+    if threshold <= 0:
+        return to_plain(payload)
+    raw = dumps(payload).encode()
+    if len(raw) < threshold:
+        return to_plain(payload)
+    compressed = zlib.compress(raw, _COMPRESS_LEVEL)
+    logger.debug(
+        "Compressed result payload %d -> %d bytes", len(raw), len(compressed),
+    )
+    return {
+        "session_id": payload.get("session_id"),
+        "encoding": "deflate",
+        "data": compressed,
+    }
+
+
+def decode_payload(message: dict[str, Any]) -> dict[str, Any]:
+    """Invert :func:`encode_payload`.
+
+    Args:
+        message: A payload as emitted.
+
+    Returns:
+        The original payload dictionary.
+    """
+    if message.get("encoding") != "deflate":
+        return message
+    return json.loads(zlib.decompress(message["data"]))
+
+
+def _fingerprint(issue: IssueResponse) -> tuple:
+    """Content of an issue that the client renders, excluding status."""
+    return (
+        issue.source, issue.rule_name, issue.flagged_text, issue.message,
+        tuple(issue.suggestions), _enum_value(issue.severity),
+        _enum_value(issue.category), issue.sentence, issue.sentence_index,
+        tuple(issue.span), issue.style_guide_citation, issue.confidence,
+    )
+
+
+def _status_value(issue: IssueResponse) -> str:
+    """Return the issue status as its string value."""
+    status = issue.status
+    return status.value if isinstance(status, IssueStatus) else str(status)
+
+
+def _enum_value(value: Any) -> str:
+    """Return an enum's value, or the value itself as a string."""
+    return str(getattr(value, "value", value))
@@ -1,8 +1,23 @@
 """Thread-safe in-memory session store with TTL-based expiration.
 
 Stores analysis responses keyed by session ID, supports suggestion
-caching, issue status updates with score recalculation, and request
-cancellation for superseded analyses.
+caching, issue status updates with incremental score maintenance, and
+request cancellation for superseded analyses.  Each running analysis
+holds a ``CancellationToken``; superseding or cancelling the analysis
+fires the token, which drops its queued LLM calls and aborts in-flight
+ones.
+The store also keeps each session's ``ResultStream`` (the issues its
+browser tabs have been sent), which a new run restarts.
+
+Memory is budgeted per worker: every stored session carries an
+approximate size, running analyses report the size of the data they
+hold, and when the total exceeds ``Config.SESSION_MEMORY_BUDGET_MB``
+the least recently used sessions without a running analysis are
+evicted before their TTL.
+
+Each session keeps an issue-id index and a ``ScoreLedger`` so that
+accept/dismiss actions (single or bulk) update the score in O(1) per
+issue instead of rescoring the whole document.
 
 Usage:
     from app.services.session.store import get_session_store
@@ -16,12 +31,17 @@ import logging
 import threading
 import time
 import uuid
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Optional
 
 from app.config import Config
-from app.models.enums import IssueStatus
-from app.models.schemas import AnalyzeResponse, ScoreResponse
-from app.services.analysis.scorer import calculate_score
+from app.models.enums import IssueCategory, IssueStatus
+from app.models.schemas import AnalyzeResponse, IssueResponse, ScoreResponse
+from app.services.analysis.block_priority import BlockPriority
+from app.services.analysis.scorer import ScoreLedger
+from app.services.session.memory import estimate_bytes, estimate_response_bytes
+from app.services.session.result_stream import ResultStream
+from models.cancellation import CancellationToken, get_cancellation_stats
 
 logger = logging.getLogger(__name__)
 
@@ -30,29 +50,55 @@ class SessionStore:
     """Thread-safe in-memory session store with TTL expiration.
 
     Manages analysis sessions keyed by UUID. Each session holds the
-    full AnalyzeResponse, a suggestion cache, creation timestamp, and
-    cancellation flag. A daemon background thread periodically purges
-    expired sessions.
+    full AnalyzeResponse, an issue-id index, a running score ledger,
+    a suggestion cache, creation timestamp, and cancellation flag.
+    A daemon background thread periodically purges expired sessions.
 
     Attributes:
-        _sessions: Dict mapping session IDs to session data dicts.
+        _sessions: Maps session IDs to session data dicts, least
+            recently used first.
         _lock: Threading lock for thread-safe access.
         _ttl_seconds: Time-to-live for sessions in seconds.
         _active_analyses: Maps Socket.IO SIDs to active session IDs.
+        _analysis_tokens: Maps session IDs to the cancellation token of
+            the analysis currently running for that session.
+        _result_streams: Maps session IDs to the result stream that
+            tracks what their Socket.IO clients have been sent.
+        _block_priorities: Maps session IDs to the part of the document
+            their writer is looking at, which orders LLM blocks.
+        _analysis_bytes: Maps session IDs with a running analysis to
+            the approximate size of the data that run holds.
+        _memory_budget: Budget in bytes for sessions and running
+            analyses together (0 disables eviction).
+        _evictions: Number of sessions evicted to stay within budget.
         _cleanup_thread: Daemon thread that purges expired sessions.
     """
 
-    def __init__(self, ttl_seconds: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        ttl_seconds: Optional[int] = None,
+        memory_budget_mb: Optional[int] = None,
+    ) -> None:
         """Initialize the session store.
 
         Args:
             ttl_seconds: Session time-to-live in seconds. Defaults to
                 the configured SESSION_TTL_SECONDS value.
+            memory_budget_mb: Memory budget in MiB. Defaults to the
+                configured SESSION_MEMORY_BUDGET_MB value.
         """
-        self._sessions: dict[str, dict] = {}
+        self._sessions: OrderedDict[str, dict] = OrderedDict()
         self._lock: threading.Lock = threading.Lock()
         self._ttl_seconds: int = ttl_seconds if ttl_seconds is not None else Config.SESSION_TTL_SECONDS
         self._active_analyses: dict[str, str] = {}
+        self._analysis_tokens: dict[str, CancellationToken] = {}
+        self._result_streams: dict[str, ResultStream] = {}
+        self._block_priorities: dict[str, BlockPriority] = {}
+        if memory_budget_mb is None:
+            memory_budget_mb = Config.SESSION_MEMORY_BUDGET_MB
+        self._analysis_bytes: dict[str, int] = {}
+        self._memory_budget: int = max(0, memory_budget_mb) * 1024 * 1024
+        self._evictions: int = 0
         self._cleanup_thread: threading.Thread = threading.Thread(
             target=self._cleanup_loop,
             daemon=True,
@@ -95,14 +141,23 @@ class SessionStore:
         Returns:
             The session ID string.
         """
+        index = _IssueIndex(response)
+        size = estimate_response_bytes(response)
         with self._lock:
+            self._sessions.pop(session_id, None)
             self._sessions[session_id] = {
                 "response": response,
+                "index": index,
                 "created_at": time.time(),
                 "suggestion_cache": {},
                 "cancelled": False,
+                "version": 0,
+                "response_bytes": size,
+                "extra_bytes": 0,
             }
+            evicted = self._enforce_budget_locked(keep=session_id)
 
+        self._log_evictions(evicted)
         logger.info("Stored session %s with %d issues", session_id, len(response.issues))
         logger.debug(
             "store: session %s stored, total sessions=%d, all_ids=%s",
@@ -125,13 +180,20 @@ class SessionStore:
         Returns:
             True if the session was found and updated, False otherwise.
         """
+        index = _IssueIndex(response)
+        size = estimate_response_bytes(response)
         with self._lock:
             session = self._sessions.get(session_id)
             if session is None:
                 return False
-            old_response = session["response"]
-            _transfer_issue_statuses(old_response, response)
+            _transfer_issue_statuses(session["index"], index)
             session["response"] = response
+            session["index"] = index
+            session["version"] = session.get("version", 0) + 1
+            session["response_bytes"] = size
+            self._sessions.move_to_end(session_id)
+            evicted = self._enforce_budget_locked(keep=session_id)
+        self._log_evictions(evicted)
         logger.info("Updated session %s with %d issues", session_id, len(response.issues))
         return True
 
@@ -156,15 +218,69 @@ class SessionStore:
                 logger.debug("store.get_session: %s NOT FOUND", session_id)
                 return None
             if self._is_expired(session):
-                del self._sessions[session_id]
+                self._drop_session_locked(session_id)
                 logger.debug("Session %s expired on access", session_id)
                 return None
+            self._sessions.move_to_end(session_id)
             logger.debug(
                 "store.get_session: %s FOUND with %d issues",
                 session_id, len(session["response"].issues),
             )
             return session["response"]
 
+    def get_session_version(self, session_id: str) -> Optional[int]:
+        """Return the change counter for a session.
+
+        The version increases whenever the stored response is replaced
+        or an issue status changes, so derived artefacts (e.g. the PDF
+        report) can be cached per ``(session_id, version)``.
+
+        Args:
+            session_id: The session identifier.
+
+        Returns:
+            The current version number, or None if not found/expired.
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or self._is_expired(session):
+                return None
+            return session.get("version", 0)
+
+    def get_issue(self, session_id: str, issue_id: str) -> Optional[IssueResponse]:
+        """Look up a single issue by ID via the session's issue index.
+
+        Args:
+            session_id: The session identifier.
+            issue_id: The issue identifier.
+
+        Returns:
+            The IssueResponse, or None if the session or issue was not found.
+        """
+        with self._lock:
+            session = self._get_live_session(session_id)
+            if session is None:
+                return None
+            return session["index"].by_id.get(issue_id)
+
+    def get_context_sentences(self, session_id: str) -> list[str]:
+        """Return the session's unique issue sentences ordered by index.
+
+        Built once per stored response and reused by every suggestion
+        request for that response.
+
+        Args:
+            session_id: The session identifier.
+
+        Returns:
+            Ordered list of unique sentence strings, empty if not found.
+        """
+        with self._lock:
+            session = self._get_live_session(session_id)
+            if session is None:
+                return []
+            return session["index"].sentences()
+
     def update_issue_status(
         self, session_id: str, issue_id: str, status: IssueStatus
     ) -> Optional[ScoreResponse]:
@@ -180,22 +296,14 @@ class SessionStore:
             issue was not found.
         """
         with self._lock:
-            session = self._sessions.get(session_id)
+            session = self._get_live_session(session_id)
             if session is None:
                 return None
-            if self._is_expired(session):
-                del self._sessions[session_id]
-                return None
-
-            response = session["response"]
-            issue = self._find_issue(response, issue_id)
+            index = session["index"]
+            issue = index.by_id.get(issue_id)
             if issue is None:
                 return None
-
-            issue.status = status
-
-        new_score = calculate_score(response.issues, response.report.word_count)
-        response.score = new_score
+            new_score = self._apply_statuses_locked(session, [issue], status)
 
         logger.info(
             "Updated issue %s to %s in session %s; new score=%d",
@@ -203,6 +311,47 @@ class SessionStore:
         )
         return new_score
 
+    def update_issue_statuses(
+        self,
+        session_id: str,
+        status: IssueStatus,
+        issue_ids: Optional[list[str]] = None,
+        category: Optional[str] = None,
+        rule_name: Optional[str] = None,
+    ) -> Optional[tuple[ScoreResponse, list[str]]]:
+        """Apply one status to many issues and recalculate the score once.
+
+        Issues are selected by explicit ``issue_ids`` or by ``category``
+        and/or ``rule_name`` (e.g. "accept all in category").  Only
+        issues that are currently OPEN are changed when selecting by
+        category or rule, so previously dismissed issues are not
+        resurrected as accepted.
+
+        Args:
+            session_id: The session identifier.
+            status: The new status to apply.
+            issue_ids: Explicit issue identifiers to update.
+            category: Category value to select OPEN issues by.
+            rule_name: Rule name to select OPEN issues by.
+
+        Returns:
+            Tuple of (recalculated ScoreResponse, updated issue IDs), or
+            None if the session was not found.
+        """
+        with self._lock:
+            session = self._get_live_session(session_id)
+            if session is None:
+                return None
+            targets = session["index"].select(issue_ids, category, rule_name)
+            new_score = self._apply_statuses_locked(session, targets, status)
+
+        updated_ids = [issue.id for issue in targets]
+        logger.info(
+            "Bulk-updated %d issues to %s in session %s; new score=%d",
+            len(updated_ids), status.value, session_id, new_score.score,
+        )
+        return new_score, updated_ids
+
     # ------------------------------------------------------------------
     # Public API — Suggestion caching
     # ------------------------------------------------------------------
@@ -233,12 +382,14 @@ class SessionStore:
             issue_id: The issue identifier.
             suggestion: The suggestion dict to cache.
         """
+        size = estimate_bytes(suggestion)
         with self._lock:
             session = self._sessions.get(session_id)
             if session is None:
                 logger.debug("Cannot cache suggestion: session %s not found", session_id)
                 return
             session["suggestion_cache"][issue_id] = suggestion
+            session["extra_bytes"] = session.get("extra_bytes", 0) + size
 
         logger.debug("Cached suggestion for issue %s in session %s", issue_id, session_id)
 
@@ -259,12 +410,16 @@ class SessionStore:
             block_hashes: Ordered list of block content hashes.
             block_issues: Mapping of block hash to raw LLM issue dicts.
         """
+        size = estimate_bytes(block_hashes) + estimate_bytes(block_issues)
         with self._lock:
             session = self._sessions.get(session_id)
             if session is None:
                 return
             session["block_hashes"] = block_hashes
             session["block_llm_issues"] = block_issues
+            session["block_bytes"] = size
+            evicted = self._enforce_budget_locked(keep=session_id)
+        self._log_evictions(evicted)
 
     def get_block_results(
         self, session_id: str,
@@ -291,6 +446,111 @@ class SessionStore:
     # Public API — Request cancellation (Amendment 4)
     # ------------------------------------------------------------------
 
+    def begin_analysis(self, session_id: str) -> CancellationToken:
+        """Start an analysis run and return its cancellation token.
+
+        A run already in progress for the same session ID (re-analysis
+        of an edited document) is superseded: its token is cancelled.
+        The session's result stream is restarted for the new run.
+
+        Args:
+            session_id: The session identifier of the new run.
+
+        Returns:
+            The token the new run must pass to its LLM calls.
+        """
+        token = CancellationToken()
+        with self._lock:
+            previous = self._analysis_tokens.get(session_id)
+            self._analysis_tokens[session_id] = token
+            self._analysis_bytes.pop(session_id, None)
+            stream = self._result_streams.setdefault(session_id, ResultStream())
+        stream.restart(token)
+        if previous is not None:
+            self._fire_token(previous, "superseded", session_id)
+        return token
+
+    def finish_analysis(self, session_id: str, token: CancellationToken) -> None:
+        """Release the token of a finished analysis run.
+
+        A no-op when a newer run has already replaced *token*.
+
+        Args:
+            session_id: The session identifier.
+            token: The token returned by :meth:`begin_analysis`.
+        """
+        with self._lock:
+            if self._analysis_tokens.get(session_id) is token:
+                del self._analysis_tokens[session_id]
+                self._analysis_bytes.pop(session_id, None)
+
+    def track_analysis_memory(
+        self, session_id: str, token: CancellationToken, nbytes: int,
+    ) -> None:
+        """Record how much memory a running analysis holds.
+
+        The figure replaces any earlier one for the run and counts
+        against the memory budget until the run finishes.  A no-op
+        when *token* no longer owns the session.
+
+        Args:
+            session_id: The session identifier.
+            token: The token returned by :meth:`begin_analysis`.
+            nbytes: Approximate bytes held by the run.
+        """
+        with self._lock:
+            if self._analysis_tokens.get(session_id) is not token:
+                return
+            self._analysis_bytes[session_id] = nbytes
+            evicted = self._enforce_budget_locked()
+        self._log_evictions(evicted)
+
+    def memory_stats(self) -> dict[str, Any]:
+        """Return the approximate memory held by this worker's store.
+
+        Returns:
+            Dict with ``sessions``, ``session_bytes``, ``analyses``,
+            ``analysis_bytes``, ``budget_bytes`` and ``evictions``.
+        """
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "session_bytes": sum(
+                    _session_bytes(s) for s in self._sessions.values()
+                ),
+                "analyses": len(self._analysis_tokens),
+                "analysis_bytes": sum(self._analysis_bytes.values()),
+                "budget_bytes": self._memory_budget,
+                "evictions": self._evictions,
+            }
+
+    def result_stream(self, session_id: str) -> ResultStream:
+        """Return the result stream of a session, creating it if needed.
+
+        Args:
+            session_id: The session identifier.
+
+        Returns:
+            The session's ResultStream.
+        """
+        with self._lock:
+            return self._result_streams.setdefault(session_id, ResultStream())
+
+    def block_priority(self, session_id: str) -> BlockPriority:
+        """Return the block priority of a session, creating it if needed.
+
+        The priority outlives individual runs, so re-analysis of an
+        edited document starts from the writer's last known viewport.
+
+        Args:
+            session_id: The session identifier.
+
+        Returns:
+            The session's BlockPriority.
+        """
+        with self._lock:
+            return self._block_priorities.setdefault(session_id, BlockPriority())
+
     def set_active_analysis(self, socket_sid: str, session_id: str) -> None:
         """Register the active analysis session for a browser tab.
 
@@ -301,6 +561,7 @@ class SessionStore:
             socket_sid: The Socket.IO session identifier for the tab.
             session_id: The session ID of the new active analysis.
         """
+        prev_token: Optional[CancellationToken] = None
         with self._lock:
             previous = self._active_analyses.get(socket_sid)
             if previous and previous != session_id:
@@ -311,7 +572,11 @@ class SessionStore:
                         "Superseded session %s for socket %s with %s",
                         previous, socket_sid, session_id,
                     )
+                prev_token = self._analysis_tokens.pop(previous, None)
+                self._analysis_bytes.pop(previous, None)
             self._active_analyses[socket_sid] = session_id
+        if prev_token is not None:
+            self._fire_token(prev_token, "superseded", previous)
 
     def is_analysis_current(self, session_id: str) -> bool:
         """Check whether an analysis session is still the active one.
@@ -342,11 +607,72 @@ class SessionStore:
             if session is not None:
                 session["cancelled"] = True
                 logger.info("Cancelled session %s", session_id)
+            token = self._analysis_tokens.pop(session_id, None)
+            self._analysis_bytes.pop(session_id, None)
+        if token is not None:
+            self._fire_token(token, "cancelled", session_id)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _fire_token(token: CancellationToken, reason: str, session_id: str) -> None:
+        """Cancel *token* outside the lock and count the cancelled run."""
+        if token.cancel(reason):
+            get_cancellation_stats().record_analysis_cancelled()
+            logger.info("Analysis %s for session %s", reason, session_id)
+
+    def _enforce_budget_locked(self, keep: Optional[str] = None) -> list[str]:
+        """Evict idle sessions, least recently used first, until within budget.
+
+        Sessions with a running analysis and *keep* (the session just
+        written) are never evicted.  Caller must hold ``_lock``.
+
+        Args:
+            keep: Session ID to spare.
+
+        Returns:
+            IDs of the evicted sessions.
+        """
+        if not self._memory_budget:
+            return []
+        total = sum(self._analysis_bytes.values()) + sum(
+            _session_bytes(s) for s in self._sessions.values()
+        )
+        evicted: list[str] = []
+        for session_id in list(self._sessions):
+            if total <= self._memory_budget:
+                break
+            if session_id == keep or session_id in self._analysis_tokens:
+                continue
+            total -= _session_bytes(self._sessions[session_id])
+            self._drop_session_locked(session_id)
+            evicted.append(session_id)
+        self._evictions += len(evicted)
+        return evicted
+
+    def _log_evictions(self, evicted: list[str]) -> None:
+        """Log sessions evicted by :meth:`_enforce_budget_locked`."""
+        if evicted:
+            logger.info(
+                "Evicted %d idle sessions to stay within the %d MiB memory budget",
+                len(evicted), self._memory_budget // (1024 * 1024),
+            )
+
+    def _drop_session_locked(self, session_id: str) -> None:
+        """Remove a session and everything keyed by it.  Caller holds ``_lock``."""
+        self._sessions.pop(session_id, None)
+        self._analysis_tokens.pop(session_id, None)
+        self._analysis_bytes.pop(session_id, None)
+        self._result_streams.pop(session_id, None)
+        self._block_priorities.pop(session_id, None)
+        stale_sids = [
+            sid for sid, s_id in self._active_analyses.items() if s_id == session_id
+        ]
+        for sid in stale_sids:
+            del self._active_analyses[sid]
+
     def _is_expired(self, session: dict) -> bool:
         """Check whether a session has exceeded its TTL.
 
@@ -359,21 +685,51 @@ class SessionStore:
         age = time.time() - session["created_at"]
         return age > self._ttl_seconds
 
+    def _get_live_session(self, session_id: str) -> Optional[dict]:
+        """Return a session dict, purging it if expired.  Caller holds ``_lock``.
+
+        Args:
+            session_id: The session identifier.
+
+        Returns:
+            The session data dict, or None if not found/expired.
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        if self._is_expired(session):
+            self._drop_session_locked(session_id)
+            return None
+        self._sessions.move_to_end(session_id)
+        return session
+
     @staticmethod
-    def _find_issue(response: AnalyzeResponse, issue_id: str) -> object:
-        """Find an issue by ID within an analysis response.
+    def _apply_statuses_locked(
+        session: dict,
+        issues: list[IssueResponse],
+        status: IssueStatus,
+    ) -> ScoreResponse:
+        """Set *status* on *issues*, update the ledger and bump the version.
+
+        Caller must hold ``_lock``.
 
         Args:
-            response: The analysis response to search.
-            issue_id: The issue identifier to find.
+            session: The session data dict.
+            issues: Issues to update.
+            status: The new status.
 
         Returns:
-            The matching IssueResponse, or None if not found.
+            The recalculated ScoreResponse (also stored on the response).
         """
-        for issue in response.issues:
-            if issue.id == issue_id:
-                return issue
-        return None
+        ledger: ScoreLedger = session["index"].ledger
+        for issue in issues:
+            old_status = issue.status
+            issue.status = status
+            ledger.apply_status_change(issue, old_status, status)
+        response = session["response"]
+        response.score = ledger.to_score()
+        session["version"] = session.get("version", 0) + 1
+        return response.score
 
     def _cleanup_loop(self) -> None:
         """Background loop that periodically removes expired sessions.
@@ -401,15 +757,17 @@ class SessionStore:
                     expired_ids.append(session_id)
 
             for session_id in expired_ids:
-                del self._sessions[session_id]
-
-            # Clean up active_analyses entries pointing to expired sessions
-            stale_sids = [
-                sid for sid, s_id in self._active_analyses.items()
-                if s_id in expired_ids
-            ]
-            for sid in stale_sids:
-                del self._active_analyses[sid]
+                self._drop_session_locked(session_id)
+
+            # Streams and priorities of runs that were cancelled before
+            # storing a session
+            for per_session in (self._result_streams, self._block_priorities):
+                orphaned = [
+                    s_id for s_id in per_session
+                    if s_id not in self._sessions and s_id not in self._analysis_tokens
+                ]
+                for s_id in orphaned:
+                    del per_session[s_id]
 
         if expired_ids:
             logger.info("Purged %d expired sessions", len(expired_ids))
@@ -422,41 +780,132 @@ class SessionStore:
 # ---------------------------------------------------------------------------
 
 
+class _IssueIndex:
+    """Per-response lookup tables and running score ledger.
+
+    Attributes:
+        response: The indexed analysis response.
+        by_id: Maps issue IDs to IssueResponse objects.
+        by_category: Maps category values to issues in document order.
+        ledger: Running score totals for O(1) status updates.
+    """
+
+    def __init__(self, response: AnalyzeResponse) -> None:
+        """Index a response's issues.
+
+        Args:
+            response: The analysis response to index.
+        """
+        self.response: AnalyzeResponse = response
+        self.by_id: dict[str, IssueResponse] = {}
+        self.by_category: dict[str, list[IssueResponse]] = {}
+        for issue in response.issues:
+            self.by_id[issue.id] = issue
+            self.by_category.setdefault(_category_value(issue), []).append(issue)
+        self.ledger: ScoreLedger = ScoreLedger(
+            response.issues, response.report.word_count,
+        )
+        self._sentences: Optional[list[str]] = None
+
+    def select(
+        self,
+        issue_ids: Optional[list[str]],
+        category: Optional[str],
+        rule_name: Optional[str],
+    ) -> list[IssueResponse]:
+        """Resolve a bulk-update selection to issue objects.
+
+        Args:
+            issue_ids: Explicit issue identifiers (unknown IDs ignored).
+            category: Category value filter for OPEN issues.
+            rule_name: Rule name filter for OPEN issues.
+
+        Returns:
+            Matching issues without duplicates.
+        """
+        if issue_ids:
+            seen: set[str] = set()
+            selected: list[IssueResponse] = []
+            for issue_id in issue_ids:
+                issue = self.by_id.get(issue_id)
+                if issue is not None and issue_id not in seen:
+                    seen.add(issue_id)
+                    selected.append(issue)
+            return selected
+
+        if category is None and rule_name is None:
+            return []
+        pool = (
+            self.by_category.get(category, []) if category is not None
+            else self.response.issues
+        )
+        return [
+            issue for issue in pool
+            if issue.status == IssueStatus.OPEN
+            and (rule_name is None or issue.rule_name == rule_name)
+        ]
+
+    def sentences(self) -> list[str]:
+        """Unique issue sentences ordered by sentence_index, built lazily."""
+        if self._sentences is None:
+            sentence_map: dict[int, str] = {}
+            for issue in self.response.issues:
+                if issue.sentence and issue.sentence_index not in sentence_map:
+                    sentence_map[issue.sentence_index] = issue.sentence
+            self._sentences = [sentence_map[idx] for idx in sorted(sentence_map)]
+        return self._sentences
+
+
+def _session_bytes(session: dict) -> int:
+    """Approximate bytes held by one stored session."""
+    return (
+        session.get("response_bytes", 0)
+        + session.get("block_bytes", 0)
+        + session.get("extra_bytes", 0)
+    )
+
+
+def _category_value(issue: IssueResponse) -> str:
+    """Return the category of an issue as its plain string value."""
+    category = issue.category
+    return category.value if isinstance(category, IssueCategory) else str(category)
+
+
 def _transfer_issue_statuses(
-    old_response: AnalyzeResponse,
-    new_response: AnalyzeResponse,
+    old_index: _IssueIndex,
+    new_index: _IssueIndex,
 ) -> None:
     """Transfer user-modified issue statuses from old to new response.
 
     When the LLM background phase completes and replaces the session
     response, any accept/dismiss/manually-fixed actions the user took
-    during the LLM phase must be preserved.
+    during the LLM phase must be preserved.  The new index's ledger is
+    adjusted per transferred issue and the response score refreshed.
 
     Args:
-        old_response: The previous response with potential user actions.
-        new_response: The incoming response to receive preserved statuses.
+        old_index: Index of the previous response with potential user actions.
+        new_index: Index of the incoming response to receive preserved statuses.
     """
-    old_statuses: dict[str, IssueStatus] = {}
-    for issue in old_response.issues:
-        if issue.status != IssueStatus.OPEN:
-            old_statuses[issue.id] = issue.status
-
-    if not old_statuses:
+    transferred = 0
+    for issue_id, old_issue in old_index.by_id.items():
+        if old_issue.status == IssueStatus.OPEN:
+            continue
+        new_issue = new_index.by_id.get(issue_id)
+        if new_issue is None:
+            continue
+        previous = new_issue.status
+        new_issue.status = old_issue.status
+        new_index.ledger.apply_status_change(new_issue, previous, old_issue.status)
+        transferred += 1
+
+    if not transferred:
         return
 
-    for issue in new_response.issues:
-        saved = old_statuses.get(issue.id)
-        if saved is not None:
-            issue.status = saved
-
-    # Recalculate score to reflect preserved statuses
-    new_score = calculate_score(
-        new_response.issues, new_response.report.word_count
-    )
-    new_response.score = new_score
+    new_response = new_index.response
+    new_response.score = new_index.ledger.to_score()
     logger.debug(
         "Transferred %d user-modified statuses, recalculated score=%d",
-        len(old_statuses), new_score.score,
+        transferred, new_response.score.score,
     )
 
 
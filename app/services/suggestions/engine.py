@@ -15,7 +15,7 @@ import re
 from typing import Optional
 
 from app.llm.client import LLMClient
-from app.models.schemas import AnalyzeResponse, IssueResponse
+from app.models.schemas import IssueResponse
 from app.services.session.store import get_session_store
 
 logger = logging.getLogger(__name__)
@@ -44,12 +44,11 @@ def get_suggestion(session_id: str, issue_id: str) -> dict:
         logger.debug("Returning cached suggestion for issue %s", issue_id)
         return cached
 
-    response = store.get_session(session_id)
-    if response is None:
+    if store.get_session_version(session_id) is None:
         logger.warning("Session %s not found for suggestion request", session_id)
         return {"error": "Session not found or expired"}
 
-    issue = _find_issue(response, issue_id)
+    issue = store.get_issue(session_id, issue_id)
     if issue is None:
         logger.warning("Issue %s not found in session %s", issue_id, session_id)
         return {"error": "Issue not found"}
@@ -59,7 +58,7 @@ def get_suggestion(session_id: str, issue_id: str) -> dict:
         store.cache_suggestion(session_id, issue_id, suggestion)
         return suggestion
 
-    suggestion = _request_llm_suggestion(issue, response)
+    suggestion = _request_llm_suggestion(issue, session_id)
     store.cache_suggestion(session_id, issue_id, suggestion)
     return suggestion
 
@@ -69,22 +68,6 @@ def get_suggestion(session_id: str, issue_id: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def _find_issue(response: AnalyzeResponse, issue_id: str) -> Optional[IssueResponse]:
-    """Find an issue by ID within an analysis response.
-
-    Args:
-        response: The analysis response to search.
-        issue_id: The issue identifier to find.
-
-    Returns:
-        The matching IssueResponse, or None if not found.
-    """
-    for issue in response.issues:
-        if issue.id == issue_id:
-            return issue
-    return None
-
-
 def _is_simple_replacement(issue: IssueResponse) -> bool:
     """Determine whether an issue has a single deterministic suggestion.
 
@@ -196,7 +179,7 @@ def _build_deterministic_suggestion(issue: IssueResponse) -> dict:
     }
 
 
-def _request_llm_suggestion(issue: IssueResponse, response: AnalyzeResponse) -> dict:
+def _request_llm_suggestion(issue: IssueResponse, session_id: str) -> dict:
     """Request a rewrite suggestion from the LLM.
 
     Builds context from surrounding sentences, rule details, and style
@@ -205,7 +188,7 @@ def _request_llm_suggestion(issue: IssueResponse, response: AnalyzeResponse) ->
 
     Args:
         issue: The issue to get a suggestion for.
-        response: The full analysis response for sentence context.
+        session_id: The session whose sentences provide context.
 
     Returns:
         Dict with rewritten_text, explanation, and confidence on
@@ -230,7 +213,9 @@ def _request_llm_suggestion(issue: IssueResponse, response: AnalyzeResponse) ->
             "suggestions": suggestions,
         }
 
-    context_sentences = _extract_context_sentences(issue, response)
+    context_sentences = _extract_context_sentences(
+        issue, get_session_store().get_context_sentences(session_id),
+    )
     rule_info = _build_rule_info(issue)
     style_guide_excerpt = _build_style_guide_excerpt(issue)
 
@@ -263,22 +248,20 @@ def _request_llm_suggestion(issue: IssueResponse, response: AnalyzeResponse) ->
 
 
 def _extract_context_sentences(
-    issue: IssueResponse, response: AnalyzeResponse
+    issue: IssueResponse, all_sentences: list[str]
 ) -> list[str]:
     """Extract the flagged sentence and surrounding context.
 
     Retrieves the flagged sentence plus up to 2 sentences before
-    and 2 sentences after from the same analysis response.
+    and 2 sentences after from the session's ordered sentence list.
 
     Args:
-        issue: The issue containing sentence_index.
-        response: The analysis response with all issues.
+        issue: The issue containing the flagged sentence.
+        all_sentences: Unique session sentences ordered by index.
 
     Returns:
         List of context sentences (3-5 sentences typically).
     """
-    all_sentences = _collect_unique_sentences(response)
-
     if not all_sentences:
         return [issue.sentence] if issue.sentence else []
 
@@ -289,24 +272,6 @@ def _extract_context_sentences(
     return all_sentences[start:end]
 
 
-def _collect_unique_sentences(response: AnalyzeResponse) -> list[str]:
-    """Collect unique sentences from all issues, ordered by sentence_index.
-
-    Args:
-        response: The analysis response with all issues.
-
-    Returns:
-        Sorted list of unique sentence strings.
-    """
-    sentence_map: dict[int, str] = {}
-    for resp_issue in response.issues:
-        if resp_issue.sentence and resp_issue.sentence_index not in sentence_map:
-            sentence_map[resp_issue.sentence_index] = resp_issue.sentence
-
-    sorted_indices = sorted(sentence_map.keys())
-    return [sentence_map[idx] for idx in sorted_indices]
-
-
 def _find_sentence_index(all_sentences: list[str], issue: IssueResponse) -> int:
     """Find the position of the issue's sentence in the sentence list.
 
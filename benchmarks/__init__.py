@@ -0,0 +1,19 @@
+"""Reproducible performance benchmarks for the analysis pipeline.
+
+Generates a seeded synthetic corpus (AsciiDoc, Markdown, DITA, HTML,
+DOCX and PDF, 1 KB to 5 MB, with a controlled density of planted style
+issues), times each pipeline stage (parsing, preprocessing, the
+deterministic rules, merging and the full orchestrated analysis with a
+stub LLM provider), records peak memory, and compares the results with
+a stored baseline.  No network access or spaCy model is required.
+For load tests, :mod:`benchmarks.stub_server` stands in for the model
+provider and LanguageTool over HTTP and :mod:`benchmarks.load` replays
+concurrent socket analyses against a running server.
+
+This package is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python -m benchmarks.run --sizes 1k 100k --output results.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --tolerance 0.25
+    python -m benchmarks.load --concurrency 20 --stub-url http://localhost:8089
+"""
@@ -0,0 +1,350 @@
+"""Seeded synthetic documents for the benchmarks.
+
+A document is a title and a list of sections (heading, paragraphs, an
+optional procedure and an optional command listing) built from a fixed
+technical vocabulary, then rendered as AsciiDoc, Markdown, DITA, HTML,
+DOCX or PDF.  The same seed and size give the same sections in every
+format, so timings are comparable across formats and across runs.
+
+A fraction of sentences (the issue density) carries a phrase the
+deterministic rules flag with or without a trained spaCy model, e.g.
+"click on" or "and/or"; the stub LLM provider reports the same phrases.
+"""
+
+import html
+import io
+import random
+import textwrap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence, Tuple, Union
+
+import fitz
+from docx import Document
+
+FORMATS: Tuple[str, ...] = ("asciidoc", "markdown", "dita", "html", "docx", "pdf")
+BINARY_FORMATS = frozenset({"docx", "pdf"})
+
+_EXTENSIONS = {
+    "asciidoc": "adoc", "markdown": "md", "dita": "dita",
+    "html": "html", "docx": "docx", "pdf": "pdf",
+}
+
+# Phrases the deterministic rules flag; each issue template uses one
+ISSUE_PHRASES: Tuple[str, ...] = (
+    "Click on", "Please", "and/or", "(see below)", " -- ", "e.g.", "!",
+)
+
+_SUBJECTS = (
+    "the operator", "the cluster administrator", "each node", "the registry",
+    "the installation program", "a persistent volume", "the web console",
+    "the update service",
+)
+_VERBS = (
+    "configures", "validates", "stores", "replicates", "schedules", "monitors",
+    "exposes", "updates",
+)
+_OBJECTS = (
+    "the container images", "the network policies", "the storage classes",
+    "the deployment manifests", "the service accounts", "the routing rules",
+    "the audit logs", "the node pools",
+)
+_TAILS = (
+    "for every namespace", "after each upgrade", "when the cluster starts",
+    "across all availability zones", "before the workload runs",
+    "on the control plane",
+)
+_IMPERATIVES = ("Configure", "Verify", "Update", "Back up", "Inspect", "Label")
+_RESOURCES = ("pods", "nodes", "routes", "secrets", "deployments", "configmaps")
+
+_PLAIN_TEMPLATE = "{S} {v} {o} {t}."
+_STEP_TEMPLATE = "{I} {o} {t}."
+_ISSUE_TEMPLATES = (
+    "Click on Save after {s} {v} {o}.",
+    "Please verify that {s} {v} {o} {t}.",
+    "{S} {v} {o} and/or {o2} {t}.",
+    "{S} {v} {o} {t} (see below).",
+    "{S} {v} {o} -- {t}.",
+    "{S} {v} {o}, e.g. {o2}, {t}.",
+    "{S} {v} {o} {t}!",
+)
+
+
+@dataclass(frozen=True)
+class Section:
+    """One section of a synthetic document.
+
+    Attributes:
+        heading: Section title.
+        paragraphs: Prose paragraphs.
+        steps: Procedure steps (may be empty).
+        command: Command listing (may be empty).
+    """
+
+    heading: str
+    paragraphs: Tuple[str, ...]
+    steps: Tuple[str, ...]
+    command: str
+
+
+@dataclass(frozen=True)
+class CorpusDocument:
+    """A rendered synthetic document.
+
+    Attributes:
+        format: One of :data:`FORMATS`.
+        size: Requested size in bytes of text content.
+        seed: Generator seed.
+        issue_density: Fraction of sentences carrying a planted issue.
+        content: Rendered document (bytes for DOCX and PDF).
+        sentence_count: Number of prose and step sentences.
+        planted_issues: Number of sentences carrying a planted issue.
+    """
+
+    format: str
+    size: int
+    seed: int
+    issue_density: float
+    content: Union[str, bytes]
+    sentence_count: int
+    planted_issues: int
+
+    @property
+    def name(self) -> str:
+        """Return a stable identifier such as ``asciidoc-102400``."""
+        return f"{self.format}-{self.size}"
+
+    def write(self, directory: Path) -> Path:
+        """Write the document to *directory* and return its path.
+
+        Args:
+            directory: Existing output directory.
+
+        Returns:
+            Path of the written file.
+        """
+        path = Path(directory) / f"{self.name}.{_EXTENSIONS[self.format]}"
+        if isinstance(self.content, bytes):
+            path.write_bytes(self.content)
+        else:
+            path.write_text(self.content, encoding="utf-8")
+        return path
+
+
+def generate(
+    fmt: str,
+    size: int,
+    seed: int = 1234,
+    issue_density: float = 0.1,
+) -> CorpusDocument:
+    """Generate one document of roughly *size* bytes of text.
+
+    Args:
+        fmt: Output format, one of :data:`FORMATS`.
+        size: Target amount of text in bytes (markup not counted).
+        seed: Generator seed.
+        issue_density: Fraction of sentences, between 0 and 1, that
+            carry a planted issue.
+
+    Returns:
+        The rendered document.
+
+    Raises:
+        ValueError: If *fmt* is unknown or *issue_density* is out of range.
+    """
+    if fmt not in _RENDERERS:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    if not 0.0 <= issue_density <= 1.0:
+        raise ValueError(f"issue_density must be between 0 and 1, got {issue_density}")
+    title, sections, sentence_count, planted = build_sections(size, seed, issue_density)
+    return CorpusDocument(
+        format=fmt,
+        size=size,
+        seed=seed,
+        issue_density=issue_density,
+        content=_RENDERERS[fmt](title, sections),
+        sentence_count=sentence_count,
+        planted_issues=planted,
+    )
+
+
+def build_sections(
+    size: int, seed: int, issue_density: float,
+) -> Tuple[str, List[Section], int, int]:
+    """Build the format-independent document structure.
+
+    Args:
+        size: Target amount of text in bytes.
+        seed: Generator seed; with *size* it fixes the text.
+        issue_density: Fraction of sentences carrying a planted issue.
+
+    Returns:
+        Tuple of (title, sections, sentence_count, planted_issues).
+    """
+    rng = random.Random(f"{seed}:{size}:{issue_density}")
+    counts = [0, 0]
+
+    def sentence(template: str) -> str:
+        counts[0] += 1
+        if rng.random() < issue_density:
+            counts[1] += 1
+            template = rng.choice(_ISSUE_TEMPLATES)
+        subject = rng.choice(_SUBJECTS)
+        return template.format(
+            S=subject[0].upper() + subject[1:], s=subject, v=rng.choice(_VERBS),
+            o=rng.choice(_OBJECTS), o2=rng.choice(_OBJECTS), t=rng.choice(_TAILS),
+            I=rng.choice(_IMPERATIVES),
+        )
+
+    title = "Managing " + rng.choice(_OBJECTS)[4:]
+    sections: List[Section] = []
+    total = len(title)
+    while total < size:
+        heading = " ".join(rng.choice(_OBJECTS).split()[1:]).capitalize()
+        total += len(heading)
+        paragraphs: List[str] = []
+        for _ in range(rng.randint(2, 5)):
+            paragraph = " ".join(sentence(_PLAIN_TEMPLATE) for _ in range(rng.randint(2, 6)))
+            paragraphs.append(paragraph)
+            total += len(paragraph)
+            if total >= size:
+                break
+        steps: List[str] = []
+        if total < size and rng.random() < 0.4:
+            steps = [sentence(_STEP_TEMPLATE) for _ in range(rng.randint(3, 6))]
+            total += sum(map(len, steps))
+        command = ""
+        if total < size and rng.random() < 0.3:
+            command = f"$ oc get {rng.choice(_RESOURCES)} -n {rng.choice(_RESOURCES)[:-1]}-system"
+            total += len(command)
+        sections.append(Section(heading, tuple(paragraphs), tuple(steps), command))
+    return title, sections, counts[0], counts[1]
+
+
+# ---------------------------------------------------------------------------
+# Renderers
+# ---------------------------------------------------------------------------
+
+def _render_asciidoc(title: str, sections: Sequence[Section]) -> str:
+    """Render as an AsciiDoc module."""
+    parts = [f"= {title}"]
+    for section in sections:
+        parts.append(f"== {section.heading}")
+        parts.extend(section.paragraphs)
+        if section.steps:
+            parts.append(".Procedure\n" + "\n".join(f". {step}" for step in section.steps))
+        if section.command:
+            parts.append(f"[source,terminal]\n----\n{section.command}\n----")
+    return "\n\n".join(parts) + "\n"
+
+
+def _render_markdown(title: str, sections: Sequence[Section]) -> str:
+    """Render as Markdown."""
+    parts = [f"# {title}"]
+    for section in sections:
+        parts.append(f"## {section.heading}")
+        parts.extend(section.paragraphs)
+        if section.steps:
+            parts.append("\n".join(f"{n}. {step}" for n, step in enumerate(section.steps, 1)))
+        if section.command:
+            parts.append(f"```terminal\n{section.command}\n```")
+    return "\n\n".join(parts) + "\n"
+
+
+def _render_dita(title: str, sections: Sequence[Section]) -> str:
+    """Render as a DITA concept topic."""
+    esc = html.escape
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<concept id="benchmark">',
+        f"<title>{esc(title)}</title>",
+        "<conbody>",
+    ]
+    for section in sections:
+        parts.append(f"<section><title>{esc(section.heading)}</title>")
+        parts.extend(f"<p>{esc(p)}</p>" for p in section.paragraphs)
+        if section.steps:
+            parts.append("<ol>" + "".join(f"<li>{esc(s)}</li>" for s in section.steps) + "</ol>")
+        if section.command:
+            parts.append(f"<codeblock>{esc(section.command)}</codeblock>")
+        parts.append("</section>")
+    parts += ["</conbody>", "</concept>"]
+    return "\n".join(parts) + "\n"
+
+
+def _render_html(title: str, sections: Sequence[Section]) -> str:
+    """Render as an HTML page."""
+    esc = html.escape
+    parts = [f"<html><head><title>{esc(title)}</title></head><body>", f"<h1>{esc(title)}</h1>"]
+    for section in sections:
+        parts.append(f"<h2>{esc(section.heading)}</h2>")
+        parts.extend(f"<p>{esc(p)}</p>" for p in section.paragraphs)
+        if section.steps:
+            parts.append("<ol>" + "".join(f"<li>{esc(s)}</li>" for s in section.steps) + "</ol>")
+        if section.command:
+            parts.append(f"<pre><code>{esc(section.command)}</code></pre>")
+    parts.append("</body></html>")
+    return "\n".join(parts) + "\n"
+
+
+def _render_docx(title: str, sections: Sequence[Section]) -> bytes:
+    """Render as a Word document."""
+    doc = Document()
+    doc.add_heading(title, 0)
+    for section in sections:
+        doc.add_heading(section.heading, 1)
+        for paragraph in section.paragraphs:
+            doc.add_paragraph(paragraph)
+        for step in section.steps:
+            doc.add_paragraph(step, style="List Number")
+        if section.command:
+            doc.add_paragraph(section.command, style="No Spacing")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+# A4 page layout for the PDF renderer, in points
+_PDF_MARGIN = 72
+_PDF_PAGE_BOTTOM = 842 - _PDF_MARGIN
+_PDF_WRAP = 95
+
+
+def _render_pdf(title: str, sections: Sequence[Section]) -> bytes:
+    """Render as a PDF, wrapping text at a fixed width."""
+    doc = fitz.open()
+    page = doc.new_page()
+    y = float(_PDF_MARGIN)
+
+    def write(text: str, fontsize: float, gap: float) -> None:
+        nonlocal page, y
+        for line in textwrap.wrap(text, _PDF_WRAP) or [""]:
+            if y + fontsize > _PDF_PAGE_BOTTOM:
+                page = doc.new_page()
+                y = float(_PDF_MARGIN)
+            page.insert_text((_PDF_MARGIN, y), line, fontsize=fontsize)
+            y += fontsize * 1.4
+        y += gap
+
+    write(title, 18, 12)
+    for section in sections:
+        write(section.heading, 14, 8)
+        for paragraph in section.paragraphs:
+            write(paragraph, 10, 8)
+        for n, step in enumerate(section.steps, 1):
+            write(f"{n}. {step}", 10, 4)
+        if section.command:
+            write(section.command, 9, 8)
+    content = doc.tobytes()
+    doc.close()
+    return content
+
+
+_RENDERERS = {
+    "asciidoc": _render_asciidoc,
+    "markdown": _render_markdown,
+    "dita": _render_dita,
+    "html": _render_html,
+    "docx": _render_docx,
+    "pdf": _render_pdf,
+}
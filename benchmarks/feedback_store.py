@@ -0,0 +1,262 @@
+"""Benchmark concurrent writers and readers of the feedback store.
+
+Several processes, each running ``--writers`` threads, store feedback
+in one SQLite file database, as the gunicorn workers do, while a
+reader thread per process keeps asking for rule statistics.  The
+database is prefilled with ``--rows`` feedback entries first.  Each
+run uses a fresh copy of it, in one of two modes:
+
+``write-behind``
+    ``store_feedback`` only; the store's writer batches the inserts.
+``commit-per-insert``
+    ``store_feedback`` followed by ``flush``, so every entry is its
+    own transaction, as before write-behind.
+
+For each mode it reports the throughput (from the first write until
+every entry is written, in the slowest process), p50/p99 latency of
+``store_feedback`` and of ``get_rule_feedback_stats``, and whether the
+rows and the rule counters agree afterwards.  It also times the
+full-table aggregate that rule statistics used to run, on the
+prefilled database.
+
+The writers store feedback in tight loops, so with several of them
+per process the reader's latency is mostly waiting for the GIL; use
+``--writers 1`` to see the cost of the lookup itself.
+
+This script is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python -m benchmarks.feedback_store
+    python -m benchmarks.feedback_store --processes 4 --writers 8 --entries 1000 --rows 500000
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import random
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from app.services.feedback.store import FeedbackStore
+from benchmarks.load import percentile
+
+MODES = ("write-behind", "commit-per-insert")
+
+# What get_rule_feedback_stats ran before the counter table existed
+_AGGREGATE_SQL = """
+SELECT
+    COUNT(*) AS total,
+    SUM(CASE WHEN thumbs_up = 1 THEN 1 ELSE 0 END) AS positive,
+    SUM(CASE WHEN thumbs_up = 0 THEN 1 ELSE 0 END) AS negative
+FROM feedback
+WHERE rule_type = ?
+"""
+
+
+def _rules(count: int) -> List[str]:
+    """Return *count* rule type names."""
+    return [f"rule_{n:03d}" for n in range(count)]
+
+
+def prefill(db_path: str, rows: int, rules: int, seed: int) -> None:
+    """Create the database with *rows* feedback entries.
+
+    Args:
+        db_path: Database file to create.
+        rows: Entries to insert.
+        rules: Distinct rule types they spread over.
+        seed: Random seed for rules and votes.
+    """
+    rng = random.Random(seed)
+    names = _rules(rules)
+    store = FeedbackStore(db_path=db_path, flush_interval=60, batch_size=rows + 1)
+    for n in range(rows):
+        store.store_feedback("prefill", f"i{n}", rng.choice(names), rng.random() < 0.7)
+    store.close()
+
+
+def _worker_process(
+    db_path: str, mode: str, writers: int, entries: int, rules: int, seed: int,
+) -> Dict[str, List[float]]:
+    """Write and read feedback from one process.
+
+    Args:
+        db_path: The shared database file.
+        mode: One of :data:`MODES`.
+        writers: Writer threads.
+        entries: Entries each writer stores.
+        rules: Distinct rule types.
+        seed: Random seed for this process.
+
+    Returns:
+        ``{"store": [...], "stats": [...]}`` latencies and ``{"seconds":
+        [...]}``, the time from the first write to the last entry
+        written, all in seconds.
+    """
+    names = _rules(rules)
+    store = FeedbackStore(db_path=db_path)
+    store_latencies: List[float] = []
+    stats_latencies: List[float] = []
+    done = threading.Event()
+
+    def write(thread: int) -> None:
+        rng = random.Random(seed * 1000 + thread)
+        latencies = []
+        for n in range(entries):
+            started = time.perf_counter()
+            store.store_feedback(f"bench-{seed}", f"{thread}-{n}", rng.choice(names), rng.random() < 0.7)
+            if mode == "commit-per-insert":
+                store.flush()
+            latencies.append(time.perf_counter() - started)
+        store_latencies.extend(latencies)
+
+    def read() -> None:
+        rng = random.Random(seed)
+        while not done.is_set():
+            started = time.perf_counter()
+            store.get_rule_feedback_stats(rng.choice(names))
+            stats_latencies.append(time.perf_counter() - started)
+            time.sleep(0.001)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    started = time.perf_counter()
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.set()
+    reader.join()
+    store.close()
+    return {"store": store_latencies, "stats": stats_latencies, "seconds": [time.perf_counter() - started]}
+
+
+def _consistent(db_path: str, expected_rows: int) -> bool:
+    """Return True when the rows and the rule counters agree."""
+    connection = sqlite3.connect(db_path)
+    try:
+        rows = connection.execute("SELECT COUNT(*) FROM feedback").fetchone()[0]
+        aggregated = connection.execute(
+            "SELECT rule_type, COUNT(*), SUM(thumbs_up = 1), SUM(thumbs_up = 0) "
+            "FROM feedback GROUP BY rule_type ORDER BY rule_type"
+        ).fetchall()
+        counters = connection.execute(
+            "SELECT rule_type, total, positive, negative FROM rule_feedback_stats ORDER BY rule_type"
+        ).fetchall()
+    finally:
+        connection.close()
+    return rows == expected_rows and aggregated == counters
+
+
+def time_aggregate(db_path: str, rules: int, queries: int = 200) -> Dict[str, float]:
+    """Time the old full aggregate against the counter lookup.
+
+    Args:
+        db_path: The prefilled database.
+        rules: Distinct rule types.
+        queries: Queries of each kind.
+
+    Returns:
+        ``{"aggregate_p50_ms", "counter_p50_ms"}``.
+    """
+    names = _rules(rules)
+    connection = sqlite3.connect(db_path)
+    timings: Dict[str, List[float]] = {"aggregate": [], "counter": []}
+    sql = {
+        "aggregate": _AGGREGATE_SQL,
+        "counter": "SELECT total, positive, negative FROM rule_feedback_stats WHERE rule_type = ?",
+    }
+    try:
+        for n in range(queries):
+            for kind, query in sql.items():
+                started = time.perf_counter()
+                connection.execute(query, (names[n % rules],)).fetchone()
+                timings[kind].append(time.perf_counter() - started)
+    finally:
+        connection.close()
+    return {f"{kind}_p50_ms": percentile(values, 50) * 1000 for kind, values in timings.items()}
+
+
+def run_mode(
+    template: str, mode: str, processes: int, writers: int, entries: int, rules: int, rows: int,
+) -> Dict[str, Any]:
+    """Run one mode against a fresh copy of the prefilled database.
+
+    Args:
+        template: The prefilled database file.
+        mode: One of :data:`MODES`.
+        processes: Writer processes.
+        writers: Writer threads per process.
+        entries: Entries each writer stores.
+        rules: Distinct rule types.
+        rows: Entries in the prefilled database.
+
+    Returns:
+        Throughput, latency percentiles and the consistency check.
+    """
+    db_path = str(Path(template).with_name(f"{mode}.db"))
+    shutil.copyfile(template, db_path)
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes) as pool:
+        results = pool.starmap(
+            _worker_process,
+            [(db_path, mode, writers, entries, rules, seed) for seed in range(1, processes + 1)],
+        )
+    elapsed = max(result["seconds"][0] for result in results)
+    stored = [value for result in results for value in result["store"]]
+    stats = [value for result in results for value in result["stats"]]
+    return {
+        "entries": len(stored),
+        "seconds": elapsed,
+        "entries_per_second": len(stored) / elapsed,
+        "store_p50_ms": percentile(stored, 50) * 1000,
+        "store_p99_ms": percentile(stored, 99) * 1000,
+        "stats_p50_ms": percentile(stats, 50) * 1000 if stats else 0.0,
+        "stats_p99_ms": percentile(stats, 99) * 1000 if stats else 0.0,
+        "consistent": _consistent(db_path, rows + len(stored)),
+    }
+
+
+def main() -> None:
+    """Parse arguments, run each mode and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--writers", type=int, default=4, help="Writer threads per process")
+    parser.add_argument("--entries", type=int, default=500, help="Entries per writer")
+    parser.add_argument("--rules", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=100_000, help="Entries prefilled")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", type=Path, help="Also write the figures as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    workdir = tempfile.mkdtemp(prefix="feedback-bench-")
+    try:
+        template = str(Path(workdir) / "prefilled.db")
+        prefill(template, args.rows, args.rules, args.seed)
+        report: Dict[str, Any] = {"lookup": time_aggregate(template, args.rules)}
+        print(f"rule stats on {args.rows} rows: full aggregate "
+              f"{report['lookup']['aggregate_p50_ms']:.3f} ms, counter {report['lookup']['counter_p50_ms']:.3f} ms")
+        for mode in args.modes:
+            figures = run_mode(template, mode, args.processes, args.writers, args.entries, args.rules, args.rows)
+            report[mode] = figures
+            print(f"{mode:<18} {figures['entries_per_second']:9.0f} entries/s"
+                  f"  store p50 {figures['store_p50_ms']:.3f} ms p99 {figures['store_p99_ms']:.3f} ms"
+                  f"  stats p50 {figures['stats_p50_ms']:.3f} ms p99 {figures['stats_p99_ms']:.3f} ms"
+                  f"  {'consistent' if figures['consistent'] else 'INCONSISTENT'}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+"""Replay concurrent socket analyses against a running server.
+
+Each analysis does what the browser does: connect a Socket.IO client,
+join a fresh session room, ``POST /api/v1/analyze`` with a corpus
+document (see :mod:`benchmarks.corpus`), and wait for
+``analysis_complete``.  ``--concurrency`` analyses run at once until
+``--analyses`` have run.  The report gives, per phase, p50/p95/p99 of
+the time from the POST to:
+
+``response``
+    The HTTP response (the deterministic results).
+``deterministic_complete``, ``languagetool_complete``,
+``llm_granular_complete``, ``llm_global_complete``, ``analysis_complete``
+    The first arrival of that event.
+
+plus error rates (failed connects, non-2xx responses, ``error`` events,
+``llm_skipped`` and analyses that did not complete in ``--timeout``).
+While the load runs ``/api/v1/health`` is polled for queue depths:
+granular blocks waiting for an LLM worker, LLM calls in flight, and
+shared analyses.  Each poll reaches one gunicorn worker, so with
+several workers the depths are samples of individual workers.  With
+``--stub-url`` the requests and injected faults the stub server (see
+:mod:`benchmarks.stub_server`) saw during the run are included.
+
+Socket.IO rooms live in the worker that holds the connection, so run
+gunicorn with ``GUNICORN_WORKERS=1`` unless the deployment routes
+sessions stickily.  Clients upgrade to WebSocket, as browsers do, when
+the ``websocket-client`` package is installed, and stay on long
+polling otherwise.
+
+This script is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python -m benchmarks.stub_server --profile realistic &
+    MODEL_PROVIDER=api BASE_URL=http://localhost:8089/v1 MODEL_ID=stub-model \\
+        ACCESS_TOKEN=stub LANGUAGETOOL_ENABLED=true LANGUAGETOOL_URL=http://localhost:8089 \\
+        LLM_ENABLED=true GUNICORN_WORKERS=1 ./main.sh &
+    python -m benchmarks.load --url http://localhost:8080 --concurrency 20 --analyses 100 \\
+        --stub-url http://localhost:8089
+"""
+
+import argparse
+import dataclasses
+import datetime
+import importlib.util
+import itertools
+import json
+import logging
+import math
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import requests
+import socketio
+
+from benchmarks.corpus import BINARY_FORMATS, FORMATS, generate
+from benchmarks.run import parse_size
+
+logger = logging.getLogger(__name__)
+
+PHASES = (
+    "response",
+    "deterministic_complete",
+    "languagetool_complete",
+    "llm_granular_complete",
+    "llm_global_complete",
+    "analysis_complete",
+)
+
+PERCENTILES = (50, 95, 99)
+
+_TEXT_FORMATS = tuple(fmt for fmt in FORMATS if fmt not in BINARY_FORMATS)
+
+# Seconds allowed for the socket handshake and the room join
+_CONNECT_TIMEOUT_SECONDS = 30.0
+
+# The websocket transport needs the optional websocket-client package
+_TRANSPORTS = None if importlib.util.find_spec("websocket") else ["polling"]
+
+
+@dataclasses.dataclass
+class AnalysisRun:
+    """What one replayed analysis observed.
+
+    Attributes:
+        phases: Seconds from the POST to each phase reached.
+        status: HTTP status of ``/analyze``; 0 when it was not sent.
+        error: Why the analysis failed, or empty.
+        error_events: ``error`` events received.
+        llm_skipped: Whether ``llm_skipped`` arrived.
+    """
+
+    phases: Dict[str, float] = dataclasses.field(default_factory=dict)
+    status: int = 0
+    error: str = ""
+    error_events: int = 0
+    llm_skipped: bool = False
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the *pct* percentile of *values* by linear interpolation.
+
+    Args:
+        values: Samples; must not be empty.
+        pct: Percentile between 0 and 100.
+
+    Returns:
+        The interpolated percentile.
+    """
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def run_analysis(url: str, text: str, fmt: str, timeout: float) -> AnalysisRun:
+    """Replay one browser analysis and time its phases.
+
+    Args:
+        url: Base URL of the server.
+        text: Document text.
+        fmt: Format hint sent with the text.
+        timeout: Seconds to wait for ``analysis_complete`` after the POST.
+
+    Returns:
+        The observations of the run.
+    """
+    run = AnalysisRun()
+    done = threading.Event()
+    started = [0.0]
+    lock = threading.Lock()
+    client = socketio.Client(reconnection=False)
+
+    @client.on("*")
+    def on_event(event: str, *_args: Any) -> None:
+        with lock:
+            if not started[0]:
+                return
+            elapsed = time.perf_counter() - started[0]
+            if event in PHASES:
+                run.phases.setdefault(event, elapsed)
+            elif event == "error":
+                run.error_events += 1
+            elif event == "llm_skipped":
+                run.llm_skipped = True
+        if event == "analysis_complete":
+            done.set()
+
+    session_id = str(uuid.uuid4())
+    try:
+        client.connect(url, transports=_TRANSPORTS, wait_timeout=_CONNECT_TIMEOUT_SECONDS)
+        client.call("join_session", {"session_id": session_id}, timeout=_CONNECT_TIMEOUT_SECONDS)
+    except (socketio.exceptions.SocketIOError, OSError) as exc:
+        run.error = f"connect: {exc}"
+        client.disconnect()
+        return run
+
+    try:
+        with lock:
+            started[0] = time.perf_counter()
+        response = requests.post(f"{url}/api/v1/analyze", json={
+            "text": text,
+            "content_type": "concept",
+            "format_hint": fmt,
+            "session_id": session_id,
+        }, timeout=timeout)
+        with lock:
+            run.phases["response"] = time.perf_counter() - started[0]
+        run.status = response.status_code
+        if not response.ok:
+            run.error = f"http {response.status_code}"
+        elif not done.wait(max(0.0, timeout - run.phases["response"])):
+            run.error = "timeout"
+    except requests.RequestException as exc:
+        run.error = f"http: {type(exc).__name__}"
+    finally:
+        client.disconnect()
+    return run
+
+
+class HealthPoller:
+    """Samples ``/api/v1/health`` on a background thread.
+
+    Attributes:
+        samples: One dict per successful poll with ``blocks_pending``,
+            ``llm_calls_in_flight`` and ``shared_analyses``.
+        failures: Polls that failed.
+    """
+
+    def __init__(self, url: str, interval: float) -> None:
+        """Create the poller.
+
+        Args:
+            url: Base URL of the server.
+            interval: Seconds between polls.
+        """
+        self.samples: List[Dict[str, int]] = []
+        self.failures = 0
+        self._url = url
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll, name="health-poller", daemon=True)
+
+    def __enter__(self) -> "HealthPoller":
+        """Start polling."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Stop polling."""
+        self._stop.set()
+        self._thread.join()
+
+    def _poll(self) -> None:
+        """Poll until stopped."""
+        while not self._stop.wait(self._interval):
+            try:
+                data = requests.get(f"{self._url}/api/v1/health", timeout=self._interval * 10).json()
+            except (requests.RequestException, ValueError):
+                self.failures += 1
+                continue
+            queues = data.get("queues", {})
+            self.samples.append({
+                "blocks_pending": queues.get("blocks_pending", 0),
+                "llm_calls_in_flight": queues.get("llm_calls_in_flight", 0),
+                "shared_analyses": data.get("single_flight", {}).get("flights", 0),
+            })
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the mean and maximum of each sampled depth."""
+        report: Dict[str, Any] = {"samples": len(self.samples), "failures": self.failures}
+        for key in ("blocks_pending", "llm_calls_in_flight", "shared_analyses"):
+            values = [sample[key] for sample in self.samples] or [0]
+            report[key] = {"mean": sum(values) / len(values), "max": max(values)}
+        return report
+
+
+def stub_stats(stub_url: Optional[str]) -> Dict[str, Dict[str, int]]:
+    """Return the stub server's request counters, or {} without one."""
+    if not stub_url:
+        return {}
+    try:
+        return requests.get(f"{stub_url}/_stub/stats", timeout=10).json()["requests"]
+    except (requests.RequestException, ValueError, KeyError) as exc:
+        logger.warning("Could not read stub statistics: %s", exc)
+        return {}
+
+
+def _stats_delta(
+    before: Dict[str, Dict[str, int]], after: Dict[str, Dict[str, int]],
+) -> Dict[str, Dict[str, int]]:
+    """Subtract two stub counter snapshots."""
+    delta = {
+        route: {
+            outcome: count - before.get(route, {}).get(outcome, 0)
+            for outcome, count in outcomes.items()
+            if count > before.get(route, {}).get(outcome, 0)
+        }
+        for route, outcomes in after.items()
+    }
+    return {route: outcomes for route, outcomes in delta.items() if outcomes}
+
+
+def summarize(runs: Sequence[AnalysisRun], wall_seconds: float) -> Dict[str, Any]:
+    """Aggregate replayed analyses into percentiles and error rates.
+
+    Args:
+        runs: Observations of every analysis.
+        wall_seconds: Duration of the whole load.
+
+    Returns:
+        ``{"analyses", "wall_seconds", "throughput_per_minute",
+        "phases", "errors"}``; each phase lists how many runs reached
+        it and its percentiles in seconds, each error its count and
+        rate.
+    """
+    total = len(runs)
+    phases: Dict[str, Dict[str, float]] = {}
+    for phase in PHASES:
+        values = [run.phases[phase] for run in runs if phase in run.phases]
+        if not values:
+            continue
+        phases[phase] = {"count": len(values)}
+        for pct in PERCENTILES:
+            phases[phase][f"p{pct}"] = percentile(values, pct)
+
+    counts = {
+        "connect": sum(run.error.startswith("connect") for run in runs),
+        "http": sum(run.error.startswith("http") for run in runs),
+        "timeout": sum(run.error == "timeout" for run in runs),
+        "error_event": sum(run.error_events > 0 for run in runs),
+        "llm_skipped": sum(run.llm_skipped for run in runs),
+    }
+    counts["failed"] = sum(bool(run.error) for run in runs)
+    completed = sum("analysis_complete" in run.phases for run in runs)
+    return {
+        "analyses": total,
+        "wall_seconds": wall_seconds,
+        "throughput_per_minute": completed / wall_seconds * 60 if wall_seconds else 0.0,
+        "phases": phases,
+        "errors": {
+            name: {"count": count, "rate": count / total if total else 0.0}
+            for name, count in counts.items()
+        },
+    }
+
+
+def run_load(
+    url: str,
+    texts: Sequence[str],
+    fmt: str,
+    concurrency: int,
+    analyses: int,
+    timeout: float,
+    health_interval: float = 0.5,
+    stub_url: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Replay *analyses* analyses, *concurrency* at a time.
+
+    Args:
+        url: Base URL of the server.
+        texts: Documents, used in turn.
+        fmt: Their format.
+        concurrency: Analyses in flight at once.
+        analyses: Total analyses.
+        timeout: Seconds each analysis may take.
+        health_interval: Seconds between health polls.
+        stub_url: Base URL of the stub server, for its counters.
+
+    Returns:
+        The :func:`summarize` report with ``queues`` and ``stub`` added.
+    """
+    before = stub_stats(stub_url)
+    documents = itertools.cycle(texts)
+    with HealthPoller(url, health_interval) as poller, \
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load") as pool:
+        started = time.perf_counter()
+        futures = [
+            pool.submit(run_analysis, url, next(documents), fmt, timeout)
+            for _ in range(analyses)
+        ]
+        runs = [future.result() for future in futures]
+        wall = time.perf_counter() - started
+    report = summarize(runs, wall)
+    report["queues"] = poller.summary()
+    if stub_url:
+        report["stub"] = _stats_delta(before, stub_stats(stub_url))
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print the phase percentiles, queue depths and error rates."""
+    print(f"{report['analyses']} analyses in {report['wall_seconds']:.1f} s"
+          f" ({report['throughput_per_minute']:.1f} completed/min)")
+    print(f"{'phase':<24} {'n':>5} " + " ".join(f"{'p' + str(p):>9}" for p in PERCENTILES))
+    for phase, figures in report["phases"].items():
+        print(f"{phase:<24} {figures['count']:>5.0f} "
+              + " ".join(f"{figures['p' + str(p)]:8.2f}s" for p in PERCENTILES))
+    queues = report["queues"]
+    for key in ("blocks_pending", "llm_calls_in_flight", "shared_analyses"):
+        print(f"{key:<24} mean {queues[key]['mean']:.1f}  max {queues[key]['max']}")
+    print(f"{'errors':<24} " + ", ".join(
+        f"{name} {figures['count']} ({figures['rate']:.1%})"
+        for name, figures in report["errors"].items()
+    ))
+    for route, outcomes in report.get("stub", {}).items():
+        print(f"stub {route:<19} " + ", ".join(f"{k} {v}" for k, v in sorted(outcomes.items())))
+
+
+def main() -> None:
+    """Parse arguments, run the load and save the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8080")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--analyses", type=int, help="Total analyses (default: 5 per concurrent user)")
+    parser.add_argument("--format", choices=_TEXT_FORMATS, default="asciidoc")
+    parser.add_argument("--size", type=parse_size, default=parse_size("10k"),
+                        help="Document size, e.g. 10k")
+    parser.add_argument("--documents", type=int, default=5,
+                        help="Distinct documents; identical requests share one analysis")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--issue-density", type=float, default=0.1)
+    parser.add_argument("--timeout", type=float, default=600.0,
+                        help="Seconds each analysis may take")
+    parser.add_argument("--health-interval", type=float, default=0.5)
+    parser.add_argument("--stub-url", help="Stub server base URL, for its fault counters")
+    parser.add_argument("--output", type=Path, default=Path("load_results.json"))
+    args = parser.parse_args()
+    if args.concurrency < 1 or args.documents < 1:
+        parser.error("--concurrency and --documents must be at least 1")
+
+    logging.basicConfig(level=logging.WARNING)
+    texts = [
+        str(generate(args.format, args.size, args.seed + n, args.issue_density).content)
+        for n in range(args.documents)
+    ]
+    report = run_load(
+        args.url.rstrip("/"), texts, args.format, args.concurrency,
+        args.analyses or args.concurrency * 5, args.timeout, args.health_interval, args.stub_url,
+    )
+    report["meta"] = {
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "format": args.format,
+        "size": args.size,
+        "documents": args.documents,
+        "seed": args.seed,
+        "issue_density": args.issue_density,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    }
+    print_report(report)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"results: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Measure what slow-analysis profiling costs an analysis.
+
+Runs the ``pipeline`` stage (see :mod:`benchmarks.stages`) on corpus
+documents with profiling off and on, alternating so drift on the
+machine affects both alike, and reports the fastest run of each and
+the overhead.  With profiling on the threshold is 0, so every run is
+sampled and kept — the most expensive case.
+
+This script is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python -m benchmarks.profile_overhead --sizes 10k 100k --rounds 5
+    python -m benchmarks.profile_overhead --interval-ms 1
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator
+from unittest.mock import patch
+
+from app.config import Config
+from app.models.enums import FileType
+from app.services.analysis import slow_profiles
+from app.services.parsing import get_parser
+from benchmarks.corpus import BINARY_FORMATS, FORMATS, generate
+from benchmarks.run import _use_available_pipeline, parse_size
+from benchmarks.stages import analysis_input, run_pipeline
+
+
+@contextlib.contextmanager
+def profiling(interval_ms: float) -> Iterator[slow_profiles.SlowAnalysisProfiler]:
+    """Profile every analysis while active.
+
+    Args:
+        interval_ms: Milliseconds between samples.
+
+    Yields:
+        The profiler, which keeps every run.
+    """
+    profiler = slow_profiles.SlowAnalysisProfiler(threshold=0.0, interval=interval_ms / 1000)
+    with patch.object(Config, "SLOW_PROFILE_ENABLED", True), \
+            patch.object(slow_profiles, "_slow_profiler_instance", profiler):
+        yield profiler
+
+
+def measure_overhead(
+    fmt: str, size: int, rounds: int, interval_ms: float, seed: int = 1234,
+) -> Dict[str, Any]:
+    """Time the pipeline on one document with and without profiling.
+
+    Args:
+        fmt: Corpus format.
+        size: Document size in bytes of text.
+        rounds: Off/on pairs; the fastest run of each side counts.
+        interval_ms: Milliseconds between samples.
+        seed: Corpus seed.
+
+    Returns:
+        ``{"off_seconds", "on_seconds", "overhead", "samples"}``, where
+        ``overhead`` is the relative slowdown and ``samples`` the
+        most stacks recorded in one profiled run.
+    """
+    doc = generate(fmt, size, seed)
+    parsed = get_parser(FileType(fmt)).parse(str(doc.content))
+    text, file_type, blocks = analysis_input(doc, parsed)
+    run_pipeline(text, file_type, blocks, 1, 0.0)
+    off, on = [], []
+    samples = 0
+    for _ in range(rounds):
+        off.append(run_pipeline(text, file_type, blocks, 1, 0.0)["seconds"])
+        with profiling(interval_ms) as profiler:
+            on.append(run_pipeline(text, file_type, blocks, 1, 0.0)["seconds"])
+            captures = profiler.captures()
+        samples = max(samples, max((c.sample_count for c in captures), default=0))
+    best_off, best_on = min(off), min(on)
+    return {
+        "off_seconds": best_off,
+        "on_seconds": best_on,
+        "overhead": best_on / best_off - 1,
+        "samples": samples,
+    }
+
+
+def main() -> None:
+    """Parse arguments, measure and print the overhead per document."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--formats", nargs="+", default=["asciidoc"],
+                        choices=[fmt for fmt in FORMATS if fmt not in BINARY_FORMATS])
+    parser.add_argument("--sizes", nargs="+", type=parse_size,
+                        default=[parse_size(s) for s in ("10k", "100k")])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--interval-ms", type=float, default=Config.SLOW_PROFILE_INTERVAL_MS)
+    parser.add_argument("--output", type=Path, help="Also write the figures as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    _use_available_pipeline()
+    results = {}
+    for size in args.sizes:
+        for fmt in args.formats:
+            figures = measure_overhead(fmt, size, args.rounds, args.interval_ms)
+            results[f"{fmt}-{size}"] = figures
+            print(f"{fmt}-{size:<10} off {figures['off_seconds'] * 1000:9.1f} ms"
+                  f"  on {figures['on_seconds'] * 1000:9.1f} ms"
+                  f"  overhead {figures['overhead']:+.1%}  ({figures['samples']} samples)")
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Run the benchmark suite and compare it with a stored baseline.
+
+Generates the corpus for every requested format and size, runs the
+stages (see :mod:`benchmarks.stages`), prints a table, and saves the
+figures as JSON.  When a baseline file exists, each stage's time and
+peak memory are compared with it; the run exits non-zero if any of them
+grew by more than the tolerance (and by more than a small absolute
+noise floor, so sub-millisecond stages do not flap).
+
+Timings depend on the machine: record the baseline on the machine that
+runs the comparison (``--update-baseline``).  Uses ``SPACY_MODEL`` when
+it is installed, otherwise a blank English pipeline with a sentencizer;
+the pipeline used is stored with the results.
+
+This script is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python -m benchmarks.run --sizes 1k 100k 5m --formats asciidoc pdf
+    python -m benchmarks.run --update-baseline
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import platform
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import spacy
+
+from app.config import Config
+from app.extensions import get_nlp, set_nlp
+from benchmarks.corpus import FORMATS, generate
+from benchmarks.stages import STAGES, run_document
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Metrics compared with the baseline, and the smallest growth that counts
+_NOISE_FLOORS: Dict[str, float] = {
+    "seconds": 0.005,
+    "first_response_seconds": 0.005,
+    "peak_mb": 0.25,
+}
+
+_SIZE_RE = re.compile(r"^(\d+)([km]?)$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024 * 1024}
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as ``512``, ``10k`` or ``5m`` into bytes.
+
+    Args:
+        value: Size with an optional ``k`` or ``m`` suffix.
+
+    Returns:
+        Size in bytes.
+
+    Raises:
+        argparse.ArgumentTypeError: If *value* is not a size.
+    """
+    match = _SIZE_RE.match(value.strip())
+    if not match or int(match.group(1)) == 0:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}")
+    return int(match.group(1)) * _SIZE_UNITS[match.group(2).lower()]
+
+
+def run_suite(
+    formats: Sequence[str],
+    sizes: Sequence[int],
+    stages: Sequence[str],
+    seed: int = 1234,
+    issue_density: float = 0.1,
+    repeats: int = 3,
+    llm_latency: float = 0.0,
+) -> Dict[str, Any]:
+    """Benchmark every format at every size.
+
+    Args:
+        formats: Corpus formats.
+        sizes: Document sizes in bytes of text.
+        stages: Stage names to report.
+        seed: Corpus seed.
+        issue_density: Fraction of sentences carrying a planted issue.
+        repeats: Timed runs per stage.
+        llm_latency: Stub LLM latency per call, in seconds.
+
+    Returns:
+        Results document with ``meta`` and per-document ``results``.
+    """
+    # Load the rules and fill import-time caches before timing anything
+    run_document(generate(FORMATS[0], 1024, seed, issue_density), tuple(stages), 1, 0.0)
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for size in sizes:
+        for fmt in formats:
+            doc = generate(fmt, size, seed, issue_density)
+            results[doc.name] = run_document(doc, tuple(stages), repeats, llm_latency)
+            print_document(doc.name, results[doc.name])
+    return {
+        "meta": {
+            "seed": seed,
+            "issue_density": issue_density,
+            "repeats": repeats,
+            "llm_latency": llm_latency,
+            "spacy_pipeline": get_nlp().meta.get("name", ""),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float,
+) -> List[str]:
+    """List the figures in *current* that regressed against *baseline*.
+
+    Documents and stages missing from either side are skipped.
+
+    Args:
+        current: Results of this run.
+        baseline: Stored baseline results.
+        tolerance: Allowed relative growth, e.g. ``0.25`` for 25%.
+
+    Returns:
+        One line per regression; empty if none.
+    """
+    regressions: List[str] = []
+    base_results = baseline.get("results", {})
+    for name, stages in current.get("results", {}).items():
+        for stage, figures in stages.items():
+            base_figures = base_results.get(name, {}).get(stage)
+            if base_figures is None:
+                continue
+            for metric, floor in _NOISE_FLOORS.items():
+                if metric not in figures or metric not in base_figures:
+                    continue
+                old, new = base_figures[metric], figures[metric]
+                if new > old * (1 + tolerance) and new - old > floor:
+                    growth = (new / old - 1) * 100 if old else float("inf")
+                    regressions.append(
+                        f"{name} {stage} {metric}: {old:.4f} -> {new:.4f} (+{growth:.0f}%)"
+                    )
+    return regressions
+
+
+def print_document(name: str, stages: Dict[str, Dict[str, float]]) -> None:
+    """Print one table row per stage of a document."""
+    for stage, figures in stages.items():
+        line = (f"{name:<18} {stage:<10} {figures['seconds'] * 1000:10.1f} ms"
+                f" {figures['peak_mb']:9.1f} MB peak")
+        if "first_response_seconds" in figures:
+            line += (f"  first response {figures['first_response_seconds'] * 1000:.1f} ms,"
+                     f" {figures['llm_calls']:.0f} LLM calls")
+        print(line)
+
+
+def _use_available_pipeline() -> None:
+    """Use the configured spaCy model, or a blank pipeline without it."""
+    if spacy.util.is_package(Config.SPACY_MODEL):
+        return
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    set_nlp(nlp)
+
+
+def main() -> None:
+    """Parse arguments, run the suite, save and compare the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--sizes", nargs="+", type=parse_size,
+                        default=[parse_size(s) for s in ("1k", "10k", "100k")],
+                        help="Document sizes, e.g. 1k 100k 5m")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--issue-density", type=float, default=0.1,
+                        help="Fraction of sentences carrying a planted issue")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--llm-latency", type=float, default=0.0,
+                        help="Stub LLM seconds per call")
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative growth before a figure counts as a regression")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the results to the baseline file instead of comparing")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    _use_available_pipeline()
+    results = run_suite(
+        args.formats, args.sizes, args.stages, args.seed,
+        args.issue_density, args.repeats, args.llm_latency,
+    )
+    args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    print(f"results: {args.output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline updated: {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline to record one")
+        return
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    for key in ("seed", "issue_density", "spacy_pipeline"):
+        if baseline.get("meta", {}).get(key) != results["meta"][key]:
+            print(f"warning: baseline {key} differs"
+                  f" ({baseline.get('meta', {}).get(key)!r} vs {results['meta'][key]!r})")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        sys.exit("Regressions beyond {:.0%}:\n  {}".format(args.tolerance, "\n  ".join(regressions)))
+    print(f"no regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
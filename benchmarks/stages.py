@@ -0,0 +1,243 @@
+"""Per-stage timing and peak memory for one corpus document.
+
+Stages, in pipeline order:
+
+``parse``
+    The format's parser (``get_parser(...).parse``), given the text, or
+    the file path for DOCX and PDF.
+``preprocess``
+    ``preprocess()`` on the text the analysis sees: the document itself,
+    or the parser's plain text for DOCX and PDF (the upload flow sends
+    that to ``/api/v1/analyze``, which sniffs and parses it again).
+``rules``
+    The deterministic pass over the whole text (``RulesRegistry.analyze``
+    through ``deterministic.analyze``).
+``merge``
+    ``merger.merge`` of the deterministic issues with an LLM tier built
+    from them, half duplicates and half at shifted spans.
+``pipeline``
+    ``orchestrator.analyze`` end to end with the stub LLM provider and
+    LanguageTool off, until ``analysis_complete``; also records when
+    the deterministic response was returned.
+
+Each stage is timed *repeats* times and the fastest run is reported
+(the least disturbed by the rest of the machine), then run once more
+under ``tracemalloc`` for its peak, so tracing does not slow the timed
+runs.
+"""
+
+import dataclasses
+import gc
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from app.config import Config
+from app.models.enums import FileType
+from app.models.schemas import IssueResponse
+from app.services.analysis import orchestrator, single_flight
+from app.services.analysis.deterministic import analyze as run_deterministic
+from app.services.analysis.merger import merge
+from app.services.analysis.preprocessor import preprocess
+from app.services.parsing import get_parser
+from app.services.parsing.base import ParseResult
+from app.services.parsing.sniffer import sniff
+from benchmarks.corpus import BINARY_FORMATS, CorpusDocument
+from benchmarks.stub_llm import stub_llm
+
+STAGES: Tuple[str, ...] = ("parse", "preprocess", "rules", "merge", "pipeline")
+
+_CONTENT_TYPE = "concept"
+
+# Longest wait for the background phases of one pipeline run
+_PIPELINE_TIMEOUT_SECONDS = 1800.0
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def measure(
+    func: Callable[[], Any],
+    repeats: int,
+    reset: Optional[Callable[[], None]] = None,
+) -> Tuple[Dict[str, float], Any]:
+    """Time *func* and record its peak traced allocation.
+
+    Args:
+        func: The stage to run.
+        repeats: Timed runs; the fastest is reported.
+        reset: Called before every run to drop state a previous run
+            left behind (e.g. result caches).
+
+    Returns:
+        Tuple of (``{"seconds", "peak_mb"}``, result of the last run).
+    """
+    times: List[float] = []
+    result: Any = None
+    for _ in range(max(repeats, 1)):
+        if reset is not None:
+            reset()
+        gc.collect()
+        started = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - started)
+    if reset is not None:
+        reset()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(times), "peak_mb": peak / _BYTES_PER_MB}, result
+
+
+def run_document(
+    doc: CorpusDocument,
+    stages: Tuple[str, ...] = STAGES,
+    repeats: int = 3,
+    llm_latency: float = 0.0,
+) -> Dict[str, Dict[str, float]]:
+    """Run the selected *stages* on *doc*.
+
+    Later stages take their input from earlier ones, which run once
+    untimed when not selected; the pipeline stage runs only if selected.
+
+    Args:
+        doc: The corpus document.
+        stages: Stage names to report, from :data:`STAGES`.
+        repeats: Timed runs per stage.
+        llm_latency: Stub LLM latency per call, in seconds.
+
+    Returns:
+        Mapping of stage name to its figures.
+    """
+    report: Dict[str, Dict[str, float]] = {}
+
+    def stage(name: str, func: Callable[[], Any]) -> Any:
+        if name not in stages:
+            return func()
+        report[name], result = measure(func, repeats)
+        return result
+
+    with tempfile.TemporaryDirectory(prefix="cea-bench-") as tmp:
+        source = str(doc.write(Path(tmp))) if doc.format in BINARY_FORMATS else doc.content
+        parser = get_parser(FileType(doc.format))
+        parsed = stage("parse", lambda: parser.parse(source))
+        text, file_type, blocks = analysis_input(doc, parsed)
+        prep = stage("preprocess", lambda: preprocess(text, blocks, file_type))
+        det_issues = stage("rules", lambda: run_deterministic(
+            prep["text"], prep["sentences"], prep["spacy_doc"], content_type=_CONTENT_TYPE,
+        ))
+        llm_issues = llm_tier(det_issues)
+        stage("merge", lambda: merge(
+            det_issues, llm_issues, Config.CONFIDENCE_THRESHOLD, blocks=blocks, lt_issues=[],
+        ))
+        if "pipeline" in stages:
+            report["pipeline"] = run_pipeline(text, file_type, blocks, repeats, llm_latency)
+    return {name: report[name] for name in stages}
+
+
+def analysis_input(doc: CorpusDocument, parsed: ParseResult) -> Tuple[str, str, list]:
+    """Return the text, file type and blocks ``/api/v1/analyze`` receives.
+
+    Args:
+        doc: The corpus document.
+        parsed: Its parse result.
+
+    Returns:
+        Tuple of (text, file type value, blocks).
+    """
+    if doc.format not in BINARY_FORMATS:
+        return str(doc.content), doc.format, parsed.blocks
+    text = parsed.plain_text
+    file_type = sniff(text).file_type
+    return text, file_type.value, get_parser(file_type).parse(text, None).blocks
+
+
+def llm_tier(det_issues: List[IssueResponse]) -> List[IssueResponse]:
+    """Build LLM-sourced issues overlapping the deterministic ones.
+
+    Every other issue repeats a deterministic finding (merged away as a
+    duplicate); the rest are moved past their original span.
+
+    Args:
+        det_issues: Deterministic issues.
+
+    Returns:
+        The synthetic LLM issues.
+    """
+    issues = []
+    for n, issue in enumerate(det_issues):
+        shift = 0 if n % 2 == 0 else issue.span[1] - issue.span[0] + 1
+        issues.append(dataclasses.replace(
+            issue, id=str(uuid.uuid4()), source="llm", confidence=0.9,
+            span=[issue.span[0] + shift, issue.span[1] + shift],
+        ))
+    return issues
+
+
+def run_pipeline(
+    text: str,
+    file_type: str,
+    blocks: list,
+    repeats: int,
+    llm_latency: float,
+) -> Dict[str, float]:
+    """Time ``orchestrator.analyze`` through to ``analysis_complete``.
+
+    Args:
+        text: Analysis input text.
+        file_type: File type value.
+        blocks: Parsed blocks.
+        repeats: Timed runs.
+        llm_latency: Stub LLM latency per call, in seconds.
+
+    Returns:
+        ``{"seconds", "first_response_seconds", "peak_mb", "llm_calls"}``,
+        where ``llm_calls`` is the number of completions per run.
+    """
+    completed: Dict[str, threading.Event] = {}
+    first_response: List[float] = []
+
+    def record_event(_sid: Optional[str], event: str, data: Dict[str, Any]) -> None:
+        done = completed.get(data.get("session_id", ""))
+        if event == "analysis_complete" and done is not None:
+            done.set()
+
+    def analyze() -> None:
+        session_id = str(uuid.uuid4())
+        completed[session_id] = threading.Event()
+        started = time.perf_counter()
+        orchestrator.analyze(text, _CONTENT_TYPE, file_type=file_type,
+                             session_id=session_id, blocks=blocks)
+        first_response.append(time.perf_counter() - started)
+        finished = completed[session_id].wait(_PIPELINE_TIMEOUT_SECONDS)
+        del completed[session_id]
+        if not finished:
+            raise RuntimeError("Analysis did not complete within the timeout")
+
+    with stub_llm(llm_latency) as manager, \
+            patch.object(Config, "LLM_ENABLED", True), \
+            patch.object(Config, "LANGUAGETOOL_ENABLED", False), \
+            patch.object(single_flight, "_single_flight_instance",
+                         single_flight.SingleFlight(result_ttl=0)), \
+            patch.object(orchestrator, "_emit_event", record_event):
+        figures, _ = measure(analyze, repeats, reset=clear_analysis_caches)
+        runs = len(first_response)
+        calls = manager.calls
+    figures["first_response_seconds"] = min(first_response[:-1] or first_response)
+    figures["llm_calls"] = calls / runs
+    return figures
+
+
+def clear_analysis_caches() -> None:
+    """Drop the orchestrator's per-block result caches."""
+    with orchestrator._det_block_cache_lock:
+        orchestrator._det_block_cache.clear()
+    with orchestrator._block_cache_lock:
+        orchestrator._block_cache.clear()
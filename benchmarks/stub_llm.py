@@ -0,0 +1,115 @@
+"""A local stand-in for the LLM provider.
+
+:func:`stub_llm` swaps the ``ModelManager`` behind ``app.llm.client``
+for :class:`StubModelManager`, so prompt building, response parsing,
+the judge and the orchestrator's parallel block dispatch all run as in
+production while every completion is answered in-process: analysis
+prompts get one issue per planted phrase (see
+:data:`benchmarks.corpus.ISSUE_PHRASES`) found in the prompt, the judge
+keeps everything.  An optional per-call latency models a remote model.
+:func:`completion` gives the same answers to the HTTP stub in
+:mod:`benchmarks.stub_server`.
+"""
+
+import contextlib
+import json
+import threading
+import time
+from typing import Iterator
+from unittest.mock import patch
+
+from app.llm import client as llm_client
+from benchmarks.corpus import ISSUE_PHRASES
+
+# Opening of the judge's system prompt (see build_judge_prompt)
+_JUDGE_PROMPT_PREFIX = "You are reviewing editorial flags"
+
+# Upper bound on issues reported per completion
+_MAX_ISSUES_PER_CALL = 5
+
+
+def completion(prompt: str, system_prompt: str = "") -> str:
+    """Return the canned JSON completion for a prompt.
+
+    Args:
+        prompt: The user prompt.
+        system_prompt: The system prompt; the judge's gets the judge
+            response.
+
+    Returns:
+        A JSON response in the shape the client parses.
+    """
+    if system_prompt.startswith(_JUDGE_PROMPT_PREFIX):
+        return json.dumps({"keep": [], "drop": []})
+    issues = [
+        {
+            "flagged_text": phrase.strip(),
+            "message": f"Avoid '{phrase.strip()}' in technical documentation.",
+            "severity": "low",
+            "category": "style",
+            "confidence": 0.9,
+            "suggestions": [],
+        }
+        for phrase in ISSUE_PHRASES if phrase in prompt
+    ]
+    return json.dumps({"issues": issues[:_MAX_ISSUES_PER_CALL]})
+
+
+class StubModelManager:
+    """Answers ``generate_text`` calls without a provider.
+
+    Attributes:
+        latency: Seconds to sleep per call.
+        calls: Number of completions served.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Create the stub.
+
+        Args:
+            latency: Seconds to sleep per call.
+        """
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        """Report the provider as available."""
+        return True
+
+    def generate_text(self, prompt: str, **kwargs: object) -> str:
+        """Return a canned JSON completion for *prompt*.
+
+        Args:
+            prompt: The user prompt.
+            **kwargs: Provider parameters; ``system_prompt`` selects
+                the judge response.
+
+        Returns:
+            A JSON response in the shape the client parses.
+        """
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return completion(prompt, str(kwargs.get("system_prompt", "")))
+
+
+@contextlib.contextmanager
+def stub_llm(latency: float = 0.0) -> Iterator[StubModelManager]:
+    """Route all LLM calls to a :class:`StubModelManager` while active.
+
+    Args:
+        latency: Seconds to sleep per call.
+
+    Yields:
+        The stub, whose ``calls`` counter the caller may read.
+    """
+    manager = StubModelManager(latency)
+    with patch.object(llm_client, "_model_manager_instance", manager), \
+            patch.object(llm_client, "_client_instance", None):
+        try:
+            yield manager
+        finally:
+            if llm_client._client_instance is not None:
+                llm_client._client_instance._executor.shutdown(wait=False)
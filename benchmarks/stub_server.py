@@ -0,0 +1,462 @@
+"""A local HTTP stand-in for the model providers and LanguageTool.
+
+Serves the wire formats the providers in ``models/providers`` speak, so
+a real deployment (gunicorn, gevent workers, provider HTTP clients,
+retries, timeouts) can run under load without a model:
+
+``GET /v1/models``, ``GET /models``
+    Model list for the API provider's connection check and the
+    LlamaStack client (items carry both ``id`` and ``identifier``).
+``POST /v1/chat/completions``, ``POST /chat/completions``,
+``POST /v1/openai/v1/chat/completions``
+    OpenAI-compatible chat completions (API and LlamaStack providers).
+``GET /api/tags``, ``POST /api/chat``
+    Ollama's model list and chat endpoint.
+``POST /v2/check``
+    LanguageTool: one style match per planted phrase in the text.
+``GET /_stub/stats``
+    Requests served per route and outcome, as JSON.
+
+Completions are the canned answers of :func:`benchmarks.stub_llm.completion`.
+A :class:`Profile` adds latency, errors, hangs past the client timeout
+and truncated completions (``finish_reason: "length"`` with the JSON
+cut in half).  Each request's fate is drawn from a generator seeded
+with the profile seed, the request body and how often that body was
+seen, so a replay of the same requests meets the same faults however
+the concurrent requests interleave, and a retried request can
+succeed.
+
+Point the application at it with, e.g. for the API provider::
+
+    MODEL_PROVIDER=api BASE_URL=http://localhost:8089/v1 MODEL_ID=stub-model
+    ACCESS_TOKEN=stub LANGUAGETOOL_ENABLED=true
+    LANGUAGETOOL_URL=http://localhost:8089
+
+(``MODEL_PROVIDER=ollama`` with ``BASE_URL=http://localhost:8089``, or
+``MODEL_PROVIDER=llamastack`` with
+``LIGHTRAIL_LLAMA_STACK_BASE_URL=http://localhost:8089``, for the others).
+
+This script is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python -m benchmarks.stub_server --profile realistic --port 8089
+    python -m benchmarks.stub_server --latency 2 --error-rate 0.05 --truncate-rate 0.1
+"""
+
+import argparse
+import collections
+import dataclasses
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from benchmarks.corpus import ISSUE_PHRASES
+from benchmarks.stub_llm import completion
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "stub-model"
+
+# Status codes of injected errors: server error, overload, rate limit
+_ERROR_STATUSES: Tuple[int, ...] = (500, 503, 429)
+
+_CHAT_PATHS = frozenset({
+    "/v1/chat/completions", "/chat/completions", "/v1/openai/v1/chat/completions",
+})
+_MODELS_PATHS = frozenset({"/v1/models", "/models", "/v1/openai/v1/models"})
+
+_WORD_RE = re.compile(r"\S+")
+
+
+@dataclasses.dataclass(frozen=True)
+class Profile:
+    """How the stub misbehaves.
+
+    Rates are fractions of chat requests; they are drawn in the order
+    error, hang, truncation, so their sum must not exceed 1.
+
+    Attributes:
+        latency: Mean seconds per completion.
+        jitter: Spread of the latency as a fraction of it (uniform).
+        error_rate: Fraction answered with HTTP 500, 503 or 429.
+        timeout_rate: Fraction that hang for ``hang_seconds`` first.
+        hang_seconds: How long a hung request waits; longer than the
+            provider timeout makes it a client-side timeout.
+        truncate_rate: Fraction whose completion is cut in half.
+        lt_latency: Seconds per LanguageTool check.
+        seed: Seed of the fault draws.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    hang_seconds: float = 120.0
+    truncate_rate: float = 0.0
+    lt_latency: float = 0.0
+    seed: int = 1234
+
+    def __post_init__(self) -> None:
+        """Validate the rates.
+
+        Raises:
+            ValueError: If a rate is outside 0-1 or they sum past 1.
+        """
+        rates = (self.error_rate, self.timeout_rate, self.truncate_rate)
+        if any(rate < 0 or rate > 1 for rate in rates) or sum(rates) > 1:
+            raise ValueError("fault rates must lie in 0-1 and sum to at most 1")
+        if self.latency < 0 or self.jitter < 0 or self.lt_latency < 0:
+            raise ValueError("latencies must not be negative")
+
+
+PROFILES: Dict[str, Profile] = {
+    "fast": Profile(),
+    "realistic": Profile(latency=1.5, jitter=0.5, lt_latency=0.2),
+    "flaky": Profile(
+        latency=1.5, jitter=0.5, lt_latency=0.2,
+        error_rate=0.05, timeout_rate=0.02, truncate_rate=0.05,
+    ),
+}
+
+
+class StubState:
+    """Fault draws and counters shared by the request handlers.
+
+    Attributes:
+        profile: The active profile.
+        model: Model name the model lists report.
+    """
+
+    def __init__(self, profile: Profile, model: str = DEFAULT_MODEL) -> None:
+        """Create the state.
+
+        Args:
+            profile: The active profile.
+            model: Model name the model lists report.
+        """
+        self.profile = profile
+        self.model = model
+        self._lock = threading.Lock()
+        self._seen: Dict[str, int] = collections.Counter()
+        self._stats: Dict[str, Dict[str, int]] = collections.defaultdict(collections.Counter)
+
+    def draw(self, body: bytes) -> Tuple[str, float, int]:
+        """Decide the fate of a chat request.
+
+        Args:
+            body: The raw request body.
+
+        Returns:
+            Tuple of (outcome, latency in seconds, error status), where
+            outcome is ``ok``, ``error``, ``hang`` or ``truncated``.
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            occurrence = self._seen[digest]
+            self._seen[digest] += 1
+        profile = self.profile
+        rng = random.Random(f"{profile.seed}:{digest}:{occurrence}")
+        latency = max(0.0, profile.latency * (1 + profile.jitter * rng.uniform(-1, 1)))
+        roll = rng.random()
+        if roll < profile.error_rate:
+            return "error", latency, rng.choice(_ERROR_STATUSES)
+        roll -= profile.error_rate
+        if roll < profile.timeout_rate:
+            return "hang", latency, 0
+        roll -= profile.timeout_rate
+        if roll < profile.truncate_rate:
+            return "truncated", latency, 0
+        return "ok", latency, 0
+
+    def record(self, route: str, outcome: str) -> None:
+        """Count a served request."""
+        with self._lock:
+            self._stats[route][outcome] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return requests served per route and outcome."""
+        with self._lock:
+            return {route: dict(counts) for route, counts in self._stats.items()}
+
+
+def _messages(payload: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the (system prompt, user prompt) of a chat payload."""
+    system, user = "", ""
+    for message in payload.get("messages") or []:
+        content = message.get("content", "")
+        if isinstance(content, list):
+            content = "".join(part.get("text", "") for part in content if isinstance(part, dict))
+        if message.get("role") == "system":
+            system = str(content)
+        elif message.get("role") == "user":
+            user = str(content)
+    return system, user
+
+
+def _count_tokens(text: str) -> int:
+    """Estimate a token count from whitespace-separated words."""
+    return len(_WORD_RE.findall(text))
+
+
+def languagetool_matches(text: str) -> List[Dict[str, Any]]:
+    """Build LanguageTool matches for the planted phrases in *text*.
+
+    Args:
+        text: The checked text.
+
+    Returns:
+        Matches in LanguageTool's ``/v2/check`` shape, with UTF-16
+        offsets and lengths.
+    """
+    matches = []
+    for phrase in ISSUE_PHRASES:
+        word = phrase.strip()
+        start = text.find(word)
+        while start >= 0:
+            matches.append({
+                "message": f"Consider rephrasing '{word}'.",
+                "shortMessage": "Style",
+                "replacements": [],
+                "offset": len(text[:start].encode("utf-16-le")) // 2,
+                "length": len(word.encode("utf-16-le")) // 2,
+                "context": {"text": text[max(0, start - 20):start + len(word) + 20]},
+                "sentence": text[max(0, text.rfind(".", 0, start) + 1):start + len(word)].strip(),
+                "type": {"typeName": "Other"},
+                "rule": {
+                    "id": "STUB_PLANTED_PHRASE",
+                    "description": "Planted benchmark phrase",
+                    "issueType": "style",
+                    "category": {"id": "STYLE", "name": "Style"},
+                },
+            })
+            start = text.find(word, start + len(word))
+    matches.sort(key=lambda match: match["offset"])
+    return matches
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Routes requests to the provider and LanguageTool stand-ins."""
+
+    server: "StubServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Log requests at debug level instead of to stderr."""
+        logger.debug("%s " + format, self.address_string(), *args)
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Serve model lists and stub statistics."""
+        state = self.server.state
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path in _MODELS_PATHS:
+            state.record("models", "ok")
+            self._send_json(200, {"object": "list", "data": [{
+                "id": state.model,
+                "identifier": state.model,
+                "object": "model",
+                "owned_by": "stub",
+                "provider_id": "stub",
+                "provider_resource_id": state.model,
+                "model_type": "llm",
+                "metadata": {},
+            }]})
+        elif path == "/api/tags":
+            state.record("tags", "ok")
+            self._send_json(200, {"models": [{"name": state.model, "model": state.model}]})
+        elif path == "/_stub/stats":
+            self._send_json(200, {"profile": dataclasses.asdict(state.profile), "requests": state.stats()})
+        else:
+            self._send_json(404, {"error": f"no route {path}"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Serve chat completions and LanguageTool checks."""
+        path = self.path.split("?", 1)[0].rstrip("/")
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if path in _CHAT_PATHS:
+            self._chat(body, ollama=False)
+        elif path == "/api/chat":
+            self._chat(body, ollama=True)
+        elif path == "/v2/check":
+            self._check(body)
+        else:
+            self._send_json(404, {"error": f"no route {path}"})
+
+    def _chat(self, body: bytes, ollama: bool) -> None:
+        """Answer a chat request according to the profile."""
+        state = self.server.state
+        route = "ollama_chat" if ollama else "chat"
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            state.record(route, "bad_request")
+            self._send_json(400, {"error": "request body is not JSON"})
+            return
+        outcome, latency, status = state.draw(body)
+        state.record(route, outcome)
+        if outcome == "hang":
+            time.sleep(state.profile.hang_seconds)
+        time.sleep(latency)
+        if outcome == "error":
+            self._send_json(status, {"error": {"message": f"stub injected {status}", "code": status}})
+            return
+
+        system, prompt = _messages(payload)
+        content = completion(prompt, system)
+        finish_reason = "stop"
+        if outcome == "truncated":
+            content, finish_reason = content[:len(content) // 2], "length"
+        prompt_tokens = _count_tokens(system) + _count_tokens(prompt)
+        completion_tokens = _count_tokens(content)
+        model = payload.get("model") or state.model
+        if ollama:
+            self._send_json(200, {
+                "model": model,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "message": {"role": "assistant", "content": content},
+                "done": True,
+                "done_reason": finish_reason,
+                "prompt_eval_count": prompt_tokens,
+                "eval_count": completion_tokens,
+            })
+            return
+        self._send_json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason,
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+    def _check(self, body: bytes) -> None:
+        """Answer a LanguageTool ``/v2/check`` request."""
+        state = self.server.state
+        form = parse_qs(body.decode("utf-8"), keep_blank_values=True)
+        text = (form.get("text") or [""])[0]
+        state.record("languagetool", "ok")
+        if state.profile.lt_latency:
+            time.sleep(state.profile.lt_latency)
+        self._send_json(200, {
+            "software": {"name": "LanguageTool", "version": "stub"},
+            "language": {"code": (form.get("language") or ["en-US"])[0]},
+            "matches": languagetool_matches(text),
+        })
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        """Write a JSON response, ignoring clients that went away."""
+        encoded = json.dumps(data).encode("utf-8")
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client closed the connection before the response")
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying the shared :class:`StubState`.
+
+    Attributes:
+        state: Fault draws and counters.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], state: StubState) -> None:
+        """Bind the server.
+
+        Args:
+            address: ``(host, port)``; port 0 picks a free port.
+            state: Fault draws and counters.
+        """
+        super().__init__(address, StubHandler)
+        self.state = state
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start(
+    profile: Optional[Profile] = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    model: str = DEFAULT_MODEL,
+) -> StubServer:
+    """Start a stub server on a background thread.
+
+    Args:
+        profile: The fault profile; well-behaved when None.
+        host: Interface to bind.
+        port: Port to bind; 0 picks a free port.
+        model: Model name the model lists report.
+
+    Returns:
+        The running server; call ``shutdown()`` to stop it.
+    """
+    server = StubServer((host, port), StubState(profile or Profile(), model))
+    threading.Thread(target=server.serve_forever, name="stub-server", daemon=True).start()
+    return server
+
+
+def main() -> None:
+    """Parse arguments and serve until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="fast",
+                        help="Starting point for the options below")
+    parser.add_argument("--latency", type=float, help="Mean seconds per completion")
+    parser.add_argument("--jitter", type=float, help="Latency spread as a fraction of it")
+    parser.add_argument("--error-rate", type=float, help="Fraction answered with 500/503/429")
+    parser.add_argument("--timeout-rate", type=float, help="Fraction that hang first")
+    parser.add_argument("--hang-seconds", type=float, help="How long a hung request waits")
+    parser.add_argument("--truncate-rate", type=float, help="Fraction cut off mid-JSON")
+    parser.add_argument("--lt-latency", type=float, help="Seconds per LanguageTool check")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    overrides = {
+        field.name: getattr(args, field.name)
+        for field in dataclasses.fields(Profile)
+        if getattr(args, field.name) is not None
+    }
+    try:
+        profile = dataclasses.replace(PROFILES[args.profile], **overrides)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    logging.basicConfig(level=logging.INFO)
+    server = StubServer((args.host, args.port), StubState(profile, args.model))
+    print(f"stub serving {server.url} with {profile}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,443 @@
+"""
+Cooperative Cancellation
+Tokens that let superseded analyses drop queued LLM work and abort
+in-flight HTTP requests.
+
+A ``CancellationToken`` is created per analysis run and handed down to
+every LLM call.  Work checks ``token.cancelled`` (or calls
+``raise_if_cancelled()``) before it starts; HTTP clients created with
+``cancellable_session()`` or ``cancellable_httpx_transport()`` register
+their sockets with the token, and ``cancel()`` shuts those sockets
+down so a blocked read returns immediately instead of waiting for the
+model to finish generating.  The provider then raises
+``OperationCancelled``.
+
+``CancellationStats`` counts cancelled analyses, dropped and aborted
+calls, and an estimate of the LLM tokens that cancellation saved.
+"""
+
+import logging
+import socket
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used for saved-token estimates.
+_CHARS_PER_TOKEN = 4
+
+
+class OperationCancelled(Exception):
+    """Raised when work is abandoned because its token was cancelled.
+
+    Deliberately not a ``ConnectionError``/``RuntimeError`` subclass so
+    retry policies and fail-open handlers do not treat it as a
+    transient failure.
+    """
+
+
+class CancellationToken:
+    """Thread-safe, one-shot cancellation signal with callbacks.
+
+    Attributes:
+        reason: Why the token was cancelled (empty until cancelled).
+    """
+
+    def __init__(self) -> None:
+        """Create an uncancelled token."""
+        self.reason: str = ""
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether ``cancel()`` has been called."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """Cancel the token and run registered callbacks.
+
+        Args:
+            reason: Short description recorded on the token.
+
+        Returns:
+            True if this call cancelled the token, False if it was
+            already cancelled.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            _run_callback(callback)
+        logger.debug("Cancellation token fired: %s", reason)
+        return True
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run *callback* when the token is cancelled.
+
+        Runs immediately when the token is already cancelled.
+
+        Args:
+            callback: Zero-argument callable; exceptions are logged.
+
+        Returns:
+            A function that unregisters the callback.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        _run_callback(callback)
+        return lambda: None
+
+    def raise_if_cancelled(self) -> None:
+        """Raise OperationCancelled when the token has been cancelled.
+
+        Raises:
+            OperationCancelled: If the token is cancelled.
+        """
+        if self._event.is_set():
+            raise OperationCancelled(self.reason)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or *timeout* elapses.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if the token is cancelled.
+        """
+        return self._event.wait(timeout)
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister *callback* if it has not run yet."""
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+
+def _run_callback(callback: Callable[[], None]) -> None:
+    """Run a cancellation callback, logging instead of raising."""
+    try:
+        callback()
+    except Exception as exc:  # noqa: BLE001 — callbacks must not break cancel()
+        logger.warning("Cancellation callback failed: %s", exc)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the LLM token count of *text*.
+
+    Args:
+        text: Prompt or document text.
+
+    Returns:
+        Approximate token count (at least 1 for non-empty text).
+    """
+    if not text:
+        return 0
+    return max(1, len(text) // _CHARS_PER_TOKEN)
+
+
+# ---------------------------------------------------------------------------
+# Socket tracking
+# ---------------------------------------------------------------------------
+
+
+class _SocketTracker:
+    """Sockets opened on behalf of one token, shut down on cancel."""
+
+    def __init__(self, token: CancellationToken) -> None:
+        self._token = token
+        self._lock = threading.Lock()
+        self._sockets: List[Any] = []
+
+    def add(self, sock: Any) -> None:
+        """Track *sock*; shuts it down at once if already cancelled."""
+        if sock is None:
+            return
+        with self._lock:
+            self._sockets.append(sock)
+        if self._token.cancelled:
+            self.abort()
+
+    def abort(self) -> None:
+        """Shut down every tracked socket, waking blocked reads."""
+        with self._lock:
+            sockets, self._sockets = self._sockets, []
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if sockets:
+            logger.debug("Aborted %d in-flight connection(s)", len(sockets))
+
+
+# ---------------------------------------------------------------------------
+# requests
+# ---------------------------------------------------------------------------
+
+
+def _tracked_connection_classes() -> Dict[str, type]:
+    """Build urllib3 connection classes that report their sockets."""
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+
+    def _make(base: type) -> type:
+        class _Tracked(base):  # type: ignore[misc, valid-type]
+            def __init__(self, *args: Any, socket_tracker: Any = None,
+                         **kwargs: Any) -> None:
+                self._socket_tracker = socket_tracker
+                super().__init__(*args, **kwargs)
+
+            def connect(self) -> None:
+                super().connect()
+                if self._socket_tracker is not None:
+                    self._socket_tracker.add(self.sock)
+
+        _Tracked.__name__ = "Tracked%s" % base.__name__
+        return _Tracked
+
+    return {"http": _make(HTTPConnection), "https": _make(HTTPSConnection)}
+
+
+_connection_classes: Optional[Dict[str, type]] = None
+
+
+@contextmanager
+def cancellable_session(token: CancellationToken) -> Iterator[Any]:
+    """Yield a ``requests.Session`` whose requests abort on cancel.
+
+    Connections opened by the session are tracked; cancelling *token*
+    shuts their sockets down so a pending ``post()`` fails at once.
+
+    Args:
+        token: The analysis cancellation token.
+
+    Yields:
+        A requests.Session (closed on exit).
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    global _connection_classes  # noqa: PLW0603
+    if _connection_classes is None:
+        _connection_classes = _tracked_connection_classes()
+    tracker = _SocketTracker(token)
+    classes = _connection_classes
+
+    class _TrackingAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+            super().init_poolmanager(*args, **kwargs)
+            factories = {}
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items():
+                factories[scheme] = _tracked_pool_factory(
+                    pool_cls, classes[scheme], tracker,
+                )
+            self.poolmanager.pool_classes_by_scheme = factories
+
+    session = requests.Session()
+    adapter = _TrackingAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    unregister = token.add_callback(tracker.abort)
+    try:
+        yield session
+    finally:
+        unregister()
+        session.close()
+
+
+def cancellable_post(
+    token: Optional[CancellationToken], url: str, **kwargs: Any,
+) -> Any:
+    """``requests.post`` that aborts when *token* is cancelled.
+
+    Without a token this is exactly ``requests.post``.
+
+    Args:
+        token: The analysis cancellation token, or None.
+        url: Request URL.
+        **kwargs: Passed to ``post()`` (json, headers, timeout, ...).
+
+    Returns:
+        The requests.Response.
+
+    Raises:
+        OperationCancelled: If *token* is cancelled before or during
+            the request.
+    """
+    import requests
+
+    if token is None:
+        return requests.post(url, **kwargs)
+    token.raise_if_cancelled()
+    with cancellable_session(token) as session:
+        try:
+            return session.post(url, **kwargs)
+        except (requests.exceptions.RequestException, OSError) as exc:
+            if token.cancelled:
+                raise OperationCancelled(token.reason) from exc
+            raise
+
+
+def _tracked_pool_factory(
+    pool_cls: type, connection_cls: type, tracker: _SocketTracker,
+) -> Callable[..., Any]:
+    """Return a pool constructor that uses tracked connections."""
+
+    def _create(*args: Any, **kwargs: Any) -> Any:
+        pool = pool_cls(*args, **kwargs)
+        pool.ConnectionCls = connection_cls
+        pool.conn_kw = dict(pool.conn_kw, socket_tracker=tracker)
+        return pool
+
+    return _create
+
+
+# ---------------------------------------------------------------------------
+# httpx
+# ---------------------------------------------------------------------------
+
+
+def cancellable_httpx_transport(
+    token: CancellationToken, **transport_kwargs: Any,
+) -> Any:
+    """Create an ``httpx.HTTPTransport`` whose requests abort on cancel.
+
+    Args:
+        token: The analysis cancellation token.
+        **transport_kwargs: Passed to ``httpx.HTTPTransport``
+            (e.g. ``verify``).
+
+    Returns:
+        The transport, closed automatically when *token* is cancelled.
+        Closing it unregisters its callbacks from *token*, so close it
+        (or the client using it) once the call is done.
+    """
+    import httpcore
+    import httpx
+
+    tracker = _SocketTracker(token)
+
+    class _TrackingBackend(httpcore.NetworkBackend):
+        def __init__(self, inner: Any) -> None:
+            self._inner = inner
+
+        def connect_tcp(self, *args: Any, **kwargs: Any) -> Any:
+            stream = self._inner.connect_tcp(*args, **kwargs)
+            tracker.add(stream.get_extra_info("socket"))
+            return stream
+
+        def connect_unix_socket(self, *args: Any, **kwargs: Any) -> Any:
+            return self._inner.connect_unix_socket(*args, **kwargs)
+
+        def sleep(self, seconds: float) -> None:
+            self._inner.sleep(seconds)
+
+    unregister: List[Callable[[], None]] = []
+
+    class _CancellableTransport(httpx.HTTPTransport):
+        # httpx.Client.close() calls close(); leaving a ``with`` block
+        # calls __exit__ instead.
+        def close(self) -> None:
+            self._leave_token()
+            super().close()
+
+        def __exit__(self, *exc_info: Any) -> None:
+            self._leave_token()
+            super().__exit__(*exc_info)
+
+        def _leave_token(self) -> None:
+            for remove in unregister:
+                remove()
+
+    transport = _CancellableTransport(**transport_kwargs)
+    # httpx does not expose the network backend; wrap the pool's so
+    # every connection it opens is tracked.
+    pool = getattr(transport, "_pool", None)
+    if pool is not None and hasattr(pool, "_network_backend"):
+        pool._network_backend = _TrackingBackend(pool._network_backend)
+    else:
+        logger.debug("httpx transport internals changed; abort falls back to close()")
+    unregister.append(token.add_callback(tracker.abort))
+    unregister.append(token.add_callback(transport.close))
+    return transport
+
+
+# ---------------------------------------------------------------------------
+# Counters
+# ---------------------------------------------------------------------------
+
+
+class CancellationStats:
+    """Process-wide counters for cancelled analysis work."""
+
+    def __init__(self) -> None:
+        """Create zeroed counters."""
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = dict.fromkeys(
+            ("analyses_cancelled", "calls_skipped", "calls_aborted", "tokens_saved"), 0,
+        )
+
+    def record_analysis_cancelled(self) -> None:
+        """Count one cancelled analysis run."""
+        self._add(analyses_cancelled=1)
+
+    def record_skipped(self, tokens_saved: int, calls: int = 1) -> None:
+        """Count LLM calls dropped before they were sent.
+
+        Args:
+            tokens_saved: Estimated prompt + output tokens not spent.
+            calls: Number of calls dropped.
+        """
+        self._add(calls_skipped=calls, tokens_saved=tokens_saved)
+
+    def record_aborted(self, tokens_saved: int) -> None:
+        """Count an LLM call aborted while in flight.
+
+        Args:
+            tokens_saved: Estimated output tokens not generated.
+        """
+        self._add(calls_aborted=1, tokens_saved=tokens_saved)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return a copy of the current counters."""
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            for key in self._counts:
+                self._counts[key] = 0
+
+    def _add(self, **deltas: int) -> None:
+        with self._lock:
+            for key, delta in deltas.items():
+                self._counts[key] += delta
+
+
+_stats_instance: Optional[CancellationStats] = None
+_stats_lock = threading.Lock()
+
+
+def get_cancellation_stats() -> CancellationStats:
+    """Return the process-wide CancellationStats singleton.
+
+    Returns:
+        The shared CancellationStats instance.
+    """
+    global _stats_instance  # noqa: PLW0603
+    if _stats_instance is None:
+        with _stats_lock:
+            if _stats_instance is None:
+                _stats_instance = CancellationStats()
+    return _stats_instance
@@ -9,6 +9,7 @@ from typing import Any, Dict, Union
 
 import requests
 
+from ..cancellation import cancellable_post
 from .base_provider import BaseModelProvider
 
 logger = logging.getLogger(__name__)
@@ -185,6 +186,7 @@ class APIProvider(BaseModelProvider):
         result_meta_raw = kwargs.pop('_result_meta', None)
         result_meta = result_meta_raw if isinstance(result_meta_raw, dict) else None
         timeout_override = kwargs.pop('_timeout_override', None)
+        cancel_token = kwargs.pop('_cancel_token', None)
 
         params = self._prepare_generation_params(**kwargs)
         endpoint, payload = self._build_request(prompt, params)
@@ -201,7 +203,8 @@ class APIProvider(BaseModelProvider):
             cert_path = self.config.get('cert_path')
             verify: Union[str, bool] = cert_path if cert_path else True
 
-            response = requests.post(
+            response = cancellable_post(
+                cancel_token,
                 endpoint,
                 json=payload,
                 headers=headers,
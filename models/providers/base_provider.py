@@ -55,6 +55,7 @@ class BaseModelProvider(ABC):
         # Pop internal-only keys so they never leak into API payloads
         kwargs.pop('_result_meta', None)
         kwargs.pop('_timeout_override', None)
+        kwargs.pop('_cancel_token', None)
 
         params: Dict[str, Any] = {
             'temperature': self.config.get('temperature', 0.4),
@@ -11,6 +11,7 @@ from typing import Any, Dict, Optional, Sequence
 import httpx
 from llama_stack_client import DefaultHttpxClient, LlamaStackClient
 
+from ..cancellation import OperationCancelled, cancellable_httpx_transport
 from .base_provider import BaseModelProvider
 
 logger = logging.getLogger(__name__)
@@ -219,8 +220,9 @@ class LlamaStackProvider(BaseModelProvider):
         Internal keyword arguments (not sent to the API): ``use_case``
         selects the HTTP client timeout profile; ``_result_meta`` may be
         a dict updated with ``finish_reason``, ``completion_tokens``, and
-        ``prompt_tokens``; ``_timeout_override`` is accepted for API
-        compatibility and ignored here (reserved for future use).
+        ``prompt_tokens``; ``_timeout_override`` sets the request timeout
+        of a per-call client; ``_cancel_token`` aborts the request when
+        cancelled (raises ``OperationCancelled``).
         """
         if not self.is_available():
             raise RuntimeError("Llama Stack is not available")
@@ -231,6 +233,7 @@ class LlamaStackProvider(BaseModelProvider):
         try:
             meta_raw = kwargs.pop('_result_meta', None)
             timeout_override = kwargs.pop('_timeout_override', None)
+            cancel_token = kwargs.pop('_cancel_token', None)
             use_case = kwargs.pop('use_case', 'default')
             result_meta: Optional[Dict[str, Any]] = (
                 meta_raw if isinstance(meta_raw, dict) else None
@@ -264,7 +267,25 @@ class LlamaStackProvider(BaseModelProvider):
             if response_format:
                 call_kwargs["response_format"] = response_format
 
-            if timeout_override is not None:
+            owns_client = True
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+                base_client = self._client_for_use_case(use_case)
+                request_timeout = (
+                    int(timeout_override) if timeout_override is not None
+                    else base_client.timeout
+                )
+                # Per-call client whose sockets are shut down on cancel.
+                active = LlamaStackClient(
+                    base_url=self.client._base_url,
+                    http_client=DefaultHttpxClient(
+                        transport=cancellable_httpx_transport(
+                            cancel_token, verify=self._ssl_context,
+                        ),
+                        timeout=request_timeout,
+                    ),
+                )
+            elif timeout_override is not None:
                 active = LlamaStackClient(
                     base_url=self.client._base_url,
                     http_client=DefaultHttpxClient(
@@ -276,7 +297,18 @@ class LlamaStackProvider(BaseModelProvider):
                 )
             else:
                 active = self._client_for_use_case(use_case)
-            response = active.chat.completions.create(**call_kwargs)
+                owns_client = False
+            try:
+                response = active.chat.completions.create(**call_kwargs)
+            except Exception as exc:
+                if cancel_token is not None and cancel_token.cancelled:
+                    raise OperationCancelled(cancel_token.reason) from exc
+                raise
+            finally:
+                # Per-call clients own their connections (and, with a
+                # token, a cancel callback); release them now.
+                if owns_client:
+                    active.close()
             self._populate_result_meta(response, result_meta)
 
             if (response.choices
@@ -4,10 +4,11 @@ Local Ollama model provider.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import requests
 
+from ..cancellation import CancellationToken, cancellable_post
 from .base_provider import BaseModelProvider
 
 logger = logging.getLogger(__name__)
@@ -115,6 +116,7 @@ class OllamaProvider(BaseModelProvider):
             logger.error("Ollama is not available")
             return ""
 
+        cancel_token = kwargs.pop('_cancel_token', None)
         params = self._prepare_generation_params(**kwargs)
         system_prompt = params.pop('system_prompt', '')
 
@@ -144,19 +146,25 @@ class OllamaProvider(BaseModelProvider):
             "options": options,
         }
 
-        return self._send_chat_request(payload)
+        return self._send_chat_request(payload, cancel_token)
 
-    def _send_chat_request(self, payload: Dict[str, Any]) -> str:
+    def _send_chat_request(
+        self,
+        payload: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> str:
         """Send a chat request to the Ollama API.
 
         Args:
             payload: The complete request payload.
+            cancel_token: Aborts the request when cancelled.
 
         Returns:
             Generated text, or empty string on failure.
         """
         try:
-            response = requests.post(
+            response = cancellable_post(
+                cancel_token,
                 "%s/api/chat" % self.config['base_url'],
                 json=payload,
                 timeout=self.config.get('timeout', 60)
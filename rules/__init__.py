@@ -14,13 +14,14 @@ Usage::
     errors = registry.analyze(text, sentences)
 """
 
+import hashlib
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 import yaml
 
-from rules.base_rule import BaseRule
+from rules.base_rule import ALL_NLP_ANNOTATIONS, BaseRule
 from rules.loader import discover_rules
 
 logger = logging.getLogger(__name__)
@@ -49,6 +50,10 @@ class RulesRegistry:
         rule_locations: Mapping of rule_type to human-readable location.
         block_type_rules: Block type to applicable rule types (from YAML).
         rule_exclusions: Block type to excluded rule types (from YAML).
+        ruleset_version: Fingerprint of the loaded rules, mappings,
+            rule configs and confidence threshold.  Changes whenever
+            rule output could change, so cached results keyed by it
+            are invalidated automatically.
     """
 
     def __init__(
@@ -68,9 +73,11 @@ class RulesRegistry:
         self.block_type_rules: Dict[str, List[str]] = {}
         self.rule_exclusions: Dict[str, List[str]] = {}
         self.confidence_threshold = confidence_threshold
+        self._nlp_annotations: Dict[Optional[str], FrozenSet[str]] = {}
 
         self._load_rule_mappings()
         self._discover_all_rules()
+        self.ruleset_version: str = self._compute_ruleset_version()
 
     # ------------------------------------------------------------------
     # Rule discovery
@@ -81,6 +88,26 @@ class RulesRegistry:
         rules_dir = os.path.dirname(os.path.abspath(__file__))
         self.rules, self.rule_locations = discover_rules(rules_dir)
 
+    def _compute_ruleset_version(self) -> str:
+        """Hash rule classes, YAML configs and the confidence threshold."""
+        rules_dir = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+        for rule_type in sorted(self.rules):
+            rule_cls = type(self.rules[rule_type])
+            digest.update(
+                f"{rule_type}={rule_cls.__module__}.{rule_cls.__qualname__}\n".encode(),
+            )
+        digest.update(f"threshold={self.confidence_threshold}\n".encode())
+        for root, dirs, files in os.walk(rules_dir):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith((".yaml", ".yml")):
+                    path = os.path.join(root, name)
+                    digest.update(os.path.relpath(path, rules_dir).encode())
+                    with open(path, "rb") as fh:
+                        digest.update(fh.read())
+        return digest.hexdigest()[:16]
+
     # ------------------------------------------------------------------
     # Rule mappings
     # ------------------------------------------------------------------
@@ -336,6 +363,42 @@ class RulesRegistry:
         """Return the full ``{ rule_type: instance }`` mapping."""
         return self.rules
 
+    def nlp_annotations(self, block_type: Optional[str] = None) -> FrozenSet[str]:
+        """Return the SpaCy annotations the rules for a block type read.
+
+        The union of ``NLP_ANNOTATIONS`` over the applicable rules; the
+        caller can disable every pipeline component that produces none
+        of them.
+
+        Args:
+            block_type: Block type whose rules are considered, or None
+                for every registered rule.
+
+        Returns:
+            Annotation names from ``rules.base_rule`` (``"sentences"``,
+            ``"pos"``, ...).
+        """
+        cached = self._nlp_annotations.get(block_type)
+        if cached is not None:
+            return cached
+        rule_types = (
+            list(self.rules) if block_type is None
+            else self._get_applicable_rules(block_type.lower())
+        )
+        needed: set = set()
+        for rule_type in rule_types:
+            declared = type(self.rules[rule_type]).NLP_ANNOTATIONS
+            unknown = declared - ALL_NLP_ANNOTATIONS
+            if unknown:
+                logger.warning(
+                    "Rule %s declares unknown NLP annotations %s",
+                    rule_type, sorted(unknown),
+                )
+            needed.update(declared & ALL_NLP_ANNOTATIONS)
+        result = frozenset(needed)
+        self._nlp_annotations[block_type] = result
+        return result
+
     def list_discovered_rules(self) -> Dict[str, Any]:
         """Return a summary of all discovered rules grouped by location."""
         rules_by_location: Dict[str, list] = {}
@@ -74,6 +74,8 @@ _KNOWN_ACRONYMS: frozenset = frozenset({
 class AccessibilityRule(BaseAudienceRule):
     """Detects accessibility issues in technical documentation."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'accessibility'
 
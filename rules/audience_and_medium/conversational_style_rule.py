@@ -38,6 +38,8 @@ _FORMAL_MAP = _load_config()
 class ConversationalStyleRule(BaseAudienceRule):
     """Detects overly formal language and suggests conversational alternatives."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     def _get_rule_type(self) -> str:
         return 'conversational_style'
 
@@ -80,6 +80,8 @@ _SELF_REFERENTIAL_PATTERNS = [
 class GlobalAudiencesRule(BaseAudienceRule):
     """Detects constructs difficult for global audiences."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'global_audiences'
 
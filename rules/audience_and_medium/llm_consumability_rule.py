@@ -34,6 +34,8 @@ _MIN_SENTENCES = _CONFIG.get('min_sentences_per_topic', 5)
 class LLMConsumabilityRule(BaseAudienceRule):
     """Detects content that is difficult for LLMs to consume effectively."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'llm_consumability'
 
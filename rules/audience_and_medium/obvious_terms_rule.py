@@ -31,6 +31,8 @@ _OBVIOUS_PATTERNS = [
 class ObviousTermsRule(BaseAudienceRule):
     """Flag self-explanatory field descriptions that don't need documenting."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'obvious_terms'
 
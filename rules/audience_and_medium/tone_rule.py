@@ -49,6 +49,8 @@ _QUOTED_RANGES_RE: re.Pattern = re.compile(r"""(['"]).*?\1""")
 class ToneRule(BaseAudienceRule):
     """Detects business jargon, marketing buzzwords, and informal phrases."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'tone'
 
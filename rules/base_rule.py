@@ -7,19 +7,23 @@ the ``analyze`` and ``_get_rule_type`` abstract methods.
 
 This module provides:
 - Standardized error creation with automatic exception/technical-content filtering
-- Protected product-name range detection
+- Protected product-name range detection (see ``rules.protected_spans``)
 - IBM Style Guide citation enrichment via ``style_guides.ibm.ibm_style_mapping``
 - SpaCy token serialization helpers
+- The SpaCy annotations a rule reads (``NLP_ANNOTATIONS``), from which
+  the registry derives the pipeline components to run
 """
 
 import logging
 import os
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 import yaml
 
+from rules.protected_spans import ProtectedSpanMatcher, ProtectedSpans
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -70,6 +74,22 @@ except ImportError:
 # ---------------------------------------------------------------------------
 
 
+# ---------------------------------------------------------------------------
+# SpaCy annotations a rule can depend on
+# ---------------------------------------------------------------------------
+
+# Tokenization is always available; these need trained components.
+NLP_SENTENCES = "sentences"        # doc.sents, token.sent, is_sent_start
+NLP_POS = "pos"                    # pos_, tag_, morph
+NLP_LEMMAS = "lemmas"              # lemma_
+NLP_DEPENDENCIES = "dependencies"  # dep_, head, children, subtree
+NLP_ENTITIES = "entities"          # doc.ents, ent_type_, ent_iob_
+
+ALL_NLP_ANNOTATIONS: FrozenSet[str] = frozenset({
+    NLP_SENTENCES, NLP_POS, NLP_LEMMAS, NLP_DEPENDENCIES, NLP_ENTITIES,
+})
+
+
 def in_code_range(content_pos: int, ranges: list) -> bool:
     """Return True if *content_pos* falls inside any inline-code range.
 
@@ -105,10 +125,16 @@ class BaseRule(ABC):
     Subclasses must implement ``_get_rule_type`` and ``analyze``.
     """
 
+    # SpaCy annotations this rule reads, directly or through helpers it
+    # inherits.  Rules that do not declare them get the full pipeline.
+    NLP_ANNOTATIONS: FrozenSet[str] = ALL_NLP_ANNOTATIONS
+
     # Class-level cache -- loaded once, shared across all rule instances
     _exceptions: Optional[Dict[str, Any]] = None
+    _global_exceptions: FrozenSet[str] = frozenset()
+    _rule_exceptions: Dict[str, FrozenSet[str]] = {}
     _protected_terms: Optional[List[str]] = None
-    _protected_patterns: Optional[List["re.Pattern[str]"]] = None
+    _protected_matcher: Optional[ProtectedSpanMatcher] = None
 
     def __init__(self) -> None:
         """Initialize the rule, load exceptions and style-guide mapping."""
@@ -117,8 +143,9 @@ class BaseRule(ABC):
 
         # Load exceptions once, cache at the class level
         if BaseRule._exceptions is None:
-            self._load_exceptions()
-            self._load_protected_terms()
+            BaseRule._load_exceptions()
+            BaseRule._freeze_exceptions()
+            BaseRule._load_protected_terms()
 
         # IBM Style Guide citation fields
         self._ibm_style_mapping: Optional[Dict[str, Any]] = None
@@ -188,26 +215,33 @@ class BaseRule(ABC):
             logger.warning("Failed to parse exceptions.yaml: %s", exc)
             cls._exceptions = {}
 
+    @classmethod
+    def _freeze_exceptions(cls) -> None:
+        """Lower-case the exception lists into frozensets for lookups."""
+        exceptions = cls._exceptions or {}
+        global_exc = exceptions.get("global_exceptions", [])
+        cls._global_exceptions = frozenset(
+            str(e).lower() for e in global_exc
+        ) if isinstance(global_exc, list) else frozenset()
+
+        rule_exceptions: Dict[str, FrozenSet[str]] = {}
+        rule_specifics = exceptions.get("rule_specific_exceptions", {})
+        if isinstance(rule_specifics, dict):
+            for rule_type, rule_exc in rule_specifics.items():
+                if isinstance(rule_exc, list):
+                    rule_exceptions[rule_type] = frozenset(str(e).lower() for e in rule_exc)
+        cls._rule_exceptions = rule_exceptions
+
     @classmethod
     def _load_protected_terms(cls) -> None:
-        """Build pre-compiled regex patterns for protected product names."""
+        """Compile the protected product names into one matcher."""
         terms: List[str] = []
         if cls._exceptions and isinstance(cls._exceptions, dict):
             raw = cls._exceptions.get("protected_product_names", [])
             terms = [str(t) for t in raw if t]
 
         cls._protected_terms = terms
-        cls._protected_patterns = []
-        for term in cls._protected_terms:
-            try:
-                pattern = re.compile(
-                    r"\b" + re.escape(term) + r"\b", re.IGNORECASE
-                )
-                cls._protected_patterns.append(pattern)
-            except re.error:
-                logger.warning(
-                    "Invalid regex for protected term '%s'; skipping", term
-                )
+        cls._protected_matcher = ProtectedSpanMatcher(terms)
 
     # ------------------------------------------------------------------
     # Exception / technical-content filtering
@@ -219,20 +253,10 @@ class BaseRule(ABC):
             return False
 
         normalized = text_span.lower().strip()
-
-        global_exc = self._exceptions.get("global_exceptions", [])
-        if isinstance(global_exc, list):
-            if normalized in {str(e).lower() for e in global_exc}:
-                return True
-
-        rule_specifics = self._exceptions.get("rule_specific_exceptions", {})
-        if isinstance(rule_specifics, dict):
-            rule_exc = rule_specifics.get(self.rule_type, [])
-            if isinstance(rule_exc, list):
-                if normalized in {str(e).lower() for e in rule_exc}:
-                    return True
-
-        return False
+        if normalized in self._global_exceptions:
+            return True
+        rule_exc = self._rule_exceptions.get(self.rule_type)
+        return rule_exc is not None and normalized in rule_exc
 
     def _is_technical_content(self, text_span: str) -> bool:
         """Return ``True`` if *text_span* is a URL, email, path, or code identifier."""
@@ -267,21 +291,23 @@ class BaseRule(ABC):
     # Protected product-name ranges
     # ------------------------------------------------------------------
 
-    def _get_protected_ranges(self, text: str) -> List[tuple]:
-        """Return character ranges in *text* covered by protected product names."""
-        ranges: List[tuple] = []
-        if not self._protected_patterns:
-            return ranges
-        for pattern in self._protected_patterns:
-            for match in pattern.finditer(text):
-                ranges.append((match.start(), match.end()))
-        return ranges
+    def _get_protected_ranges(self, text: str) -> ProtectedSpans:
+        """Return character ranges in *text* covered by protected product names.
+
+        The ranges of a text are computed once and shared by every rule
+        that checks it.
+        """
+        if self._protected_matcher is None:
+            return ProtectedSpans([])
+        return self._protected_matcher.find(text)
 
     @staticmethod
     def _is_in_protected_range(
-        start: int, end: int, protected_ranges: List[tuple]
+        start: int, end: int, protected_ranges: Any
     ) -> bool:
         """Return ``True`` if the span [start, end) falls within a protected range."""
+        if isinstance(protected_ranges, ProtectedSpans):
+            return protected_ranges.covers(start, end)
         for pstart, pend in protected_ranges:
             if start >= pstart and end <= pend:
                 return True
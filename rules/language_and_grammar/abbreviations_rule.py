@@ -35,6 +35,8 @@ _CONFIG = _load_config()
 class AbbreviationsRule(BaseLanguageRule):
     """Checks Latin abbreviations, undefined abbreviations, and verb usage."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     def __init__(self):
         super().__init__()
         self.defined_abbreviations: Set[str] = set()
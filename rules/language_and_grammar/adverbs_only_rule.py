@@ -12,6 +12,8 @@ from .base_language_rule import BaseLanguageRule
 class AdverbsOnlyRule(BaseLanguageRule):
     """Detects misplaced 'only' using SpaCy dependency parsing."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def __init__(self):
         super().__init__()
 
@@ -42,6 +42,8 @@ _PRODUCT_CENTRIC_RE = re.compile(
 class AnthropomorphismRule(BaseLanguageRule):
     """Detects anthropomorphic language using SpaCy dependency parsing."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     def __init__(self):
         super().__init__()
 
@@ -38,6 +38,8 @@ _VOWEL_SOUND_LETTERS = set('AEFHILMNORSX')
 class ArticlesRule(BaseLanguageRule):
     """Checks a/an usage based on pronunciation, not spelling."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def __init__(self):
         super().__init__()
 
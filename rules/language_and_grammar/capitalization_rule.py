@@ -12,6 +12,8 @@ from .base_language_rule import BaseLanguageRule
 class CapitalizationRule(BaseLanguageRule):
     """Deterministic capitalization checker using SpaCy NER and POS tagging."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     ENTITY_LABELS = {'PERSON', 'ORG', 'GPE'}
 
     LOWERCASE_CANDIDATES = {
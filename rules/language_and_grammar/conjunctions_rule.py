@@ -26,6 +26,8 @@ _CONTRASTIVE_ADVERBS = frozenset({
 class ConjunctionsRule(BaseLanguageRule):
     """Detects misused subordinating conjunctions using SpaCy dependency parsing."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     def __init__(self):
         super().__init__()
 
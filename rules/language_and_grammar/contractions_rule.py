@@ -39,6 +39,8 @@ _CONTRACTION_RE = re.compile(r"\b\w+['\u2019]\w+\b")
 class ContractionsRule(BaseLanguageRule):
     """Detects contractions in technical documentation."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'contractions'
 
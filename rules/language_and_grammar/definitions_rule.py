@@ -48,6 +48,8 @@ _WELL_KNOWN = _load_exceptions()
 class DefinitionsRule(BaseLanguageRule):
     """Flag acronyms that are not defined on first occurrence."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'definitions'
 
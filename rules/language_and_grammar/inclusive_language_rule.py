@@ -37,6 +37,8 @@ _PHRASE_TERMS = [t for t in _TERMS if t['is_phrase']]
 class InclusiveLanguageRule(BaseLanguageRule):
     """Detects non-inclusive terms using token lemmas to catch variations like 'mastering' or 'slaves'."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'inclusive_language'
 
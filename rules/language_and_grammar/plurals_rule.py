@@ -35,6 +35,8 @@ class PluralsRule(BaseLanguageRule):
     Checks for common pluralization errors in technical writing.
     """
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'plurals'
 
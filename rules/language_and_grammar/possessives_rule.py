@@ -29,6 +29,8 @@ _BRAND_EXCEPTIONS = _load_config()
 class PossessivesRule(BaseLanguageRule):
     """Detects possessive 's on abbreviations and suggests prepositional phrases."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'possessives'
 
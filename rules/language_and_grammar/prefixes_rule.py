@@ -40,6 +40,8 @@ _PREFIX_PATTERN = re.compile(
 class PrefixesRule(BaseLanguageRule):
     """Detect prefixes that should be closed (written without a hyphen)."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'prefixes'
 
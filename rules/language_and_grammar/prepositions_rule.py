@@ -33,6 +33,8 @@ UNNECESSARY_PHRASAL_VERBS: Dict[str, Dict[str, str]] = _CONFIG.get('unnecessary_
 class PrepositionsRule(BaseLanguageRule):
     """Detects unnecessary prepositions in phrasal verbs."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def __init__(self):
         super().__init__()
 
@@ -26,6 +26,8 @@ COMBINED_GENDER_PATTERNS = {'he or she', 'his or her', 'him or her', 'his or her
 class PronounsRule(BaseLanguageRule):
     """Detects first-person, gender-specific, and ambiguous pronoun references."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     def __init__(self):
         super().__init__()
 
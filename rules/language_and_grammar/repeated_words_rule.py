@@ -30,6 +30,8 @@ _COMPOUND_REPEAT_RE = re.compile(
 class RepeatedWordsRule(BaseLanguageRule):
     """Flag consecutive repeated words."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'repeated_words'
 
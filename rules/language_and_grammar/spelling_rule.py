@@ -29,6 +29,8 @@ _SPELLING_MAP = _load_config()
 class SpellingRule(BaseLanguageRule):
     """Detects non-US spellings and suggests the preferred US English form."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'spelling'
 
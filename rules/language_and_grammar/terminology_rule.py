@@ -28,6 +28,8 @@ _PHRASE_TERMS = {k: v for k, v in _TERM_MAP.items() if ' ' in k}
 class TerminologyRule(BaseLanguageRule):
     """Detects deprecated terms using linguistic tokens to minimize false positives."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'terminology'
 
@@ -25,6 +25,8 @@ _IDIOMATIC_USING_OBJECTS = frozenset({
 class UsingRule(BaseLanguageRule):
     """Flag 'using' after a noun where 'by using' would be clearer."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'using_clarity'
 
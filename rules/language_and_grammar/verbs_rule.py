@@ -41,6 +41,8 @@ _REFERENCE_OK_PASSIVE: frozenset = frozenset({
 class VerbsRule(BaseLanguageRule):
     """Detects passive voice and future tense using SpaCy dependency parsing."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     def __init__(self):
         super().__init__()
 
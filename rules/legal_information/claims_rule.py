@@ -67,6 +67,8 @@ _ATTRIBUTION_MARKERS: re.Pattern = re.compile(
 class ClaimsRule(BaseLegalRule):
     """Detects unsubstantiated claims and recommendations."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'claims'
 
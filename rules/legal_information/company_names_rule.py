@@ -48,6 +48,8 @@ _REGISTRY = _load_registry()
 class CompanyNamesRule(BaseLegalRule):
     """Detects company name references and checks for official naming."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     def _get_rule_type(self) -> str:
         return 'company_names'
 
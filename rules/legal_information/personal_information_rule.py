@@ -32,6 +32,8 @@ _TERM_MAP = _load_config()
 class PersonalInformationRule(BaseLegalRule):
     """Detects culturally specific naming terms and suggests neutral alternatives."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'personal_information'
 
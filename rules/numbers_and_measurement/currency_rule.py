@@ -62,6 +62,8 @@ class CurrencyRule(BaseNumbersRule):
     """Check currency formatting: prefer ISO codes over symbols,
     spell out multipliers instead of letter abbreviations."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'numbers_currency'
 
@@ -44,6 +44,8 @@ _CODE_BLOCK_TYPES = frozenset([
 class DatesAndTimesRule(BaseNumbersRule):
     """Check for ambiguous date formats and incorrect AM/PM formatting."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'dates_and_times'
 
@@ -58,6 +58,8 @@ def _span_inside_any(start, end, guard_spans):
 class NumbersRule(BaseNumbersRule):
     """Checks for missing comma separators and missing leading zeros."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'numbers_general'
 
@@ -25,6 +25,8 @@ _MEASUREMENT_UNIT_RE = re.compile(
 class NumeralsVsWordsRule(BaseNumbersRule):
     """Flag sentences that begin with a bare numeral."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     _config = None
 
     def _get_rule_type(self) -> str:
@@ -43,6 +43,8 @@ _CSS_UNITS = frozenset(['px', 'em', 'rem', 'vw', 'vh', 'vmin', 'vmax', 'ch', 'ex
 class UnitsOfMeasurementRule(BaseNumbersRule):
     """Check for a missing space between a number and its unit of measurement."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'units_of_measurement'
 
@@ -0,0 +1,121 @@
+"""Protected product-name spans, found in one scan per text.
+
+Word-usage and terminology rules skip matches that fall inside a
+protected product name (``protected_product_names`` in
+``config/exceptions.yaml``), e.g. "Developer Preview" or "OpenShift
+Dev Spaces".  :class:`ProtectedSpanMatcher` compiles every name into a
+single pattern when the exceptions are loaded, scans a text once, and
+remembers the result for recent texts, so the rules that check the
+same sentence share one scan.  The result, :class:`ProtectedSpans`,
+answers "is ``[start, end)`` inside a protected name?" in O(log n).
+"""
+
+import bisect
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterator, List, Sequence, Tuple
+
+# Scanned texts whose spans are kept for the next rule to ask
+_SPANS_CACHE_MAX_ENTRIES = 256
+
+
+class ProtectedSpans:
+    """Protected ranges in one text, ordered by start.
+
+    Only the longest protected name starting at each position is kept:
+    any shorter name starting there lies inside it, so containment
+    answers are the same as with every individual match.
+    """
+
+    __slots__ = ("_starts", "_ends", "_reach")
+
+    def __init__(self, ranges: Sequence[Tuple[int, int]]) -> None:
+        """Index *ranges*, given in ascending start order.
+
+        Args:
+            ranges: ``(start, end)`` pairs, one per start position.
+        """
+        self._starts: List[int] = [start for start, _ in ranges]
+        self._ends: List[int] = [end for _, end in ranges]
+        # _reach[i]: furthest end among the first i + 1 ranges
+        self._reach: List[int] = []
+        furthest = -1
+        for end in self._ends:
+            furthest = max(furthest, end)
+            self._reach.append(furthest)
+
+    def covers(self, start: int, end: int) -> bool:
+        """Return ``True`` if ``[start, end)`` lies inside a protected range.
+
+        Args:
+            start: Span start offset.
+            end: Span end offset.
+
+        Returns:
+            Whether some range starts at or before *start* and ends at
+            or after *end*.
+        """
+        index = bisect.bisect_right(self._starts, start) - 1
+        return index >= 0 and self._reach[index] >= end
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Yield the ``(start, end)`` ranges."""
+        return iter(zip(self._starts, self._ends))
+
+    def __len__(self) -> int:
+        """Return the number of ranges."""
+        return len(self._starts)
+
+
+_NO_SPANS = ProtectedSpans([])
+
+
+class ProtectedSpanMatcher:
+    """Finds protected names in text with one compiled pattern.
+
+    Names match case-insensitively on word boundaries.  The pattern is a
+    lookahead, so overlapping names (one starting inside another) are
+    all found, and its alternatives are ordered longest first, so each
+    position yields the longest name that matches there.
+    """
+
+    def __init__(self, terms: Sequence[str]) -> None:
+        """Compile *terms* into the combined pattern.
+
+        Args:
+            terms: Protected names, matched literally.
+        """
+        alternatives = sorted({re.escape(term) for term in terms if term}, key=len, reverse=True)
+        self._pattern = (
+            re.compile(r"(?=\b(" + "|".join(alternatives) + r")\b)", re.IGNORECASE)
+            if alternatives else None
+        )
+        self._cache: OrderedDict[str, ProtectedSpans] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def find(self, text: str) -> ProtectedSpans:
+        """Return the protected spans in *text*, scanning it at most once.
+
+        Args:
+            text: Text to scan (usually one sentence).
+
+        Returns:
+            The spans, shared with other callers; do not modify.
+        """
+        if self._pattern is None or not text:
+            return _NO_SPANS
+        with self._lock:
+            spans = self._cache.get(text)
+            if spans is not None:
+                self._cache.move_to_end(text)
+                return spans
+
+        spans = ProtectedSpans([
+            (match.start(), match.end(1)) for match in self._pattern.finditer(text)
+        ])
+        with self._lock:
+            self._cache[text] = spans
+            while len(self._cache) > _SPANS_CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return spans
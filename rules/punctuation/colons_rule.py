@@ -21,6 +21,8 @@ _SKIP_BLOCKS = frozenset(['code_block', 'listing', 'literal', 'inline_code'])
 class ColonsRule(BasePunctuationRule):
     """Flag colon usage violations."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'colons'
 
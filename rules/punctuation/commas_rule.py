@@ -19,6 +19,8 @@ _SKIP_BLOCKS = frozenset(['code_block', 'listing', 'literal', 'inline_code'])
 class CommasRule(BasePunctuationRule):
     """Flag comma usage violations."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'commas'
 
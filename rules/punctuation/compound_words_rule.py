@@ -34,6 +34,8 @@ _TERM_MAP = _load_config()
 class CompoundWordsRule(BasePunctuationRule):
     """Flag incorrect compound word and hyphenation forms."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'compound_words'
 
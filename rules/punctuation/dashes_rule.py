@@ -55,6 +55,8 @@ def _is_ascii_em_dash_fp(sentence: str, match: re.Match[str]) -> bool:
 class DashesRule(BasePunctuationRule):
     """Flags em dash usage in technical prose."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'dashes'
 
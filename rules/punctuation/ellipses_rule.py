@@ -36,6 +36,8 @@ def _is_bracketed(sentence: str, start: int, end: int) -> bool:
 class EllipsesRule(BasePunctuationRule):
     """Flags ellipsis usage in technical prose."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'ellipses'
 
@@ -47,6 +47,8 @@ def _remove_quoted_text(sentence: str) -> str:
 class ExclamationPointsRule(BasePunctuationRule):
     """Flags exclamation point usage in technical prose."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'exclamation_points'
 
@@ -30,6 +30,8 @@ _SKIP_BLOCK_TYPES = ('code_block', 'listing', 'literal', 'inline_code')
 class HyphensRule(BasePunctuationRule):
     """Flag '-ly' adverbs incorrectly hyphenated to the following word."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'hyphens'
 
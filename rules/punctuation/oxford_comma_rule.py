@@ -24,6 +24,8 @@ _OXFORD_RE = re.compile(
 class OxfordCommaRule(BasePunctuationRule):
     """Flag lists of three or more items missing the Oxford comma."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'oxford_comma'
 
@@ -19,6 +19,8 @@ _SKIP_BLOCKS = frozenset(['code_block', 'listing', 'literal', 'inline_code'])
 class ParenthesesRule(BasePunctuationRule):
     """Flag parentheses usage violations."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'parentheses'
 
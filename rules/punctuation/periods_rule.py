@@ -35,6 +35,8 @@ _DOUBLE_PERIOD = re.compile(r'\.\.(?!\.)')
 class PeriodsRule(BasePunctuationRule):
     """Flag periods in abbreviations and duplicate periods."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'periods'
 
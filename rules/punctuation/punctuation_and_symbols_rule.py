@@ -37,6 +37,8 @@ _SKIP_BLOCK_TYPES = ('code_block', 'listing', 'literal', 'inline_code')
 class PunctuationAndSymbolsRule(BasePunctuationRule):
     """Flag symbols used in place of words in general text."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'punctuation_and_symbols'
 
@@ -26,6 +26,8 @@ _SKIP_BLOCKS = frozenset(['code_block', 'listing', 'literal', 'inline_code'])
 class QuotationMarksRule(BasePunctuationRule):
     """Flag quotation mark usage violations."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'quotation_marks'
 
@@ -30,6 +30,8 @@ _SKIP_BLOCKS = frozenset(['code_block', 'listing', 'literal', 'inline_code'])
 class SemicolonsRule(BasePunctuationRule):
     """Flag semicolon usage violations."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'semicolons'
 
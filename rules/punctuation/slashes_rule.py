@@ -51,6 +51,8 @@ def _collect_yaml_strings(container) -> Set[str]:
 class SlashesRule(BasePunctuationRule):
     """Flag ambiguous slash usage in general text."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     _FALLBACK_ALLOWED: Set[str] = {
         'CI/CD', 'TCP/IP', 'I/O', 'INPUT/OUTPUT', 'CLIENT/SERVER',
         'READ/WRITE', 'R/W', 'N/A', 'W/O', 'C/O', 'ON/OFF',
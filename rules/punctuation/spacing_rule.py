@@ -81,6 +81,8 @@ def _in_exclusion(pos: int, ranges: List[tuple]) -> bool:
 class SpacingRule(BasePunctuationRule):
     """Flag double spaces and missing spaces after punctuation."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'spacing'
 
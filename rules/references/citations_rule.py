@@ -73,6 +73,8 @@ class CitationsRule(BaseReferencesRule):
     """Flag problematic link text, capitalized cross-reference terms,
     and abbreviated cross-reference words."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'references_citations'
 
@@ -47,6 +47,8 @@ def _in_quotes(pos: int, text: str) -> bool:
 class GeographicLocationsRule(BaseReferencesRule):
     """Flag outdated and misused geographic terminology."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'references_geographic'
 
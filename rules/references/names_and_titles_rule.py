@@ -45,6 +45,8 @@ _TITLE_ABBREVS = frozenset([
 class NamesAndTitlesRule(BaseReferencesRule):
     """Flag standalone professional titles that are incorrectly capitalized."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     def _get_rule_type(self) -> str:
         return 'references_names_titles'
 
@@ -61,6 +61,8 @@ class ProductNamesRule(BaseReferencesRule):
     """Flag product name misspellings, prohibited abbreviations,
     and possessive forms of brand names."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'references_product_names'
 
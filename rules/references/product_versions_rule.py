@@ -45,6 +45,8 @@ _CHANGELOG = re.compile(r'\bchangelog\b|\brelease\s+notes?\b', re.IGNORECASE)
 class ProductVersionsRule(BaseReferencesRule):
     """Flag incorrect version number prefixes."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'references_product_versions'
 
@@ -94,6 +94,8 @@ class SecondPersonRule(BaseRule):
     is preferred (API, reference docs).
     """
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies", "entities"})
+
     def _get_rule_type(self) -> str:
         return 'second_person'
 
@@ -24,6 +24,8 @@ _MIN_WORDS_TO_CHECK = 10
 class SentenceLengthRule(BaseRule):
     """Flag sentences that exceed the recommended word count."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'sentence_length'
 
@@ -28,6 +28,8 @@ _SENTENCE_END = re.compile(r'[.!?](?:\s|$)')
 class AdmonitionContentRule(BaseStructureRule):
     """Flag overly long admonition content."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'admonition_content'
 
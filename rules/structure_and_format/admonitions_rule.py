@@ -31,6 +31,8 @@ _APPROVED_LABELS = frozenset([
 class AdmonitionsRule(BaseStructureRule):
     """Flag unapproved admonition labels."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'admonitions'
 
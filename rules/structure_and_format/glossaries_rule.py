@@ -25,6 +25,8 @@ _TERM_DEF_RE = re.compile(r'^\s*([\w\s\-]+?)\s*(?:::|\s*:\s)\s*(.*)', re.DOTALL)
 class GlossariesRule(BaseStructureRule):
     """Flag improperly capitalized glossary terms."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies", "entities"})
+
     def _get_rule_type(self) -> str:
         return 'glossaries'
 
@@ -50,6 +50,8 @@ _PAREN_SEPARATOR = re.compile(r'\s+\([^)]+\)\s*$')
 class HeadingsRule(BaseStructureRule):
     """Flag heading formatting violations."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'headings'
 
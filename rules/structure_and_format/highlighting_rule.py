@@ -76,6 +76,8 @@ def _is_surrounded_by_lowercase(text: str, start: int, end: int) -> bool:
 class HighlightingRule(BaseStructureRule):
     """Flag all-caps words used for emphasis instead of proper formatting."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'highlighting'
 
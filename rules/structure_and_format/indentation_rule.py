@@ -25,6 +25,8 @@ _MIXED_INDENT = re.compile(r'^(\t+ +| +\t+)', re.MULTILINE)
 class IndentationRule(BaseStructureRule):
     """Flag mixed tab and space indentation."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'indentation'
 
@@ -52,6 +52,8 @@ _MIN_SENTENCE_LENGTH = 20
 class ListConsistencyRule(BaseStructureRule):
     """Flag list items with inconsistent punctuation per IBM Style Guide."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'list_consistency'
 
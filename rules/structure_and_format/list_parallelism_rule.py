@@ -33,6 +33,8 @@ _PASSIVE_AUX = frozenset(['is', 'are', 'was', 'were', 'be', 'been', 'being'])
 class ListParallelismRule(BaseStructureRule):
     """Flag list items that use passive voice, breaking parallel structure."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'list_parallelism'
 
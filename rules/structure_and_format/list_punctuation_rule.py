@@ -32,6 +32,8 @@ _TRAILING_SEMICOLON = re.compile(r';\s*$')
 class ListPunctuationRule(BaseStructureRule):
     """Flag trailing commas or semicolons on list items."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'list_punctuation'
 
@@ -68,6 +68,8 @@ def _should_skip_capitalization(
 class ListsRule(BaseStructureRule):
     """Flag uncapitalized list items and 'these' as a list introducer."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'lists'
 
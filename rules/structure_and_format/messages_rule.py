@@ -78,6 +78,8 @@ _SUCCESS = _CONFIG.get('success_phrases', [])
 class MessagesRule(BaseStructureRule):
     """Flag exaggerated, casual, blaming, or inappropriate language in messages."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'messages'
 
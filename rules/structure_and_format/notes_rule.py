@@ -46,6 +46,8 @@ _RECOMMENDATION_RE = re.compile(r'^Recommendation\b', re.IGNORECASE | re.MULTILI
 class NotesRule(BaseStructureRule):
     """Flag note labels missing a colon or using unapproved labels."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'notes'
 
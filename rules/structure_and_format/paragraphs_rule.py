@@ -22,6 +22,8 @@ _SKIP_BLOCKS = frozenset([
 class ParagraphsRule(BaseStructureRule):
     """Flag indented paragraphs that should be flush left."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'paragraphs'
 
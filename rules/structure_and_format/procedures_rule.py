@@ -35,6 +35,8 @@ _PLEASE_RE = re.compile(r'\bplease\b', re.IGNORECASE)
 class ProceduresRule(BaseStructureRule):
     """Flag procedure step issues: 'then' usage, 'please', non-imperative starts."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies", "entities"})
+
     def _get_rule_type(self) -> str:
         return 'procedures'
 
@@ -65,6 +65,8 @@ _POSITIONAL_STEP_RE = re.compile(
 class SelfReferentialTextRule(BaseStructureRule):
     """Flag self-referential phrases, positional references, and 'as follows'."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'self_referential_text'
 
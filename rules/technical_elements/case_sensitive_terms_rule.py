@@ -60,6 +60,8 @@ _PATTERNS = _build_patterns(_TERM_MAP)
 class CaseSensitiveTermsRule(BaseTechnicalRule):
     """Flag incorrect capitalization of product and technology names."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'case_sensitive_terms'
 
@@ -95,16 +97,17 @@ class CaseSensitiveTermsRule(BaseTechnicalRule):
         errors: List[Dict[str, Any]],
     ) -> None:
         """Check a single sentence against all case-sensitive patterns."""
-        protected_ranges = self._get_protected_ranges(sent.text)
+        sent_text = sent.text
+        protected_ranges = self._get_protected_ranges(sent_text)
         for wrong, right, pattern in _PATTERNS:
-            for match in pattern.finditer(sent.text):
+            for match in pattern.finditer(sent_text):
                 if self._is_in_protected_range(
                     match.start(), match.end(), protected_ranges,
                 ):
                     continue
                 found = match.group(0)
                 error = self._create_error(
-                    sentence=sent.text,
+                    sentence=sent_text,
                     sentence_index=idx,
                     message=(
                         f"Use '{right}' instead of '{found}'."
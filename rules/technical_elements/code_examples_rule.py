@@ -51,6 +51,8 @@ _INLINE_FRAGMENT_RE = re.compile(
 class CodeExamplesRule(BaseTechnicalRule):
     """Flag code and command example formatting issues."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_code_examples'
 
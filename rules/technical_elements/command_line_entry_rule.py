@@ -70,6 +70,8 @@ _NON_WINDOWS_OS_RE = re.compile(
 class CommandLineEntryRule(BaseTechnicalRule):
     """Flag incorrect data entry terminology."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_command_line_entry'
 
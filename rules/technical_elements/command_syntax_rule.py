@@ -65,6 +65,8 @@ _BARE_CMD_RE = re.compile(
 class CommandSyntaxRule(BaseTechnicalRule):
     """Flag command syntax formatting and terminology issues."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_command_syntax'
 
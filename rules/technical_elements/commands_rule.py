@@ -58,6 +58,8 @@ _ALLCAPS_SAFE = frozenset([
 class CommandsRule(BaseTechnicalRule):
     """Flag command names used as verbs."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_commands'
 
@@ -58,6 +58,8 @@ _NOUN_BEFORE_SAFE = frozenset([
 class FilesAndDirectoriesRule(BaseTechnicalRule):
     """Flag incorrect usage of file extensions and directory names."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_files_directories'
 
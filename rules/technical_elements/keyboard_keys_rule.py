@@ -71,6 +71,8 @@ _KEY_COMBO_SPACES_BEFORE_RE = re.compile(
 class KeyboardKeysRule(BaseTechnicalRule):
     """Flag keyboard key formatting issues."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_keyboard_keys'
 
@@ -41,6 +41,8 @@ _WRONG_MENU_SEP_RE = re.compile(
 class MenusNavigationRule(BaseTechnicalRule):
     """Flag incorrect menu and navigation terminology."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_menus_navigation'
 
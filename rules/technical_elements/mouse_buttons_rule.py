@@ -39,6 +39,8 @@ _PRESS_BUTTON_RE = re.compile(
 class MouseButtonsRule(BaseTechnicalRule):
     """Flag incorrect preposition and verb usage with mouse actions."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_mouse_buttons'
 
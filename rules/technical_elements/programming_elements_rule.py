@@ -49,6 +49,8 @@ _SAFE_WORDS = frozenset([
 class ProgrammingElementsRule(BaseTechnicalRule):
     """Flag programming keywords used as verbs or with verb endings."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_programming_elements'
 
@@ -73,6 +73,8 @@ _SELECT_BUTTON_RE = re.compile(
 class UIElementsRule(BaseTechnicalRule):
     """Flag incorrect verbs and terminology with UI elements."""
 
+    NLP_ANNOTATIONS = frozenset({"pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_ui_elements'
 
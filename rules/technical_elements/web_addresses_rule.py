@@ -33,6 +33,8 @@ _TRAILING_SLASH_RE = re.compile(
 class WebAddressesRule(BaseTechnicalRule):
     """Flag web address formatting issues."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'technical_web_addresses'
 
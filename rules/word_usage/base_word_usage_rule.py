@@ -3,6 +3,7 @@ Base Word Usage Rule
 Abstract base class that all word usage rules inherit from.
 Provides shared matching logic with protected product name awareness.
 """
+import functools
 import re
 from typing import List, Dict, Any, Optional
 
@@ -38,6 +39,23 @@ except ImportError:
             return False
 
 
+@functools.lru_cache(maxsize=None)
+def term_regex(term: str, pattern: Optional[str] = None) -> 're.Pattern[str]':
+    """Compile the case-insensitive pattern for *term* once for all rules.
+
+    The term maps hold thousands of entries, far more than the ``re``
+    module's own compile cache keeps, so matching them through
+    ``re.finditer`` recompiled most patterns for every sentence.
+
+    Args:
+        term: Term matched on word boundaries.
+        pattern: Regex used instead of the word-boundary match, if given.
+    """
+    if pattern is None:
+        pattern = r'\b' + re.escape(term) + r'\b'
+    return re.compile(pattern, re.IGNORECASE)
+
+
 class BaseWordUsageRule(BaseRule):
     """Abstract base class for all word usage rules."""
 
@@ -67,11 +85,11 @@ class BaseWordUsageRule(BaseRule):
         errors: List[Dict[str, Any]] = []
 
         for i, sent in enumerate(doc.sents):
-            protected_ranges = self._get_protected_ranges(sent.text)
+            sent_text = sent.text
+            protected_ranges = self._get_protected_ranges(sent_text)
 
             for wrong, right in term_map.items():
-                pattern = r'\b' + re.escape(wrong) + r'\b'
-                for match in re.finditer(pattern, sent.text, re.IGNORECASE):
+                for match in term_regex(wrong).finditer(sent_text):
                     if self._is_in_protected_range(match.start(), match.end(), protected_ranges):
                         continue
 
@@ -80,7 +98,7 @@ class BaseWordUsageRule(BaseRule):
                     end = sent.start_char + match.end()
 
                     error = self._create_error(
-                        sentence=sent.text,
+                        sentence=sent_text,
                         sentence_index=i,
                         message=message_fmt.format(found=found, right=right),
                         suggestions=[f"Change '{found}' to '{right}'"],
@@ -118,19 +136,20 @@ class BaseWordUsageRule(BaseRule):
         """
         errors: List[Dict[str, Any]] = []
         for i, sent in enumerate(doc.sents):
-            protected_ranges = self._get_protected_ranges(sent.text)
+            sent_text = sent.text
+            protected_ranges = self._get_protected_ranges(sent_text)
             for entry in term_list:
                 wrong = entry['wrong']
                 right = entry['right']
-                pattern = entry.get('pattern', r'\b' + re.escape(wrong) + r'\b')
-                for match in re.finditer(pattern, sent.text, re.IGNORECASE):
+                pattern = term_regex(wrong, entry.get('pattern'))
+                for match in pattern.finditer(sent_text):
                     if self._is_in_protected_range(match.start(), match.end(), protected_ranges):
                         continue
                     found = match.group(0)
                     start = sent.start_char + match.start()
                     end = sent.start_char + match.end()
                     error = self._create_error(
-                        sentence=sent.text,
+                        sentence=sent_text,
                         sentence_index=i,
                         message=message_fmt.format(found=found, right=right),
                         suggestions=[f"Change '{found}' to '{right}'"],
@@ -4,12 +4,11 @@ Flag terms that should not be used in technical documentation.
 Source: Red Hat Vale DoNotUseTerms + IBM Style Guide.
 """
 import os
-import re
 
 import yaml
 from typing import List, Dict, Any, Optional
 
-from .base_word_usage_rule import BaseWordUsageRule
+from .base_word_usage_rule import BaseWordUsageRule, term_regex
 
 _SKIP_BLOCKS = frozenset(['code_block', 'listing', 'literal', 'inline_code'])
 
@@ -78,6 +77,8 @@ _TERM_MAP: Dict[str, Dict[str, Any]] = _load_config()
 class DoNotUseTermsRule(BaseWordUsageRule):
     """Flag terms that should not be used in technical documentation."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'do_not_use'
 
@@ -94,10 +95,10 @@ class DoNotUseTermsRule(BaseWordUsageRule):
         errors: List[Dict[str, Any]] = []
 
         for i, sent in enumerate(doc.sents):
-            protected_ranges = self._get_protected_ranges(sent.text)
+            sent_text = sent.text
+            protected_ranges = self._get_protected_ranges(sent_text)
             for term, info in _TERM_MAP.items():
-                pattern = r'\b' + re.escape(term) + r'\b'
-                for match in re.finditer(pattern, sent.text, re.IGNORECASE):
+                for match in term_regex(term).finditer(sent_text):
                     if self._is_in_protected_range(match.start(), match.end(), protected_ranges):
                         continue
                     found = match.group(0)
@@ -105,7 +106,7 @@ class DoNotUseTermsRule(BaseWordUsageRule):
                     end = sent.start_char + match.end()
 
                     error = self._create_error(
-                        sentence=sent.text,
+                        sentence=sent_text,
                         sentence_index=i,
                         message=info['message'],
                         suggestions=_build_suggestions(info, found),
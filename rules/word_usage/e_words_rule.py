@@ -31,6 +31,8 @@ _TERM_MAP = _load_config()
 class EWordsRule(BaseWordUsageRule):
     """Flag incorrect word usage for E-words and suggest alternatives."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'word_usage_e'
 
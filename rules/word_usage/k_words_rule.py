@@ -31,6 +31,8 @@ _TERM_MAP = _load_config()
 class KWordsRule(BaseWordUsageRule):
     """Flag incorrect word usage for K-words and suggest alternatives."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'word_usage_k'
 
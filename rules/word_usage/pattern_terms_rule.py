@@ -49,6 +49,8 @@ _COMPILED = _compile_patterns(_PATTERN_TERMS)
 class PatternTermsRule(BaseWordUsageRule):
     """Flag word usage issues that require regex guards."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'word_usage_pattern'
 
@@ -66,16 +68,17 @@ class PatternTermsRule(BaseWordUsageRule):
         errors: List[Dict[str, Any]] = []
 
         for i, sent in enumerate(doc.sents):
-            protected_ranges = self._get_protected_ranges(sent.text)
+            sent_text = sent.text
+            protected_ranges = self._get_protected_ranges(sent_text)
             for _wrong, right, pattern in _COMPILED:
-                for match in pattern.finditer(sent.text):
+                for match in pattern.finditer(sent_text):
                     if self._is_in_protected_range(
                         match.start(), match.end(), protected_ranges
                     ):
                         continue
                     found = match.group(0)
                     error = self._create_error(
-                        sentence=sent.text,
+                        sentence=sent_text,
                         sentence_index=i,
                         message=f"Use '{right}' instead of '{found}'.",
                         suggestions=[f"Change '{found}' to '{right}'"],
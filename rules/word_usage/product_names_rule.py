@@ -57,6 +57,8 @@ for pattern_str, right in _REGEX_TERMS.items():
 class ProductNamesRule(BaseWordUsageRule):
     """Enforce correct capitalization for product and technology names."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'product_names'
 
@@ -73,11 +75,12 @@ class ProductNamesRule(BaseWordUsageRule):
         errors: List[Dict[str, Any]] = []
 
         for i, sent in enumerate(doc.sents):
-            protected_ranges = self._get_protected_ranges(sent.text)
+            sent_text = sent.text
+            protected_ranges = self._get_protected_ranges(sent_text)
 
             # Check simple_terms (case-sensitive word boundary match)
             for pattern, wrong, right in _SIMPLE_PATTERNS:
-                for match in pattern.finditer(sent.text):
+                for match in pattern.finditer(sent_text):
                     found = match.group(0)
                     if found == right:
                         continue
@@ -87,7 +90,7 @@ class ProductNamesRule(BaseWordUsageRule):
                     end = sent.start_char + match.end()
 
                     error = self._create_error(
-                        sentence=sent.text,
+                        sentence=sent_text,
                         sentence_index=i,
                         message=(
                             f"Use '{right}' instead of '{found}'. "
@@ -105,7 +108,7 @@ class ProductNamesRule(BaseWordUsageRule):
 
             # Check regex_terms (complex patterns with lookbehind/lookahead)
             for pattern, right in _REGEX_PATTERNS:
-                for match in pattern.finditer(sent.text):
+                for match in pattern.finditer(sent_text):
                     found = match.group(0)
                     if found == right:
                         continue
@@ -115,7 +118,7 @@ class ProductNamesRule(BaseWordUsageRule):
                     end = sent.start_char + match.end()
 
                     error = self._create_error(
-                        sentence=sent.text,
+                        sentence=sent_text,
                         sentence_index=i,
                         message=(
                             f"Use '{right}' instead of '{found}'. "
@@ -31,6 +31,8 @@ _TERM_MAP = _load_config()
 class SimpleWordsRule(BaseWordUsageRule):
     """Suggest simpler alternatives for complex vocabulary."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'simple_words'
 
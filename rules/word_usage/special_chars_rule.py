@@ -46,6 +46,8 @@ _PATTERNS = _build_patterns(_TERM_MAP)
 class SpecialCharsRule(BaseWordUsageRule):
     """Flag incorrect special character and number usage."""
 
+    NLP_ANNOTATIONS = frozenset({"sentences", "pos", "lemmas", "dependencies"})
+
     def _get_rule_type(self) -> str:
         return 'word_usage_special'
 
@@ -68,14 +70,15 @@ class SpecialCharsRule(BaseWordUsageRule):
 
     def _check_sent(self, sent, idx, text, context, errors):
         """Check a single sentence against all special character patterns."""
-        protected_ranges = self._get_protected_ranges(sent.text)
+        sent_text = sent.text
+        protected_ranges = self._get_protected_ranges(sent_text)
         for _wrong, right, pattern in _PATTERNS:
-            for match in pattern.finditer(sent.text):
+            for match in pattern.finditer(sent_text):
                 if self._is_in_protected_range(match.start(), match.end(), protected_ranges):
                     continue
                 found = match.group(0)
                 error = self._create_error(
-                    sentence=sent.text,
+                    sentence=sent_text,
                     sentence_index=idx,
                     message=f"Use '{right}' instead of '{found}'.",
                     suggestions=[f"Change '{found}' to '{right}'"],
@@ -0,0 +1,168 @@
+"""Benchmark offset-tracked markup cleanup.
+
+Generates a seeded AsciiDoc document (headings, block titles, lists,
+attribute lines, listing blocks, comments, inline formatting, xrefs,
+attribute references and URLs) and cleans it with
+``_clean_markup_with_mapping`` (``TrackedText``) and with a reference
+that applies the same substitutions in the same order, rebuilding the
+offset map character by character after each one.  Both must produce
+the same cleaned text and offset map; the script exits non-zero if
+they differ.
+
+This script is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python scripts/bench_markup_cleanup.py --sizes 100000 1000000
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.analysis import preprocessor  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+_WORDS = (
+    "the server configuration deployment operator cluster node pod "
+    "administrator install verify network storage volume container "
+    "image registry update procedure module assembly attribute "
+    "reference example command option parameter value"
+).split()
+
+
+def build_document(num_chars: int, rng: random.Random) -> str:
+    """Build an AsciiDoc document of roughly *num_chars* characters.
+
+    Args:
+        num_chars: Approximate document length.
+        rng: Seeded random generator.
+
+    Returns:
+        The generated document text.
+    """
+    parts: list[str] = []
+    size = 0
+    while size < num_chars:
+        roll = rng.random()
+        words = rng.choices(_WORDS, k=rng.randint(8, 20))
+        if roll < 0.05:
+            chunk = "== " + " ".join(words[:4]).title()
+        elif roll < 0.08:
+            chunk = f".{words[0].title()}\n[source,bash]\n----\n$ oc get {words[1]}\n----"
+        elif roll < 0.10:
+            chunk = f":{words[0]}-{words[1]}: {words[2]}\n// {' '.join(words[3:6])}"
+        elif roll < 0.25:
+            chunk = "\n".join(f". {w.title()} the {{prod-short}} {w}." for w in words[:3])
+        else:
+            for _ in range(2):
+                pos = rng.randrange(len(words))
+                words[pos] = rng.choice((
+                    f"**{words[pos]}**", f"`{words[pos]}`",
+                    f"xref:{words[pos]}.adoc[{words[pos]}]",
+                    f"https://example.com/{words[pos]}", f"<{words[pos]}>",
+                ))
+            chunk = " ".join(words).capitalize() + "."
+        parts.append(chunk)
+        size += len(chunk) + 2
+    return "\n\n".join(parts)
+
+
+def reference_sub_tracked(
+    text: str,
+    offset_map: list[int],
+    pattern: re.Pattern[str],
+    replacement: str,
+) -> tuple[str, list[int]]:
+    """Apply one substitution, rebuilding the map one character at a time.
+
+    Args:
+        text: Current text.
+        offset_map: Current position mapping (length = len(text) + 1).
+        pattern: Compiled regex pattern to match.
+        replacement: ``""``, ``r"\\1"`` or fixed replacement text.
+
+    Returns:
+        Tuple of (new_text, new_offset_map).
+    """
+    new_chars: list[str] = []
+    new_map: list[int] = []
+    last_end = 0
+    for match in pattern.finditer(text):
+        for i in range(last_end, match.start()):
+            new_chars.append(text[i])
+            new_map.append(offset_map[i])
+        if replacement == r"\1":
+            group_start = match.start(1)
+            for i, ch in enumerate(match.group(1)):
+                new_chars.append(ch)
+                new_map.append(offset_map[group_start + i])
+        else:
+            for ch in replacement:
+                new_chars.append(ch)
+                new_map.append(offset_map[match.start()])
+        last_end = match.end()
+    for i in range(last_end, len(text)):
+        new_chars.append(text[i])
+        new_map.append(offset_map[i])
+    new_map.append(offset_map[len(text)])
+    return "".join(new_chars), new_map
+
+
+def reference_cleanup(text: str) -> tuple[str, list[int]]:
+    """Clean *text* as AsciiDoc with the per-character reference."""
+    offset_map = list(range(len(text) + 1))
+    for pattern, replacement, _hint in preprocessor._select_cleanup_patterns("asciidoc"):
+        text, offset_map = reference_sub_tracked(text, offset_map, pattern, replacement)
+    return reference_sub_tracked(text, offset_map, preprocessor._POST_CLEANUP_RE, " ")
+
+
+def current_cleanup(text: str) -> tuple[str, list[int]]:
+    """Clean *text* as AsciiDoc with the production engine."""
+    return preprocessor._clean_markup_with_mapping(text, "asciidoc")
+
+
+def time_cleanup(
+    cleanup: Callable[[str], tuple[str, list[int]]], text: str, repeats: int,
+) -> tuple[float, tuple[str, list[int]]]:
+    """Return the best of *repeats* cleanup timings and the last result."""
+    best = float("inf")
+    result: tuple[str, list[int]] = ("", [])
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = cleanup(text)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    """Parse arguments, run both implementations, and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        text = preprocessor._normalize_whitespace(
+            build_document(size, random.Random(args.seed)),
+        )
+        current, result = time_cleanup(current_cleanup, text, args.repeats)
+        reference, expected = time_cleanup(reference_cleanup, text, args.repeats)
+        if result != expected:
+            sys.exit(f"{size} chars: cleanup output differs from the reference")
+        print(
+            f"{len(text):>9} chars  reference={reference * 1000:8.1f} ms"
+            f"  current={current * 1000:8.1f} ms  ({reference / current:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark serial versus page-sharded PDF extraction.
+
+Generates a seeded multi-page PDF (running header, page numbers and
+body paragraphs on every page) and parses it with ``PdfParser`` once
+per mode.  Each mode runs in a fresh interpreter so its peak resident
+set size is measured on its own; the sharded figure reports the parent
+and the largest worker separately.
+
+This script is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python scripts/bench_pdf_extraction.py --pages 500 --workers 2
+"""
+
+import argparse
+import json
+import logging
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fitz  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+_WORDS = (
+    "the server configuration deployment operator cluster node pod "
+    "administrator install verify network storage volume container "
+    "image registry update procedure module assembly attribute "
+    "reference example command option parameter value"
+).split()
+
+
+def build_pdf(path: str, pages: int, rng: random.Random) -> None:
+    """Write a PDF with a header, footer and ~25 paragraphs per page.
+
+    Args:
+        path: Output file path.
+        pages: Number of pages.
+        rng: Seeded random generator.
+    """
+    doc = fitz.open()
+    for n in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 30), "Product Installation Guide", fontsize=9)
+        for line in range(25):
+            words = " ".join(rng.choices(_WORDS, k=12)).capitalize() + "."
+            page.insert_text((72, 80 + line * 28), words, fontsize=10)
+        page.insert_text((290, 820), str(n + 1), fontsize=9)
+    doc.save(path)
+    doc.close()
+
+
+def run_mode(path: str, workers: int) -> dict:
+    """Parse *path* once in this process and report time and memory.
+
+    Args:
+        path: PDF file path.
+        workers: ``PDF_EXTRACT_WORKERS`` value; 0 for serial.
+
+    Returns:
+        Dict with ``seconds``, ``blocks``, ``rss_mb`` and
+        ``worker_rss_mb``.
+    """
+    from app.config import Config
+    from app.services.parsing import pdf_parser
+    from app.services.parsing.pdf_parser import PdfParser
+
+    Config.PDF_EXTRACT_WORKERS = workers
+    Config.PDF_PARALLEL_MIN_PAGES = 1
+    started = time.perf_counter()
+    result = PdfParser().parse(path)
+    elapsed = time.perf_counter() - started
+    if pdf_parser._pool is not None:
+        # Reap the workers so RUSAGE_CHILDREN includes them.
+        pdf_parser._pool.shutdown(wait=True)
+    return {
+        "seconds": elapsed,
+        "blocks": len(result.blocks),
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "worker_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    """Parse arguments, run both modes, and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--run-mode", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--pdf", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_mode is not None:
+        print(json.dumps(run_mode(args.pdf, args.run_mode)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "bench.pdf")
+        build_pdf(path, args.pages, random.Random(args.seed))
+        print(f"document: {args.pages} pages, {Path(path).stat().st_size // 1024} KiB")
+
+        for label, workers in (("serial", 0), ("sharded", args.workers)):
+            out = subprocess.run(
+                [sys.executable, __file__, "--run-mode", str(workers), "--pdf", path],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            stats = json.loads(out.strip().splitlines()[-1])
+            print(
+                f"{label + ':':9}{stats['seconds']:8.3f}s  blocks={stats['blocks']}"
+                f"  peak rss={stats['rss_mb']:.0f} MiB"
+                f"  worker peak rss={stats['worker_rss_mb']:.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark the rule registry with the shared protected-span index.
+
+Generates a seeded technical document (product names, deprecated terms,
+commands and prose) and runs every registered rule over each paragraph
+through ``analyze_with_context_aware_rules`` with the pipeline passed
+in (the word-usage rules, which check protected names, return early
+without one), twice: with the protected-span
+matcher and frozen exception sets, and with the previous per-call
+behaviour (one regex per protected name for every sentence in every
+rule, exception sets rebuilt for every flagged span).  Both runs must
+report the same issues; the script exits non-zero if they differ.
+
+Uses ``en_core_web_md`` when it is installed, otherwise a blank English
+pipeline with a sentencizer (rules that need tags then find less).
+
+This script is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python scripts/bench_rule_filters.py --paragraphs 400
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import spacy  # noqa: E402
+
+from rules import get_registry  # noqa: E402
+from rules.base_rule import BaseRule  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+_MODEL = "en_core_web_md"
+
+_PHRASES = (
+    "OpenShift Dev Spaces", "Developer Preview", "OpenShift Container Platform",
+    "Technology Preview", "the cluster", "the administrator", "a node",
+    "the operator", "whitelist", "utilize", "e.g.", "in order to", "click on",
+    "the oc get pods command", "persistent volume", "OpenShift AI",
+)
+_VERBS = ("configures", "is deployed by", "updates", "allows you to check", "uses")
+
+
+def build_paragraphs(count: int, rng: random.Random) -> List[str]:
+    """Build *count* paragraphs of three to six sentences each.
+
+    Args:
+        count: Number of paragraphs.
+        rng: Seeded random generator.
+
+    Returns:
+        The paragraphs.
+    """
+    paragraphs = []
+    for _ in range(count):
+        sentences = [
+            f"{rng.choice(_PHRASES).capitalize()} {rng.choice(_VERBS)} "
+            f"{rng.choice(_PHRASES)} and {rng.choice(_PHRASES)}."
+            for _ in range(rng.randint(3, 6))
+        ]
+        paragraphs.append(" ".join(sentences))
+    return paragraphs
+
+
+def previous_protected_ranges(self: BaseRule, text: str) -> List[tuple]:
+    """Find protected ranges with one regex per name, on every call."""
+    ranges: List[tuple] = []
+    for term in self._protected_terms or []:
+        pattern = re.compile(r"\b" + re.escape(term) + r"\b", re.IGNORECASE)
+        ranges.extend((m.start(), m.end()) for m in pattern.finditer(text))
+    return ranges
+
+
+def previous_is_excepted(self: BaseRule, text_span: str) -> bool:
+    """Check exceptions, rebuilding the lower-cased sets on every call."""
+    if not self._exceptions or not text_span:
+        return False
+    normalized = text_span.lower().strip()
+    if normalized in {str(e).lower() for e in self._exceptions.get("global_exceptions", [])}:
+        return True
+    rule_exc = self._exceptions.get("rule_specific_exceptions", {}).get(self.rule_type, [])
+    return normalized in {str(e).lower() for e in rule_exc}
+
+
+def run(nlp: Any, paragraphs: List[str]) -> tuple[float, list]:
+    """Analyze every paragraph and return the elapsed time and issues."""
+    registry = get_registry()
+    issues = []
+    started = time.perf_counter()
+    for text in paragraphs:
+        sentences = [s.text.strip() for s in nlp(text).sents if s.text.strip()] or [text]
+        issues.append(registry.analyze_with_context_aware_rules(
+            text, sentences, nlp, {"block_type": "paragraph"},
+        ))
+    return time.perf_counter() - started, issues
+
+
+def main() -> None:
+    """Parse arguments, run both configurations, and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    if spacy.util.is_package(_MODEL):
+        nlp = spacy.load(_MODEL)
+    else:
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+    paragraphs = build_paragraphs(args.paragraphs, random.Random(args.seed))
+    print(f"pipeline: {nlp.meta.get('name')}, {sum(map(len, paragraphs))} chars")
+
+    run(nlp, paragraphs[:5])  # warm up rule construction and caches
+    current, issues = run(nlp, paragraphs)
+    with patch.object(BaseRule, "_get_protected_ranges", previous_protected_ranges), \
+            patch.object(BaseRule, "_is_excepted", previous_is_excepted):
+        previous, expected = run(nlp, paragraphs)
+    if issues != expected:
+        sys.exit("Issues differ between the two configurations")
+    print(f"previous: {previous:7.3f}s  shared index: {current:7.3f}s"
+          f"  issues: {sum(map(len, issues))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Benchmark LLM issue span resolution and remapping.
+
+Generates a seeded AsciiDoc-like document (~50k characters by default)
+and a set of synthetic LLM results whose ``flagged_text`` exercises
+every span-resolution strategy: exact, case-altered, Markdown-wrapped,
+and slightly misspelled (fuzzy).  Each result is resolved with
+``_parse_llm_results`` and then remapped with
+``_remap_issues_to_original``, once with a shared per-document
+``DocumentTextIndex`` (production behaviour) and once with a fresh
+index per issue (the previous per-issue cost model).
+
+This script is a developer tool and is NOT deployed to the cluster.
+
+Usage:
+    python scripts/bench_span_resolution.py --chars 50000 --issues 1000
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.analysis import orchestrator  # noqa: E402
+from app.services.analysis.text_index import DocumentTextIndex  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+_WORDS = (
+    "the server configuration deployment operator cluster node pod "
+    "administrator utilize install verify network storage volume "
+    "container image registry update procedure module assembly "
+    "attribute reference example command option parameter value"
+).split()
+
+
+def build_document(num_chars: int, rng: random.Random) -> str:
+    """Build a document with headings, inline bold and inline code.
+
+    Args:
+        num_chars: Approximate document length.
+        rng: Seeded random generator.
+
+    Returns:
+        The generated document text.
+    """
+    parts: list[str] = []
+    size = 0
+    while size < num_chars:
+        if rng.random() < 0.05:
+            line = "== " + " ".join(rng.choices(_WORDS, k=4)).title()
+        else:
+            words = rng.choices(_WORDS, k=rng.randint(8, 20))
+            if rng.random() < 0.3:
+                pos = rng.randrange(len(words))
+                words[pos] = f"**{words[pos]}**"
+            if rng.random() < 0.3:
+                pos = rng.randrange(len(words))
+                words[pos] = f"`{words[pos]}`"
+            line = " ".join(words).capitalize() + "."
+        parts.append(line)
+        size += len(line) + 1
+    return "\n".join(parts)
+
+
+def build_llm_results(
+    text: str, num_issues: int, rng: random.Random,
+) -> list[dict[str, Any]]:
+    """Create synthetic LLM results that need span resolution.
+
+    Args:
+        text: The document text.
+        num_issues: Number of results to create.
+        rng: Seeded random generator.
+
+    Returns:
+        List of raw LLM result dicts (spans left unresolved).
+    """
+    results: list[dict[str, Any]] = []
+    for _ in range(num_issues):
+        start = rng.randrange(0, len(text) - 40)
+        flagged = text[start:start + rng.randint(8, 30)]
+        kind = rng.random()
+        if kind < 0.5:
+            pass
+        elif kind < 0.7:
+            flagged = flagged.upper()
+        elif kind < 0.9:
+            flagged = flagged.replace("**", "").replace("`", "")
+            flagged = f"**{flagged}**"
+        else:
+            chars = list(flagged)
+            chars[rng.randrange(len(chars))] = "x"
+            flagged = "".join(chars)
+        results.append({
+            "category": "style",
+            "flagged_text": flagged,
+            "message": "Synthetic benchmark issue.",
+            "suggestions": [],
+            "severity": "low",
+        })
+    return results
+
+
+def run_once(
+    text: str, results: list[dict[str, Any]], shared_index: bool,
+) -> tuple[float, int]:
+    """Resolve and remap all results, returning elapsed time and hits.
+
+    Args:
+        text: The document text.
+        results: Raw LLM results (copied before use).
+        shared_index: Use one index per document instead of per issue.
+
+    Returns:
+        Tuple of (elapsed seconds, number of resolved spans).
+    """
+    raws = [dict(r) for r in results]
+    offset_map = list(range(len(text) + 1))
+
+    started = time.perf_counter()
+    if shared_index:
+        issues = orchestrator._parse_llm_results(raws, "llm_global", text)
+        orchestrator._remap_issues_to_original(issues, offset_map, text)
+    else:
+        issues = []
+        for raw in raws:
+            issues.extend(orchestrator._parse_llm_results([raw], "llm_global", text))
+        for issue in issues:
+            orchestrator._remap_issues_to_original([issue], offset_map, text)
+    elapsed = time.perf_counter() - started
+
+    resolved = sum(1 for issue in issues if issue.span not in ([0, 0], [-1, -1]))
+    return elapsed, resolved
+
+
+def main() -> None:
+    """Parse arguments, run both modes, and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=50_000)
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument(
+        "--skip-per-issue", action="store_true",
+        help="Only run the shared-index mode.",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    text = build_document(args.chars, rng)
+    results = build_llm_results(text, args.issues, rng)
+    print(f"document: {len(text)} chars, issues: {len(results)}")
+
+    elapsed, resolved = run_once(text, results, shared_index=True)
+    print(f"shared index:   {elapsed:8.3f}s  resolved={resolved}")
+
+    if not args.skip_per_issue:
+        elapsed, resolved = run_once(text, results, shared_index=False)
+        print(f"index per issue:{elapsed:8.3f}s  resolved={resolved}")
+
+    # Sanity check that the index builds quickly on its own
+    started = time.perf_counter()
+    index = DocumentTextIndex(text)
+    index.find_ignoring_inline_markers("benchmark")
+    _ = index.lower
+    print(f"index build:    {time.perf_counter() - started:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
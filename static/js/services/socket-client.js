@@ -2,16 +2,35 @@
  * WebSocket Client — Socket.IO event binding and streaming analysis handlers.
  * Socket.IO is loaded as a global script (not an ES module).
  *
- * All intermediate phase events (deterministic_complete, llm_granular_complete,
- * llm_global_complete) are logged but do NOT update the UI. The checking
+ * All intermediate phase events (deterministic_complete, languagetool_complete,
+ * llm_granular_complete, llm_global_complete) are logged but do NOT update the UI. The checking
  * indicator stays visible throughout the entire pipeline. Only the
  * analysis_complete event reveals the final merged results.
+ *
+ * Result events carry versioned deltas of the session's issue set
+ * (added issues, removed IDs, status changes) rather than full lists;
+ * large ones arrive deflate-compressed. A delta that does not apply to
+ * the version held here triggers a resync_results request, answered
+ * with a results_snapshot.
  */
 
 import { getGroup } from '../shared/style-guide-groups.js';
 
 let socket = null;
 
+// Issue set received for the current session, keyed by issue ID.
+const results = {
+    sessionId: null,
+    version: 0,
+    issues: new Map(),
+    resyncing: false,
+    pendingComplete: null,
+};
+
+// Compressed payloads are inflated asynchronously; chaining keeps
+// events in arrival order.
+let decodeChain = Promise.resolve();
+
 /**
  * Initialize Socket.IO connection and bind events.
  */
@@ -74,70 +93,40 @@ export function initSocketClient(store) {
         store.setState({ stageProgress: data });
     });
 
-    // Phase 1: Deterministic rules complete — logged only, no UI update
-    socket.on('deterministic_complete', (data) => {
-        if (data.session_id !== store.get('sessionId')) return;
-        console.log('[Socket] Deterministic phase complete (%d issues)', (data.issues || []).length);
-    });
-
-    // Phase 2: LLM granular (per-block) complete — logged only, no UI update
-    socket.on('llm_granular_complete', (data) => {
-        if (data.session_id !== store.get('sessionId')) return;
-        console.log('[Socket] LLM granular phase complete (%d issues)', (data.issues || []).length);
-    });
-
-    // Phase 3: LLM global (tone/flow) complete — logged only, no UI update
-    socket.on('llm_global_complete', (data) => {
-        if (data.session_id !== store.get('sessionId')) return;
-        console.log('[Socket] LLM global phase complete (%d issues)', (data.issues || []).length);
+    // Intermediate phases — deltas are applied, but only logged, no UI update
+    const phaseLabels = {
+        deterministic_complete: 'Deterministic',
+        languagetool_complete: 'LanguageTool',
+        llm_granular_complete: 'LLM granular',
+        llm_global_complete: 'LLM global',
+    };
+    Object.entries(phaseLabels).forEach(([event, label]) => {
+        onResultEvent(event, (data) => {
+            if (data.session_id !== store.get('sessionId')) return;
+            applyOrResync(data);
+            console.log('[Socket] %s phase complete (%d issues)', label, data.count ?? 0);
+        });
     });
 
     // Final: Analysis fully complete — the single source of truth for UI results
-    socket.on('analysis_complete', (data) => {
+    onResultEvent('analysis_complete', (data) => {
         if (data.session_id !== store.get('sessionId')) return;
-        const stateUpdate = {
-            analysisStatus: 'complete',
-            qualityScore: (typeof data.score === 'object' ? data.score?.score : data.score) ?? store.get('qualityScore'),
-            detectedContentType: data.detected_content_type || store.get('detectedContentType'),
-        };
-
-        if (data.issues && data.issues.length > 0) {
-            const normalized = data.issues.map((issue, idx) => normalizeSocketIssue(issue, idx));
-
-            const seen = new Set();
-            const finalIssues = normalized.filter((e) => {
-                const key = `${e.globalSpan[0]}-${e.globalSpan[1]}-${e.type}`;
-                if (seen.has(key)) return false;
-                seen.add(key);
-                return true;
-            });
-
-            const activeGroup = store.get('activeGroup');
-            stateUpdate.errors = finalIssues;
-            stateUpdate.filteredErrors = activeGroup === 'all'
-                ? finalIssues
-                : finalIssues.filter((e) => e.group === activeGroup);
-        }
-
-        // Merge report data into the same setState to avoid double subscriber notification
-        if (data.report) {
-            stateUpdate.readability = data.report.readability || store.get('readability');
-            stateUpdate.statistics = data.report.statistics || store.get('statistics');
-            stateUpdate.reportData = data.report || store.get('reportData');
+        if (!applyOrResync(data)) {
+            // Rendered once the snapshot arrives
+            results.pendingComplete = data;
+            return;
         }
+        renderComplete(store, data);
+    });
 
-        store.setState(stateUpdate);
-
-        // Guard: if user resolved issues during LLM phase, the score from
-        // analysis_complete may be stale.  Backend preserves statuses, but
-        // the emitted score was computed before the session update.
-        const { resolvedErrors, dismissedErrors, manuallyFixedErrors } = store.getState();
-        const hasResolved = (resolvedErrors?.size > 0)
-            || (dismissedErrors?.size > 0)
-            || (manuallyFixedErrors?.size > 0);
-        const currentErrors = store.get('errors') || [];
-        if (hasResolved && currentErrors.length === 0) {
-            store.setState({ qualityScore: 100 });
+    // Answer to resync_results: the full issue set at the current version
+    onResultEvent('results_snapshot', (data) => {
+        if (data.session_id !== store.get('sessionId')) return;
+        applyResultDelta(data);
+        const pending = results.pendingComplete;
+        results.pendingComplete = null;
+        if (pending && pending.session_id === data.session_id) {
+            renderComplete(store, pending);
         }
     });
 
@@ -185,6 +174,127 @@ export function initSocketClient(store) {
     return socket;
 }
 
+/**
+ * Register a handler for a result event, inflating compressed payloads.
+ */
+function onResultEvent(event, handler) {
+    socket.on(event, (message) => {
+        decodeChain = decodeChain
+            .then(() => decodePayload(message))
+            .then(handler)
+            .catch((err) => console.warn('[Socket] Dropped %s event:', event, err));
+    });
+}
+
+/**
+ * Inflate a payload sent with encoding "deflate" (zlib JSON).
+ */
+async function decodePayload(message) {
+    if (!message || message.encoding !== 'deflate') return message;
+    const inflated = new Blob([message.data])
+        .stream()
+        .pipeThrough(new DecompressionStream('deflate'));
+    return JSON.parse(await new Response(inflated).text());
+}
+
+/**
+ * Apply a result delta, or ask the server for a snapshot if it does not
+ * follow the version held here. Returns true when the delta applied.
+ */
+function applyOrResync(data) {
+    if (applyResultDelta(data)) return true;
+    if (!results.resyncing) {
+        results.resyncing = true;
+        socket.emit('resync_results', { session_id: data.session_id });
+    }
+    return false;
+}
+
+/**
+ * Apply a delta or snapshot to the held issue set.
+ * base_version 0 (or a snapshot) starts over with an empty set.
+ */
+function applyResultDelta(data) {
+    const restart = data.reset || data.base_version === 0;
+    if (restart) {
+        results.sessionId = data.session_id;
+        results.issues = new Map();
+    } else if (results.sessionId !== data.session_id || data.base_version !== results.version) {
+        return false;
+    }
+
+    (data.added || []).forEach((issue) => results.issues.set(issue.id, issue));
+    (data.removed || []).forEach((id) => results.issues.delete(id));
+    Object.entries(data.status || {}).forEach(([id, status]) => {
+        const issue = results.issues.get(id);
+        if (issue) results.issues.set(id, { ...issue, status });
+    });
+    results.version = data.version;
+    results.resyncing = false;
+    return true;
+}
+
+/**
+ * Held issues in the server's merge order (sentence, then span start).
+ */
+function currentIssues() {
+    return [...results.issues.values()].sort((a, b) => (
+        (a.sentence_index - b.sentence_index)
+        || ((a.span?.[0] ?? 0) - (b.span?.[0] ?? 0))
+    ));
+}
+
+/**
+ * Show the final results of an analysis_complete event.
+ */
+function renderComplete(store, data) {
+    const issues = currentIssues();
+    const stateUpdate = {
+        analysisStatus: 'complete',
+        qualityScore: (typeof data.score === 'object' ? data.score?.score : data.score) ?? store.get('qualityScore'),
+        detectedContentType: data.detected_content_type || store.get('detectedContentType'),
+    };
+
+    if (issues.length > 0) {
+        const normalized = issues.map((issue, idx) => normalizeSocketIssue(issue, idx));
+
+        const seen = new Set();
+        const finalIssues = normalized.filter((e) => {
+            const key = `${e.globalSpan[0]}-${e.globalSpan[1]}-${e.type}`;
+            if (seen.has(key)) return false;
+            seen.add(key);
+            return true;
+        });
+
+        const activeGroup = store.get('activeGroup');
+        stateUpdate.errors = finalIssues;
+        stateUpdate.filteredErrors = activeGroup === 'all'
+            ? finalIssues
+            : finalIssues.filter((e) => e.group === activeGroup);
+    }
+
+    // Merge report data into the same setState to avoid double subscriber notification
+    if (data.report) {
+        stateUpdate.readability = data.report.readability || store.get('readability');
+        stateUpdate.statistics = data.report.statistics || store.get('statistics');
+        stateUpdate.reportData = data.report || store.get('reportData');
+    }
+
+    store.setState(stateUpdate);
+
+    // Guard: if user resolved issues during LLM phase, the score from
+    // analysis_complete may be stale.  Backend preserves statuses, but
+    // the emitted score was computed before the session update.
+    const { resolvedErrors, dismissedErrors, manuallyFixedErrors } = store.getState();
+    const hasResolved = (resolvedErrors?.size > 0)
+        || (dismissedErrors?.size > 0)
+        || (manuallyFixedErrors?.size > 0);
+    const currentErrors = store.get('errors') || [];
+    if (hasResolved && currentErrors.length === 0) {
+        store.setState({ qualityScore: 100 });
+    }
+}
+
 /**
  * Normalize an issue from a socket event for the UI.
  */
@@ -383,6 +383,25 @@ class IBMStyleMapping:
             'note': ibm_style.get('note'),
         }
 
+    def get_rule_sections(self) -> Dict[str, List[str]]:
+        """Get the mapping sections each rule ID appears in.
+
+        Covers every top-level section that maps IDs to rule dicts, so
+        sections outside the searched categories, which are reachable
+        only as a category hint, are included.
+
+        Returns:
+            Dict of rule ID to section names, in mapping order.
+        """
+        sections: Dict[str, List[str]] = {}
+        for section, section_data in (self._mapping or {}).items():
+            if not isinstance(section_data, dict):
+                continue
+            for rule_id, rule_data in section_data.items():
+                if isinstance(rule_data, dict):
+                    sections.setdefault(rule_id, []).append(section)
+        return sections
+
     def get_all_unverified_rules(self) -> List[Dict[str, Any]]:
         """Get list of all unverified rules for verification tracking.
 
@@ -582,3 +601,12 @@ def get_verification_stats() -> Dict[str, Any]:
         Dict with verification stats.
     """
     return get_mapping_instance().get_verification_stats()
+
+
+def get_rule_sections() -> Dict[str, List[str]]:
+    """Get the mapping sections each rule ID appears in.
+
+    Returns:
+        Dict of rule ID to section names.
+    """
+    return get_mapping_instance().get_rule_sections()
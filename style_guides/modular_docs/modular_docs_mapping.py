@@ -271,6 +271,25 @@ class ModularDocsMapping:
             'topic': modular_docs.get('topic'),
         }
 
+    def get_rule_sections(self) -> Dict[str, List[str]]:
+        """Get the mapping sections each rule ID appears in.
+
+        Covers every top-level section that maps IDs to rule dicts, so
+        sections outside the searched categories, which are reachable
+        only as a category hint, are included.
+
+        Returns:
+            Dict of rule ID to section names, in mapping order.
+        """
+        sections: Dict[str, List[str]] = {}
+        for section, section_data in (self._mapping or {}).items():
+            if not isinstance(section_data, dict):
+                continue
+            for rule_id, rule_data in section_data.items():
+                if isinstance(rule_data, dict):
+                    sections.setdefault(rule_id, []).append(section)
+        return sections
+
     def get_all_unverified_rules(self) -> List[Dict[str, Any]]:
         """Get list of all unverified rules for verification tracking.
 
@@ -395,3 +414,12 @@ def get_verification_status(
         Dict with verification status details.
     """
     return _get_mapping_instance().get_verification_status(rule_id, category)
+
+
+def get_rule_sections() -> Dict[str, List[str]]:
+    """Get the mapping sections each rule ID appears in.
+
+    Returns:
+        Dict of rule ID to section names.
+    """
+    return _get_mapping_instance().get_rule_sections()
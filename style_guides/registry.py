@@ -7,6 +7,14 @@ Checks guides in priority order: Red Hat -> IBM -> Accessibility ->
 Modular Docs, returning the first match found.  Red Hat SSG overrides
 IBM when both guides cover the same topic.
 
+The priority resolution runs once, on first lookup, for every rule the
+guides define.  Its results are kept in an immutable table keyed by
+``(rule_type, category)``, so lookups are dictionary hits.  The table
+holds an extra entry only where a category hint changes the result; a
+rule the guides do not define gets the empty results.  IBM's confidence
+adjustment depends on how long ago a rule was verified, so the table is
+rebuilt when the date changes.
+
 Usage:
     from style_guides.registry import get_citation, format_citation
 
@@ -15,8 +23,13 @@ Usage:
     adjustment = get_confidence_adjustment('procedures')
 """
 
+import dataclasses
+import datetime
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +48,44 @@ _GUIDE_MODULES: List[Tuple[str, str]] = [
 # Cached module references after first import attempt
 _loaded_modules: Dict[str, Optional[object]] = {}
 
+# Categories that change a result without being a section holding the
+# rule (IBM adds a boost to legal rules)
+_CATEGORY_DEPENDENT = ('legal_information',)
+
+_UNKNOWN_STATUS: Mapping[str, Any] = MappingProxyType({'status': 'unknown', 'verified': False})
+
+
+@dataclasses.dataclass(frozen=True)
+class _GuideEntry:
+    """Resolved style guide data for one rule and category hint.
+
+    Attributes:
+        citation: Result of ``get_citation``.
+        excerpt: Result of ``get_excerpt``.
+        formatted_citation: Result of ``format_citation``.
+        confidence_adjustment: Result of ``get_confidence_adjustment``.
+        verification_status: Result of ``get_verification_status``.
+    """
+
+    citation: Mapping[str, Any]
+    excerpt: Mapping[str, Any]
+    formatted_citation: str
+    confidence_adjustment: float
+    verification_status: Mapping[str, Any]
+
+
+_EMPTY_ENTRY = _GuideEntry(
+    citation=MappingProxyType({}),
+    excerpt=MappingProxyType({}),
+    formatted_citation=DEFAULT_CITATION,
+    confidence_adjustment=0.0,
+    verification_status=_UNKNOWN_STATUS,
+)
+
+_table: Mapping[Tuple[str, Optional[str]], _GuideEntry] = MappingProxyType({})
+_table_expires: float = 0.0  # time.monotonic() of the next local midnight
+_table_lock = threading.Lock()
+
 
 def _get_guide_module(module_path: str) -> Optional[object]:
     """Lazily import and cache a guide module.
@@ -109,12 +160,12 @@ def _is_valid_result(result: Any, empty_result: Any) -> bool:
     return result != empty_result
 
 
-def get_citation(
+def _resolve_citation(
     rule_type: str, category: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Look up citation data for a rule across all style guides.
+    """Resolve citation data for a rule across all style guides.
 
-    Checks IBM, Red Hat, Accessibility, and Modular Docs in priority
+    Checks Red Hat, IBM, Accessibility, and Modular Docs in priority
     order. Returns the first match found.
 
     Args:
@@ -177,10 +228,10 @@ def _extract_guide_data(mapping: Dict[str, Any]) -> Dict[str, Any]:
     return {}
 
 
-def get_excerpt(
+def _resolve_excerpt(
     rule_type: str, category: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Look up excerpt data for a rule across all style guides.
+    """Resolve excerpt data for a rule across all style guides.
 
     Args:
         rule_type: Rule identifier.
@@ -198,10 +249,10 @@ def get_excerpt(
     return excerpt
 
 
-def format_citation(
+def _resolve_formatted_citation(
     rule_type: str, category: Optional[str] = None
 ) -> str:
-    """Format a human-readable citation string for a rule.
+    """Resolve a human-readable citation string for a rule.
 
     Checks all guides in priority order and returns the formatted
     citation from the first guide that has a mapping.
@@ -231,10 +282,10 @@ def format_citation(
     return DEFAULT_CITATION
 
 
-def get_confidence_adjustment(
+def _resolve_confidence_adjustment(
     rule_type: str, category: Optional[str] = None
 ) -> float:
-    """Get confidence score adjustment for a rule.
+    """Resolve the confidence score adjustment for a rule.
 
     Verified rules get +0.2 boost, unverified -0.1, legal +0.3.
     Returns the adjustment from the first guide that has a mapping.
@@ -253,10 +304,10 @@ def get_confidence_adjustment(
     return adjustment
 
 
-def get_verification_status(
+def _resolve_verification_status(
     rule_type: str, category: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Get verification status for a rule across all guides.
+    """Resolve the verification status for a rule across all guides.
 
     Args:
         rule_type: Rule identifier.
@@ -280,3 +331,202 @@ def get_verification_status(
             return result
 
     return {'status': 'unknown', 'verified': False}
+
+
+# ---------------------------------------------------------------------------
+# Resolved table
+# ---------------------------------------------------------------------------
+
+
+def _resolve_entry(rule_type: str, category: Optional[str]) -> _GuideEntry:
+    """Resolve every lookup for a rule and category hint.
+
+    Args:
+        rule_type: Rule identifier.
+        category: Category hint, or None.
+
+    Returns:
+        The resolved entry.
+    """
+    return _GuideEntry(
+        citation=MappingProxyType(_resolve_citation(rule_type, category)),
+        excerpt=MappingProxyType(_resolve_excerpt(rule_type, category)),
+        formatted_citation=_resolve_formatted_citation(rule_type, category),
+        confidence_adjustment=_resolve_confidence_adjustment(rule_type, category),
+        verification_status=MappingProxyType(_resolve_verification_status(rule_type, category)),
+    )
+
+
+def _rule_sections() -> Dict[str, set]:
+    """Collect every rule the guides define and the sections holding it.
+
+    Returns:
+        Dict of rule identifier to the section names, across guides,
+        it appears in.
+    """
+    sections: Dict[str, set] = {}
+    for _guide_name, module_path in _GUIDE_MODULES:
+        module = _get_guide_module(module_path)
+        func: Optional[Callable] = getattr(module, 'get_rule_sections', None)
+        if func is None:
+            continue
+        for rule_type, rule_sections in func().items():
+            sections.setdefault(rule_type, set()).update(rule_sections)
+    return sections
+
+
+def _build_table() -> Mapping[Tuple[str, Optional[str]], _GuideEntry]:
+    """Resolve every known rule in priority order.
+
+    Each rule gets an entry under ``(rule_type, None)``, plus one per
+    category hint (a section holding the rule, or a category in
+    ``_CATEGORY_DEPENDENT``) whose result differs from it.
+
+    Returns:
+        The immutable table.
+    """
+    started = time.perf_counter()
+    table: Dict[Tuple[str, Optional[str]], _GuideEntry] = {}
+    for rule_type, sections in sorted(_rule_sections().items()):
+        base = table[(rule_type, None)] = _resolve_entry(rule_type, None)
+        for category in sorted(sections.union(_CATEGORY_DEPENDENT)):
+            entry = _resolve_entry(rule_type, category)
+            if entry != base:
+                table[(rule_type, category)] = entry
+    logger.info(
+        "Built style guide table: %d entries in %.1f ms",
+        len(table), (time.perf_counter() - started) * 1000,
+    )
+    return MappingProxyType(table)
+
+
+def _get_table() -> Mapping[Tuple[str, Optional[str]], _GuideEntry]:
+    """Return the resolved table, building it on first use each day.
+
+    Returns:
+        The immutable table.
+    """
+    global _table, _table_expires  # noqa: PLW0603
+    if time.monotonic() >= _table_expires:
+        with _table_lock:
+            if time.monotonic() >= _table_expires:
+                _table = _build_table()
+                _table_expires = time.monotonic() + _seconds_to_midnight()
+    return _table
+
+
+def _seconds_to_midnight() -> float:
+    """Return the seconds until the next local midnight."""
+    now = datetime.datetime.now()
+    midnight = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time())
+    return (midnight - now).total_seconds()
+
+
+def _lookup(rule_type: str, category: Optional[str]) -> _GuideEntry:
+    """Return the resolved entry for a rule and category hint.
+
+    Args:
+        rule_type: Rule identifier.
+        category: Optional category hint.
+
+    Returns:
+        The entry for the hint, the rule's entry when the hint changes
+        nothing, or the empty entry for a rule no guide defines.
+    """
+    table = _get_table()
+    entry = table.get((rule_type, category))
+    if entry is None:
+        entry = table.get((rule_type, None), _EMPTY_ENTRY)
+    return entry
+
+
+# ---------------------------------------------------------------------------
+# Public lookups
+# ---------------------------------------------------------------------------
+
+
+def get_citation(
+    rule_type: str, category: Optional[str] = None
+) -> Dict[str, Any]:
+    """Look up citation data for a rule across all style guides.
+
+    Checks Red Hat, IBM, Accessibility, and Modular Docs in priority
+    order. Returns the first match found.
+
+    Args:
+        rule_type: Rule identifier (e.g., 'articles', 'inclusive_language').
+        category: Optional category hint.
+
+    Returns:
+        Dict with guide_name, topic, pages, verified, and
+        citation_text fields, or empty dict if not found in any guide.
+    """
+    return dict(_lookup(rule_type, category).citation)
+
+
+def get_excerpt(
+    rule_type: str, category: Optional[str] = None
+) -> Dict[str, Any]:
+    """Look up excerpt data for a rule across all style guides.
+
+    Args:
+        rule_type: Rule identifier.
+        category: Optional category hint.
+
+    Returns:
+        Dict with guide_name, topic, pages, excerpt, and verified
+        fields, or empty dict if not found.
+    """
+    return dict(_lookup(rule_type, category).excerpt)
+
+
+def format_citation(
+    rule_type: str, category: Optional[str] = None
+) -> str:
+    """Format a human-readable citation string for a rule.
+
+    Uses the first guide, in priority order, that has a mapping.
+
+    Args:
+        rule_type: Rule identifier.
+        category: Optional category hint.
+
+    Returns:
+        Formatted citation string like ``"IBM Style Guide (Page 312)"``
+        or the default citation if not found.
+    """
+    return _lookup(rule_type, category).formatted_citation
+
+
+def get_confidence_adjustment(
+    rule_type: str, category: Optional[str] = None
+) -> float:
+    """Get confidence score adjustment for a rule.
+
+    Verified rules get +0.2 boost, unverified -0.1, legal +0.3.
+    Returns the adjustment from the first guide that has a mapping.
+
+    Args:
+        rule_type: Rule identifier.
+        category: Optional category hint.
+
+    Returns:
+        Confidence adjustment value, or 0.0 if not found.
+    """
+    return _lookup(rule_type, category).confidence_adjustment
+
+
+def get_verification_status(
+    rule_type: str, category: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get verification status for a rule across all guides.
+
+    Args:
+        rule_type: Rule identifier.
+        category: Optional category hint.
+
+    Returns:
+        Dict with status and verified fields, or default unknown
+        status if not found.
+    """
+    return dict(_lookup(rule_type, category).verification_status)
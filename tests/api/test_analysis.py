@@ -184,6 +184,34 @@ class TestAnalyzeContentTypes:
         assert "error" in data
 
 
+class TestAnalyzePriorityHint:
+    """Tests for the viewport priority hint."""
+
+    def test_viewport_passed_to_orchestrator(self, client: FlaskClient) -> None:
+        """A viewport reaches the orchestrator as a (start, end) hint."""
+        with patch(
+            "app.services.analysis.orchestrator.analyze",
+            return_value=_build_mock_response(),
+        ) as mock_analyze:
+            response = client.post(
+                "/api/v1/analyze",
+                json={"text": "This is a test.", "viewport": {"start": 5, "end": 15}},
+            )
+
+        assert response.status_code == 200
+        assert mock_analyze.call_args.kwargs["priority_hint"] == (5, 15)
+
+    def test_malformed_viewport_rejected(self, client: FlaskClient) -> None:
+        """A malformed viewport returns 400."""
+        response = client.post(
+            "/api/v1/analyze",
+            json={"text": "This is a test.", "viewport": {"start": 15, "end": 5}},
+        )
+
+        assert response.status_code == 400
+        assert "viewport" in response.get_json()["error"]
+
+
 class TestAnalyzeResponseStructure:
     """Tests for the structure and content of analysis responses."""
 
@@ -60,6 +60,44 @@ class TestHealthCheck:
         assert isinstance(data["llm_available"], bool)
         assert isinstance(data["rules_count"], int)
 
+    def test_health_reports_cancellation_counters(self, client: FlaskClient) -> None:
+        """GET /api/v1/health includes integer cancellation counters."""
+        response = client.get("/api/v1/health")
+
+        counters = response.get_json()["cancellation"]
+        assert set(counters) == {
+            "analyses_cancelled", "calls_skipped", "calls_aborted", "tokens_saved",
+        }
+        assert all(isinstance(value, int) for value in counters.values())
+
+    def test_health_reports_memory(self, client: FlaskClient) -> None:
+        """GET /api/v1/health includes the session store's memory figures."""
+        response = client.get("/api/v1/health")
+
+        memory = response.get_json()["memory"]
+        assert set(memory) == {
+            "sessions", "session_bytes", "analyses", "analysis_bytes",
+            "budget_bytes", "evictions",
+        }
+        assert all(isinstance(value, int) for value in memory.values())
+
+    def test_health_reports_single_flight(self, client: FlaskClient) -> None:
+        """GET /api/v1/health includes shared-analysis counters."""
+        response = client.get("/api/v1/health")
+
+        shared = response.get_json()["single_flight"]
+        assert set(shared) == {"flights", "followers", "cached_results"}
+
+    def test_health_reports_queues(self, client: FlaskClient) -> None:
+        """GET /api/v1/health includes the LLM work queue depths."""
+        from app.services.analysis.block_priority import BlockQueue
+
+        queue = BlockQueue(["a", "b"], [(0, 1), (1, 2)])
+        response = client.get("/api/v1/health")
+
+        assert response.get_json()["queues"] == {"blocks_pending": 2, "llm_calls_in_flight": 0}
+        assert queue.pop() == "a"
+
     def test_health_has_uptime(self, client: FlaskClient) -> None:
         """GET /api/v1/health response includes uptime_seconds.
 
@@ -135,6 +135,78 @@ class TestDismissIssue:
         assert "error" in data
 
 
+class TestBulkStatus:
+    """Tests for POST /api/v1/issues/bulk-status."""
+
+    def test_bulk_accept_category(
+        self, client: FlaskClient, session_with_issues: dict[str, Any]
+    ) -> None:
+        """Accepting a category updates only its issues and returns the score.
+
+        Args:
+            client: The Flask test client.
+            session_with_issues: Pre-populated session fixture.
+        """
+        response = client.post(
+            "/api/v1/issues/bulk-status",
+            json={
+                "session_id": session_with_issues["session_id"],
+                "status": "accepted",
+                "category": "grammar",
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["updated_issue_ids"] == [session_with_issues["issue_id_2"]]
+        assert "score" in data["score"]
+
+    def test_bulk_invalid_status(
+        self, client: FlaskClient, session_with_issues: dict[str, Any]
+    ) -> None:
+        """An unsupported status value returns 400.
+
+        Args:
+            client: The Flask test client.
+            session_with_issues: Pre-populated session fixture.
+        """
+        response = client.post(
+            "/api/v1/issues/bulk-status",
+            json={
+                "session_id": session_with_issues["session_id"],
+                "status": "open",
+                "category": "style",
+            },
+        )
+
+        assert response.status_code == 400
+
+    def test_bulk_requires_selector(
+        self, client: FlaskClient, session_with_issues: dict[str, Any]
+    ) -> None:
+        """A request without issue_ids, category or rule_name returns 400.
+
+        Args:
+            client: The Flask test client.
+            session_with_issues: Pre-populated session fixture.
+        """
+        response = client.post(
+            "/api/v1/issues/bulk-status",
+            json={"session_id": session_with_issues["session_id"], "status": "dismissed"},
+        )
+
+        assert response.status_code == 400
+
+    def test_bulk_unknown_session(self, client: FlaskClient) -> None:
+        """An unknown session returns 404."""
+        response = client.post(
+            "/api/v1/issues/bulk-status",
+            json={"session_id": "missing", "status": "accepted", "issue_ids": ["x"]},
+        )
+
+        assert response.status_code == 404
+
+
 class TestFeedback:
     """Tests for POST /api/v1/issues/{id}/feedback."""
 
@@ -0,0 +1,112 @@
+"""Tests for the slow-analysis profile admin endpoints.
+
+Verifies GET /api/v1/admin/profiles and the per-profile download are
+hidden unless profiling and the admin token are configured, refuse a
+wrong token, and serve both export formats.
+"""
+
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+from flask.testing import FlaskClient
+
+from app.config import Config
+from app.services.analysis import slow_profiles
+from app.services.analysis.slow_profiles import ProfileCapture, SlowAnalysisProfiler, track
+
+TOKEN = "s3cret"
+
+
+@pytest.fixture
+def profiler() -> Iterator[SlowAnalysisProfiler]:
+    """Yield an installed profiler with the admin token configured."""
+    instance = SlowAnalysisProfiler(threshold=0.0)
+    with patch.object(Config, "SLOW_PROFILE_ENABLED", True), \
+            patch.object(Config, "SLOW_PROFILE_ADMIN_TOKEN", TOKEN), \
+            patch.object(slow_profiles, "_slow_profiler_instance", instance):
+        yield instance
+
+
+@pytest.fixture
+def capture(profiler: SlowAnalysisProfiler) -> ProfileCapture:
+    """Return a kept capture with one sampled stack."""
+    capture = profiler.begin("sess-1")
+    with track(capture, "request"):
+        pass
+    capture.samples[("request", "analyze (a.py:1)")] = 0.5
+    return capture
+
+
+class TestProfileAccess:
+    """Tests for the endpoints' access control."""
+
+    def test_hidden_when_disabled(self, client: FlaskClient) -> None:
+        """With profiling off the routes answer 404."""
+        with patch.object(Config, "SLOW_PROFILE_ADMIN_TOKEN", TOKEN):
+            response = client.get("/api/v1/admin/profiles", headers={"X-Admin-Token": TOKEN})
+
+        assert response.status_code == 404
+
+    def test_hidden_without_token(self, client: FlaskClient, profiler: SlowAnalysisProfiler) -> None:
+        """With no admin token configured the routes answer 404."""
+        with patch.object(Config, "SLOW_PROFILE_ADMIN_TOKEN", ""):
+            response = client.get("/api/v1/admin/profiles", headers={"X-Admin-Token": ""})
+
+        assert response.status_code == 404
+
+    def test_wrong_token_forbidden(self, client: FlaskClient, profiler: SlowAnalysisProfiler) -> None:
+        """A missing or wrong token is refused with 403."""
+        assert client.get("/api/v1/admin/profiles").status_code == 403
+        response = client.get("/api/v1/admin/profiles", headers={"X-Admin-Token": "nope"})
+
+        assert response.status_code == 403
+
+
+class TestProfileDownloads:
+    """Tests for listing and downloading profiles."""
+
+    def test_list(self, client: FlaskClient, capture: ProfileCapture) -> None:
+        """The list carries the settings and each kept capture."""
+        response = client.get("/api/v1/admin/profiles", headers={"X-Admin-Token": TOKEN})
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["threshold_seconds"] == 0.0
+        assert [p["id"] for p in data["profiles"]] == [capture.id]
+        assert data["profiles"][0]["session_id"] == "sess-1"
+        assert data["profiles"][0]["tasks"] == ["request"]
+
+    def test_download_collapsed(self, client: FlaskClient, capture: ProfileCapture) -> None:
+        """The default download is collapsed stacks as an attachment."""
+        response = client.get(f"/api/v1/admin/profiles/{capture.id}", headers={"X-Admin-Token": TOKEN})
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        assert f"analysis-{capture.id}.collapsed.txt" in response.headers["Content-Disposition"]
+        assert "request;analyze (a.py:1) 500\n" in response.get_data(as_text=True)
+
+    def test_download_speedscope(self, client: FlaskClient, capture: ProfileCapture) -> None:
+        """format=speedscope returns a speedscope JSON file."""
+        response = client.get(
+            f"/api/v1/admin/profiles/{capture.id}?format=speedscope", headers={"X-Admin-Token": TOKEN},
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["shared"]["frames"] == [{"name": "analyze (a.py:1)"}]
+        assert data["profiles"][0]["weights"] == [0.5]
+
+    def test_invalid_format(self, client: FlaskClient, capture: ProfileCapture) -> None:
+        """An unknown format is a 400."""
+        response = client.get(
+            f"/api/v1/admin/profiles/{capture.id}?format=pprof", headers={"X-Admin-Token": TOKEN},
+        )
+
+        assert response.status_code == 400
+
+    def test_unknown_profile(self, client: FlaskClient, profiler: SlowAnalysisProfiler) -> None:
+        """An unknown ID is a 404."""
+        response = client.get("/api/v1/admin/profiles/0-0", headers={"X-Admin-Token": TOKEN})
+
+        assert response.status_code == 404
@@ -0,0 +1,93 @@
+"""Tests for the report API endpoints.
+
+Verifies JSON report retrieval, direct PDF download, and the
+job-style PDF flow (submit, poll, download).
+"""
+
+import logging
+import time
+from typing import Any, Generator
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def _thread_renderer(app: Flask) -> Generator[None, None, None]:
+    """Render PDFs in a background thread instead of a process pool.
+
+    Args:
+        app: The Flask test application (resets singletons first).
+    """
+    import app.services.reporting.pdf_jobs as pdf_jobs_mod
+
+    pdf_jobs_mod._manager_instance = pdf_jobs_mod.PdfJobManager(max_workers=0)
+    yield
+    if pdf_jobs_mod._manager_instance is not None:
+        pdf_jobs_mod._manager_instance.shutdown()
+    pdf_jobs_mod._manager_instance = None
+
+
+class TestReportPdf:
+    """Tests for POST /api/v1/report/pdf."""
+
+    def test_pdf_download(
+        self, client: FlaskClient, session_with_issues: dict[str, Any]
+    ) -> None:
+        """A valid session returns a PDF attachment."""
+        response = client.post(
+            "/api/v1/report/pdf",
+            json={"session_id": session_with_issues["session_id"]},
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "application/pdf"
+        assert response.data.startswith(b"%PDF")
+
+    def test_pdf_missing_session_id(self, client: FlaskClient) -> None:
+        """A request without session_id returns 400."""
+        response = client.post("/api/v1/report/pdf", json={})
+        assert response.status_code == 400
+
+    def test_pdf_unknown_session(self, client: FlaskClient) -> None:
+        """An unknown session returns 404."""
+        response = client.post("/api/v1/report/pdf", json={"session_id": "nope"})
+        assert response.status_code == 404
+
+
+class TestReportPdfJobs:
+    """Tests for the /api/v1/report/pdf/jobs endpoints."""
+
+    def test_submit_poll_download(
+        self, client: FlaskClient, session_with_issues: dict[str, Any]
+    ) -> None:
+        """A submitted job can be polled to completion and downloaded."""
+        submit = client.post(
+            "/api/v1/report/pdf/jobs",
+            json={"session_id": session_with_issues["session_id"]},
+        )
+        assert submit.status_code == 202
+        job_id = submit.get_json()["job_id"]
+
+        deadline = time.monotonic() + 10
+        status = client.get(f"/api/v1/report/pdf/jobs/{job_id}").get_json()
+        while status["status"] == "pending" and time.monotonic() < deadline:
+            time.sleep(0.02)
+            status = client.get(f"/api/v1/report/pdf/jobs/{job_id}").get_json()
+        assert status["status"] == "done"
+
+        download = client.get(f"/api/v1/report/pdf/jobs/{job_id}/download")
+        assert download.status_code == 200
+        assert download.data.startswith(b"%PDF")
+
+    def test_submit_unknown_session(self, client: FlaskClient) -> None:
+        """Submitting for an unknown session returns 404."""
+        response = client.post("/api/v1/report/pdf/jobs", json={"session_id": "nope"})
+        assert response.status_code == 404
+
+    def test_unknown_job(self, client: FlaskClient) -> None:
+        """Polling or downloading an unknown job returns 404."""
+        assert client.get("/api/v1/report/pdf/jobs/nope").status_code == 404
+        assert client.get("/api/v1/report/pdf/jobs/nope/download").status_code == 404
@@ -0,0 +1,109 @@
+"""Tests for the benchmark suite's corpus, stub LLM and baseline check.
+
+Validates that the corpus is reproducible and carries the requested
+issue density in every format, that the stub provider answers the
+client without a network, and that baseline comparison flags only
+growth beyond the tolerance and the noise floor.
+"""
+
+import argparse
+import json
+
+import pytest
+
+from app.llm import client as llm_client
+from benchmarks.corpus import FORMATS, build_sections, generate
+from benchmarks.run import compare, parse_size
+from benchmarks.stub_llm import stub_llm
+
+
+class TestCorpus:
+    """Tests for the synthetic corpus generator."""
+
+    def test_same_seed_same_document(self) -> None:
+        """A seed and size always give the same document."""
+        assert generate("asciidoc", 4096, seed=7).content == generate("asciidoc", 4096, seed=7).content
+        assert generate("asciidoc", 4096, seed=7).content != generate("asciidoc", 4096, seed=8).content
+
+    def test_size_and_density(self) -> None:
+        """The text reaches the requested size with about the requested density."""
+        title, sections, sentences, planted = build_sections(50_000, 1, 0.2)
+        text = title + "".join(
+            s.heading + "".join(s.paragraphs) + "".join(s.steps) + s.command for s in sections
+        )
+
+        assert 50_000 <= len(text) < 52_000
+        assert 0.15 < planted / sentences < 0.25
+        assert build_sections(50_000, 1, 0.0)[3] == 0
+
+    @pytest.mark.parametrize("fmt", FORMATS)
+    def test_every_format_renders(self, fmt: str) -> None:
+        """Each format renders the same sentences."""
+        doc = generate(fmt, 2048, issue_density=0.5)
+
+        assert doc.content
+        assert doc.planted_issues == generate("markdown", 2048, issue_density=0.5).planted_issues
+
+    def test_rejects_unknown_format(self) -> None:
+        """Unknown formats and densities are refused."""
+        with pytest.raises(ValueError):
+            generate("rtf", 1024)
+        with pytest.raises(ValueError):
+            generate("html", 1024, issue_density=1.5)
+
+
+class TestStubLlm:
+    """Tests for the in-process LLM provider."""
+
+    def test_client_uses_stub(self) -> None:
+        """Block analysis returns the planted phrases the prompt contains."""
+        with stub_llm() as manager:
+            manager_before = llm_client._model_manager_instance
+            issues = llm_client._get_client()._safe_analysis_call("Please click on and/or Save.")
+
+        assert manager_before is manager
+        assert manager.calls == 1
+        assert {issue["flagged_text"] for issue in issues} == {"and/or", "Please"}
+
+    def test_judge_keeps_everything(self) -> None:
+        """The judge answer keeps every issue."""
+        with stub_llm() as manager:
+            raw = manager.generate_text("", system_prompt="You are reviewing editorial flags")
+
+        assert json.loads(raw) == {"keep": [], "drop": []}
+
+
+class TestBaseline:
+    """Tests for result comparison."""
+
+    @staticmethod
+    def _results(seconds: float, peak_mb: float = 1.0) -> dict:
+        return {"results": {"asciidoc-1024": {"rules": {"seconds": seconds, "peak_mb": peak_mb}}}}
+
+    def test_within_tolerance(self) -> None:
+        """Growth inside the tolerance is not a regression."""
+        assert compare(self._results(0.12), self._results(0.1), 0.25) == []
+
+    def test_beyond_tolerance(self) -> None:
+        """Time and memory growth beyond the tolerance are reported."""
+        regressions = compare(self._results(0.2, 4.0), self._results(0.1, 1.0), 0.25)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith("asciidoc-1024 rules seconds")
+
+    def test_noise_floor(self) -> None:
+        """Sub-millisecond stages do not flap."""
+        assert compare(self._results(0.0009), self._results(0.0003), 0.25) == []
+
+    def test_missing_entries_skipped(self) -> None:
+        """Documents absent from the baseline are not compared."""
+        assert compare(self._results(1.0), {"results": {}}, 0.25) == []
+
+
+def test_parse_size() -> None:
+    """Sizes accept k and m suffixes."""
+    assert parse_size("512") == 512
+    assert parse_size("10k") == 10_240
+    assert parse_size("5M") == 5 * 1024 * 1024
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_size("5g")
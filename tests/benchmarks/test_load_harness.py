@@ -0,0 +1,120 @@
+"""Tests for the stub provider server and the load driver's report.
+
+Runs the real provider clients against the stub server's wire formats
+and profiles, checks the LanguageTool stand-in's offsets, and the
+percentiles and error rates the load driver reports.
+"""
+
+import dataclasses
+from typing import Iterator
+
+import pytest
+import requests
+
+from benchmarks.load import AnalysisRun, percentile, summarize
+from benchmarks.stub_server import Profile, StubServer, StubState, languagetool_matches, start
+from models.providers.api_provider import APIProvider
+from models.providers.ollama_provider import OllamaProvider
+
+PROMPT = "Please click on Save and/or exit."
+
+
+@pytest.fixture
+def stub() -> Iterator[StubServer]:
+    """Yield a running stub server with the default profile."""
+    server = start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _api(server: StubServer) -> APIProvider:
+    """Build an API provider pointed at *server*."""
+    return APIProvider({
+        "base_url": f"{server.url}/v1", "model": "stub-model", "api_key": "stub", "timeout": 5,
+    })
+
+
+class TestStubServer:
+    """Tests for the provider and LanguageTool stand-ins."""
+
+    def test_api_provider_round_trip(self, stub: StubServer) -> None:
+        """The API provider connects and gets the planted-phrase issues."""
+        provider = _api(stub)
+
+        assert provider.is_available()
+        assert '"flagged_text": "and/or"' in provider.generate_text(PROMPT)
+
+    def test_ollama_provider_round_trip(self, stub: StubServer) -> None:
+        """The Ollama provider finds the model and gets a completion."""
+        provider = OllamaProvider({"base_url": stub.url, "model": "stub-model", "timeout": 5})
+
+        assert provider.is_available()
+        assert '"flagged_text": "Please"' in provider.generate_text(PROMPT)
+
+    def test_profile_faults(self, stub: StubServer) -> None:
+        """Injected errors yield no text and truncation cuts the JSON."""
+        provider = _api(stub)
+        stub.state.profile = Profile(error_rate=1.0)
+        assert provider.generate_text(PROMPT) == ""
+
+        stub.state.profile = Profile(truncate_rate=1.0)
+        assert not provider.generate_text(PROMPT).endswith("}")
+
+        counts = requests.get(f"{stub.url}/_stub/stats", timeout=5).json()["requests"]["chat"]
+        assert counts == {"error": 1, "truncated": 1}
+
+    def test_fault_draws_are_reproducible(self) -> None:
+        """The same request meets the same fault sequence under a seed."""
+        def fates(seed: int) -> list:
+            state = StubState(Profile(error_rate=0.3, truncate_rate=0.3, seed=seed))
+            return [state.draw(b"body")[0] for _ in range(20)]
+
+        assert fates(5) == fates(5)
+        assert fates(5) != fates(6)
+        assert len(set(fates(5))) > 1
+
+    def test_profile_validation(self) -> None:
+        """Rates outside 0-1 or summing past 1 are refused."""
+        with pytest.raises(ValueError):
+            Profile(error_rate=0.6, truncate_rate=0.6)
+        with pytest.raises(ValueError):
+            dataclasses.replace(Profile(), latency=-1)
+
+    def test_languagetool_offsets_in_utf16(self) -> None:
+        """Match offsets count astral characters as two units."""
+        matches = languagetool_matches("\U0001F600 Please and/or go.")
+
+        assert [(m["offset"], m["length"]) for m in matches] == [(3, 6), (10, 6)]
+
+
+class TestLoadReport:
+    """Tests for the load driver's aggregation."""
+
+    def test_percentile_interpolates(self) -> None:
+        """Percentiles interpolate between the nearest samples."""
+        values = [float(n) for n in range(1, 101)]
+
+        assert percentile(values, 50) == 50.5
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([2.0], 95) == 2.0
+
+    def test_summarize_phases_and_errors(self) -> None:
+        """Phases count only the runs that reached them; errors are rated."""
+        runs = [
+            AnalysisRun(phases={"response": 0.1, "analysis_complete": 1.0}, status=200),
+            AnalysisRun(phases={"response": 0.3}, status=200, error="timeout", llm_skipped=True),
+            AnalysisRun(error="connect: refused"),
+            AnalysisRun(phases={"response": 0.2}, status=503, error="http 503"),
+        ]
+
+        report = summarize(runs, 60.0)
+
+        assert report["phases"]["response"]["count"] == 3
+        assert report["phases"]["response"]["p50"] == pytest.approx(0.2)
+        assert report["phases"]["analysis_complete"]["count"] == 1
+        assert report["throughput_per_minute"] == 1.0
+        assert report["errors"]["failed"] == {"count": 3, "rate": 0.75}
+        assert report["errors"]["timeout"]["count"] == 1
+        assert report["errors"]["llm_skipped"]["count"] == 1
+        assert report["errors"]["http"]["count"] == 1
@@ -6,6 +6,7 @@ sessions for issue lifecycle testing.
 """
 
 import logging
+import sys
 import uuid
 from typing import Any, Generator
 from unittest.mock import MagicMock, patch
@@ -115,6 +116,18 @@ def mock_llm() -> Generator[MagicMock, None, None]:
         yield mock_cls
 
 
+@pytest.fixture(autouse=True)
+def _clear_block_result_caches() -> None:
+    """Clear the orchestrator's deterministic block cache between tests.
+
+    Tests patch spaCy and the rule runner with different fakes for the
+    same block text, so cached block results must not leak across tests.
+    """
+    orchestrator = sys.modules.get("app.services.analysis.orchestrator")
+    if orchestrator is not None:
+        orchestrator._det_block_cache.clear()
+
+
 @pytest.fixture()
 def app(mock_spacy: MagicMock, mock_llm: MagicMock) -> Generator[Flask, None, None]:
     """Create a Flask test application with testing overrides.
@@ -300,6 +313,16 @@ def _reset_singleton_stores() -> None:
 
     try:
         import app.services.feedback.store as feedback_mod
+        if feedback_mod._store_instance is not None:
+            feedback_mod._store_instance.close()
         feedback_mod._store_instance = None
     except ImportError:
         pass
+
+    try:
+        import app.services.reporting.pdf_jobs as pdf_jobs_mod
+        if pdf_jobs_mod._manager_instance is not None:
+            pdf_jobs_mod._manager_instance.shutdown()
+        pdf_jobs_mod._manager_instance = None
+    except ImportError:
+        pass
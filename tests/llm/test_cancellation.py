@@ -0,0 +1,228 @@
+"""Tests for cooperative cancellation of LLM work.
+
+Validates token semantics, that cancelled tokens skip LLM calls before
+they are sent, that in-flight HTTP requests made through the
+cancellable requests and httpx clients abort promptly, and that the
+cancellation counters record skipped and aborted calls.
+"""
+
+import http.server
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from app.llm.client import LLMClient
+from models.cancellation import (
+    CancellationStats,
+    CancellationToken,
+    OperationCancelled,
+    cancellable_httpx_transport,
+    cancellable_post,
+)
+
+logger = logging.getLogger(__name__)
+
+# A slow "model" holds the request this long; cancellation must beat it.
+_SERVER_DELAY_SECONDS = 5.0
+
+
+class _SlowHandler(http.server.BaseHTTPRequestHandler):
+    """Answers POSTs only after a long delay, like a generating LLM."""
+
+    def do_POST(self) -> None:  # noqa: N802 — http.server naming
+        time.sleep(_SERVER_DELAY_SECONDS)
+        try:
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"{}")
+        except OSError:
+            pass
+
+    def log_message(self, *_args: object) -> None:
+        """Silence request logging."""
+
+
+@pytest.fixture(scope="module")
+def slow_server_url() -> Iterator[str]:
+    """Start a local HTTP server whose responses take several seconds.
+
+    Yields:
+        Base URL of the server.
+    """
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d/" % server.server_port
+    server.shutdown()
+
+
+def _cancel_later(token: CancellationToken, delay: float = 0.2) -> None:
+    """Cancel *token* from another thread after *delay* seconds."""
+    timer = threading.Timer(delay, token.cancel, args=("superseded",))
+    timer.daemon = True
+    timer.start()
+
+
+class TestCancellationToken:
+    """Tests for CancellationToken."""
+
+    def test_cancel_runs_callbacks_once(self) -> None:
+        """Callbacks run on the first cancel only."""
+        token = CancellationToken()
+        callback = MagicMock()
+        token.add_callback(callback)
+
+        assert token.cancel("superseded") is True
+        assert token.cancel("again") is False
+
+        callback.assert_called_once()
+        assert token.reason == "superseded"
+
+    def test_callback_added_after_cancel_runs_immediately(self) -> None:
+        """Registering on a cancelled token runs the callback at once."""
+        token = CancellationToken()
+        token.cancel()
+        callback = MagicMock()
+
+        token.add_callback(callback)
+
+        callback.assert_called_once()
+
+    def test_removed_callback_does_not_run(self) -> None:
+        """The remover returned by add_callback unregisters it."""
+        token = CancellationToken()
+        callback = MagicMock()
+        remove = token.add_callback(callback)
+
+        remove()
+        token.cancel()
+
+        callback.assert_not_called()
+
+    def test_raise_if_cancelled(self) -> None:
+        """raise_if_cancelled raises only after cancel()."""
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        token.cancel("superseded")
+        with pytest.raises(OperationCancelled, match="superseded"):
+            token.raise_if_cancelled()
+
+
+class TestCancellableHttp:
+    """In-flight requests abort when their token is cancelled."""
+
+    def test_requests_post_aborts_in_flight(self, slow_server_url: str) -> None:
+        """cancellable_post returns long before the server would answer."""
+        token = CancellationToken()
+        _cancel_later(token)
+        started = time.monotonic()
+
+        with pytest.raises(OperationCancelled):
+            cancellable_post(token, slow_server_url, json={}, timeout=30)
+
+        assert time.monotonic() - started < 2.0
+
+    def test_requests_post_refuses_cancelled_token(self) -> None:
+        """An already-cancelled token never opens a connection."""
+        token = CancellationToken()
+        token.cancel()
+        with patch("requests.Session.post") as post:
+            with pytest.raises(OperationCancelled):
+                cancellable_post(token, "http://127.0.0.1:9/", json={})
+        post.assert_not_called()
+
+    def test_httpx_transport_aborts_in_flight(self, slow_server_url: str) -> None:
+        """A client on the cancellable transport fails fast on cancel."""
+        token = CancellationToken()
+        _cancel_later(token)
+        started = time.monotonic()
+
+        with httpx.Client(transport=cancellable_httpx_transport(token)) as client:
+            with pytest.raises(httpx.HTTPError):
+                client.post(slow_server_url, json={}, timeout=30)
+
+        assert time.monotonic() - started < 2.0
+
+    def test_closed_httpx_transport_leaves_token(self) -> None:
+        """Closing the client unregisters the transport's callbacks."""
+        token = CancellationToken()
+
+        for _ in range(3):
+            with httpx.Client(transport=cancellable_httpx_transport(token)):
+                pass
+
+        assert token._callbacks == []
+        assert token.cancel()
+
+
+class TestClientCancellation:
+    """LLMClient skips or aborts calls and records what was saved."""
+
+    @pytest.fixture
+    def stats(self) -> Iterator[CancellationStats]:
+        """Patch a fresh stats object into the client module."""
+        fresh = CancellationStats()
+        with patch("app.llm.client.get_cancellation_stats", return_value=fresh):
+            yield fresh
+
+    @pytest.fixture
+    def mock_config(self) -> Iterator[MagicMock]:
+        """Patch a minimal Config into the client module."""
+        with patch("app.llm.client.Config") as config:
+            config.LLM_ENABLED = True
+            config.LLM_MAX_CONCURRENT = 5
+            config.MODEL_ANALYSIS_TEMPERATURE = 0.1
+            config.MODEL_SEED = None
+            config.MODEL_MAX_TOKENS = 16384
+            config.GEMINI_REASONING_EFFORT = "low"
+            yield config
+
+    @patch("app.llm.client._get_model_manager")
+    def test_cancelled_token_skips_call(
+        self, mock_get_mm: MagicMock, mock_config: MagicMock,
+        stats: CancellationStats,
+    ) -> None:
+        """A cancelled token raises without reaching the provider."""
+        manager = MagicMock()
+        manager.is_available.return_value = True
+        mock_get_mm.return_value = manager
+        token = CancellationToken()
+        token.cancel()
+
+        with pytest.raises(OperationCancelled):
+            LLMClient().analyze_block(
+                "The server was restarted.", ["The server was restarted."], [],
+                cancel_token=token,
+            )
+
+        manager.generate_text.assert_not_called()
+        snapshot = stats.snapshot()
+        assert snapshot["calls_skipped"] == 1
+        assert snapshot["tokens_saved"] > 1024
+
+    @patch("app.llm.client._get_model_manager")
+    def test_aborted_call_is_not_retried(
+        self, mock_get_mm: MagicMock, mock_config: MagicMock,
+        stats: CancellationStats,
+    ) -> None:
+        """An abort propagates once and is counted as aborted."""
+        manager = MagicMock()
+        manager.is_available.return_value = True
+        manager.generate_text.side_effect = OperationCancelled("superseded")
+        mock_get_mm.return_value = manager
+
+        with pytest.raises(OperationCancelled):
+            LLMClient().judge_issues(
+                [{"flagged_text": "x", "message": "m"}], "excerpt", "concept",
+                cancel_token=CancellationToken(),
+            )
+
+        assert manager.generate_text.call_count == 1
+        assert stats.snapshot()["calls_aborted"] == 1
+        assert "_cancel_token" in manager.generate_text.call_args.kwargs
@@ -11,7 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.llm.client import LLMClient
+from app.llm.client import LLMClient, calls_in_flight
 
 logger = logging.getLogger(__name__)
 
@@ -296,6 +296,29 @@ class TestRetryLogic:
         assert mm.generate_text.call_count == 2
 
 
+class TestCallsInFlight:
+    """Tests for the in-flight provider call gauge."""
+
+    @patch("app.llm.client._get_model_manager")
+    def test_counts_call_while_waiting(self, mock_get_mm: MagicMock) -> None:
+        """A call counts while the provider runs and not after it fails."""
+        seen = []
+        mm = _make_mock_model_manager(available=True)
+
+        def generate(*_args: object, **_kwargs: object) -> str:
+            seen.append(calls_in_flight())
+            raise RuntimeError("provider error")
+
+        mm.generate_text.side_effect = generate
+        mock_get_mm.return_value = mm
+
+        with pytest.raises(RuntimeError):
+            LLMClient()._generate("prompt")
+
+        assert seen == [1]
+        assert calls_in_flight() == 0
+
+
 # ---------------------------------------------------------------------------
 # LLMClient.judge_issues
 # ---------------------------------------------------------------------------
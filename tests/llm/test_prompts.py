@@ -18,6 +18,7 @@ from app.llm.prompts import (
     build_granular_prompt,
     build_judge_prompt,
     build_suggestion_prompt,
+    granular_prompt_prefix,
 )
 
 logger = logging.getLogger(__name__)
@@ -297,6 +298,44 @@ class TestBuildGranularPrompt:
         assert "was fixed" in combined
 
 
+class TestGranularPromptPrefix:
+    """Tests for the shared prefix of granular prompts."""
+
+    EXCERPTS = [{"guide_name": "IBM Style", "topic": "Verbs", "excerpt": "Use active voice."}]
+
+    def test_blocks_share_identical_prefix(self) -> None:
+        """Two blocks of one analysis differ only after the shared prefix."""
+        acronyms = {"CSI": "Container Storage Interface"}
+        first = build_granular_prompt(
+            "The CSI driver stores data.", ["The CSI driver stores data."],
+            self.EXCERPTS, content_type="concept", acronym_context=acronyms,
+            document_outline="= Storage",
+        )
+        second = build_granular_prompt(
+            "Restart the pod.", ["Restart the pod."],
+            list(self.EXCERPTS), content_type="concept", acronym_context=acronyms,
+            document_outline="= Storage",
+        )
+        prefix = granular_prompt_prefix("concept", self.EXCERPTS, "= Storage")
+
+        assert first[0] == second[0]
+        assert first[1].startswith(prefix) and second[1].startswith(prefix)
+        assert "Use active voice." in prefix and "= Storage" in prefix
+        assert "Container Storage Interface" in first[1][len(prefix):]
+        assert "Container Storage Interface" not in second[1]
+
+    def test_prefix_is_cached_per_excerpt_set(self) -> None:
+        """Equal inputs reuse the cached prefix; new excerpts build another."""
+        prefix = granular_prompt_prefix("reference", self.EXCERPTS)
+
+        assert granular_prompt_prefix("reference", [dict(self.EXCERPTS[0])]) is prefix
+        refined = granular_prompt_prefix(
+            "reference", [{"guide_name": "IBM Style", "topic": "Tense", "excerpt": "Use present tense."}],
+        )
+        assert refined is not prefix
+        assert "Use present tense." in refined
+
+
 # ---------------------------------------------------------------------------
 # build_suggestion_prompt with examples
 # ---------------------------------------------------------------------------
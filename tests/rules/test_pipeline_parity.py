@@ -0,0 +1,70 @@
+"""Parity of rule output between the full and slim SpaCy pipelines.
+
+Runs every registered rule over the paragraphs of the sample document
+with ``en_core_web_md`` loaded whole and loaded under the ``slim``
+profile (components the rules do not declare excluded, per-block
+components disabled), and requires identical issues.  A rule that reads
+an annotation it does not declare in ``NLP_ANNOTATIONS`` shows up here.
+"""
+
+import os
+from typing import Any, Dict, List
+
+import pytest
+import spacy
+
+from app.services.analysis.nlp_profile import (
+    PROFILE_FULL,
+    PROFILE_SLIM,
+    disabled_components,
+    load_nlp,
+    pipeline_annotations,
+)
+
+_MODEL = "en_core_web_md"
+_FIXTURE = os.path.join(
+    os.path.dirname(__file__), os.pardir, "fixtures", "errors_sample.adoc",
+)
+
+pytestmark = pytest.mark.skipif(
+    not spacy.util.is_package(_MODEL), reason=f"{_MODEL} is not installed",
+)
+
+
+def _paragraphs() -> List[str]:
+    """Return the prose paragraphs of the sample document."""
+    with open(_FIXTURE, encoding="utf-8") as fh:
+        chunks = fh.read().split("\n\n")
+    return [
+        chunk.strip() for chunk in chunks
+        if chunk.strip() and not chunk.lstrip().startswith(("=", ":", "----", "//"))
+    ]
+
+
+def _analyze(nlp: Any, text: str, block_type: str, slim: bool) -> List[Dict[str, Any]]:
+    """Run the registry over one block the way the orchestrator does."""
+    from rules import get_registry
+
+    disable = disabled_components(nlp, pipeline_annotations(block_type)) if slim else []
+    doc = nlp(text, disable=disable) if disable else nlp(text)
+    sentences = [s.text.strip() for s in doc.sents if s.text.strip()] or [text]
+    return get_registry().analyze(text, sentences, spacy_doc=doc, block_type=block_type)
+
+
+@pytest.fixture(scope="module")
+def pipelines() -> Dict[str, Any]:
+    """Load the model under both profiles."""
+    return {
+        PROFILE_FULL: load_nlp(_MODEL, PROFILE_FULL),
+        PROFILE_SLIM: load_nlp(_MODEL, PROFILE_SLIM),
+    }
+
+
+@pytest.mark.parametrize("block_type", ["paragraph", "list_item", "heading"])
+def test_slim_pipeline_matches_full(pipelines: Dict[str, Any], block_type: str) -> None:
+    """Every paragraph yields the same issues under both profiles."""
+    for text in _paragraphs():
+        full = _analyze(pipelines[PROFILE_FULL], text, block_type, slim=False)
+        slim = _analyze(pipelines[PROFILE_SLIM], text, block_type, slim=True)
+
+        assert slim == full, f"Slim pipeline diverges on: {text[:60]!r}"
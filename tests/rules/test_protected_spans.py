@@ -0,0 +1,106 @@
+"""Tests for protected product-name spans and frozen rule exceptions.
+
+Validates that the combined matcher protects exactly the spans that
+one regex per protected name did, including overlapping names, that a
+text is scanned once however many rules ask about it, and that
+exception lookups use the sets frozen at load.
+"""
+
+import random
+import re
+from typing import List
+
+import spacy
+
+from rules.base_rule import BaseRule
+from rules.protected_spans import ProtectedSpanMatcher, ProtectedSpans
+from rules.word_usage.a_words_rule import AWordsRule
+from rules.word_usage.base_word_usage_rule import term_regex
+
+_TERMS = [
+    "OpenShift Dev Spaces", "Dev Spaces", "Red Hat OpenShift", "OpenShift AI",
+    "Developer Preview", "C++",
+]
+
+
+def _covered_by_any(text: str, start: int, end: int) -> bool:
+    """Reference: one case-insensitive word-boundary regex per name."""
+    for term in _TERMS:
+        for match in re.finditer(r"\b" + re.escape(term) + r"\b", text, re.IGNORECASE):
+            if start >= match.start() and end <= match.end():
+                return True
+    return False
+
+
+class TestProtectedSpanMatcher:
+    """Tests for the combined protected-name matcher."""
+
+    def test_overlapping_names_all_found(self) -> None:
+        """A name starting inside another one still protects its tail."""
+        spans = ProtectedSpanMatcher(_TERMS).find("Use Red Hat OpenShift AI now.")
+
+        assert list(spans) == [(4, 21), (12, 24)]
+        assert spans.covers(22, 24)
+        assert not spans.covers(0, 3)
+
+    def test_matches_one_regex_per_name(self) -> None:
+        """Containment answers agree with per-name regexes on random text."""
+        matcher = ProtectedSpanMatcher(_TERMS)
+        words: List[str] = " ".join(_TERMS).split() + ["the", "uses", "-", "."]
+        rng = random.Random(45)
+        for _ in range(300):
+            text = " ".join(rng.choices(words, k=rng.randint(0, 12)))
+            if rng.random() < 0.3:
+                text = text.lower()
+            spans = matcher.find(text)
+            for start in range(len(text)):
+                for end in range(start, min(len(text), start + 22) + 1):
+                    assert spans.covers(start, end) == _covered_by_any(text, start, end)
+
+    def test_text_scanned_once(self) -> None:
+        """Repeat lookups of a text share one result."""
+        matcher = ProtectedSpanMatcher(_TERMS)
+
+        assert matcher.find("Try Developer Preview.") is matcher.find("Try Developer Preview.")
+
+    def test_no_terms(self) -> None:
+        """Without names nothing is protected."""
+        assert len(ProtectedSpanMatcher([]).find("Developer Preview")) == 0
+
+
+class TestBaseRuleFilters:
+    """Tests for the BaseRule helpers built on the frozen data."""
+
+    def test_is_in_protected_range_accepts_lists(self) -> None:
+        """Plain range lists are still checked linearly."""
+        assert BaseRule._is_in_protected_range(2, 4, [(0, 5)])
+        assert not BaseRule._is_in_protected_range(2, 6, [(0, 5)])
+        assert BaseRule._is_in_protected_range(2, 4, ProtectedSpans([(0, 5)]))
+
+    def test_exceptions_frozen(self) -> None:
+        """Global exceptions are matched case-insensitively from a frozenset."""
+        rule = AWordsRule()
+        term = next(iter(BaseRule._global_exceptions))
+
+        assert isinstance(BaseRule._global_exceptions, frozenset)
+        assert rule._is_excepted(f" {term.upper()} ")
+        assert not rule._is_excepted("definitely not an exception")
+
+    def test_protected_name_not_flagged(self) -> None:
+        """Word usage matches inside a protected name are skipped."""
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        rule = AWordsRule()
+        name = BaseRule._protected_terms[0]
+        doc = nlp(f"Install {name} today.")
+
+        errors = rule._match_terms(doc, doc.text, {name.split()[-1]: "x"}, {})
+
+        assert errors == []
+
+
+def test_term_regex_compiled_once() -> None:
+    """Term patterns are compiled once and match case-insensitively."""
+    assert term_regex("abort") is term_regex("abort")
+    assert term_regex("abort").search("ABORT the job")
+    assert term_regex("abort", r"abort(?= the)").search("abort the")
@@ -186,3 +186,38 @@ class TestRulesRegistry:
 
         unknown = registry.get_rule("nonexistent_rule_type_xyz")
         assert unknown is None
+
+    def test_nlp_annotations_union(self) -> None:
+        """nlp_annotations() unions the declarations of the applicable rules.
+
+        Every rule declares known annotation names; a block type's union
+        is contained in the union over all rules.
+        """
+        from rules import RulesRegistry
+        from rules.base_rule import ALL_NLP_ANNOTATIONS
+
+        registry: RulesRegistry = RulesRegistry()
+
+        for rule_type, rule_instance in registry.get_all_rules().items():
+            assert type(rule_instance).NLP_ANNOTATIONS <= ALL_NLP_ANNOTATIONS, rule_type
+        everything = registry.nlp_annotations()
+        assert registry.nlp_annotations("heading") <= everything
+        assert registry.nlp_annotations("listing") == frozenset()
+
+    def test_undeclared_rule_gets_full_pipeline(self) -> None:
+        """A rule without NLP_ANNOTATIONS is assumed to read everything."""
+        from rules import RulesRegistry
+        from rules.base_rule import ALL_NLP_ANNOTATIONS
+
+        class _UndeclaredRule(BaseRule):
+            def _get_rule_type(self) -> str:
+                return "undeclared"
+
+            def analyze(self, text: str, sentences: List[str], nlp: Any = None,
+                        context: Any = None, spacy_doc: Any = None) -> List[Dict[str, Any]]:
+                return []
+
+        registry: RulesRegistry = RulesRegistry()
+        registry.rules = {"undeclared": _UndeclaredRule()}
+
+        assert registry.nlp_annotations() == ALL_NLP_ANNOTATIONS
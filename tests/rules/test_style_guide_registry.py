@@ -0,0 +1,88 @@
+"""Tests for the style guide registry's resolved lookup table.
+
+Proves that table lookups return what the priority resolution across
+guides returns, for every rule the guides define under every category
+hint callers use, and that the table is immutable and rebuilt daily.
+"""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from app.llm.excerpt_selector import _CATEGORY_TO_GUIDES, _CONTENT_TYPE_GUIDES
+from app.models.enums import IssueCategory
+from style_guides import registry
+
+logger = logging.getLogger(__name__)
+
+_LOOKUPS = (
+    (registry.get_citation, registry._resolve_citation),
+    (registry.get_excerpt, registry._resolve_excerpt),
+    (registry.format_citation, registry._resolve_formatted_citation),
+    (registry.get_confidence_adjustment, registry._resolve_confidence_adjustment),
+    (registry.get_verification_status, registry._resolve_verification_status),
+)
+
+
+def _selector_lookups() -> list:
+    """Return the (rule_type, category_hint) pairs the excerpt selector uses."""
+    pairs = [pair for guides in _CATEGORY_TO_GUIDES.values() for pair in guides]
+    return pairs + [pair for guides in _CONTENT_TYPE_GUIDES.values() for pair in guides]
+
+
+class TestResolvedTable:
+    """Tests for the precomputed style guide table."""
+
+    def test_table_matches_priority_resolution(self) -> None:
+        """Every known rule resolves the same under every category hint.
+
+        Covers each section of every guide, the category-dependent
+        hints, issue categories, the excerpt selector's hints, no hint,
+        and an unknown hint, plus rules no guide defines.
+        """
+        sections = registry._rule_sections()
+        categories = {None, "", "no_such_category", *registry._CATEGORY_DEPENDENT}
+        categories.update(section for names in sections.values() for section in names)
+        categories.update(category.value for category in IssueCategory)
+        categories.update(hint for _rule, hint in _selector_lookups())
+        rule_types = set(sections) | {rule for rule, _hint in _selector_lookups()} | {"no_such_rule"}
+
+        assert len(sections) > 100
+        mismatches = [
+            (lookup.__name__, rule_type, category)
+            for rule_type in sorted(rule_types)
+            for category in sorted(categories, key=str)
+            for lookup, resolve in _LOOKUPS
+            if lookup(rule_type, category) != resolve(rule_type, category)
+        ]
+        assert mismatches == []
+
+    def test_lookups_do_not_probe_guides(self) -> None:
+        """Once built, lookups are served from the table alone."""
+        registry._get_table()
+
+        with patch.object(registry, "_find_in_guides", side_effect=AssertionError), \
+                patch.object(registry, "_get_guide_module", side_effect=AssertionError):
+            assert registry.get_citation("articles")
+            assert registry.format_citation("no_such_rule") == registry.DEFAULT_CITATION
+
+    def test_table_is_immutable(self) -> None:
+        """The table cannot be changed, even through returned results."""
+        table = registry._get_table()
+        with pytest.raises(TypeError):
+            table[("articles", None)] = registry._EMPTY_ENTRY  # type: ignore[index]
+
+        registry.get_citation("articles")["topic"] = "changed"
+        assert registry.get_citation("articles")["topic"] != "changed"
+
+    def test_table_rebuilt_after_midnight(self) -> None:
+        """The table is rebuilt once its day has passed."""
+        table = registry._get_table()
+        assert registry._get_table() is table
+
+        with patch.object(registry, "_table_expires", 0.0):
+            rebuilt = registry._get_table()
+
+        assert rebuilt is not table
+        assert rebuilt == table
@@ -0,0 +1,128 @@
+"""Tests for viewport-first ordering of LLM granular blocks.
+
+Validates the distance measure, queue order and re-ordering when the
+focus moves, block location in original-text coordinates, and parsing
+of priority hints.
+"""
+
+import pytest
+
+from app.services.analysis.block_priority import (
+    BlockPriority,
+    BlockQueue,
+    locate_blocks,
+    parse_priority_hint,
+    pending_blocks,
+)
+
+SPANS = [(0, 100), (100, 200), (200, 300), (300, 400)]
+
+
+def _drain(queue: BlockQueue) -> list:
+    """Pop every item from *queue*."""
+    items = []
+    while (item := queue.pop()) is not None:
+        items.append(item)
+    return items
+
+
+class TestBlockPriority:
+    """Tests for BlockPriority.distance."""
+
+    def test_distance_to_focus(self) -> None:
+        """Blocks overlapping the focus are at 0; others by the gap."""
+        priority = BlockPriority()
+        priority.set_focus((150, 250))
+
+        assert priority.distance((100, 200)) == 0
+        assert priority.distance((0, 100)) == 50
+        assert priority.distance((300, 400)) == 50
+
+    def test_no_focus_keeps_document_order(self) -> None:
+        """Without a focus every block is equally near."""
+        assert BlockPriority().distance((900, 1000)) == 0
+
+
+class TestBlockQueue:
+    """Tests for BlockQueue ordering."""
+
+    def test_nearest_block_first(self) -> None:
+        """Blocks come out by distance from the focus, ties in document order."""
+        priority = BlockPriority()
+        priority.set_focus((250, 250))
+        queue = BlockQueue(["a", "b", "c", "d"], SPANS, priority)
+
+        assert _drain(queue) == ["c", "b", "d", "a"]
+
+    def test_focus_change_reorders_pending(self) -> None:
+        """Moving the focus affects the blocks not yet handed out."""
+        priority = BlockPriority()
+        queue = BlockQueue(["a", "b", "c", "d"], SPANS, priority)
+
+        assert queue.pop() == "a"
+        priority.set_focus((390, 390))
+
+        assert _drain(queue) == ["d", "c", "b"]
+
+    def test_without_priority_document_order(self) -> None:
+        """A queue with no priority is first-in first-out."""
+        assert _drain(BlockQueue(["a", "b", "c"], SPANS[:3])) == ["a", "b", "c"]
+
+    def test_pending_blocks_counts_live_queues(self) -> None:
+        """Pending blocks are summed over queues still in use."""
+        before = pending_blocks()
+        queue = BlockQueue(["a", "b", "c"], SPANS[:3])
+        queue.pop()
+
+        assert pending_blocks() == before + 2
+        del queue
+        assert pending_blocks() == before
+
+
+class TestLocateBlocks:
+    """Tests for locate_blocks."""
+
+    def test_maps_through_offset_map(self) -> None:
+        """Block ranges are found in order and mapped to original positions."""
+        text = "First para.\n\nSecond para."
+        offset_map = [i + 10 for i in range(len(text))]
+
+        spans = locate_blocks(["First para.", "Second para."], text, offset_map)
+
+        assert spans == [(10, 21), (23, 34)]
+
+    def test_reformatted_block_found_by_first_line(self) -> None:
+        """A block that differs from the text is located by its first line."""
+        text = "Intro.\n\nStep one.\nStep two."
+
+        spans = locate_blocks(["Intro.", "Step one.\n- Step two."], text, [])
+
+        assert spans[1][0] == text.index("Step one.")
+
+    def test_missing_block_follows_previous(self) -> None:
+        """A block absent from the text sits where the previous one ended."""
+        spans = locate_blocks(["Intro.", "Not there."], "Intro. More.", [])
+
+        assert spans == [(0, 6), (6, 6)]
+
+
+class TestParsePriorityHint:
+    """Tests for parse_priority_hint."""
+
+    def test_viewport_and_cursor(self) -> None:
+        """A viewport gives its range; a cursor an empty range."""
+        assert parse_priority_hint({"viewport": {"start": 5, "end": 9}}) == (5, 9)
+        assert parse_priority_hint({"cursor": 7}) == (7, 7)
+        assert parse_priority_hint({"text": "x"}) is None
+
+    @pytest.mark.parametrize("data", [
+        {"viewport": [1, 2]},
+        {"viewport": {"start": 9, "end": 5}},
+        {"viewport": {"start": -1, "end": 5}},
+        {"cursor": "12"},
+        {"cursor": True},
+    ])
+    def test_malformed_hint_rejected(self, data: dict) -> None:
+        """Malformed hints raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_priority_hint(data)
@@ -1,13 +1,16 @@
 """Tests for the SQLite-backed feedback persistence store.
 
 Validates feedback storage and retrieval, aggregate statistics per rule,
-in-memory fallback when persistent storage is disabled, and thread-safe
-concurrent access.
+in-memory fallback when persistent storage is disabled, thread-safe
+concurrent access, and the write-behind queue, counter table and WAL
+setup of file databases.
 """
 
 import logging
+import sqlite3
 import threading
-from typing import Any
+import time
+from typing import Any, Callable, Iterator, List
 from unittest.mock import patch
 
 import pytest
@@ -16,6 +19,23 @@ from app.services.feedback.store import FeedbackStore
 
 logger = logging.getLogger(__name__)
 
+StoreFactory = Callable[..., FeedbackStore]
+
+
+@pytest.fixture
+def make_store() -> Iterator[StoreFactory]:
+    """Create feedback stores that are closed after the test."""
+    stores: List[FeedbackStore] = []
+
+    def factory(*args: Any, **kwargs: Any) -> FeedbackStore:
+        created = FeedbackStore(*args, **kwargs)
+        stores.append(created)
+        return created
+
+    yield factory
+    for created in stores:
+        created.close()
+
 
 # ---------------------------------------------------------------------------
 # Tests
@@ -25,15 +45,15 @@ logger = logging.getLogger(__name__)
 class TestFeedbackStore:
     """Tests for FeedbackStore with in-memory SQLite backend."""
 
-    def test_store_and_retrieve_feedback(self) -> None:
+    def test_store_and_retrieve_feedback(self, make_store: StoreFactory) -> None:
         """Stored feedback is retrievable via aggregate stats.
 
         After inserting a positive feedback entry, the stats for the
         corresponding rule should reflect one total and one positive.
         """
-        store = FeedbackStore(db_path=":memory:")
+        store = make_store(db_path=":memory:")
 
-        row_id: int = store.store_feedback(
+        store.store_feedback(
             session_id="s1",
             issue_id="i1",
             rule_type="passive_voice",
@@ -41,7 +61,7 @@ class TestFeedbackStore:
             comment="Good catch",
         )
 
-        assert row_id >= 1
+        assert store.flush() == 1
 
         stats = store.get_rule_feedback_stats("passive_voice")
         assert stats["total"] == 1
@@ -49,13 +69,13 @@ class TestFeedbackStore:
         assert stats["negative"] == 0
         assert stats["false_positive_rate"] == 0.0
 
-    def test_negative_feedback_increments_negative_count(self) -> None:
+    def test_negative_feedback_increments_negative_count(self, make_store: StoreFactory) -> None:
         """Negative (thumbs-down) feedback increments the negative counter.
 
         The false positive rate should reflect the proportion of negative
         feedback relative to the total.
         """
-        store = FeedbackStore(db_path=":memory:")
+        store = make_store(db_path=":memory:")
 
         store.store_feedback("s1", "i1", "contraction_usage", True)
         store.store_feedback("s1", "i2", "contraction_usage", False)
@@ -66,13 +86,13 @@ class TestFeedbackStore:
         assert stats["negative"] == 1
         assert stats["false_positive_rate"] == 0.5
 
-    def test_stats_for_unknown_rule_returns_zeros(self) -> None:
+    def test_stats_for_unknown_rule_returns_zeros(self, make_store: StoreFactory) -> None:
         """Querying stats for a rule with no feedback returns all zeros.
 
         The store should handle unknown rules gracefully rather than
         raising errors.
         """
-        store = FeedbackStore(db_path=":memory:")
+        store = make_store(db_path=":memory:")
 
         stats = store.get_rule_feedback_stats("nonexistent_rule")
         assert stats["total"] == 0
@@ -80,7 +100,7 @@ class TestFeedbackStore:
         assert stats["negative"] == 0
         assert stats["false_positive_rate"] == 0.0
 
-    def test_memory_fallback_when_persistent_disabled(self) -> None:
+    def test_memory_fallback_when_persistent_disabled(self, make_store: StoreFactory) -> None:
         """FeedbackStore falls back to in-memory when persistence is disabled.
 
         When Config.FEEDBACK_PERSISTENT is False and no db_path is
@@ -90,8 +110,10 @@ class TestFeedbackStore:
         with patch("app.services.feedback.store.Config") as mock_config:
             mock_config.FEEDBACK_PERSISTENT = False
             mock_config.FEEDBACK_DB_PATH = "/nonexistent/path/feedback.db"
+            mock_config.FEEDBACK_FLUSH_INTERVAL_MS = 200
+            mock_config.FEEDBACK_FLUSH_BATCH_SIZE = 100
 
-            store = FeedbackStore()
+            store = make_store()
 
         assert store._db_path == ":memory:"
 
@@ -100,12 +122,12 @@ class TestFeedbackStore:
         stats = store.get_rule_feedback_stats("test_rule")
         assert stats["total"] == 1
 
-    def test_multiple_rules_tracked_independently(self) -> None:
+    def test_multiple_rules_tracked_independently(self, make_store: StoreFactory) -> None:
         """Feedback for different rules is tracked independently.
 
         Inserting feedback for rule_a should not affect stats for rule_b.
         """
-        store = FeedbackStore(db_path=":memory:")
+        store = make_store(db_path=":memory:")
 
         store.store_feedback("s1", "i1", "rule_a", True)
         store.store_feedback("s1", "i2", "rule_a", True)
@@ -122,34 +144,34 @@ class TestFeedbackStore:
         assert stats_b["positive"] == 0
         assert stats_b["negative"] == 1
 
-    def test_store_feedback_with_no_comment(self) -> None:
+    def test_store_feedback_with_no_comment(self, make_store: StoreFactory) -> None:
         """Feedback can be stored without a comment (None default).
 
         The comment field is optional. Storing without a comment should
         succeed and not affect aggregate stats.
         """
-        store = FeedbackStore(db_path=":memory:")
+        store = make_store(db_path=":memory:")
 
-        row_id: int = store.store_feedback(
+        store.store_feedback(
             session_id="s1",
             issue_id="i1",
             rule_type="tone_rule",
             thumbs_up=False,
         )
 
-        assert row_id >= 1
+        assert store.flush() == 1
 
         stats = store.get_rule_feedback_stats("tone_rule")
         assert stats["total"] == 1
         assert stats["negative"] == 1
 
-    def test_false_positive_rate_calculation(self) -> None:
+    def test_false_positive_rate_calculation(self, make_store: StoreFactory) -> None:
         """False positive rate is calculated correctly and rounded to 4 decimals.
 
         With 1 positive and 2 negative entries, the false positive rate
         should be 2/3 = 0.6667 (rounded to 4 decimal places).
         """
-        store = FeedbackStore(db_path=":memory:")
+        store = make_store(db_path=":memory:")
 
         store.store_feedback("s1", "i1", "fp_rule", True)
         store.store_feedback("s1", "i2", "fp_rule", False)
@@ -161,14 +183,13 @@ class TestFeedbackStore:
         assert stats["negative"] == 2
         assert stats["false_positive_rate"] == round(2 / 3, 4)
 
-    def test_thread_safe_concurrent_writes(self) -> None:
+    def test_thread_safe_concurrent_writes(self, make_store: StoreFactory) -> None:
         """Concurrent feedback writes from multiple threads do not corrupt data.
 
-        The store uses a threading.Lock for all database operations.
-        Multiple threads writing simultaneously should produce correct
-        aggregate counts.
+        Multiple threads queueing simultaneously, while the writer
+        flushes, should produce correct aggregate counts.
         """
-        store = FeedbackStore(db_path=":memory:")
+        store = make_store(db_path=":memory:")
         num_threads = 10
         barrier = threading.Barrier(num_threads)
         errors: list[str] = []
@@ -197,8 +218,154 @@ class TestFeedbackStore:
 
         assert not errors, f"Thread errors: {errors}"
 
+        store.flush()
         stats = store.get_rule_feedback_stats("concurrent_rule")
         assert stats["total"] == num_threads
         # Even-numbered threads give positive, odd give negative
         assert stats["positive"] == num_threads // 2
         assert stats["negative"] == num_threads - num_threads // 2
+
+
+class TestWriteBehind:
+    """Tests for the write-behind queue and the per-rule counters."""
+
+    def test_queued_feedback_counts_before_write(self, make_store: StoreFactory) -> None:
+        """Queued entries count in the stats and are written by flush.
+
+        Nothing reaches the database until the batch is flushed, and
+        the stats do not change when it is.
+        """
+        store = make_store(db_path=":memory:", flush_interval=60)
+
+        store.store_feedback("s1", "i1", "rule_a", True)
+        store.store_feedback("s1", "i2", "rule_a", False)
+        queued = store.get_rule_feedback_stats("rule_a")
+        rows = store._connection.execute("SELECT COUNT(*) FROM feedback").fetchone()[0]
+
+        assert rows == 0
+        assert queued["total"] == 2
+        assert store.flush() == 2
+        assert store.flush() == 0
+        assert store.get_rule_feedback_stats("rule_a") == queued
+        assert store._pending_counts == {}
+
+    def test_writer_flushes_after_interval(self, make_store: StoreFactory) -> None:
+        """The background writer writes a queued entry within the interval."""
+        store = make_store(db_path=":memory:", flush_interval=0.01)
+
+        store.store_feedback("s1", "i1", "rule_a", True)
+
+        deadline = time.monotonic() + 5
+        while store._pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not store._pending
+        assert store.get_rule_feedback_stats("rule_a")["total"] == 1
+
+    def test_full_batch_written_without_waiting(self, make_store: StoreFactory) -> None:
+        """A full batch is written without waiting for the interval."""
+        store = make_store(db_path=":memory:", flush_interval=60, batch_size=3)
+
+        for n in range(3):
+            store.store_feedback("s1", f"i{n}", "rule_a", True)
+
+        deadline = time.monotonic() + 5
+        while store._pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not store._pending
+
+    def test_failed_write_keeps_entries_queued(self, make_store: StoreFactory) -> None:
+        """A batch that fails to write is queued again, stats unchanged."""
+        store = make_store(db_path=":memory:", flush_interval=60)
+        store.store_feedback("s1", "i1", "rule_a", True)
+        store._connection.execute("DROP TABLE rule_feedback_stats")
+
+        with pytest.raises(sqlite3.OperationalError):
+            store.flush()
+
+        assert len(store._pending) == 1
+        assert store._connection.execute("SELECT COUNT(*) FROM feedback").fetchone()[0] == 0
+
+    def test_writer_backs_off_while_writes_fail(self, make_store: StoreFactory) -> None:
+        """A full queue that cannot be written is retried after a delay, not in a loop."""
+        store = make_store(db_path=":memory:", flush_interval=0, batch_size=2)
+        store._connection.execute("DROP TABLE rule_feedback_stats")
+        attempts = []
+        flush = store.flush
+
+        def counting_flush() -> int:
+            attempts.append(time.monotonic())
+            return flush()
+
+        with patch.object(store, "flush", side_effect=counting_flush):
+            for n in range(4):
+                store.store_feedback("s1", f"i{n}", "rule_a", True)
+            time.sleep(0.5)
+
+        # Retries after 0.1s and 0.2s; spinning would make thousands
+        assert 1 <= len(attempts) <= 4
+        assert len(store._pending) == 4
+
+    def test_full_queue_refuses_feedback(self, make_store: StoreFactory, caplog: Any) -> None:
+        """Once max_pending entries are queued, new feedback is refused with a warning."""
+        store = make_store(db_path=":memory:", flush_interval=60, batch_size=10, max_pending=2)
+        store._connection.execute("DROP TABLE rule_feedback_stats")
+        for n in range(10):
+            store.store_feedback("s1", f"i{n}", "rule_a", True)
+
+        with caplog.at_level(logging.WARNING), pytest.raises(RuntimeError, match="full"):
+            store.store_feedback("s1", "i10", "rule_a", False)
+
+        assert "queue is full" in caplog.text
+        assert len(store._pending) == 10
+
+    def test_close_writes_queue_and_refuses_new_feedback(self, tmp_path: Any, make_store: StoreFactory) -> None:
+        """Closing writes what is queued; later feedback is refused."""
+        db_path = str(tmp_path / "feedback.db")
+        store = make_store(db_path=db_path, flush_interval=60)
+        store.store_feedback("s1", "i1", "rule_a", False)
+
+        store.close()
+
+        with pytest.raises(RuntimeError):
+            store.store_feedback("s1", "i2", "rule_a", False)
+        reopened = FeedbackStore(db_path=db_path)
+        assert reopened.get_rule_feedback_stats("rule_a")["negative"] == 1
+        reopened.close()
+
+    def test_file_database_uses_wal_and_rule_index(self, tmp_path: Any, make_store: StoreFactory) -> None:
+        """File databases run in WAL mode with an index on rule_type."""
+        store = make_store(db_path=str(tmp_path / "feedback.db"))
+
+        mode = store._connection.execute("PRAGMA journal_mode").fetchone()[0]
+        plan = store._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM feedback WHERE rule_type = ?", ("rule_a",),
+        ).fetchall()
+
+        assert mode == "wal"
+        assert "idx_feedback_rule_type" in str(plan)
+        store.close()
+
+    def test_counters_backfilled_from_existing_rows(self, tmp_path: Any, make_store: StoreFactory) -> None:
+        """A database without the counter table gets it filled once."""
+        db_path = str(tmp_path / "feedback.db")
+        legacy = sqlite3.connect(db_path)
+        legacy.execute(
+            "CREATE TABLE feedback (id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT NOT NULL, "
+            "issue_id TEXT NOT NULL, rule_type TEXT NOT NULL, thumbs_up BOOLEAN NOT NULL, "
+            "comment TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+        legacy.executemany(
+            "INSERT INTO feedback (session_id, issue_id, rule_type, thumbs_up) VALUES (?, ?, ?, ?)",
+            [("s1", "i1", "rule_a", True), ("s1", "i2", "rule_a", False), ("s1", "i3", "rule_b", False)],
+        )
+        legacy.commit()
+        legacy.close()
+
+        FeedbackStore(db_path=db_path).close()
+        store = make_store(db_path=db_path)
+
+        assert store.get_rule_feedback_stats("rule_a") == {
+            "total": 2, "positive": 1, "negative": 1, "false_positive_rate": 0.5,
+        }
+        assert store.get_rule_feedback_stats("rule_b")["negative"] == 1
+        store.close()
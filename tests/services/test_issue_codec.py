@@ -0,0 +1,140 @@
+"""Tests for compact issue storage and the direct JSON encoder.
+
+Validates that compaction shares equal strings without changing any
+value, and that the encoder's output parses to the same data as
+``json.dumps`` of the ``to_dict()`` form.
+"""
+
+import json
+from typing import List
+
+from app.models.enums import IssueCategory, IssueSeverity, IssueStatus
+from app.models.issue_codec import compact_issues, dumps, issues_to_json
+from app.models.schemas import AnalyzeResponse, IssueResponse, ReportResponse, ScoreResponse
+
+SENTENCES = ["The system was configured.", "Please click “Save”."]
+
+
+def _issue(index: int, sentence_index: int) -> IssueResponse:
+    """Create an issue whose strings are fresh copies.
+
+    Args:
+        index: Issue number, used in the ID.
+        sentence_index: Index into SENTENCES.
+
+    Returns:
+        An IssueResponse.
+    """
+    return IssueResponse(
+        id=f"issue-{index}",
+        source="deterministic",
+        category=IssueCategory.STYLE,
+        rule_name="verbs",
+        flagged_text="was",
+        message="".join(["Use active ", "voice."]),
+        suggestions=["configured"],
+        severity=IssueSeverity.MEDIUM,
+        sentence="".join(list(SENTENCES[sentence_index])),
+        sentence_index=sentence_index,
+        span=[4, 7],
+        style_guide_citation="".join(["IBM Style", ", p. 113"]),
+        confidence=0.85,
+        status=IssueStatus.OPEN,
+    )
+
+
+def _issues() -> List[IssueResponse]:
+    """Create six issues alternating between the two sentences."""
+    return [_issue(n, n % 2) for n in range(6)]
+
+
+class TestCompactIssues:
+    """Tests for compact_issues."""
+
+    def test_shares_strings_without_changing_values(self) -> None:
+        """Equal strings become one object; serialized data is unchanged."""
+        issues = _issues()
+        before = [i.to_dict() for i in issues]
+
+        compact_issues(issues, SENTENCES)
+
+        assert [i.to_dict() for i in issues] == before
+        assert issues[0].sentence is SENTENCES[0]
+        assert issues[1].sentence is SENTENCES[1]
+        assert all(i.message is issues[0].message for i in issues)
+        assert all(i.style_guide_citation is issues[0].style_guide_citation for i in issues)
+
+    def test_mismatched_sentence_is_kept(self) -> None:
+        """A sentence that differs from the indexed one is not replaced."""
+        issue = _issue(0, 0)
+        issue.sentence = "A different sentence."
+
+        compact_issues([issue], SENTENCES)
+
+        assert issue.sentence == "A different sentence."
+
+    def test_issues_are_slotted(self) -> None:
+        """IssueResponse carries no per-instance __dict__."""
+        assert not hasattr(_issue(0, 0), "__dict__")
+
+
+class TestIssueJson:
+    """Tests for the direct JSON encoder."""
+
+    def test_matches_to_dict(self) -> None:
+        """Encoded issues parse to their to_dict() form."""
+        issues = _issues()
+
+        assert json.loads(issues_to_json(issues)) == [i.to_dict() for i in issues]
+
+    def test_unusual_numbers_fall_back_to_to_dict(self) -> None:
+        """A missing index or non-float confidence still matches to_dict()."""
+        issues = _issues()
+        issues[0].sentence_index = None
+        issues[1].confidence = 1
+        issues[2].span = [4.0, 7.0]
+
+        assert json.loads(issues_to_json(issues)) == [i.to_dict() for i in issues]
+
+    def test_non_finite_confidence_is_valid_json(self) -> None:
+        """NaN and infinite confidences are written as null."""
+        issues = _issues()[:2]
+        issues[0].confidence = float("nan")
+        issues[1].confidence = float("inf")
+
+        def _strict(constant: str) -> None:
+            raise ValueError(constant)
+
+        decoded = json.loads(issues_to_json(issues), parse_constant=_strict)
+        assert [d["confidence"] for d in decoded] == [None, None]
+
+    def test_payload_mixes_issues_and_plain_values(self) -> None:
+        """Only top-level issue lists use the issue encoder."""
+        issues = _issues()
+        payload = {"session_id": "abc", "added": issues, "removed": ["x"], "status": {}}
+
+        assert json.loads(dumps(payload)) == {
+            "session_id": "abc",
+            "added": [i.to_dict() for i in issues],
+            "removed": ["x"],
+            "status": {},
+        }
+
+    def test_analyze_response_to_json(self) -> None:
+        """AnalyzeResponse.to_json() equals json.dumps(to_dict())."""
+        response = AnalyzeResponse(
+            session_id="abc",
+            issues=_issues(),
+            score=ScoreResponse(
+                score=80, color="green", label="Good", total_issues=6,
+                category_counts={"style": 6}, compliance={},
+            ),
+            report=ReportResponse(
+                word_count=10, sentence_count=2, paragraph_count=1,
+                avg_words_per_sentence=5.0, avg_syllables_per_word=1.2,
+                estimated_reading_time="1 min",
+            ),
+            partial=True,
+        )
+
+        assert json.loads(response.to_json()) == json.loads(json.dumps(response.to_dict()))
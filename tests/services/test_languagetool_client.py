@@ -15,6 +15,7 @@ from app.models.enums import IssueCategory, IssueSeverity, IssueStatus
 from app.services.analysis.languagetool_client import (
     _BatchEntry,
     _build_batches,
+    _build_utf16_offset_table,
     _call_languagetool,
     _find_entry_for_offset,
     _HINT_GATED_CATEGORIES,
@@ -25,6 +26,7 @@ from app.services.analysis.languagetool_client import (
     _LT_SKIP_RULES,
     _map_lt_match_to_issue,
     _PROSE_BLOCK_TYPES,
+    _resolve_utf16_offset,
     _should_skip_match,
     _SPELLING_ALLOWLIST,
     _utf16_to_codepoint_offset,
@@ -155,6 +157,39 @@ class TestUtf16ToCodepointOffset:
         assert _utf16_to_codepoint_offset(text, 5) == 5
 
 
+class TestUtf16OffsetTable:
+    """Tests for the per-batch UTF-16 offset table."""
+
+    @staticmethod
+    def _legacy(text: str, utf16_offset: int) -> int:
+        """Re-encode and decode a prefix, as the original converter did."""
+        encoded = text.encode("utf-16-le")
+        sliced = encoded[:min(utf16_offset * 2, len(encoded))]
+        return len(sliced.decode("utf-16-le", errors="replace"))
+
+    def test_bmp_text_has_no_table(self) -> None:
+        """Text without astral characters maps offsets one-to-one."""
+        assert _build_utf16_offset_table("café résumé") is None
+        assert _resolve_utf16_offset(None, 11, 5) == 5
+        assert _resolve_utf16_offset(None, 11, 40) == 11
+
+    @pytest.mark.parametrize("text", [
+        "Hello \U0001f680 world",
+        "\U0001d400\U0001d401 math",
+        "tail emoji \U0001f600",
+        "a\U0001f680b\U0001f681c\U0001f682",
+    ])
+    def test_table_matches_legacy_conversion(self, text: str) -> None:
+        """Every offset, including ones inside surrogate pairs, agrees."""
+        table = _build_utf16_offset_table(text)
+        assert table is not None
+        units = len(text.encode("utf-16-le")) // 2
+        for offset in range(units + 5):
+            assert _resolve_utf16_offset(table, len(text), offset) == (
+                self._legacy(text, offset)
+            )
+
+
 # ---------------------------------------------------------------------------
 # Technical content detection
 # ---------------------------------------------------------------------------
@@ -388,6 +423,19 @@ class TestFindEntryForOffset:
         result = _find_entry_for_offset([entry], 200, 5)
         assert result is None
 
+    def test_offset_in_separator_gap(self) -> None:
+        """An offset between two entries belongs to neither."""
+        entry_a = _BatchEntry(
+            block=MagicMock(), batch_start=0, batch_end=50,
+        )
+        entry_b = _BatchEntry(
+            block=MagicMock(), batch_start=52, batch_end=100,
+        )
+        assert _find_entry_for_offset([entry_a, entry_b], 51, 1) is None
+        assert _find_entry_for_offset(
+            [entry_a, entry_b], 52, 1, [0, 52],
+        ) is entry_b
+
 
 # ---------------------------------------------------------------------------
 # Match mapping — _map_lt_match_to_issue
@@ -688,6 +736,21 @@ class TestShouldSkipMatch:
             "GRAMMAR_RULE", "the the", 0, [],
         ) is False
 
+    def test_text_verdicts_memoized_per_flagged_text(self) -> None:
+        """Repeated flagged text is classified once per shared memo."""
+        verdicts: dict = {}
+        with patch(
+            "app.services.analysis.languagetool_client.is_likely_code",
+            return_value=False,
+        ) as likely_code:
+            for _ in range(3):
+                assert _should_skip_match(
+                    "GRAMMAR_RULE", "the the", 0, [],
+                    text_verdicts=verdicts,
+                ) is False
+        assert likely_code.call_count == 1
+        assert set(verdicts) == {"the the"}
+
 
 # ---------------------------------------------------------------------------
 # check_blocks() integration
@@ -0,0 +1,133 @@
+"""Tests for the demand-driven SpaCy pipeline profile.
+
+Validates the annotation-to-component mapping, per-call disabling,
+and loading a pipeline from disk with unneeded components excluded and
+unused static vectors dropped.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy
+import pytest
+import spacy
+
+from app.services.analysis import nlp_profile
+from app.services.analysis.nlp_profile import (
+    block_disabled_components,
+    disabled_components,
+    excluded_components,
+    load_nlp,
+    required_components,
+)
+
+_PIPE_NAMES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+
+
+def _save_pipeline(path: Path, static_vectors: bool) -> str:
+    """Save a small initialized tok2vec + tagger + NER pipeline.
+
+    Args:
+        path: Directory to write the pipeline to.
+        static_vectors: Whether tok2vec embeds the static vectors.
+
+    Returns:
+        The pipeline path, loadable with ``spacy.load``.
+    """
+    nlp = spacy.blank("en")
+    nlp.vocab.set_vector("cluster", numpy.ones(4, dtype="f"))
+    nlp.add_pipe("tok2vec", config={"model": {
+        "@architectures": "spacy.Tok2Vec.v2",
+        "embed": {
+            "@architectures": "spacy.MultiHashEmbed.v2", "width": 8,
+            "attrs": ["NORM"], "rows": [100],
+            "include_static_vectors": static_vectors,
+        },
+        "encode": {
+            "@architectures": "spacy.MaxoutWindowEncoder.v2", "width": 8,
+            "depth": 1, "window_size": 1, "maxout_pieces": 2,
+        },
+    }})
+    nlp.add_pipe("tagger").add_label("NN")
+    nlp.add_pipe("ner").add_label("ORG")
+    nlp.initialize()
+    nlp.to_disk(path)
+    return str(path)
+
+
+class TestComponents:
+    """Tests for the annotation-to-component mapping."""
+
+    def test_required_components(self) -> None:
+        """Lemmas pull in POS; listeners of tok2vec pull in tok2vec."""
+        assert required_components({"lemmas"}) == {
+            "tok2vec", "tagger", "attribute_ruler", "lemmatizer",
+        }
+        assert required_components({"sentences"}) == {"tok2vec", "parser"}
+        assert required_components({"entities"}) == {"ner"}
+        assert required_components(set()) == set()
+
+    def test_excluded_components(self) -> None:
+        """Everything known but not required may be excluded."""
+        assert excluded_components({"entities"}) == [
+            "attribute_ruler", "lemmatizer", "parser", "tagger", "tok2vec",
+        ]
+
+    def test_disabled_components_keeps_unknown_and_order(self) -> None:
+        """Only known components are disabled, in pipeline order."""
+        nlp = SimpleNamespace(pipe_names=_PIPE_NAMES + ["custom"])
+
+        assert disabled_components(nlp, {"sentences", "pos"}) == ["lemmatizer", "ner"]
+        assert disabled_components(nlp, {"sentences", "lemmas", "entities"}) == []
+
+
+class TestBlockDisabledComponents:
+    """Tests for the per-block disable list."""
+
+    def test_uses_registry_union_for_block_type(self) -> None:
+        """Components none of the block's rules read are disabled."""
+        nlp = SimpleNamespace(pipe_names=_PIPE_NAMES)
+        with patch("rules.RulesRegistry.nlp_annotations", return_value=frozenset({"pos"})):
+            assert block_disabled_components(nlp, "heading") == ["lemmatizer", "ner"]
+
+    def test_full_profile_disables_nothing(self) -> None:
+        """The full profile always runs the whole pipeline."""
+        nlp = SimpleNamespace(pipe_names=_PIPE_NAMES)
+        with patch("app.config.Config.SPACY_PIPELINE_PROFILE", "full"):
+            assert block_disabled_components(nlp, "heading") == []
+
+
+class TestLoadNlp:
+    """Tests for load_nlp."""
+
+    def test_slim_excludes_unneeded_components(self, tmp_path: Path) -> None:
+        """Unneeded components are not loaded and unused vectors are dropped."""
+        path = _save_pipeline(tmp_path, static_vectors=False)
+        with patch.object(nlp_profile, "pipeline_annotations", return_value=frozenset({"pos"})):
+            nlp = load_nlp(path)
+
+        assert nlp.pipe_names == ["tok2vec", "tagger"]
+        assert nlp.vocab.vectors.size == 0
+
+    def test_static_vectors_kept_when_embedded(self, tmp_path: Path) -> None:
+        """Vectors stay while a kept component embeds them."""
+        path = _save_pipeline(tmp_path, static_vectors=True)
+        with patch.object(nlp_profile, "pipeline_annotations", return_value=frozenset({"pos"})):
+            nlp = load_nlp(path)
+
+        assert nlp.vocab.vectors.size > 0
+
+    def test_full_profile_loads_everything(self, tmp_path: Path) -> None:
+        """The full profile keeps every component and the vectors."""
+        path = _save_pipeline(tmp_path, static_vectors=False)
+
+        nlp = load_nlp(path, "full")
+
+        assert nlp.pipe_names == ["tok2vec", "tagger", "ner"]
+        assert nlp.vocab.vectors.size > 0
+
+    def test_unknown_profile_rejected(self) -> None:
+        """An unknown profile raises ValueError."""
+        with pytest.raises(ValueError, match="profile"):
+            load_nlp("en_core_web_md", "tiny")
@@ -5,6 +5,7 @@ analysis pipeline and returns properly structured AnalyzeResponse objects.
 """
 
 import logging
+import time
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
@@ -249,6 +250,25 @@ class TestCollectAcronyms:
         result = _collect_acronyms("")
         assert result == {}
 
+    def test_expansion_bounded_by_punctuation(self) -> None:
+        """The expansion starts after the last punctuation before it."""
+        text = "See the docs. Then, Container Storage Interface\n(CSI) (x) Red Hat (RH)."
+        result = _collect_acronyms(text)
+        assert result == {"CSI": "Container Storage Interface", "RH": "Red Hat"}
+
+    def test_matches_full_document_scan(self) -> None:
+        """Searching only before each parenthesis finds what a full scan does."""
+        from app.services.analysis.orchestrator import _ACRONYM_DEF_RE
+
+        text = (
+            "The Container Storage Interface (CSI) and Red Hat\tOpenShift (OCP), "
+            "fooBar Baz (FB) and (CD) Container Disk (FS) fs. "
+        ) * 3
+        expected = {m.group(2): m.group(1).strip() for m in _ACRONYM_DEF_RE.finditer(text)}
+        result = _collect_acronyms(text)
+        assert {k: result[k] for k in expected} == expected
+        assert result["FB"] == "Bar Baz"
+
 
 # ---------------------------------------------------------------------------
 # LanguageTool phase integration
@@ -275,7 +295,7 @@ class TestRunLanguageToolPhase:
 
         assert len(result) == 1
         mock_check.assert_called_once_with(
-            [mock_block], original_text="Hello world.",
+            [mock_block], original_text="Hello world.", cancel_token=None,
         )
 
     def test_empty_blocks_returns_empty(self) -> None:
@@ -463,3 +483,610 @@ class TestPreJudgeDedup:
         )
         result = deduplicate_llm_issues([dup_a, dup_b])
         assert len(result) == 1
+
+
+# ---------------------------------------------------------------------------
+# Deterministic block cache
+# ---------------------------------------------------------------------------
+
+
+def _flag_utilize(text: str, *args: Any, **kwargs: Any) -> List[IssueResponse]:
+    """Fake deterministic runner flagging 'utilize' in block text."""
+    idx = text.find("utilize")
+    if idx < 0:
+        return []
+    issue = _make_issue(rule_name="simple_words")
+    issue.flagged_text = "utilize"
+    issue.span = [idx, idx + len("utilize")]
+    return [issue]
+
+
+def _make_text_block(content: str, start_pos: int) -> MagicMock:
+    """Create a paragraph block positioned at *start_pos* in the document."""
+    block = _make_block("paragraph", content, start_pos=start_pos)
+    block.inline_content = content
+    block.char_map = None
+    block.end_pos = start_pos + len(content)
+    return block
+
+
+class TestDeterministicBlockCache:
+    """Tests for incremental per-block deterministic analysis."""
+
+    @patch(
+        "app.services.analysis.orchestrator._det_block_cache_context",
+        return_value="concept|v1|acr",
+    )
+    @patch("app.services.analysis.orchestrator.run_deterministic", side_effect=_flag_utilize)
+    @patch("app.extensions.get_nlp")
+    def test_only_changed_blocks_reanalysed(
+        self, mock_nlp: MagicMock, mock_det: MagicMock, _ctx: MagicMock,
+    ) -> None:
+        """Unchanged blocks reuse cached issues, re-offset to their new position."""
+        from app.services.analysis.orchestrator import _analyze_blocks_deterministic
+
+        first = "Intro paragraph here."
+        second = "You can utilize the tool."
+        text_v1 = f"{first}\n\n{second}"
+        blocks_v1 = [
+            _make_text_block(first, 0),
+            _make_text_block(second, len(first) + 2),
+        ]
+        issues_v1 = _analyze_blocks_deterministic(blocks_v1, "concept", text_v1)
+        assert mock_det.call_count == 2
+
+        edited = "Intro paragraph was edited and grew longer."
+        text_v2 = f"{edited}\n\n{second}"
+        blocks_v2 = [
+            _make_text_block(edited, 0),
+            _make_text_block(second, len(edited) + 2),
+        ]
+        issues_v2 = _analyze_blocks_deterministic(blocks_v2, "concept", text_v2)
+
+        assert mock_det.call_count == 3
+        assert len(issues_v2) == 1
+        start, end = issues_v2[0].span
+        assert text_v2[start:end] == "utilize"
+        assert issues_v2[0].id != issues_v1[0].id
+
+    @patch("rules.get_registry")
+    def test_context_changes_with_acronyms_and_rules(self, mock_registry: MagicMock) -> None:
+        """The cache context differs when acronyms or the rule set change."""
+        from app.services.analysis.orchestrator import _det_block_cache_context
+
+        mock_registry.return_value.ruleset_version = "v1"
+        base = _det_block_cache_context("concept", {"API": "application programming interface"})
+        assert base == _det_block_cache_context(
+            "concept", {"API": "application programming interface"},
+        )
+        assert base != _det_block_cache_context("concept", {})
+        assert base != _det_block_cache_context("procedure", {"API": "application programming interface"})
+
+        mock_registry.return_value.ruleset_version = "v2"
+        assert base != _det_block_cache_context(
+            "concept", {"API": "application programming interface"},
+        )
+
+
+class TestPhaseOverlap:
+    """Tests for background phases overlapping the deterministic phase."""
+
+    @patch("app.services.analysis.orchestrator._update_stored_session")
+    @patch("app.services.analysis.orchestrator._store_session")
+    @patch("app.services.analysis.orchestrator._is_cancelled", return_value=False)
+    @patch("app.services.analysis.orchestrator._select_style_guide_excerpts")
+    @patch("app.services.analysis.orchestrator._run_languagetool_phase")
+    @patch("app.services.analysis.orchestrator.analyze_block")
+    @patch("app.services.analysis.orchestrator._emit_event")
+    @patch("app.services.analysis.orchestrator.Config")
+    @patch("app.services.analysis.orchestrator.run_deterministic")
+    @patch("app.services.analysis.orchestrator.preprocess")
+    def test_languagetool_and_granular_start_before_deterministic_ends(
+        self,
+        mock_preprocess: MagicMock,
+        mock_run_det: MagicMock,
+        mock_config: MagicMock,
+        mock_emit: MagicMock,
+        mock_analyze_block: MagicMock,
+        mock_lt: MagicMock,
+        mock_excerpts: MagicMock,
+        _cancelled: MagicMock,
+        _store: MagicMock,
+        _update: MagicMock,
+    ) -> None:
+        """LT and granular run during Phase 1; LT emits its own event."""
+        import threading
+
+        from app.services.analysis.orchestrator import analyze
+
+        mock_config.LLM_ENABLED = True
+        mock_config.LANGUAGETOOL_ENABLED = True
+        mock_config.LANGUAGETOOL_TIMEOUT = 5
+        mock_config.LLM_JUDGE_ENABLED = False
+        mock_config.CONFIDENCE_THRESHOLD = 0.7
+        prep = _make_prep_result()
+        prep["readability"] = {}  # reuse cached scores, skip textstat
+        mock_preprocess.return_value = prep
+        mock_excerpts.side_effect = lambda det, _ct: [{"topic": f"{len(det)} issues"}]
+
+        lt_started = threading.Event()
+        granular_started = threading.Event()
+        completed = threading.Event()
+        lt_issue = _make_issue(rule_name="lt_rule")
+
+        def _lt(_prep: Dict[str, Any], _token: Any = None) -> List[IssueResponse]:
+            lt_started.set()
+            return [lt_issue]
+
+        def _det(*_args: Any, **_kwargs: Any) -> List[IssueResponse]:
+            # Phase 1 only finishes once both background phases are running
+            assert lt_started.wait(2) and granular_started.wait(2)
+            return [_make_issue()]
+
+        def _block(*_args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+            granular_started.set()
+            return []
+
+        def _emit(_sid: Any, event: str, _data: Dict[str, Any]) -> None:
+            if event == "analysis_complete":
+                completed.set()
+
+        mock_lt.side_effect = _lt
+        mock_run_det.side_effect = _det
+        mock_analyze_block.side_effect = _block
+        mock_emit.side_effect = _emit
+
+        result = analyze(
+            text="This is a test sentence. It has multiple words.",
+            content_type="concept",
+        )
+
+        assert result.partial is True
+        assert completed.wait(5)
+        events = [c.args[1] for c in mock_emit.call_args_list]
+        assert "languagetool_complete" in events
+        assert events.index("languagetool_complete") < events.index("analysis_complete")
+        lt_payload = next(
+            c.args[2] for c in mock_emit.call_args_list
+            if c.args[1] == "languagetool_complete"
+        )
+        assert lt_payload["added"][0]["rule_name"] == "lt_rule"
+        # Granular started with the provisional (content-type) excerpts
+        kwargs = mock_analyze_block.call_args.kwargs
+        assert kwargs["style_guide_excerpts"] == [{"topic": "0 issues"}]
+
+    @patch("app.services.analysis.orchestrator._publish_results")
+    @patch("app.services.analysis.orchestrator._update_stored_session")
+    @patch("app.services.analysis.orchestrator._store_session")
+    @patch("app.services.analysis.orchestrator._is_cancelled", return_value=False)
+    @patch("app.services.analysis.orchestrator._select_style_guide_excerpts", return_value=[])
+    @patch("app.services.analysis.orchestrator._run_languagetool_phase", return_value=[])
+    @patch("app.services.analysis.orchestrator.analyze_block", return_value=[])
+    @patch("app.services.analysis.orchestrator._emit_event")
+    @patch("app.services.analysis.orchestrator.Config")
+    @patch("app.services.analysis.orchestrator.run_deterministic", return_value=[])
+    @patch("app.services.analysis.orchestrator.preprocess")
+    def test_failure_before_scheduling_releases_graph(
+        self,
+        mock_preprocess: MagicMock,
+        _run_det: MagicMock,
+        mock_config: MagicMock,
+        _emit: MagicMock,
+        _analyze_block: MagicMock,
+        _lt: MagicMock,
+        _excerpts: MagicMock,
+        _cancelled: MagicMock,
+        _store: MagicMock,
+        _update: MagicMock,
+        mock_publish: MagicMock,
+    ) -> None:
+        """A request that fails after the early phases started still ends its profile."""
+        from app.services.analysis import slow_profiles
+        from app.services.analysis.orchestrator import analyze
+
+        mock_config.LLM_ENABLED = True
+        mock_config.LANGUAGETOOL_ENABLED = True
+        mock_config.LANGUAGETOOL_TIMEOUT = 5
+        prep = _make_prep_result()
+        prep["readability"] = {}
+        mock_preprocess.return_value = prep
+        mock_publish.side_effect = ValueError("publish broke")
+        profiler = slow_profiles.SlowAnalysisProfiler(threshold=0.0, interval=0.002, capacity=3)
+
+        with patch.object(slow_profiles, "_slow_profiler_instance", profiler), \
+                patch.object(slow_profiles.Config, "SLOW_PROFILE_ENABLED", True), \
+                pytest.raises(ValueError, match="publish broke"):
+            analyze(text="This is a test sentence.", content_type="concept")
+
+        # The aborted graph shuts down and releases its hold on the capture
+        deadline = time.monotonic() + 5
+        while not profiler.captures() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(profiler.captures()) == 1
+        assert not profiler._running
+
+    @patch("app.services.analysis.orchestrator._end_flight")
+    @patch("app.services.analysis.orchestrator._merge_and_complete")
+    @patch("app.services.analysis.orchestrator._emit_event")
+    def test_failed_finalize_emits_analysis_error(
+        self,
+        mock_emit: MagicMock,
+        mock_merge: MagicMock,
+        mock_end_flight: MagicMock,
+    ) -> None:
+        """A final merge that raises tells the client instead of going quiet."""
+        from app.services.analysis.orchestrator import _finalize_phase
+
+        mock_merge.side_effect = ValueError("merge broke")
+
+        with pytest.raises(ValueError):
+            _finalize_phase(MagicMock(), "s1", "sid-1", {}, [], "concept")
+
+        mock_emit.assert_called_once()
+        sid, event, payload = mock_emit.call_args.args
+        assert (sid, event, payload["session_id"]) == ("sid-1", "analysis_error", "s1")
+        assert payload["error"]
+        mock_end_flight.assert_called_once_with(None, None)
+
+
+class TestExcerptSource:
+    """Tests for style guide excerpt refinement."""
+
+    @patch("app.services.analysis.orchestrator._select_style_guide_excerpts")
+    def test_refine_replaces_provisional_excerpts(self, mock_select: MagicMock) -> None:
+        """Blocks read refined excerpts once deterministic issues arrive."""
+        from app.services.analysis.orchestrator import _ExcerptSource
+
+        mock_select.side_effect = lambda det, _ct: [{"count": len(det)}]
+        source = _ExcerptSource("concept")
+        assert source.snapshot() == ([{"count": 0}], 0)
+
+        source.refine([_make_issue(), _make_issue()])
+
+        assert source.snapshot() == ([{"count": 2}], 2)
+
+
+class TestBlockCancellation:
+    """Tests for dropping granular work when the run is cancelled."""
+
+    @patch("app.services.analysis.orchestrator.get_cancellation_stats")
+    @patch("app.services.analysis.orchestrator._cache_block")
+    @patch("app.services.analysis.orchestrator._get_cached_block", return_value=None)
+    @patch("app.services.analysis.orchestrator.analyze_block")
+    @patch("app.services.analysis.orchestrator.Config")
+    def test_cancel_drops_queued_blocks_without_caching(
+        self,
+        mock_config: MagicMock,
+        mock_analyze_block: MagicMock,
+        _cached: MagicMock,
+        mock_cache: MagicMock,
+        mock_stats: MagicMock,
+    ) -> None:
+        """Queued blocks never run, nothing is cached, and the run raises."""
+        import threading
+        import time
+
+        from app.services.analysis.orchestrator import _analyze_blocks_parallel
+        from models.cancellation import CancellationToken, OperationCancelled
+
+        mock_config.LLM_MAX_CONCURRENT = 1
+        token = CancellationToken()
+        started = threading.Event()
+
+        def _block(*_args: Any, cancel_token: Any = None, **_kwargs: Any) -> list:
+            # Stands in for an in-flight HTTP call aborted by the token
+            started.set()
+            cancel_token.wait(5)
+            raise OperationCancelled(cancel_token.reason)
+
+        mock_analyze_block.side_effect = _block
+        threading.Timer(0.1, token.cancel, args=("superseded",)).start()
+
+        begin = time.monotonic()
+        with pytest.raises(OperationCancelled):
+            _analyze_blocks_parallel(
+                ["First block.", "Second block.", "Third block."],
+                "concept", cancel_token=token,
+            )
+
+        assert time.monotonic() - begin < 2.0
+        assert started.is_set()
+        assert mock_analyze_block.call_count == 1
+        mock_cache.assert_not_called()
+        mock_stats.return_value.record_skipped.assert_called_once()
+        assert mock_stats.return_value.record_skipped.call_args.kwargs["calls"] == 2
+
+
+class TestViewportScheduling:
+    """Tests for starting granular blocks nearest the viewport."""
+
+    @patch("app.services.analysis.orchestrator._cache_block")
+    @patch("app.services.analysis.orchestrator._get_cached_block", return_value=None)
+    @patch("app.services.analysis.orchestrator.analyze_block")
+    @patch("app.services.analysis.orchestrator.Config")
+    def test_blocks_start_nearest_viewport_and_follow_updates(
+        self,
+        mock_config: MagicMock,
+        mock_analyze_block: MagicMock,
+        _cached: MagicMock,
+        _cache: MagicMock,
+    ) -> None:
+        """The focused block runs first; a moved focus reorders the rest."""
+        from app.services.analysis.block_priority import BlockPriority
+        from app.services.analysis.orchestrator import _analyze_blocks_parallel
+
+        mock_config.LLM_MAX_CONCURRENT = 1
+        priority = BlockPriority()
+        priority.set_focus((350, 350))
+        started: List[str] = []
+
+        def _block(block: str, *_args: Any, **_kwargs: Any) -> list:
+            started.append(block)
+            if len(started) == 1:
+                # The writer scrolls back to the top mid-analysis
+                priority.set_focus((0, 0))
+            return [{"block": block}]
+
+        mock_analyze_block.side_effect = _block
+
+        results = _analyze_blocks_parallel(
+            ["A.", "B.", "C.", "D."], "concept",
+            block_spans=[(0, 100), (100, 200), (200, 300), (300, 400)],
+            priority=priority,
+        )
+
+        assert started == ["D.", "A.", "B.", "C."]
+        # Results stay in document order for deterministic dedup
+        assert [r["block"] for r in results] == ["A.", "B.", "C.", "D."]
+
+
+def _paragraphs(count: int) -> List[str]:
+    """Build *count* distinct prose paragraphs of varying length.
+
+    Args:
+        count: Number of paragraphs.
+
+    Returns:
+        Paragraph strings of roughly 150-450 characters each.
+    """
+    return [
+        f"Paragraph {i} describes step {i} of the procedure. "
+        + "Configure the service and verify the result. " * (3 + i % 7)
+        for i in range(count)
+    ]
+
+
+class TestContentDefinedChunks:
+    """Tests for edit-stable chunk boundaries."""
+
+    def test_chunks_respect_max_and_overlap(self) -> None:
+        """No chunk exceeds the limit; neighbours share the overlap blocks."""
+        from app.services.analysis.orchestrator import _OVERLAP_BLOCK_COUNT, _group_with_overlap
+
+        parts = _paragraphs(60)
+        chunks = _group_with_overlap(parts, 3500)
+
+        assert len(chunks) > 3
+        assert all(len(c) - 2 * c.count("\n\n") <= 3500 for c in chunks)
+        for prev, nxt in zip(chunks, chunks[1:]):
+            tail = prev.split("\n\n")[-_OVERLAP_BLOCK_COUNT:]
+            assert nxt.split("\n\n")[:_OVERLAP_BLOCK_COUNT] == tail
+
+    def test_insert_near_top_keeps_later_chunks(self) -> None:
+        """Inserting a sentence near the top only changes nearby chunks."""
+        from app.services.analysis.orchestrator import _group_with_overlap
+
+        parts = _paragraphs(80)
+        before = _group_with_overlap(parts, 3500)
+        edited = list(parts)
+        edited.insert(2, "One more sentence near the top.")
+        after = _group_with_overlap(edited, 3500)
+
+        changed = [c for c in after if c not in set(before)]
+        assert len(changed) <= 2
+        assert after[-5:] == before[-5:]
+
+    def test_oversized_block_is_own_chunk(self) -> None:
+        """A block longer than the limit is still emitted, never split."""
+        from app.services.analysis.orchestrator import _group_with_overlap
+
+        parts = ["Short intro.", "x" * 5000, "Short outro."]
+        chunks = _group_with_overlap(parts, 3500)
+
+        assert any(c == "x" * 5000 or c.endswith("x" * 5000) for c in chunks)
+        assert "".join(chunks).count("x" * 5000) == 1
+
+    def test_empty_parts(self) -> None:
+        """No parts yields a single empty chunk."""
+        from app.services.analysis.orchestrator import _group_with_overlap
+
+        assert _group_with_overlap([], 3500) == [""]
+
+
+class TestBackgroundPrep:
+    """Tests for the slimmed preprocessing data handed to background phases."""
+
+    def test_drops_foreground_only_data(self) -> None:
+        """The copy has no spaCy Doc, no unused offset map and no char maps."""
+        from app.services.analysis.orchestrator import _background_prep
+        from app.services.parsing.base import Block
+
+        child = Block("paragraph", "Child.", "Child.", 10, 16, char_map=[0, 1, 2])
+        parent = Block("list", "Child.", "* Child.", 8, 16, children=[child], char_map=[0])
+        prep = _make_prep_result()
+        prep.update({
+            "blocks": [parent],
+            "lite_markers": "- Child.",
+            "lite_markers_offset_map": [8, 9, 10],
+            "offset_map": [0, 1, 2],
+        })
+
+        slim = _background_prep(prep)
+
+        assert "spacy_doc" not in slim and "offset_map" not in slim
+        assert slim["lite_markers_offset_map"] is prep["lite_markers_offset_map"]
+        assert slim["sentences"] is prep["sentences"]
+        assert slim["blocks"][0].char_map is None
+        assert slim["blocks"][0].children[0].char_map is None
+        assert slim["blocks"][0].children[0].content == "Child."
+        assert parent.char_map == [0] and child.char_map == [0, 1, 2]
+
+    def test_plain_text_keeps_offset_map(self) -> None:
+        """Without parsed blocks the LLM resolver needs the plain offset map."""
+        from app.services.analysis.orchestrator import _background_prep
+
+        prep = _make_prep_result()
+        prep.update({"offset_map": [0, 1, 2], "lite_markers_offset_map": []})
+
+        slim = _background_prep(prep)
+
+        assert slim["offset_map"] is prep["offset_map"]
+        assert "lite_markers_offset_map" not in slim
+
+
+class TestSingleFlightAnalysis:
+    """Tests for identical concurrent analyses sharing one run."""
+
+    @patch("app.services.analysis.orchestrator._analysis_config_version", return_value="v1")
+    @patch("app.services.analysis.orchestrator._update_stored_session")
+    @patch("app.services.analysis.orchestrator._store_session")
+    @patch("app.services.analysis.orchestrator._emit_event")
+    @patch("app.services.analysis.orchestrator.get_single_flight")
+    @patch("app.services.analysis.orchestrator.Config")
+    @patch("app.services.analysis.orchestrator.run_deterministic")
+    @patch("app.services.analysis.orchestrator.preprocess")
+    def test_concurrent_identical_requests_share_one_run(
+        self,
+        mock_preprocess: MagicMock,
+        mock_run_det: MagicMock,
+        mock_config: MagicMock,
+        mock_flights: MagicMock,
+        _emit: MagicMock,
+        mock_store: MagicMock,
+        mock_update: MagicMock,
+        _version: MagicMock,
+    ) -> None:
+        """A follower gets its own copy; a repeat is served from the cache."""
+        import threading
+        import time
+
+        from app.services.analysis.orchestrator import analyze
+        from app.services.analysis.single_flight import SingleFlight
+
+        mock_config.LLM_ENABLED = False
+        mock_config.CONFIDENCE_THRESHOLD = 0.7
+        mock_flights.return_value = SingleFlight(result_ttl=30)
+        prep = _make_prep_result()
+        prep["readability"] = {}  # reuse cached scores, skip textstat
+        mock_preprocess.return_value = prep
+
+        det_started = threading.Event()
+        release = threading.Event()
+
+        def _det(*_args: Any, **_kwargs: Any) -> List[IssueResponse]:
+            det_started.set()
+            assert release.wait(2)
+            return [_make_issue()]
+
+        mock_run_det.side_effect = _det
+        text = "This is a test sentence. It has multiple words."
+        results: Dict[str, AnalyzeResponse] = {}
+        leader = threading.Thread(target=lambda: results.setdefault(
+            "leader", analyze(text=text, content_type="concept", session_id="lead"),
+        ))
+        leader.start()
+        assert det_started.wait(2)
+        follower_thread = threading.Thread(target=lambda: results.setdefault(
+            "follower", analyze(text=text, content_type="concept", session_id="follow"),
+        ))
+        follower_thread.start()
+        while not mock_flights.return_value.followers("lead"):
+            assert follower_thread.is_alive()
+            time.sleep(0.001)
+        release.set()
+        leader.join(2)
+        follower_thread.join(2)
+
+        repeat = analyze(text=text, content_type="concept", session_id="again")
+
+        assert mock_run_det.call_count == 1
+        lead, follow = results["leader"], results["follower"]
+        assert (lead.session_id, follow.session_id, repeat.session_id) == ("lead", "follow", "again")
+        assert [i.id for i in follow.issues] == [i.id for i in lead.issues]
+        assert follow.issues[0] is not lead.issues[0]
+        assert repeat.issues[0] is not lead.issues[0]
+        stored = {c.args[0] for c in mock_store.call_args_list}
+        assert stored == {"lead", "follow", "again"}
+        assert [c.args[0] for c in mock_update.call_args_list] == ["follow"]
+
+    @patch("app.services.analysis.orchestrator._analysis_config_version", return_value="v1")
+    @patch("app.services.analysis.orchestrator._update_stored_session")
+    @patch("app.services.analysis.orchestrator._store_session")
+    @patch("app.services.analysis.orchestrator._emit_event")
+    @patch("app.services.analysis.orchestrator.get_single_flight")
+    @patch("app.services.analysis.orchestrator.Config")
+    @patch("app.services.analysis.orchestrator.run_deterministic")
+    @patch("app.services.analysis.orchestrator.preprocess")
+    def test_leader_statuses_do_not_reach_followers(
+        self,
+        mock_preprocess: MagicMock,
+        mock_run_det: MagicMock,
+        mock_config: MagicMock,
+        mock_flights: MagicMock,
+        _emit: MagicMock,
+        mock_store: MagicMock,
+        mock_update: MagicMock,
+        _version: MagicMock,
+    ) -> None:
+        """An issue the leader dismissed before finalize is open for others."""
+        import threading
+        import time
+
+        from app.services.analysis.orchestrator import analyze
+        from app.services.analysis.single_flight import SingleFlight
+
+        mock_config.LLM_ENABLED = False
+        mock_config.CONFIDENCE_THRESHOLD = 0.7
+        mock_flights.return_value = SingleFlight(result_ttl=30)
+        prep = _make_prep_result()
+        prep["readability"] = {}
+        mock_preprocess.return_value = prep
+        release = threading.Event()
+
+        def _det(*_args: Any, **_kwargs: Any) -> List[IssueResponse]:
+            assert release.wait(2)
+            return [_make_issue()]
+
+        def _store(session_id: str, response: AnalyzeResponse) -> None:
+            # The session store transfers statuses onto the stored issues
+            if session_id == "lead":
+                response.issues[0].status = IssueStatus.DISMISSED
+
+        mock_run_det.side_effect = _det
+        mock_store.side_effect = _store
+        text = "This is a test sentence. It has multiple words."
+        results: Dict[str, AnalyzeResponse] = {}
+        leader = threading.Thread(target=lambda: results.setdefault(
+            "leader", analyze(text=text, content_type="concept", session_id="lead"),
+        ))
+        leader.start()
+        follower_thread = threading.Thread(target=lambda: results.setdefault(
+            "follower", analyze(text=text, content_type="concept", session_id="follow"),
+        ))
+        follower_thread.start()
+        while not mock_flights.return_value.followers("lead"):
+            assert follower_thread.is_alive()
+            time.sleep(0.001)
+        release.set()
+        leader.join(2)
+        follower_thread.join(2)
+        repeat = analyze(text=text, content_type="concept", session_id="again")
+
+        from app.services.analysis.scorer import calculate_score
+
+        lead = results["leader"]
+        final = mock_update.call_args_list[0].args[1]
+        assert lead.issues[0].status == IssueStatus.DISMISSED
+        for response in (results["follower"], final, repeat):
+            assert response.issues[0].status == IssueStatus.OPEN
+            assert response.score == calculate_score(response.issues, response.report.word_count)
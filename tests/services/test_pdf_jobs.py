@@ -0,0 +1,194 @@
+"""Tests for cached, job-based PDF report rendering.
+
+Validates that rendered PDFs are cached per session version, that
+issue status changes invalidate the cache, that concurrent submits
+share one render, and that failures surface as failed jobs.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from app.models.enums import IssueStatus
+from app.services.reporting.pdf_generator import _build_styles
+from app.services.reporting.pdf_jobs import (
+    JOB_DONE,
+    JOB_FAILED,
+    PdfJobManager,
+    SessionNotFoundError,
+)
+from app.services.session.store import get_session_store
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture()
+def manager() -> PdfJobManager:
+    """Create a thread-backed manager so tests avoid spawning processes.
+
+    Returns:
+        A PdfJobManager rendering in a background thread.
+    """
+    mgr = PdfJobManager(max_workers=0, cache_max_entries=4, cache_ttl_seconds=600)
+    yield mgr
+    mgr.shutdown()
+
+
+def _wait_for_job(manager: PdfJobManager, job_id: str, timeout: float = 10.0) -> dict[str, Any]:
+    """Poll a job until it leaves the pending state.
+
+    Args:
+        manager: The job manager.
+        job_id: The job to poll.
+        timeout: Maximum seconds to wait.
+
+    Returns:
+        The final job status dict.
+    """
+    deadline = time.monotonic() + timeout
+    status = manager.get_job(job_id)
+    while status["status"] not in (JOB_DONE, JOB_FAILED) and time.monotonic() < deadline:
+        time.sleep(0.01)
+        status = manager.get_job(job_id)
+    return status
+
+
+class TestPdfStyles:
+    """Tests for the per-process style sheet."""
+
+    def test_styles_built_once(self) -> None:
+        """Repeated calls return the same precomputed style dict."""
+        assert _build_styles() is _build_styles()
+
+
+class TestPdfJobManager:
+    """Tests for the PdfJobManager cache and job lifecycle."""
+
+    def test_render_returns_pdf(
+        self, app: Flask, manager: PdfJobManager, session_with_issues: dict[str, Any],
+    ) -> None:
+        """render() produces PDF bytes for an existing session."""
+        pdf = manager.render(session_with_issues["session_id"])
+        assert pdf.startswith(b"%PDF")
+
+    def test_unknown_session_raises(self, app: Flask, manager: PdfJobManager) -> None:
+        """Submitting an unknown session raises SessionNotFoundError."""
+        with pytest.raises(SessionNotFoundError):
+            manager.submit("no-such-session")
+
+    def test_unchanged_session_served_from_cache(
+        self, app: Flask, manager: PdfJobManager, session_with_issues: dict[str, Any],
+    ) -> None:
+        """A second render of an unchanged session does not re-render."""
+        session_id = session_with_issues["session_id"]
+        with patch(
+            "app.services.reporting.pdf_jobs.generate_pdf_report",
+            return_value=b"%PDF-fake",
+        ) as gen:
+            first = manager.render(session_id)
+            second = manager.render(session_id)
+        assert first == second == b"%PDF-fake"
+        assert gen.call_count == 1
+
+    def test_status_change_invalidates_cache(
+        self, app: Flask, manager: PdfJobManager, session_with_issues: dict[str, Any],
+    ) -> None:
+        """Accepting an issue bumps the session version and forces a re-render."""
+        session_id = session_with_issues["session_id"]
+        with patch(
+            "app.services.reporting.pdf_jobs.generate_pdf_report",
+            return_value=b"%PDF-fake",
+        ) as gen:
+            manager.render(session_id)
+            get_session_store().update_issue_status(
+                session_id, session_with_issues["issue_id_1"], IssueStatus.ACCEPTED,
+            )
+            manager.render(session_id)
+        assert gen.call_count == 2
+        issues_data = gen.call_args.kwargs["issues_data"]
+        assert any(i["status"] == "accepted" for i in issues_data)
+
+    def test_job_lifecycle(
+        self, app: Flask, manager: PdfJobManager, session_with_issues: dict[str, Any],
+    ) -> None:
+        """A submitted job becomes done and its result is downloadable."""
+        job = manager.submit(session_with_issues["session_id"])
+
+        status = _wait_for_job(manager, job["job_id"])
+        assert status["status"] == JOB_DONE
+        assert manager.get_result(job["job_id"]).startswith(b"%PDF")
+
+    def test_failed_render_marks_job_failed(
+        self, app: Flask, manager: PdfJobManager, session_with_issues: dict[str, Any],
+    ) -> None:
+        """Renderer exceptions produce a failed job with the error message."""
+        with patch(
+            "app.services.reporting.pdf_jobs.generate_pdf_report",
+            side_effect=ValueError("boom"),
+        ):
+            job = manager.submit(session_with_issues["session_id"])
+            status = _wait_for_job(manager, job["job_id"])
+        assert status["status"] == JOB_FAILED
+        assert "boom" in status["error"]
+        assert manager.get_result(job["job_id"]) is None
+
+    def test_concurrent_renders_share_slow_submit(
+        self, app: Flask, manager: PdfJobManager, session_with_issues: dict[str, Any],
+    ) -> None:
+        """A render joining a job still being submitted waits for its result."""
+        session_id = session_with_issues["session_id"]
+        submit = manager._submit_render
+        entered = threading.Event()
+
+        def slow_submit(payload: dict[str, Any]) -> Future:
+            entered.set()
+            time.sleep(0.2)
+            return submit(payload)
+
+        results: list[Any] = []
+
+        def render() -> None:
+            try:
+                results.append(manager.render(session_id))
+            except RuntimeError as exc:
+                results.append(exc)
+
+        with patch(
+            "app.services.reporting.pdf_jobs.generate_pdf_report",
+            return_value=b"%PDF-fake",
+        ) as gen, patch.object(manager, "_submit_render", side_effect=slow_submit):
+            leader = threading.Thread(target=render)
+            leader.start()
+            assert entered.wait(5)
+            follower = threading.Thread(target=render)
+            follower.start()
+            leader.join(5)
+            follower.join(5)
+
+        assert results == [b"%PDF-fake", b"%PDF-fake"]
+        assert gen.call_count == 1
+
+    def test_failed_submit_fails_job_and_allows_retry(
+        self, app: Flask, manager: PdfJobManager, session_with_issues: dict[str, Any],
+    ) -> None:
+        """A render that cannot be started fails its job instead of leaving it pending."""
+        session_id = session_with_issues["session_id"]
+        with patch.object(manager, "_submit_render", side_effect=OSError("no workers")):
+            with pytest.raises(OSError):
+                manager.submit(session_id)
+
+        job_id = next(iter(manager._jobs))
+        assert manager.get_job(job_id)["status"] == JOB_FAILED
+        assert "no workers" in manager.get_job(job_id)["error"]
+        assert manager._inflight == {}
+        with patch(
+            "app.services.reporting.pdf_jobs.generate_pdf_report",
+            return_value=b"%PDF-fake",
+        ):
+            assert manager.render(session_id) == b"%PDF-fake"
@@ -0,0 +1,96 @@
+"""Tests for PDF extraction in serial and page-sharded modes.
+
+Validates that sharded extraction on the worker pool yields the same
+blocks as serial extraction, that running headers are still removed
+when detected on a page sample, and the sample itself.
+"""
+
+from typing import Generator
+from unittest.mock import patch
+
+import fitz
+import pytest
+
+from app.services.parsing import pdf_parser
+from app.services.parsing.pdf_parser import PdfParser, _sample_pages
+
+
+def _build_pdf(pages: int) -> bytes:
+    """Build a PDF with a running header, body text and page numbers.
+
+    Args:
+        pages: Number of pages.
+
+    Returns:
+        The PDF bytes.
+    """
+    doc = fitz.open()
+    for n in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 30), "Product Guide", fontsize=9)
+        page.insert_text((72, 100), "Chapter overview", fontsize=10)
+        for line in range(3):
+            page.insert_text(
+                (72, 200 + line * 40), f"Page {n} explains step {line} of the setup.",
+                fontsize=11,
+            )
+        page.insert_text((72, 820), f"{n + 1}", fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture()
+def sharded() -> Generator[None, None, None]:
+    """Extract documents of 32 pages or more in shards on two workers."""
+    with patch.object(pdf_parser.Config, "PDF_EXTRACT_WORKERS", 2), \
+            patch.object(pdf_parser.Config, "PDF_PARALLEL_MIN_PAGES", 32):
+        yield
+    pdf_parser._discard_pool()
+
+
+class TestShardedExtraction:
+    """Tests for page-sharded extraction."""
+
+    def test_matches_serial(self, sharded: None) -> None:
+        """Sharded and serial extraction produce identical blocks."""
+        data = _build_pdf(40)
+
+        result = PdfParser().parse(data)
+        with patch.object(pdf_parser.Config, "PDF_EXTRACT_WORKERS", 0):
+            expected = PdfParser().parse(data)
+
+        assert [vars(b) for b in result.blocks] == [vars(b) for b in expected.blocks]
+        assert result.plain_text == expected.plain_text
+        assert result.metadata["pages"] == 40
+
+    def test_running_text_removed_from_sample(self, sharded: None) -> None:
+        """Text repeated across sampled pages is excluded as a header."""
+        result = PdfParser().parse(_build_pdf(80))
+
+        assert "Chapter overview" not in result.plain_text
+        assert "Page 79 explains step 2" in result.plain_text
+
+    def test_pool_failure_falls_back_to_serial(self, sharded: None) -> None:
+        """A broken pool does not fail the parse."""
+        data = _build_pdf(40)
+        with patch.object(pdf_parser, "_iter_shards", side_effect=RuntimeError("pool")):
+            result = PdfParser().parse(data)
+
+        assert "Page 39 explains step 0" in result.plain_text
+
+
+class TestSamplePages:
+    """Tests for _sample_pages."""
+
+    def test_short_document_uses_every_page(self) -> None:
+        """Documents within the sample size are fully counted."""
+        assert _sample_pages(5) == [0, 1, 2, 3, 4]
+
+    def test_long_document_sampled_evenly(self) -> None:
+        """Long documents are sampled across their whole length."""
+        sample = _sample_pages(500)
+
+        assert len(sample) == pdf_parser._REPEATED_SAMPLE_PAGES
+        assert sample[0] == 0 and sample[-1] > 450
+        assert sample == sorted(set(sample))
@@ -0,0 +1,106 @@
+"""Tests for the background phase dependency graph.
+
+Validates that phases start as soon as their dependencies finish,
+that provided values satisfy dependencies, that failures are isolated
+from dependents, and that independent phases overlap in time.
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from app.services.analysis.pipeline import PhaseGraph
+
+
+class TestPhaseGraph:
+    """Tests for PhaseGraph."""
+
+    def test_dependents_see_results(self) -> None:
+        """A phase reads the results of the phases it runs after."""
+        graph = PhaseGraph(max_workers=2)
+        graph.add("a", lambda: 2)
+        graph.add("b", lambda: graph.result("a") * 10, after=("a",))
+        graph.close()
+
+        assert graph.result("b") == 20
+
+    def test_phase_waits_for_provided_value(self) -> None:
+        """A dependency added before it is provided holds the phase back."""
+        graph = PhaseGraph(max_workers=2)
+        started = threading.Event()
+        graph.add("b", started.set, after=("det",))
+
+        assert not started.wait(0.05)
+        graph.provide("det", ["issue"])
+        graph.close()
+
+        assert started.wait(1)
+        assert graph.result("det") == ["issue"]
+
+    def test_failure_returns_default_and_dependents_run(self) -> None:
+        """A failing phase yields the default; its dependents still run."""
+        def _fail() -> None:
+            raise ConnectionError("llm down")
+
+        graph = PhaseGraph(max_workers=2)
+        graph.add("granular", _fail)
+        graph.add("judge", lambda: graph.result("granular", []), after=("granular",))
+        graph.close()
+
+        assert graph.result("judge") == []
+
+    def test_failure_logged_without_reader(self, caplog: pytest.LogCaptureFixture) -> None:
+        """A failing phase is logged with its traceback even if nobody reads it."""
+        def _fail() -> None:
+            raise ValueError("merge broke")
+
+        graph = PhaseGraph(max_workers=1, name="s1")
+        with caplog.at_level(logging.ERROR, logger="app.services.analysis.pipeline"):
+            future = graph.add("finalize", _fail)
+            graph.close()
+            with pytest.raises(ValueError):
+                future.result(timeout=1)
+
+        record = next(r for r in caplog.records if "finalize" in r.getMessage())
+        assert record.exc_info is not None
+        assert "merge broke" in caplog.text
+
+    def test_independent_phases_overlap(self) -> None:
+        """Wall time tracks the longest phase, not the sum."""
+        graph = PhaseGraph(max_workers=3)
+        started = time.monotonic()
+        for name in ("languagetool", "granular", "global"):
+            graph.add(name, time.sleep, 0.2)
+        graph.add("finalize", lambda: None, after=("languagetool", "granular", "global"))
+        graph.close()
+
+        graph.result("finalize")
+        assert time.monotonic() - started < 0.5
+
+    def test_result_timeout_returns_default(self) -> None:
+        """Waiting on a slow phase past the timeout returns the default."""
+        release = threading.Event()
+        graph = PhaseGraph(max_workers=1)
+        graph.add("languagetool", release.wait)
+        graph.close()
+
+        assert graph.result("languagetool", "late", timeout=0.05) == "late"
+        release.set()
+
+    def test_missing_dependency_resolved_on_close(self) -> None:
+        """Closing unblocks phases that wait on a never-added phase."""
+        graph = PhaseGraph(max_workers=1)
+        graph.add("finalize", lambda: graph.result("languagetool", []), after=("languagetool",))
+        graph.close()
+
+        assert graph.result("finalize") == []
+
+    def test_duplicate_name_rejected(self) -> None:
+        """Registering the same phase twice raises ValueError."""
+        graph = PhaseGraph(max_workers=1)
+        graph.provide("det", [])
+        with pytest.raises(ValueError):
+            graph.provide("det", [])
+        graph.close()
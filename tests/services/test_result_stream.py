@@ -0,0 +1,151 @@
+"""Tests for versioned issue deltas sent over Socket.IO.
+
+Validates that each issue is sent once, that later events carry only
+additions, removals and status changes, that superseded runs cannot
+publish, and that large payloads round-trip through compression.
+"""
+
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from app.models.enums import IssueCategory, IssueSeverity, IssueStatus
+from app.models.schemas import IssueResponse
+from app.services.session.result_stream import ResultStream, decode_payload, encode_payload
+
+
+def _issue(issue_id: str, message: str = "Use active voice.") -> IssueResponse:
+    """Create a minimal IssueResponse.
+
+    Args:
+        issue_id: Issue identifier.
+        message: Issue message.
+
+    Returns:
+        An open IssueResponse.
+    """
+    return IssueResponse(
+        id=issue_id,
+        source="deterministic",
+        category=IssueCategory.STYLE,
+        rule_name="verbs",
+        flagged_text="was configured",
+        message=message,
+        suggestions=["configured"],
+        severity=IssueSeverity.MEDIUM,
+        sentence="The system was configured.",
+        sentence_index=0,
+        span=[11, 25],
+        style_guide_citation="",
+        confidence=0.9,
+        status=IssueStatus.OPEN,
+    )
+
+
+def _publish(stream: ResultStream, owner: Any, issues: List[IssueResponse],
+             replace: bool = False) -> Dict[str, Any]:
+    """Publish and return the delta that was sent."""
+    sent: List[Dict[str, Any]] = []
+    stream.publish(owner, issues, sent.append, replace=replace)
+    assert len(sent) == 1
+    return sent[0]
+
+
+class TestResultStream:
+    """Tests for ResultStream deltas."""
+
+    def test_issues_sent_once(self) -> None:
+        """A later phase event does not resend earlier issues."""
+        stream = ResultStream()
+        owner = object()
+        stream.restart(owner)
+        first, second = _issue("a"), _issue("b")
+
+        det = _publish(stream, owner, [first])
+        final = _publish(stream, owner, [first, second], replace=True)
+
+        assert (det["base_version"], det["version"]) == (0, 1)
+        assert [i.id for i in det["added"]] == ["a"]
+        assert (final["base_version"], final["version"]) == (1, 2)
+        assert [i.id for i in final["added"]] == ["b"]
+        assert final["removed"] == [] and final["status"] == {}
+
+    def test_replace_removes_and_reports_status_changes(self) -> None:
+        """The final set removes dropped issues and lists status changes."""
+        stream = ResultStream()
+        owner = object()
+        stream.restart(owner)
+        kept, dropped = _issue("a"), _issue("b")
+        _publish(stream, owner, [kept, dropped])
+
+        kept.status = IssueStatus.DISMISSED
+        delta = _publish(stream, owner, [kept], replace=True)
+
+        assert delta["added"] == []
+        assert delta["removed"] == ["b"]
+        assert delta["status"] == {"a": "dismissed"}
+
+    def test_changed_content_is_resent(self) -> None:
+        """An issue whose content changed is sent again in full."""
+        stream = ResultStream()
+        owner = object()
+        stream.restart(owner)
+        _publish(stream, owner, [_issue("a")])
+
+        delta = _publish(stream, owner, [_issue("a", message="Reworded.")], replace=True)
+
+        assert [i.message for i in delta["added"]] == ["Reworded."]
+
+    def test_superseded_run_cannot_publish(self) -> None:
+        """Deltas from a run that no longer owns the stream are dropped."""
+        stream = ResultStream()
+        old, new = object(), object()
+        stream.restart(old)
+        stream.restart(new)
+        sent: List[Dict[str, Any]] = []
+
+        assert stream.publish(old, [_issue("a")], sent.append) is None
+        assert sent == []
+        assert stream.version == 0
+
+    def test_snapshot_has_current_set(self) -> None:
+        """A snapshot lists every held issue at the current version."""
+        stream = ResultStream()
+        owner = object()
+        stream.restart(owner)
+        _publish(stream, owner, [_issue("a"), _issue("b")])
+
+        snapshot = stream.snapshot()
+
+        assert snapshot["reset"] is True
+        assert snapshot["version"] == snapshot["base_version"] == 1
+        assert sorted(i.id for i in snapshot["added"]) == ["a", "b"]
+
+
+class TestPayloadEncoding:
+    """Tests for result payload compression."""
+
+    @patch("app.services.session.result_stream.Config")
+    def test_large_payload_round_trips(self, mock_config: Any) -> None:
+        """Payloads over the threshold are compressed and decode intact."""
+        mock_config.SOCKET_COMPRESS_MIN_BYTES = 1024
+        issues = [_issue(str(n)) for n in range(50)]
+        payload = {"session_id": "abc", "added": issues}
+
+        encoded = encode_payload(payload)
+
+        assert encoded["encoding"] == "deflate"
+        assert encoded["session_id"] == "abc"
+        assert len(encoded["data"]) < 1024
+        assert decode_payload(encoded) == {
+            "session_id": "abc", "added": [i.to_dict() for i in issues],
+        }
+
+    @patch("app.services.session.result_stream.Config")
+    def test_small_payload_unchanged(self, mock_config: Any) -> None:
+        """Payloads under the threshold are sent as-is."""
+        mock_config.SOCKET_COMPRESS_MIN_BYTES = 1024
+        payload = {"session_id": "abc", "added": [_issue("a")]}
+
+        assert encode_payload(payload) == {
+            "session_id": "abc", "added": [_issue("a").to_dict()],
+        }
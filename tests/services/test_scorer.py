@@ -12,7 +12,7 @@ import pytest
 
 from app.models.enums import IssueCategory, IssueSeverity, IssueStatus
 from app.models.schemas import IssueResponse, ScoreResponse
-from app.services.analysis.scorer import calculate_score
+from app.services.analysis.scorer import ScoreLedger, calculate_score
 
 logger = logging.getLogger(__name__)
 
@@ -216,3 +216,36 @@ class TestScorer:
 
         assert isinstance(result.compliance, dict)
         assert len(result.compliance) > 0
+
+
+class TestScoreLedger:
+    """Tests for incremental score maintenance via ScoreLedger."""
+
+    def test_ledger_matches_full_recalculation(self) -> None:
+        """Applying status changes matches scoring the final list from scratch."""
+        issues: List[IssueResponse] = [
+            _make_issue(severity=sev, category=cat)
+            for sev in IssueSeverity
+            for cat in (IssueCategory.GRAMMAR, IssueCategory.STYLE, IssueCategory.PUNCTUATION)
+        ]
+        ledger = ScoreLedger(issues, word_count=400)
+
+        for idx, issue in enumerate(issues):
+            if idx % 3 == 0:
+                continue
+            new_status = IssueStatus.ACCEPTED if idx % 2 else IssueStatus.DISMISSED
+            ledger.apply_status_change(issue, issue.status, new_status)
+            issue.status = new_status
+
+        assert ledger.to_score().to_dict() == calculate_score(issues, 400).to_dict()
+
+    def test_reopening_restores_score(self) -> None:
+        """Moving an issue back to OPEN restores the original score."""
+        issues: List[IssueResponse] = [_make_issue(severity=IssueSeverity.HIGH)]
+        ledger = ScoreLedger(issues, word_count=100)
+        original = ledger.to_score().score
+
+        ledger.apply_status_change(issues[0], IssueStatus.OPEN, IssueStatus.ACCEPTED)
+        assert ledger.to_score().score == 100
+        ledger.apply_status_change(issues[0], IssueStatus.ACCEPTED, IssueStatus.OPEN)
+        assert ledger.to_score().score == original
@@ -2,7 +2,8 @@
 
 Validates session CRUD operations, TTL expiration, issue status updates
 with score recalculation, suggestion caching, active analysis tracking,
-concurrent access safety, and multi-session independence.
+concurrent access safety, multi-session independence, and memory-budget
+eviction.
 """
 
 import logging
@@ -461,3 +462,227 @@ class TestUpdateSessionResponsePreservesStatuses:
             updated = store.get_session(session_id)
             assert updated is not None
             assert updated.score.score == 100
+
+
+class TestBulkIssueStatus:
+    """Tests for indexed lookups and bulk status updates."""
+
+    def test_get_issue_by_id(self, app: Flask) -> None:
+        """get_issue returns the stored issue object for a known ID."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            response = _make_response(num_issues=3)
+            session_id: str = store.create_session(response)
+
+            assert store.get_issue(session_id, response.issues[2].id) is response.issues[2]
+            assert store.get_issue(session_id, "missing") is None
+            assert store.get_issue("missing", response.issues[0].id) is None
+
+    def test_bulk_update_by_category(self, app: Flask) -> None:
+        """Only OPEN issues in the selected category are updated."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            response = _make_response(num_issues=4)
+            session_id: str = store.create_session(response)
+            store.update_issue_status(
+                session_id, response.issues[0].id, IssueStatus.DISMISSED,
+            )
+
+            result = store.update_issue_statuses(
+                session_id, IssueStatus.ACCEPTED, category="style",
+            )
+
+            assert result is not None
+            _, updated_ids = result
+            assert updated_ids == [response.issues[2].id]
+            assert response.issues[0].status == IssueStatus.DISMISSED
+            assert response.issues[1].status == IssueStatus.OPEN
+
+    def test_bulk_update_score_matches_single_updates(self, app: Flask) -> None:
+        """A bulk update yields the same score as individual updates."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            bulk = _make_response(num_issues=6)
+            single = _make_response(num_issues=6)
+            bulk_id: str = store.create_session(bulk)
+            single_id: str = store.create_session(single)
+
+            ids = [bulk.issues[i].id for i in (0, 1, 3)]
+            result = store.update_issue_statuses(
+                bulk_id, IssueStatus.ACCEPTED, issue_ids=ids,
+            )
+            for i in (0, 1, 3):
+                expected = store.update_issue_status(
+                    single_id, single.issues[i].id, IssueStatus.ACCEPTED,
+                )
+
+            assert result is not None
+            assert result[0].to_dict() == expected.to_dict()
+            assert result[1] == ids
+
+    def test_bulk_update_unknown_session(self, app: Flask) -> None:
+        """Bulk updates on an unknown session return None."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            assert store.update_issue_statuses(
+                "missing", IssueStatus.ACCEPTED, category="style",
+            ) is None
+
+    def test_context_sentences_ordered(self, app: Flask) -> None:
+        """Context sentences are unique and ordered by sentence index."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            response = _make_response(num_issues=3)
+            response.issues.reverse()
+            session_id: str = store.create_session(response)
+
+            assert store.get_context_sentences(session_id) == [
+                "This is test sentence 0.",
+                "This is test sentence 1.",
+                "This is test sentence 2.",
+            ]
+
+
+class TestAnalysisTokens:
+    """Tests for per-run cancellation tokens."""
+
+    def test_reanalysis_cancels_previous_run(self, app: Flask) -> None:
+        """A second run for the same session cancels the first run's token."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            session_id = str(uuid.uuid4())
+
+            first = store.begin_analysis(session_id)
+            second = store.begin_analysis(session_id)
+
+            assert first.cancelled
+            assert first.reason == "superseded"
+            assert not second.cancelled
+
+    def test_reanalysis_restarts_result_stream(self, app: Flask) -> None:
+        """A new run owns the session's result stream from version 0."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            session_id = str(uuid.uuid4())
+            first = store.begin_analysis(session_id)
+            stream = store.result_stream(session_id)
+            stream.publish(first, [], lambda _delta: None)
+
+            second = store.begin_analysis(session_id)
+
+            assert store.result_stream(session_id) is stream
+            assert stream.version == 0
+            assert stream.publish(first, [], lambda _delta: None) is None
+            assert stream.publish(second, [], lambda _delta: None)["version"] == 1
+
+    def test_cancel_analysis_fires_token(self, app: Flask) -> None:
+        """cancel_analysis cancels the running token as well as the flag."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            session_id = store.create_session(_make_response())
+            token = store.begin_analysis(session_id)
+
+            store.cancel_analysis(session_id)
+
+            assert token.cancelled
+            assert store.is_analysis_current(session_id) is False
+
+    def test_set_active_analysis_cancels_superseded_token(self, app: Flask) -> None:
+        """A new session on the same socket cancels the old session's run."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            old_id = store.create_session(_make_response())
+            new_id = store.create_session(_make_response())
+            old_token = store.begin_analysis(old_id)
+
+            store.set_active_analysis("socket-1", old_id)
+            store.set_active_analysis("socket-1", new_id)
+
+            assert old_token.cancelled
+
+    def test_finished_run_is_not_cancelled_later(self, app: Flask) -> None:
+        """Finishing a run releases its token; the next run cancels nothing."""
+        with app.app_context():
+            store: SessionStore = get_session_store()
+            session_id = str(uuid.uuid4())
+            first = store.begin_analysis(session_id)
+            store.finish_analysis(session_id, first)
+
+            store.begin_analysis(session_id)
+
+            assert not first.cancelled
+
+    def test_session_expired_on_access_drops_run_state(self, app: Flask) -> None:
+        """A session found expired by a read loses its token, stream and socket."""
+        with app.app_context():
+            store = SessionStore(ttl_seconds=60)
+            session_id = store.create_session(_make_response())
+            store.begin_analysis(session_id)
+            store.result_stream(session_id)
+            store.block_priority(session_id)
+            store.set_active_analysis("socket-1", session_id)
+            store._sessions[session_id]["created_at"] -= 120
+
+            assert store.get_session(session_id) is None
+
+            assert session_id not in store._analysis_tokens
+            assert session_id not in store._result_streams
+            assert session_id not in store._block_priorities
+            assert "socket-1" not in store._active_analyses
+
+
+class TestMemoryBudget:
+    """Tests for memory accounting and LRU eviction of idle sessions."""
+
+    def test_least_recently_used_idle_session_is_evicted(self, app: Flask) -> None:
+        """Over budget, the session read least recently goes first."""
+        with app.app_context():
+            store = SessionStore(ttl_seconds=3600, memory_budget_mb=1)
+            first = store.create_session(_make_response(num_issues=600))
+            second = store.create_session(_make_response(num_issues=600))
+            store.get_session(first)
+
+            third = store.create_session(_make_response(num_issues=600))
+
+            assert store.get_session(second) is None
+            assert store.get_session(first) is not None
+            assert store.get_session(third) is not None
+            stats = store.memory_stats()
+            assert stats["evictions"] == 1
+            assert 0 < stats["session_bytes"] <= stats["budget_bytes"]
+
+    def test_session_with_running_analysis_is_kept(self, app: Flask) -> None:
+        """Sessions whose analysis is still running are never evicted."""
+        with app.app_context():
+            store = SessionStore(ttl_seconds=3600, memory_budget_mb=1)
+            running = store.create_session(_make_response(num_issues=600))
+            store.begin_analysis(running)
+            idle = store.create_session(_make_response(num_issues=600))
+
+            store.create_session(_make_response(num_issues=600))
+
+            assert store.get_session(running) is not None
+            assert store.get_session(idle) is None
+
+    def test_analysis_memory_counts_until_finished(self, app: Flask) -> None:
+        """Tracked analysis bytes count against the budget until the run ends."""
+        with app.app_context():
+            store = SessionStore(ttl_seconds=3600, memory_budget_mb=1)
+            idle = store.create_session(_make_response(num_issues=600))
+            token = store.begin_analysis("running")
+
+            store.track_analysis_memory("running", token, 800 * 1024)
+
+            assert store.get_session(idle) is None
+            assert store.memory_stats()["analysis_bytes"] == 800 * 1024
+            store.finish_analysis("running", token)
+            assert store.memory_stats()["analysis_bytes"] == 0
+
+    def test_zero_budget_disables_eviction(self, app: Flask) -> None:
+        """A budget of 0 keeps every session until its TTL."""
+        with app.app_context():
+            store = SessionStore(ttl_seconds=3600, memory_budget_mb=0)
+            ids = [store.create_session(_make_response(num_issues=600)) for _ in range(4)]
+
+            assert all(store.get_session(s) is not None for s in ids)
+            assert store.memory_stats()["evictions"] == 0
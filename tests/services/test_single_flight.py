@@ -0,0 +1,129 @@
+"""Tests for coalescing identical concurrent analyses.
+
+Validates flight membership, the completed-result cache, hand-over
+when a leader is cancelled, and the request key.
+"""
+
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+from app.models.schemas import AnalyzeResponse, ReportResponse, ScoreResponse
+from app.services.analysis.single_flight import SingleFlight, Subscriber, analysis_key
+from app.services.parsing.base import Block
+from models.cancellation import CancellationToken
+
+
+def _subscriber(session_id: str) -> Subscriber:
+    """Create a live subscriber with its own token."""
+    return Subscriber(session_id, None, CancellationToken(), request={"text": "x"})
+
+
+def _response() -> AnalyzeResponse:
+    """Create an empty final response."""
+    return AnalyzeResponse(
+        session_id="",
+        issues=[],
+        score=ScoreResponse(score=100, color="green", label="Excellent", total_issues=0),
+        report=ReportResponse(
+            word_count=1, sentence_count=1, paragraph_count=1,
+            avg_words_per_sentence=1.0, avg_syllables_per_word=1.0,
+        ),
+    )
+
+
+class TestSingleFlight:
+    """Tests for the flight registry."""
+
+    def test_second_request_follows_first(self) -> None:
+        """An identical request joins the running flight as a follower."""
+        flights = SingleFlight(result_ttl=30)
+        leader, follower = _subscriber("a"), _subscriber("b")
+
+        flight, leading = flights.join("key", leader)
+        same, following = flights.join("key", follower)
+
+        assert leading and not following
+        assert same is flight
+        assert flights.followers("a") == [follower]
+
+    def test_cancelled_leader_is_not_joined(self) -> None:
+        """A flight whose leader was cancelled starts afresh for new requests."""
+        flights = SingleFlight(result_ttl=30)
+        leader = _subscriber("a")
+        first, _ = flights.join("key", leader)
+        leader.cancel_token.cancel("superseded")
+
+        second, leading = flights.join("key", _subscriber("b"))
+
+        assert leading and second is not first
+
+    def test_cancelled_followers_are_skipped(self) -> None:
+        """Followers whose run was cancelled receive nothing more."""
+        flights = SingleFlight(result_ttl=30)
+        flights.join("key", _subscriber("a"))
+        follower = _subscriber("b")
+        flights.join("key", follower)
+
+        follower.cancel_token.cancel("superseded")
+
+        assert flights.followers("a") == []
+
+    def test_finish_caches_result_until_ttl(self) -> None:
+        """A finished flight's result answers repeats; a zero TTL caches nothing."""
+        flights = SingleFlight(result_ttl=30)
+        flight, _ = flights.join("key", _subscriber("a"))
+        response = _response()
+
+        flights.finish(flight, response)
+
+        assert flights.cached("key") is response
+        assert flights.followers("a") == []
+        uncached = SingleFlight(result_ttl=0)
+        other, _ = uncached.join("key", _subscriber("a"))
+        uncached.finish(other, response)
+        assert uncached.cached("key") is None
+
+    def test_waiting_follower_sees_leader_failure(self) -> None:
+        """fail_first wakes followers with the leader's exception."""
+        flights = SingleFlight(result_ttl=30)
+        flight, _ = flights.join("key", _subscriber("a"))
+
+        with pytest.raises(FutureTimeoutError):
+            flight.wait_first(0.01)
+        flight.fail_first(RuntimeError("boom"))
+        with pytest.raises(RuntimeError):
+            flight.wait_first(0.01)
+
+    def test_hand_over_to_first_live_follower(self) -> None:
+        """Without a result, the first live follower leads a new flight."""
+        flights = SingleFlight(result_ttl=30)
+        flight, _ = flights.join("key", _subscriber("a"))
+        gone, first, second = _subscriber("b"), _subscriber("c"), _subscriber("d")
+        for subscriber in (gone, first, second):
+            flights.join("key", subscriber)
+        gone.cancel_token.cancel("superseded")
+
+        successor = flights.hand_over(flight, flights.finish(flight, None))
+
+        assert successor is not None
+        assert successor.leader is first
+        assert successor.followers == [second]
+        assert flights.followers("c") == [second]
+        assert flights.cached("key") is None
+
+
+class TestAnalysisKey:
+    """Tests for the coalescing key."""
+
+    def test_key_depends_on_every_input(self) -> None:
+        """Text, content type, structure and configuration all change the key."""
+        block = Block("paragraph", "Text.", "Text.", 0, 5)
+        base = analysis_key("Text.", "concept", "html", [block], False, "v1")
+
+        assert base == analysis_key("Text.", "concept", "html", [block], False, "v1")
+        assert base != analysis_key("Text. ", "concept", "html", [block], False, "v1")
+        assert base != analysis_key("Text.", "procedure", "html", [block], False, "v1")
+        assert base != analysis_key("Text.", "concept", "html", [], False, "v1")
+        assert base != analysis_key("Text.", "concept", "html", [block], True, "v1")
+        assert base != analysis_key("Text.", "concept", "html", [block], False, "v2")
@@ -0,0 +1,191 @@
+"""Tests for the slow-analysis stack-sampling profiler.
+
+Validates that slow runs are kept and fast ones dropped, that a capture
+follows a run into its background phases and block workers, that the
+ring buffer is bounded, and the collapsed and speedscope exports.
+"""
+
+import threading
+import time
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+from flask import Flask, g
+
+from app.config import Config
+from app.services.analysis import slow_profiles
+from app.services.analysis.pipeline import PhaseGraph
+from app.services.analysis.slow_profiles import (
+    SlowAnalysisProfiler,
+    bind_capture,
+    current_capture,
+    get_slow_profiler,
+    track,
+)
+
+
+@pytest.fixture
+def profiler() -> Iterator[SlowAnalysisProfiler]:
+    """Yield an installed profiler that keeps every run."""
+    instance = SlowAnalysisProfiler(threshold=0.0, interval=0.002, capacity=3)
+    with patch.object(Config, "SLOW_PROFILE_ENABLED", True), \
+            patch.object(slow_profiles, "_slow_profiler_instance", instance):
+        yield instance
+
+
+def _spin(seconds: float) -> None:
+    """Keep the CPU busy for *seconds*."""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+def _wait_for_captures(profiler: SlowAnalysisProfiler, count: int) -> list:
+    """Return the kept captures once there are *count* of them."""
+    deadline = time.monotonic() + 5
+    while len(profiler.captures()) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return profiler.captures()
+
+
+class TestSlowAnalysisProfiler:
+    """Tests for capture lifetime and retention."""
+
+    def test_disabled_by_default(self) -> None:
+        """No profiler exists unless profiling is enabled."""
+        with patch.object(Config, "SLOW_PROFILE_ENABLED", False):
+            assert get_slow_profiler() is None
+        with track(None, "request") as capture:
+            assert capture is None
+
+    def test_slow_run_is_sampled_and_kept(self, profiler: SlowAnalysisProfiler) -> None:
+        """A run over the threshold is kept with samples of its work."""
+        capture = profiler.begin("sess-1")
+        with track(capture, "request"):
+            _spin(0.1)
+
+        assert profiler.captures() == [capture]
+        assert capture.duration >= 0.1
+        assert capture.sample_count > 0
+        assert all(stack[0] == "request" for stack in capture.samples)
+        assert any("_spin" in frame for stack in capture.samples for frame in stack)
+        assert 0 < sum(capture.samples.values()) <= capture.duration + 0.05
+
+    def test_fast_run_is_dropped(self, profiler: SlowAnalysisProfiler) -> None:
+        """A run under the threshold is not kept."""
+        profiler.threshold = 10.0
+        capture = profiler.begin("sess-1")
+        with track(capture, "request"):
+            pass
+
+        assert profiler.captures() == []
+        assert capture.duration < 10.0
+
+    def test_hold_keeps_capture_running(self, profiler: SlowAnalysisProfiler) -> None:
+        """The capture ends only when the last hold is released."""
+        capture = profiler.begin("sess-1")
+        capture.hold()
+        with track(capture, "request"):
+            pass
+        assert profiler.captures() == []
+
+        capture.release()
+        assert profiler.captures() == [capture]
+
+    def test_ring_buffer_keeps_newest(self, profiler: SlowAnalysisProfiler) -> None:
+        """Past capacity the oldest capture is dropped."""
+        captures = []
+        for n in range(5):
+            capture = profiler.begin(f"sess-{n}")
+            with track(capture, "request"):
+                pass
+            captures.append(capture)
+
+        assert profiler.captures() == captures[:1:-1]
+        assert profiler.get(captures[0].id) is None
+        assert profiler.get(captures[4].id) is captures[4]
+
+    def test_request_id_from_correlation(self, profiler: SlowAnalysisProfiler) -> None:
+        """The capture is tagged with the request's correlation ID."""
+        with Flask(__name__).test_request_context():
+            g.request_id = "req-42"
+            capture = profiler.begin("sess-1")
+        with track(capture, "request"):
+            pass
+
+        assert capture.summary()["request_id"] == "req-42"
+
+
+class TestCapturePropagation:
+    """Tests for following a run into other threads."""
+
+    def test_phase_graph_tracks_phases(self, profiler: SlowAnalysisProfiler) -> None:
+        """Phases of a graph created in a tracked task join its capture."""
+        capture = profiler.begin("sess-1")
+        with track(capture, "request"):
+            assert current_capture() is capture
+            graph = PhaseGraph(max_workers=1)
+            graph.add("spin", lambda: _spin(0.1))
+            graph.close()
+
+        assert profiler.captures() == []
+        graph.result("spin")
+        kept = _wait_for_captures(profiler, 1)
+
+        assert kept == [capture]
+        assert any(stack[0] == "phase:spin" for stack in capture.samples)
+
+    def test_bind_capture_tracks_other_thread(self, profiler: SlowAnalysisProfiler) -> None:
+        """Work handed to a thread through bind_capture is sampled."""
+        seen = []
+        capture = profiler.begin("sess-1")
+        with track(capture, "request"):
+            work = bind_capture(lambda: seen.append(current_capture()) or _spin(0.05), "worker")
+            worker = threading.Thread(target=work)
+            worker.start()
+            worker.join()
+
+        assert seen == [capture]
+        assert any(stack[0] == "worker" for stack in capture.samples)
+
+    def test_bind_capture_untracked_is_identity(self, profiler: SlowAnalysisProfiler) -> None:
+        """Outside a capture the callable is returned unchanged."""
+        assert bind_capture(_spin, "worker") is _spin
+
+
+class TestExports:
+    """Tests for the collapsed and speedscope formats."""
+
+    @pytest.fixture
+    def capture(self, profiler: SlowAnalysisProfiler) -> slow_profiles.ProfileCapture:
+        """Return a capture with fixed samples."""
+        capture = profiler.begin("sess-1")
+        with track(capture, "request"):
+            pass
+        capture.samples.clear()
+        capture.samples[("request", "analyze (a.py:1)", "rule (b.py:2)")] = 0.25
+        capture.samples[("request", "analyze (a.py:1)")] = 0.0001
+        capture.samples[("phase:llm", "analyze (a.py:1)", "call (c.py:3)")] = 1.5
+        return capture
+
+    def test_collapsed(self, capture: slow_profiles.ProfileCapture) -> None:
+        """One line per stack with whole milliseconds, at least 1."""
+        assert capture.collapsed().splitlines() == [
+            "phase:llm;analyze (a.py:1);call (c.py:3) 1500",
+            "request;analyze (a.py:1) 1",
+            "request;analyze (a.py:1);rule (b.py:2) 250",
+        ]
+
+    def test_speedscope(self, capture: slow_profiles.ProfileCapture) -> None:
+        """One sampled profile per task kind over shared frames."""
+        data = capture.speedscope()
+        frames = [frame["name"] for frame in data["shared"]["frames"]]
+        profiles = {profile["name"]: profile for profile in data["profiles"]}
+
+        assert frames == ["analyze (a.py:1)", "call (c.py:3)", "rule (b.py:2)"]
+        assert profiles["phase:llm"]["samples"] == [[0, 1]]
+        assert profiles["request"]["samples"] == [[0], [0, 2]]
+        assert profiles["request"]["weights"] == [0.0001, 0.25]
+        assert profiles["request"]["endValue"] == pytest.approx(0.2501)
+        assert profiles["request"]["unit"] == "seconds"
@@ -0,0 +1,130 @@
+"""Tests for the single-pass document sniffer.
+
+Validates that one sniff yields the same format and content type as the
+format detector and the preprocessor, the line and character counts,
+and that repeat lookups of a text reuse its profile.
+"""
+
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+
+from app.models.enums import FileType
+from app.services.parsing import sniffer
+from app.services.parsing.sniffer import sniff
+
+_PROCEDURE_ADOC = (
+    "= Installing the operator\n"
+    "\n"
+    ":toc:\n"
+    "\n"
+    ".Prerequisites\n"
+    "* You have cluster-admin access.\n"
+    "\n"
+    ".Procedure\n"
+    "\n"
+    ". Click *Operators*.\n"
+    ". Select the channel.\n"
+    "\n"
+    ".Verification\n"
+    "\n"
+    "----\n"
+    "$ oc get csv\n"
+    "----\n"
+)
+
+_RELEASE_NOTES = (
+    ":_mod-docs-content-type: REFERENCE\n"
+    "= Product 4.2 release notes\n"
+    "\n"
+    "== New features\n"
+    "\n"
+    "A feature.\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Generator[None, None, None]:
+    """Start each test with no memoized profiles."""
+    sniffer._cache.clear()
+    yield
+    sniffer._cache.clear()
+
+
+class TestSniff:
+    """Tests for the profile of one text."""
+
+    def test_asciidoc_procedure(self) -> None:
+        """Format and content type come from the same pass."""
+        profile = sniff(_PROCEDURE_ADOC)
+
+        assert profile.file_type == FileType.ASCIIDOC
+        assert profile.content_type == "procedure"
+        assert profile.format_scores[FileType.ASCIIDOC] > 0
+
+    def test_release_notes_refinement(self) -> None:
+        """A declared reference with release sections is release notes."""
+        assert sniff(_RELEASE_NOTES).content_type == "release_notes"
+
+    def test_markup_patterns_scored_when_tags_present(self) -> None:
+        """HTML is recognised; plain prose stays plaintext."""
+        assert sniff("<html><body><p>Hello</p></body></html>").file_type == FileType.HTML
+        assert sniff("Just a sentence.\nAnd another.").file_type == FileType.PLAINTEXT
+
+    def test_filename_hint(self) -> None:
+        """The extension nudges an otherwise unscored text."""
+        assert sniff("Just a sentence.", "notes.md").file_type == FileType.MARKDOWN
+
+    def test_counts(self) -> None:
+        """Lines, blank lines and characters are counted."""
+        profile = sniff("one\n\n  \ntwo")
+
+        assert profile.line_count == 4
+        assert profile.blank_line_count == 2
+        assert profile.char_count == 11
+
+
+class TestParity:
+    """The sniffer agrees with the public detectors that delegate to it."""
+
+    @pytest.mark.parametrize("text", [
+        _PROCEDURE_ADOC,
+        _RELEASE_NOTES,
+        "# Title\n\nSome *markdown* with a [link](http://x).\n",
+        "<topic id='t'><title>T</title><body><p>x</p></body></topic>",
+        "Understanding storage\n\nStorage is a concept.\n",
+    ])
+    def test_detectors_match_profile(self, text: str) -> None:
+        """detect_format and _detect_content_type report the profile."""
+        from app.services.analysis.preprocessor import _detect_content_type
+        from app.services.parsing.format_detector import detect_format
+
+        profile = sniff(text)
+
+        assert detect_format(text) == profile.file_type
+        assert _detect_content_type(text) == profile.content_type
+
+
+class TestMemo:
+    """Tests for profile reuse."""
+
+    def test_same_text_scanned_once(self) -> None:
+        """A second lookup returns the memoized profile."""
+        with patch.object(sniffer, "_sniff", wraps=sniffer._sniff) as scan:
+            first = sniff(_PROCEDURE_ADOC)
+            second = sniff(_PROCEDURE_ADOC)
+
+        assert first is second
+        assert scan.call_count == 1
+
+    def test_filename_is_part_of_the_key(self) -> None:
+        """The same text with another filename is profiled separately."""
+        assert sniff("Plain words.") is not sniff("Plain words.", "a.md")
+
+    def test_cache_is_bounded(self) -> None:
+        """Old profiles are evicted past the limit."""
+        for n in range(sniffer._PROFILE_CACHE_MAX_ENTRIES + 3):
+            sniff(f"Text {n}.")
+
+        assert len(sniffer._cache) == sniffer._PROFILE_CACHE_MAX_ENTRIES
@@ -0,0 +1,139 @@
+"""Tests for the per-document span-resolution index.
+
+Validates that DocumentTextIndex queries return exactly what the
+per-region search strategies in the orchestrator return, including
+fuzzy window selection and ``**`` pairs split by region boundaries.
+"""
+
+import random
+from difflib import SequenceMatcher
+from typing import Optional
+
+import pytest
+
+from app.services.analysis.orchestrator import _find_flagged_in_text
+from app.services.analysis.text_index import (
+    DocumentTextIndex,
+    find_ignoring_inline_markers,
+)
+
+
+def _reference_fuzzy(
+    pattern: str, text: str, threshold: float = 0.85,
+) -> Optional[tuple[int, int]]:
+    """Exhaustive sliding-window fuzzy search used as the oracle.
+
+    Args:
+        pattern: The text to approximate.
+        text: The text to search.
+        threshold: Minimum ratio for a match.
+
+    Returns:
+        ``(start, window_length)`` of the best window, or None.
+    """
+    best_ratio, best_start, best_window = 0.0, -1, 0
+    step = max(1, len(pattern) // 4)
+    for delta in (-2, -1, 0, 1, 2):
+        window = len(pattern) + delta
+        if window < 4:
+            continue
+        for start in range(0, len(text) - window + 1, step):
+            ratio = SequenceMatcher(None, pattern, text[start:start + window]).ratio()
+            if ratio > best_ratio:
+                best_ratio, best_start, best_window = ratio, start, window
+    if best_ratio >= threshold and best_start >= 0:
+        return best_start, best_window
+    return None
+
+
+class TestInlineMarkerProjection:
+    """Tests for marker-tolerant search on the document projection."""
+
+    def test_finds_text_across_bold_markers(self) -> None:
+        """Target text spanning ``**`` markers maps back to original spans."""
+        text = "Run the **oc apply** command now."
+        index = DocumentTextIndex(text)
+
+        start, end = index.find_ignoring_inline_markers("the oc apply command")
+
+        assert text[start:end] == "the **oc apply** command"
+
+    def test_region_bounds_respected(self) -> None:
+        """Matches outside the requested region are not returned."""
+        text = "`alpha` beta `alpha`"
+        index = DocumentTextIndex(text)
+
+        assert index.find_ignoring_inline_markers("alpha", 2, 12) == (-1, -1)
+        assert index.find_ignoring_inline_markers("alpha", 8) == (14, 19)
+
+    def test_split_pair_matches_region_search(self) -> None:
+        """A region starting inside ``**`` behaves like searching the slice."""
+        text = "x**y* z"
+        index = DocumentTextIndex(text)
+
+        s, e = find_ignoring_inline_markers(text[2:], "*y")
+        assert index.find_ignoring_inline_markers("*y", 2) == (s + 2, e + 2)
+
+    def test_randomized_parity_with_region_search(self) -> None:
+        """Index search equals projecting each region independently."""
+        rng = random.Random(7)
+        for _ in range(500):
+            text = "".join(rng.choice("ab *`") for _ in range(rng.randint(1, 40)))
+            index = DocumentTextIndex(text)
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, len(text))
+            target = "".join(rng.choice("ab *") for _ in range(rng.randint(1, 3)))
+
+            s, e = find_ignoring_inline_markers(text[start:end], target)
+            expected = (s + start, e + start) if s >= 0 else (-1, -1)
+            assert index.find_ignoring_inline_markers(target, start, end) == expected
+
+
+class TestLowerAlignment:
+    """Tests for the lowercased view."""
+
+    def test_ascii_text_is_aligned(self) -> None:
+        """Plain text lowercases position-for-position."""
+        assert DocumentTextIndex("Hello World").lower_aligned
+
+    @pytest.mark.parametrize("text", ["İstanbul", "ΣΟΦΙΑ"])
+    def test_length_or_context_changes_not_aligned(self, text: str) -> None:
+        """Expanding or context-sensitive lowercasing disables slicing."""
+        assert not DocumentTextIndex(text).lower_aligned
+
+    def test_flagged_search_with_index_matches_without(self) -> None:
+        """_find_flagged_in_text returns the same result with an index."""
+        text = "The **Server** restarts. The server was `restarted` by ops."
+        index = DocumentTextIndex(text)
+        for flagged, hint in (("SERVER", 30), ("the server restarts", None), ("restarted by", None)):
+            assert _find_flagged_in_text(
+                text, flagged, 0, len(text), hint, index=index,
+            ) == _find_flagged_in_text(text, flagged, 0, len(text), hint)
+
+
+class TestFuzzyMatching:
+    """Tests for pruned fuzzy window search."""
+
+    def test_typo_matched(self) -> None:
+        """A one-character LLM correction still anchors to the source."""
+        text = "Intro text here. The system utilizess resources. More text."
+        match = DocumentTextIndex(text).find_fuzzy("utilizes resources", 0.85, 4)
+
+        assert match is not None
+        assert "utilizess" in text[match[0]:match[0] + match[1]]
+
+    def test_randomized_parity_with_exhaustive_scan(self) -> None:
+        """Pruning never changes the selected window."""
+        rng = random.Random(11)
+        for _ in range(200):
+            text = "".join(rng.choice("abcde ") for _ in range(rng.randint(20, 120)))
+            pos = rng.randint(0, len(text) - 15)
+            chars = list(text[pos:pos + rng.randint(8, 14)])
+            chars[rng.randrange(len(chars))] = rng.choice("abcde ")
+            pattern = "".join(chars)
+
+            match = DocumentTextIndex(text).find_fuzzy(
+                pattern, 0.85, max(1, len(pattern) // 4),
+            )
+            got = (match[0], match[1]) if match else None
+            assert got == _reference_fuzzy(pattern, text)
@@ -0,0 +1,185 @@
+"""Tests for single-pass text statistics and derived readability scores.
+
+Validates that one pass over SpaCy tokens reproduces the counts the
+preprocessor previously computed, that readability word, sentence and
+letter counts agree with textstat, that the derived metrics match
+textstat within tolerance, and that report builds reuse the scores.
+"""
+
+import logging
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import spacy
+import textstat
+
+from app.models.schemas import ScoreResponse
+from app.services.analysis.orchestrator import _build_report
+from app.services.analysis.text_statistics import (
+    TextStatistics,
+    compute_text_statistics,
+    count_syllables,
+)
+from app.services.reporting.readability import readability_from_statistics
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE_TEXT: str = (
+    "The administrator installs the operator on the cluster. After the "
+    "installation completes, the operator reconciles the configuration "
+    "automatically. You can verify the deployment by running the status "
+    "command. If the pods do not start, check the logs for errors and "
+    "review the documentation for troubleshooting information."
+)
+
+
+@pytest.fixture(scope="module")
+def nlp() -> Any:
+    """Build a blank English pipeline with rule-based sentence splitting.
+
+    Returns:
+        A SpaCy Language object that needs no downloaded model.
+    """
+    pipeline = spacy.blank("en")
+    pipeline.add_pipe("sentencizer")
+    return pipeline
+
+
+def _cmudict_available() -> bool:
+    """Return True when textstat can load its CMU pronouncing dictionary."""
+    import nltk
+
+    try:
+        nltk.data.find("corpora/cmudict")
+    except LookupError:
+        return False
+    return True
+
+
+class TestCountSyllables:
+    """Tests for the memoized syllable heuristic."""
+
+    @pytest.mark.parametrize("word,expected", [
+        ("make", 1), ("walked", 1), ("table", 2), ("configuration", 5),
+    ])
+    def test_heuristic_counts(self, word: str, expected: int) -> None:
+        """Common suffix adjustments produce the expected counts."""
+        assert count_syllables(word) == expected
+
+    def test_repeated_words_hit_cache(self) -> None:
+        """Counting the same word twice reuses the cached result."""
+        count_syllables("reconciliation")
+        hits = count_syllables.cache_info().hits
+        count_syllables("reconciliation")
+        assert count_syllables.cache_info().hits == hits + 1
+
+
+class TestComputeTextStatistics:
+    """Tests for compute_text_statistics()."""
+
+    def test_token_counts_match_previous_preprocessor(self, nlp: Any) -> None:
+        """Token word, vocabulary and syllable totals are unchanged."""
+        doc = nlp(_SAMPLE_TEXT)
+        words = [t.text for t in doc if not t.is_punct and not t.is_space]
+
+        stats = compute_text_statistics(doc)
+
+        assert stats.word_count == len(words)
+        assert stats.unique_words == len({w.lower() for w in words})
+        assert stats.token_syllables == sum(count_syllables(w) for w in words)
+
+    def test_readability_counts_match_textstat(self, nlp: Any) -> None:
+        """Word, sentence and letter counts agree with textstat."""
+        stats = compute_text_statistics(nlp(_SAMPLE_TEXT))
+
+        assert stats.readability_words == textstat.lexicon_count(_SAMPLE_TEXT)
+        assert stats.readability_sentences == textstat.sentence_count(_SAMPLE_TEXT)
+        assert stats.letter_count == textstat.letter_count(_SAMPLE_TEXT)
+
+    def test_contractions_and_hyphens_are_single_words(self, nlp: Any) -> None:
+        """``don't`` and ``built-in`` count once, as in textstat."""
+        text = "Users don't need the built-in console today."
+        stats = compute_text_statistics(nlp(text))
+
+        assert stats.readability_words == textstat.lexicon_count(text) == 7
+
+    def test_newlines_split_sentences(self, nlp: Any) -> None:
+        """A heading line does not merge into the following sentence."""
+        stats = compute_text_statistics(
+            nlp("Installing the cluster operator\nRun the install command now."),
+        )
+        assert stats.readability_sentences == 2
+
+    def test_short_fragments_ignored(self, nlp: Any) -> None:
+        """Sentences of two words or fewer are not counted."""
+        stats = compute_text_statistics(
+            nlp("Procedure. Run the install command now."),
+        )
+        assert stats.readability_sentences == 1
+
+    def test_pronouns_counted(self, nlp: Any) -> None:
+        """Ambiguous pronouns are counted for LLM consumability."""
+        stats = compute_text_statistics(nlp("It fails when this runs. Fix it."))
+        assert stats.pronoun_count == 3
+
+
+class TestReadabilityFromStatistics:
+    """Tests for readability_from_statistics()."""
+
+    def test_too_short_returns_zeros(self) -> None:
+        """Fewer than three readability words yields zero scores."""
+        result = readability_from_statistics(
+            TextStatistics(readability_words=2, readability_sentences=1),
+        )
+        assert all(metric["score"] == 0.0 for metric in result.values())
+
+    @pytest.mark.skipif(
+        not _cmudict_available(), reason="textstat needs the CMU dictionary",
+    )
+    def test_scores_match_textstat_within_tolerance(self, nlp: Any) -> None:
+        """Token-derived metrics stay close to textstat's own scores."""
+        result = readability_from_statistics(
+            compute_text_statistics(nlp(_SAMPLE_TEXT)),
+        )
+
+        assert result["Flesch Reading Ease"]["score"] == pytest.approx(
+            textstat.flesch_reading_ease(_SAMPLE_TEXT), abs=5.0,
+        )
+        assert result["Flesch-Kincaid Grade"]["score"] == pytest.approx(
+            textstat.flesch_kincaid_grade(_SAMPLE_TEXT), abs=1.0,
+        )
+        assert result["Gunning Fog"]["score"] == pytest.approx(
+            textstat.gunning_fog(_SAMPLE_TEXT), abs=1.5,
+        )
+        assert result["Coleman-Liau"]["score"] == pytest.approx(
+            textstat.coleman_liau_index(_SAMPLE_TEXT), abs=0.5,
+        )
+
+
+class TestReportReuse:
+    """Tests that report builds reuse the preprocessed statistics."""
+
+    def test_report_builds_score_once_without_textstat(self, nlp: Any) -> None:
+        """Both report builds share one readability result from the stats."""
+        stats = compute_text_statistics(nlp(_SAMPLE_TEXT))
+        prep: dict[str, Any] = {
+            "text": _SAMPLE_TEXT,
+            "text_statistics": stats,
+            "word_count": stats.word_count,
+            "sentence_count": 4,
+            "paragraph_count": 1,
+            "avg_words_per_sentence": 11.5,
+            "avg_syllables_per_word": 2.0,
+        }
+        score = ScoreResponse(score=90, color="#00AA00", label="Good", total_issues=0)
+
+        with patch(
+            "app.services.reporting.readability.calculate_readability",
+        ) as textstat_path:
+            first = _build_report(prep, score)
+            second = _build_report(prep, score)
+
+        textstat_path.assert_not_called()
+        assert first.readability is second.readability
+        assert first.readability == readability_from_statistics(stats)
@@ -0,0 +1,113 @@
+"""Tests for offset-tracked regex rewriting.
+
+Validates that TrackedText yields the same text and offset map as
+applying each substitution in turn and rebuilding the map character by
+character, across the preprocessor's cleanup patterns, and that
+passes whose hint is absent are skipped.
+"""
+
+import os
+import random
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.analysis.preprocessor import (
+    _POST_CLEANUP_RE,
+    _clean_markup_with_mapping,
+    _select_cleanup_patterns,
+)
+from app.services.analysis.tracked_text import TrackedText
+
+_FIXTURE = os.path.join(
+    os.path.dirname(__file__), os.pardir, "fixtures", "errors_sample.adoc",
+)
+
+_FRAGMENTS = [
+    "= Title", "== Section", ".Procedure", ". Step one", "* item", "term::",
+    "----", "$ oc get pods", "////", "// note", "ifdef::x[]", "endif::[]",
+    "[source,bash]", "+", ":attr: value", "image::a.png[A]", "**bold** text",
+    "__it__", "`code`", "+lit+", "{prod}", "<disk>", "xref:a.adoc[A]",
+    "link:https://x.io[X]", "see https://x.io now", "# Heading",
+    "*em* and [link](http://y)", "```", "", "", "  spaced  out  ", "Plain prose.",
+]
+
+
+def _reference(text: str, file_type: str) -> tuple[str, list[int]]:
+    """Clean *text* one substitution at a time, one character at a time."""
+    offset_map = list(range(len(text) + 1))
+    subs = [(p, r) for p, r, _hint in _select_cleanup_patterns(file_type)]
+    for pattern, replacement in subs + [(_POST_CLEANUP_RE, " ")]:
+        chars: list[str] = []
+        new_map: list[int] = []
+        last_end = 0
+        for match in pattern.finditer(text):
+            for i in range(last_end, match.start()):
+                chars.append(text[i])
+                new_map.append(offset_map[i])
+            if replacement == r"\1":
+                for i in range(*match.span(1)):
+                    chars.append(text[i])
+                    new_map.append(offset_map[i])
+            else:
+                chars.extend(replacement)
+                new_map.extend([offset_map[match.start()]] * len(replacement))
+            last_end = match.end()
+        for i in range(last_end, len(text)):
+            chars.append(text[i])
+            new_map.append(offset_map[i])
+        new_map.append(offset_map[len(text)])
+        text, offset_map = "".join(chars), new_map
+    return text, offset_map
+
+
+class TestCleanupParity:
+    """TrackedText reproduces the sequential substitution pipeline."""
+
+    @pytest.mark.parametrize("file_type", ["asciidoc", "markdown"])
+    def test_random_documents(self, file_type: str) -> None:
+        """Random mixes of markup clean identically."""
+        rng = random.Random(44)
+        for _ in range(400):
+            text = "\n".join(rng.choices(_FRAGMENTS, k=rng.randint(0, 25)))
+            assert _clean_markup_with_mapping(text, file_type) == _reference(text, file_type)
+
+    def test_sample_document(self) -> None:
+        """The sample AsciiDoc document cleans identically."""
+        with open(_FIXTURE, encoding="utf-8") as fh:
+            text = fh.read()
+
+        assert _clean_markup_with_mapping(text, "asciidoc") == _reference(text, "asciidoc")
+
+
+class TestTrackedText:
+    """Tests for individual substitutions."""
+
+    def test_offset_map_of_untouched_text(self) -> None:
+        """Without substitutions the map is the identity plus sentinel."""
+        assert TrackedText("abc").offset_map() == [0, 1, 2, 3]
+
+    def test_modes(self) -> None:
+        """Group copies keep positions; fixed text maps to the match start."""
+        tracked = TrackedText("a **b** `c` d")
+        tracked.sub(re.compile(r"\*\*(.+?)\*\*"), r"\1")
+        tracked.sub(re.compile(r"`([^`]+)`"), "X")
+
+        assert tracked.text == "a b X d"
+        assert tracked.offset_map() == [0, 1, 4, 7, 8, 11, 12, 13]
+
+    def test_missing_hint_skips_the_regex(self) -> None:
+        """A pass whose hint is absent does not run its pattern."""
+        pattern = MagicMock()
+        tracked = TrackedText("no markup here")
+
+        assert tracked.sub(pattern, "", "xref:") == 0
+        pattern.finditer.assert_not_called()
+
+    def test_newline_hint_matches_at_start(self) -> None:
+        """A line-start hint also accepts a match on the first line."""
+        tracked = TrackedText("= Title\nBody")
+
+        assert tracked.sub(re.compile(r"^=\s+", re.MULTILINE), "", "\n=") == 1
+        assert tracked.text == "Title\nBody"